@@ -1,5 +1,6 @@
 import logging
 import os
+import multiprocessing
 
 import PySide6.QtWidgets as qtw
 from PySide6.QtCore import QTranslator, QLocale
@@ -16,6 +17,9 @@ if __name__ == '__main__':
 
     import sys
 
+    # Archives are extracted in a process pool, the exe has to start those processes itself
+    multiprocessing.freeze_support()
+
     # Old exe appears after updating
     if os.path.exists(OLD_EXE):
         os.remove(OLD_EXE)
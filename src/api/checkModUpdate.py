@@ -1,70 +1,102 @@
 import logging
+from collections import deque
 
-from PySide6.QtCore import QObject, QUrl, Signal
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QNetworkReply
 
 from semantic_version import Version
 
+from src.api.network import NetworkService, NetworkRequest
+from src.constant_vars import MODWORKSHOP_API, MAX_UPDATE_REQUESTS
 
-class checkModUpdate(QObject):
+class checkModUpdates(QObject):
     '''
-    Instancing this object will run a series of 
-    functions to get the latest Myth Mod Manager version.
+    Checks modworkshop for newer versions of several mods at once.
 
-    `checkUpdate` will delete itself after it's finished.
+    Every request goes through the `NetworkService`, so the connections to
+    modworkshop are kept alive and reused. At most `maxRequests` are in flight at a time,
+    the next mod is requested as soon as a reply comes back.
+
+    Versions are kept in the `HttpCache`, checking again soon after doesn't ask modworkshop at all.
+
+    `checkModUpdates` will delete itself after it's finished.
     '''
 
-    updateDetected = Signal(str)
-    upToDate = Signal()
-    error = Signal()
+    # Mod, latest version, if the latest version is newer than the installed one
+    modChecked = Signal(str, str, bool)
+
+    # Mod that could not be checked
+    modFailed = Signal(str)
+
+    finished = Signal()
+
+    def __init__(self, mods: dict[str, tuple[str, str]], maxRequests: int = MAX_UPDATE_REQUESTS, apiUrl: str = MODWORKSHOP_API, network: NetworkService | None = None) -> None:
+        '''`mods` has the modworkshop asset id and installed version of each mod'''
 
-    def __init__(self, modId: str, localVer: str) -> None:
         super().__init__()
         logging.getLogger(__file__)
 
-        try:
-            self.localVer = Version.coerce(localVer)
-        except Exception as e:
-            logging.error('checkModUpdate.__init__(), An error occured trying to parse mod local version %s:\n%s', localVer, str(e))
-            self.error.emit()
-            self.deleteLater()
+        self.mods = mods
+        self.apiUrl = apiUrl
+        self.maxRequests = maxRequests
 
-        link = f'https://api.modworkshop.net/mods/{modId}/version'
+        self.queue = deque(mods)
 
-        network = QNetworkAccessManager(self)
-        request = QNetworkRequest(QUrl(link))
-        logging.debug('Request for %s from checkModUpdate() started', link)
+        self.inFlight: dict[NetworkRequest, str] = {}
 
-        self.reply = network.get(request)
-        self.reply.finished.connect(self.__reply_handler)
-    
-    def __reply_handler(self) -> None:
-        reply: QNetworkReply = self.sender()
+        self.network = NetworkService.instance() if network is None else network
+
+    def start(self) -> None:
+        logging.info('Checking %s mod(s) for updates', len(self.queue))
+
+        self.requestNext()
+
+    def requestNext(self) -> None:
+
+        while self.queue and len(self.inFlight) < self.maxRequests:
+
+            mod = self.queue.popleft()
 
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            self.__checkVersion()
-        else:
-            logging.error('Internet error in checkModUpdate():\n%s', reply.error())
-            self.error.emit()
+            link = f'{self.apiUrl}/mods/{self.mods[mod][0]}/version'
+
+            logging.debug('Request for %s from checkModUpdates() started', link)
+
+            request = self.network.get(link)
+            request.finished.connect(self.__reply_handler)
+
+            self.inFlight[request] = mod
+
+        if not self.queue and not self.inFlight:
+            logging.info('Done checking mods for updates')
+
+            self.finished.emit()
             self.deleteLater()
-    
-    def __checkVersion(self) -> None:
-        reply: QNetworkReply = self.sender()
 
-        replyDecoded = reply.readAll().data().decode()
+    def __reply_handler(self) -> None:
+        request: NetworkRequest = self.sender()
+
+        mod = self.inFlight.pop(request)
 
         try:
-            latestVersion = Version.coerce(replyDecoded)
+            if request.error() != QNetworkReply.NetworkError.NoError:
+                raise ConnectionError(request.errorString())
+
+            self.__checkVersion(mod, request.readAll().data().decode())
+
         except Exception as e:
-            logging.error('An error occured trying to access a modworkshop.net API reply in checkModUpdate().__checkversion():\n%s', str(e))
-            self.error.emit()
-            self.deleteLater()
+            logging.error('Could not check %s for updates:\n%s', mod, str(e))
+            self.modFailed.emit(mod)
+
+        finally:
+            request.deleteLater()
+
+        self.requestNext()
+
+    def __checkVersion(self, mod: str, replyDecoded: str) -> None:
 
-        logging.info('Latest Version: %s', latestVersion)
+        latestVersion = Version.coerce(replyDecoded.strip().strip('"').lstrip('vV'))
+        localVersion = Version.coerce(self.mods[mod][1].lstrip('vV'))
 
-        if latestVersion > self.localVer:
-            self.updateDetected.emit(replyDecoded)
-        else:
-            self.upToDate.emit()
+        logging.info('Latest version of %s: %s, installed: %s', mod, latestVersion, localVersion)
 
-        self.deleteLater()
+        self.modChecked.emit(mod, str(latestVersion), latestVersion > localVersion)
@@ -1,13 +1,14 @@
 import json
 import logging
 
-from PySide6.QtCore import QObject, QUrl, Signal
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtNetwork import QNetworkReply
 
 from semantic_version import Version
 
 from src.errorChecking import isPrerelease
-from src.constant_vars import VERSION
+from src.api.network import NetworkService, NetworkRequest
+from src.constant_vars import VERSION, GITHUB_RELEASES_API
 
 class checkUpdate(QObject):
     '''
@@ -21,41 +22,43 @@ class checkUpdate(QObject):
     upToDate = Signal()
     error = Signal()
 
-    def __init__(self) -> None:
+    def __init__(self, network: NetworkService | None = None) -> None:
         super().__init__()
         logging.getLogger(__file__)
 
-        link = 'https://api.github.com/repos/Wolfmyths/Myth-Mod-Manager/releases'
+        link = GITHUB_RELEASES_API
 
         if not isPrerelease(VERSION):
             link += '/latest'
-        
-        network = QNetworkAccessManager(self)
-        request = QNetworkRequest(QUrl(link))
+
+        self.network = NetworkService.instance() if network is None else network
+
         logging.debug('Request for %s from checkUpdate() started', link)
-        
-        self.reply = network.get(request)
-        self.reply.finished.connect(self.__reply_handler)
+
+        # The releases rarely change, most launches only get a 304 back or don't ask at all
+        self.request = self.network.get(link)
+        self.request.finished.connect(self.__reply_handler)
     
     def __reply_handler(self) -> None:
-        reply: QNetworkReply = self.sender()
+        request: NetworkRequest = self.sender()
+        request.deleteLater()
 
-        if reply.error() == QNetworkReply.NetworkError.NoError:
-            self.__checkVersion()
+        if request.error() == QNetworkReply.NetworkError.NoError:
+            self.__checkVersion(request)
         else:
-            logging.error('Internet error in checkUpdate():\n%s', reply.error())
+            logging.error('Internet error in checkUpdate():\n%s', request.error())
             self.error.emit()
             self.deleteLater()
     
-    def __checkVersion(self) -> None:
-        reply: QNetworkReply = self.sender()
+    def __checkVersion(self, request: NetworkRequest) -> None:
 
         try:
-            data: dict = json.loads(reply.readAll().data().decode())
+            data: dict = json.loads(request.readAll().data().decode())
         except Exception as e:
             logging.error('An error occured trying to access a Github API reply in checkUpdate().__checkversion():\n%s', str(e))
             self.error.emit()
             self.deleteLater()
+            return
 
         if isPrerelease(VERSION):
             latestVersion = Version.coerce(data[0]['tag_name'])
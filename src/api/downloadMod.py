@@ -0,0 +1,400 @@
+import os
+import json
+import logging
+
+from PySide6.QtCore import QObject, QTimer, Signal
+from PySide6.QtNetwork import QNetworkReply, QNetworkRequest
+
+from src.api.network import NetworkService, NetworkRequest
+from src.constant_vars import MODWORKSHOP_API, DOWNLOADS_PATH_DEFAULT, DOWNLOAD_SEGMENTS, DOWNLOAD_SEGMENT_MIN
+
+logging.getLogger(__name__)
+
+STATUS = QNetworkRequest.Attribute.HttpStatusCodeAttribute
+
+# Milliseconds between reads of a download with a bandwidth cap
+THROTTLE_INTERVAL = 100
+
+# Bytes a throttled reply holds before the connection waits for it to be read
+THROTTLE_BUFFER = 256 * 1024
+
+# States of a download
+RUNNING = 'running'
+PAUSED = 'paused'
+CANCELED = 'canceled'
+FINISHED = 'finished'
+
+class Segment():
+    '''A byte range of the file that is downloaded by its own request'''
+
+    def __init__(self, start: int, end: int | None) -> None:
+        self.start = start
+
+        # Last byte of the range, None if the file's size isn't known
+        self.end = end
+
+        # Bytes written to the file
+        self.done = 0
+
+        self.request: NetworkRequest | None = None
+
+        # The reply whose body is being written, and if its body isn't part of the file
+        self.reply: QNetworkReply | None = None
+        self.skip = False
+
+        # The request is done, the data it left in the reply still has to be written
+        self.received = False
+
+        self.finished = False
+
+    def remaining(self) -> int | None:
+        return None if self.end is None else self.end - self.start + 1 - self.done
+
+    def headers(self) -> dict[str, str]:
+        if self.end is None:
+            return {}
+
+        return {'Range' : f'bytes={self.start + self.done}-{self.end}'}
+
+class DownloadMod(QObject):
+    '''
+    Downloads a mod from modworkshop by its asset id.
+
+    The mod's file and its size are looked up with the API first. The file is split
+    into `segments` byte ranges that are downloaded at the same time and written into one `.part` file,
+    a server that ignores ranges gets one request for the whole file instead.
+
+    The download can be paused and resumed, resuming only asks for the bytes each range is missing.
+    With a `bandwidth` the replies are read at most that fast, the connections wait while they're full.
+
+    `succeeded` has the path of the finished archive, ready to be installed
+    '''
+
+    downloading = Signal(int, int)
+    succeeded = Signal(str)
+    error = Signal(str)
+    doneCanceling = Signal()
+
+    def __init__(self, assetID: str, dest: str = DOWNLOADS_PATH_DEFAULT, segments: int = DOWNLOAD_SEGMENTS, bandwidth: int = 0, apiUrl: str = MODWORKSHOP_API, network: NetworkService | None = None) -> None:
+        '''`bandwidth` is in bytes per second, 0 doesn't limit the download'''
+
+        super().__init__()
+
+        self.assetID = assetID
+        self.dest = dest
+        self.maxSegments = segments
+        self.bandwidth = bandwidth
+        self.apiUrl = apiUrl
+
+        self.network = NetworkService.instance() if network is None else network
+
+        self.state = RUNNING
+
+        self.request: NetworkRequest | None = None
+
+        self.url = ''
+        self.path = ''
+        self.size: int | None = None
+
+        self.file = None
+        self.segments: list[Segment] = []
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(THROTTLE_INTERVAL)
+        self.timer.timeout.connect(self.__throttle)
+
+    def partPath(self) -> str:
+        return f'{self.path}.part'
+
+    def received(self) -> int:
+        return sum(x.done for x in self.segments)
+
+    def start(self) -> None:
+        link = f'{self.apiUrl}/mods/{self.assetID}'
+
+        logging.info('Looking up the download of mod %s at %s', self.assetID, link)
+
+        self.request = self.network.get(link)
+        self.request.finished.connect(self.__modFetched)
+
+    def __reply(self) -> dict | None:
+        '''Returns the API's answer, None if the request failed'''
+
+        request = self.request
+        request.deleteLater()
+
+        if self.state == CANCELED:
+            self.doneCanceling.emit()
+            return None
+
+        try:
+            if request.error() != QNetworkReply.NetworkError.NoError:
+                raise ConnectionError(request.errorString())
+
+            return json.loads(request.readAll().data().decode())
+
+        except Exception as e:
+            self.__fail(str(e))
+            return None
+
+    def __modFetched(self) -> None:
+
+        if (data := self.__reply()) is None:
+            return
+
+        # Mods can link to files hosted somewhere else
+        if data.get('download_type', 'file') != 'file' or not data.get('download_id'):
+            self.__fail(f'Mod {self.assetID} is not hosted on modworkshop, download it from its page instead')
+            return
+
+        self.request = self.network.get(f'{self.apiUrl}/files/{data["download_id"]}')
+        self.request.finished.connect(self.__fileFetched)
+
+    def __fileFetched(self) -> None:
+
+        if (data := self.__reply()) is None:
+            return
+
+        self.url = data.get('download_url') or f'{self.apiUrl}/files/{data["id"]}/download'
+
+        # Only the file's name, it can't point outside of the downloads folder
+        self.path = os.path.join(self.dest, os.path.basename(data['name']))
+
+        self.size = int(data['size']) if data.get('size') else None
+
+        self.__beginDownload()
+
+    def __beginDownload(self) -> None:
+        os.makedirs(self.dest, exist_ok=True)
+
+        self.file = open(self.partPath(), 'w+b')
+
+        if self.size is None:
+            self.segments = [Segment(0, None)]
+
+        else:
+            self.file.truncate(self.size)
+
+            amount = max(1, min(self.maxSegments, self.size // DOWNLOAD_SEGMENT_MIN))
+            length = -(-self.size // amount)
+
+            self.segments = [Segment(x, min(x + length, self.size) - 1) for x in range(0, self.size, length)]
+
+        logging.info('Downloading %s in %s segment(s) from %s', os.path.basename(self.path), len(self.segments), self.url)
+
+        self.__sendSegments()
+
+    def __sendSegments(self) -> None:
+
+        for segment in self.segments:
+            if not segment.finished:
+                self.__send(segment)
+
+        if self.bandwidth:
+            self.timer.start()
+
+    def __send(self, segment: Segment) -> None:
+        segment.received = False
+
+        segment.request = self.network.get(self.url, cached=False, headers=segment.headers(), bufferSize=THROTTLE_BUFFER if self.bandwidth else 0)
+
+        segment.request.readyRead.connect(lambda: self.__readyRead(segment))
+        segment.request.retrying.connect(lambda: setattr(segment.request, 'headers', segment.headers()))
+        segment.request.finished.connect(lambda: self.__segmentFinished(segment))
+
+    def __beginReply(self, segment: Segment) -> None:
+        '''Checks if the body of a new reply is the segment's range'''
+
+        reply = segment.reply = segment.request.reply
+
+        status = reply.attribute(STATUS)
+
+        segment.skip = status not in (200, 206)
+
+        if status != 200 or segment.end is None:
+            return
+
+        # The server ignored the range and sends the whole file, it becomes the only segment
+        logging.info('%s does not support ranges, downloading it in one piece', self.url)
+
+        for other in self.segments:
+            if other is not segment:
+                self.__drop(other)
+
+        segment.start = 0
+        segment.end = self.size - 1
+        segment.done = 0
+
+        self.segments = [segment]
+
+    def __read(self, segment: Segment, limit: int = -1) -> int:
+        '''Writes the data the segment's reply received, up to `limit` bytes. Returns the bytes read'''
+
+        if segment.request is None or segment.request.reply is None:
+            return 0
+
+        if segment.request.reply is not segment.reply:
+            self.__beginReply(segment)
+
+        data = segment.reply.readAll().data() if limit < 0 else segment.reply.read(limit).data()
+
+        if segment.skip or not data:
+            return len(data)
+
+        remaining = segment.remaining()
+
+        if remaining is not None:
+            data = data[:remaining]
+
+        self.file.seek(segment.start + segment.done)
+        self.file.write(data)
+
+        segment.done += len(data)
+
+        self.downloading.emit(self.received(), self.size or 0)
+
+        return len(data)
+
+    def __readyRead(self, segment: Segment) -> None:
+        # Throttled downloads are read by the timer
+        if not self.bandwidth and self.state == RUNNING:
+            self.__read(segment)
+
+    def __throttle(self) -> None:
+        '''Reads the replies with the bandwidth budget of one interval, split between the segments'''
+
+        active = [x for x in self.segments if x.request is not None and not x.finished]
+
+        if not active:
+            return
+
+        budget = max(1, self.bandwidth * THROTTLE_INTERVAL // 1000 // len(active))
+
+        for segment in active:
+
+            self.__read(segment, budget)
+
+            if segment.received and not segment.request.reply.bytesAvailable():
+                self.__segmentDone(segment)
+
+    def __segmentFinished(self, segment: Segment) -> None:
+
+        # Paused, canceled or replaced by a request for the whole file
+        if self.state != RUNNING or segment not in self.segments or segment.request is None:
+            return
+
+        if segment.request.error() != QNetworkReply.NetworkError.NoError:
+            self.__fail(segment.request.errorString())
+            return
+
+        segment.received = True
+
+        if not self.bandwidth:
+            self.__read(segment)
+            self.__segmentDone(segment)
+
+    def __segmentDone(self, segment: Segment) -> None:
+
+        segment.finished = True
+
+        if segment.remaining():
+            self.__fail(f'The download of {os.path.basename(self.path)} ended early')
+            return
+
+        self.__drop(segment)
+
+        if all(x.finished for x in self.segments):
+            self.__complete()
+
+    def __drop(self, segment: Segment) -> None:
+        '''Stops the segment's request, the bytes it wrote are kept'''
+
+        request = segment.request
+
+        segment.request = None
+        segment.reply = None
+
+        if request is not None:
+            request.abort()
+            request.deleteLater()
+
+    def __complete(self) -> None:
+        self.timer.stop()
+        self.state = FINISHED
+
+        self.file.close()
+
+        os.replace(self.partPath(), self.path)
+
+        logging.info('Downloaded %s', self.path)
+
+        self.succeeded.emit(self.path)
+
+    def pause(self) -> None:
+        if self.state != RUNNING or not self.segments:
+            return
+
+        logging.info('Pausing the download of %s at %s bytes', os.path.basename(self.path), self.received())
+
+        self.state = PAUSED
+        self.timer.stop()
+
+        for segment in self.segments:
+            self.__drop(segment)
+
+    def resume(self) -> None:
+        if self.state != PAUSED:
+            return
+
+        logging.info('Resuming the download of %s', os.path.basename(self.path))
+
+        self.state = RUNNING
+
+        # A file without a known size can't be asked for from the middle
+        for segment in self.segments:
+            if segment.end is None:
+                segment.done = 0
+
+        self.__sendSegments()
+
+    def cancel(self) -> None:
+        '''Stops the download and removes the partial file'''
+
+        if self.state in (CANCELED, FINISHED):
+            return
+
+        state = self.state
+        self.state = CANCELED
+
+        self.timer.stop()
+
+        # Still asking the API, `doneCanceling` is emitted once it answers
+        if not self.segments:
+            if self.request is not None:
+                self.request.abort()
+            return
+
+        for segment in self.segments:
+            self.__drop(segment)
+
+        self.file.close()
+        os.remove(self.partPath())
+
+        logging.info('Canceled the download of %s, it was %s', os.path.basename(self.path), state)
+
+        self.doneCanceling.emit()
+
+    def __fail(self, message: str) -> None:
+        logging.error('Could not download mod %s:\n%s', self.assetID, message)
+
+        self.timer.stop()
+        self.state = CANCELED
+
+        for segment in self.segments:
+            self.__drop(segment)
+
+        if self.file is not None:
+            self.file.close()
+            os.remove(self.partPath())
+
+        self.error.emit(message)
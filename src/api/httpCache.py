@@ -0,0 +1,95 @@
+import logging
+
+from PySide6.QtCore import QUrl, QDateTime
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply, QNetworkDiskCache
+
+from src.constant_vars import HTTP_CACHE_PATH_DEFAULT, HTTP_CACHE_SIZE, HTTP_CACHE_TTL
+
+logging.getLogger(__name__)
+
+# Set on requests that go to the server, the cached answer's TTL starts over once they're done
+REVALIDATE = QNetworkRequest.Attribute.User
+
+CACHE_LOAD = QNetworkRequest.Attribute.CacheLoadControlAttribute
+
+def isOffline(error: QNetworkReply.NetworkError) -> bool:
+    '''Checks if the server couldn't be reached or failed, as opposed to answering with an error'''
+
+    # Qt numbers connection and proxy errors below 200 and server errors above 400
+    return error != QNetworkReply.NetworkError.NoError and (error.value < 200 or error.value > 400)
+
+class HttpCache():
+    '''
+    On-disk cache of API answers, shared by every run of the program.
+
+    An answer younger than `ttl` seconds is used without asking the server.
+    Older answers are revalidated with their ETag and Last-Modified headers,
+    an unchanged answer costs a 304 reply without a body.
+
+    When the server can't be reached, `finished()` gets the cached answer instead, however old it is
+    '''
+
+    def __init__(self, network: QNetworkAccessManager, path: str = HTTP_CACHE_PATH_DEFAULT, ttl: int = HTTP_CACHE_TTL) -> None:
+        self.network = network
+        self.ttl = ttl
+
+        self.cache = QNetworkDiskCache(network)
+        self.cache.setCacheDirectory(path)
+        self.cache.setMaximumCacheSize(HTTP_CACHE_SIZE)
+
+        network.setCache(self.cache)
+
+    def isFresh(self, url: str) -> bool:
+        expiration = self.cache.metaData(QUrl(url)).expirationDate()
+
+        return expiration.isValid() and expiration > QDateTime.currentDateTimeUtc()
+
+    def request(self, url: str) -> QNetworkRequest:
+        request = QNetworkRequest(QUrl(url))
+
+        if self.isFresh(url):
+            request.setAttribute(CACHE_LOAD, QNetworkRequest.CacheLoadControl.PreferCache)
+        else:
+            # Qt adds the cached answer's validators and uses it if the server replies 304
+            request.setAttribute(CACHE_LOAD, QNetworkRequest.CacheLoadControl.PreferNetwork)
+            request.setAttribute(REVALIDATE, True)
+
+        return request
+
+    def get(self, url: str) -> QNetworkReply:
+        return self.network.get(self.request(url))
+
+    def finished(self, reply: QNetworkReply) -> QNetworkReply | None:
+        '''
+        Called once a reply from `get()` is finished.
+
+        Returns a reply with the cached answer if the server couldn't be reached,
+        otherwise None and `reply` is the answer
+        '''
+
+        request = reply.request()
+
+        if reply.error() == QNetworkReply.NetworkError.NoError:
+
+            if request.attribute(REVALIDATE):
+                metaData = self.cache.metaData(request.url())
+
+                if metaData.isValid():
+                    metaData.setExpirationDate(QDateTime.currentDateTimeUtc().addSecs(self.ttl))
+                    self.cache.updateMetaData(metaData)
+
+            return None
+
+        # Already the cached answer
+        if request.attribute(CACHE_LOAD) == QNetworkRequest.CacheLoadControl.AlwaysCache:
+            return None
+
+        if not isOffline(reply.error()) or not self.cache.metaData(request.url()).isValid():
+            return None
+
+        logging.warning('Could not reach %s, using the cached answer:\n%s', request.url().toString(), reply.errorString())
+
+        cached = QNetworkRequest(request.url())
+        cached.setAttribute(CACHE_LOAD, QNetworkRequest.CacheLoadControl.AlwaysCache)
+
+        return self.network.get(cached)
@@ -0,0 +1,264 @@
+import random
+import logging
+from collections import deque
+
+from PySide6.QtCore import QObject, QUrl, QTimer, QByteArray, Signal
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+
+from src.api.httpCache import HttpCache
+from src.constant_vars import HTTP_CACHE_PATH_DEFAULT, NETWORK_TIMEOUT, NETWORK_RETRIES, NETWORK_BACKOFF, NETWORK_BACKOFF_MAX, NETWORK_HOST_LIMIT, NETWORK_RETRY_STATUS
+
+logging.getLogger(__name__)
+
+# Failures that might not happen again, the connection dropped or stalled
+TRANSIENT_ERRORS = (
+    QNetworkReply.NetworkError.RemoteHostClosedError,
+    QNetworkReply.NetworkError.TimeoutError,
+    QNetworkReply.NetworkError.OperationCanceledError,
+    QNetworkReply.NetworkError.TemporaryNetworkFailureError,
+    QNetworkReply.NetworkError.NetworkSessionFailedError,
+    QNetworkReply.NetworkError.UnknownNetworkError,
+    QNetworkReply.NetworkError.ProxyTimeoutError
+)
+
+class NetworkRequest(QObject):
+    '''
+    A GET request sent by `NetworkService`, it lives through every retry.
+
+    `finished` is emitted once, after the last attempt. `reply` is the reply of that attempt,
+    None if the request was aborted before it was sent. Delete the request once it's read
+    '''
+
+    finished = Signal()
+    readyRead = Signal()
+    downloadProgress = Signal(int, int)
+
+    # Emitted before a retry is sent, `headers` can still be changed
+    retrying = Signal()
+
+    def __init__(self, service: 'NetworkService', url: str, cached: bool, headers: dict[str, str], retries: int, bufferSize: int = 0) -> None:
+        super().__init__(service)
+
+        self.url = url
+        self.cached = cached
+        self.headers = headers
+        self.retries = retries
+
+        # Bytes the reply holds before it stops reading from the connection, 0 is unlimited
+        self.bufferSize = bufferSize
+
+        self.attempt = 0
+        self.aborted = False
+
+        # Waiting out the backoff before a retry
+        self.waiting = False
+
+        self.reply: QNetworkReply | None = None
+
+    @property
+    def service(self) -> 'NetworkService':
+        # Not kept as an attribute, a request holding on to its parent would delete it while being deleted itself
+        return self.parent()
+
+    def host(self) -> str:
+        return QUrl(self.url).host()
+
+    def request(self) -> QNetworkRequest:
+        if self.cached:
+            request = self.service.cache.request(self.url)
+        else:
+            request = QNetworkRequest(QUrl(self.url))
+            request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute, QNetworkRequest.CacheLoadControl.AlwaysNetwork)
+            request.setAttribute(QNetworkRequest.Attribute.CacheSaveControlAttribute, False)
+
+        for key, value in self.headers.items():
+            request.setRawHeader(QByteArray(key.encode()), QByteArray(value.encode()))
+
+        return request
+
+    def send(self) -> None:
+        '''Called by `NetworkService` once the host has a free slot'''
+
+        if self.reply is not None:
+            self.reply.deleteLater()
+
+        self.reply = self.service.manager.get(self.request())
+        self.reply.setReadBufferSize(self.bufferSize)
+
+        # Methods of the request, so the connections go away with it
+        self.reply.readyRead.connect(self.__readyRead)
+        self.reply.downloadProgress.connect(self.__downloadProgress)
+        self.reply.finished.connect(self.__replyFinished)
+
+    def abort(self) -> None:
+        self.aborted = True
+
+        if self.reply is not None and self.reply.isRunning():
+            self.reply.abort()
+
+        elif self.service.dequeue(self) or self.waiting:
+            self.waiting = False
+            self.finished.emit()
+
+    def error(self) -> QNetworkReply.NetworkError:
+        if self.reply is None:
+            return QNetworkReply.NetworkError.OperationCanceledError
+
+        return self.reply.error()
+
+    def errorString(self) -> str:
+        return 'Operation canceled' if self.reply is None else self.reply.errorString()
+
+    def readAll(self) -> QByteArray:
+        return QByteArray() if self.reply is None else self.reply.readAll()
+
+    def deleteLater(self) -> None:
+        # Replies belong to the manager, they can't outlive it
+        if self.reply is not None:
+            self.reply.deleteLater()
+
+        super().deleteLater()
+
+    def __readyRead(self) -> None:
+        self.readyRead.emit()
+
+    def __downloadProgress(self, current: int, total: int) -> None:
+        self.downloadProgress.emit(current, total)
+
+    def __fallbackFinished(self) -> None:
+        self.finished.emit()
+
+    def __retry(self) -> None:
+        if self.waiting:
+            self.waiting = False
+            self.retrying.emit()
+            self.service.enqueue(self)
+
+    def __replyFinished(self) -> None:
+        self.service.release(self)
+
+        delay = None if self.aborted or self.attempt >= self.retries else self.service.retryDelay(self.reply, self.attempt)
+
+        if delay is not None:
+            self.attempt += 1
+
+            logging.warning('Request for %s failed, retry %s in %sms:\n%s', self.url, self.attempt, delay, self.reply.errorString())
+
+            self.waiting = True
+
+            QTimer.singleShot(delay, self, self.__retry)
+            return
+
+        # Offline, the last answer is used instead
+        fallback = self.service.cache.finished(self.reply) if self.cached and not self.aborted else None
+
+        if fallback is not None:
+            self.reply.deleteLater()
+
+            self.reply = fallback
+            self.reply.finished.connect(self.__fallbackFinished)
+            return
+
+        self.finished.emit()
+
+class NetworkService(QObject):
+    '''
+    Sends the program's HTTP requests through one `QNetworkAccessManager`,
+    so connections and TLS sessions are kept alive and reused by everything that asks a server.
+
+    Stalled requests time out, transient failures are retried with a jittered exponential backoff
+    and at most `hostLimit` requests go to one host at the same time, the rest wait in a queue.
+
+    API answers are kept in the `HttpCache`, use `instance()` to get the service shared by the program
+    '''
+
+    shared: 'NetworkService | None' = None
+
+    def __init__(self, cachePath: str = HTTP_CACHE_PATH_DEFAULT, timeout: int = NETWORK_TIMEOUT, hostLimit: int = NETWORK_HOST_LIMIT) -> None:
+        super().__init__()
+
+        self.hostLimit = hostLimit
+
+        # Milliseconds before the first retry, doubled for each one after
+        self.backoff = NETWORK_BACKOFF
+
+        self.manager = QNetworkAccessManager(self)
+        self.manager.setTransferTimeout(timeout)
+
+        self.cache = HttpCache(self.manager, cachePath)
+
+        self.active: dict[str, int] = {}
+        self.queues: dict[str, deque[NetworkRequest]] = {}
+
+    @classmethod
+    def instance(cls) -> 'NetworkService':
+        if cls.shared is None:
+            cls.shared = cls()
+
+        return cls.shared
+
+    def get(self, url: str, cached: bool = True, headers: dict[str, str] | None = None, retries: int = NETWORK_RETRIES, bufferSize: int = 0) -> NetworkRequest:
+        '''
+        Sends a GET request, or queues it if the host is busy.
+
+        Uncached requests always go to the server and their answer isn't saved, use them for downloads.
+        A download that is read slower than it arrives needs a `bufferSize`, it's kept in memory otherwise
+        '''
+
+        logging.debug('Request for %s started', url)
+
+        request = NetworkRequest(self, url, cached, headers or {}, retries, bufferSize)
+
+        self.enqueue(request)
+
+        return request
+
+    def enqueue(self, request: NetworkRequest) -> None:
+        self.queues.setdefault(request.host(), deque()).append(request)
+
+        self.sendNext(request.host())
+
+    def dequeue(self, request: NetworkRequest) -> bool:
+        '''Removes a request that wasn't sent yet, returns if it was queued'''
+
+        queue = self.queues.get(request.host(), deque())
+
+        if request not in queue:
+            return False
+
+        queue.remove(request)
+
+        return True
+
+    def release(self, request: NetworkRequest) -> None:
+        '''Frees the host's slot of a finished request'''
+
+        self.active[request.host()] -= 1
+
+        self.sendNext(request.host())
+
+    def sendNext(self, host: str) -> None:
+        queue = self.queues.get(host, deque())
+
+        while queue and self.active.get(host, 0) < self.hostLimit:
+            self.active[host] = self.active.get(host, 0) + 1
+
+            queue.popleft().send()
+
+    def retryDelay(self, reply: QNetworkReply, attempt: int) -> int | None:
+        '''Returns the milliseconds to wait before asking again, None if the failure won't go away'''
+
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+
+        if status in NETWORK_RETRY_STATUS:
+
+            retryAfter = reply.rawHeader(QByteArray(b'Retry-After')).data().decode()
+
+            if retryAfter.isdigit():
+                return min(int(retryAfter) * 1000, NETWORK_BACKOFF_MAX)
+
+        elif reply.error() not in TRANSIENT_ERRORS:
+            return None
+
+        # Full jitter, clients that failed together don't come back together
+        return int(random.uniform(0, min(NETWORK_BACKOFF_MAX, self.backoff * 2 ** attempt)))
@@ -1,15 +1,27 @@
 import os
-import shutil
 import logging
 import json
 import sys
+import threading
 
-from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply, QNetworkRequest
-from PySide6.QtCore import QObject, QUrl, Signal
+from PySide6.QtNetwork import QNetworkReply, QNetworkRequest
+from PySide6.QtCore import QObject, Signal
 
-from src.constant_vars import ROOT_PATH, OLD_EXE
+from src.api.network import NetworkService, NetworkRequest
+from src.contentStore import hashFile
+from src.extract import extractFile
+from src.constant_vars import ROOT_PATH, OLD_EXE, GITHUB_RELEASES_API
+
+STATUS = QNetworkRequest.Attribute.HttpStatusCodeAttribute
 
 class Update(QObject):
+    '''
+    Downloads the latest release and swaps it in for the running executable.
+
+    The archive is streamed to a `.part` file in `tmp`, an interrupted download
+    continues where it stopped with a Range request. The archive has to match the checksum
+    published with the release, then only the executable is extracted next to the old one and renamed over it
+    '''
 
     if sys.platform.startswith('win'):
         fileName = 'Myth-Mod-Manager.zip'
@@ -29,43 +41,71 @@ class Update(QObject):
     downloading = Signal(int, int)
     error = Signal(str)
 
+    # Emitted by the thread that verifies and extracts the archive, with the error or an empty string
+    extracted = Signal(str)
+
     cancel = False
 
-    def __init__(self) -> None:
+    def __init__(self, network: NetworkService | None = None, link: str = f'{GITHUB_RELEASES_API}/latest', installPath: str = ROOT_PATH, tmp: str | None = None) -> None:
         super().__init__()
 
         logging.getLogger(__name__)
-    
+
+        self.network = NetworkService.instance() if network is None else network
+
+        self.link = link
+        self.installPath = installPath
+
+        if tmp is not None:
+            self.tmp = tmp
+
+        # The request that is running
+        self.request: NetworkRequest | None = None
+
+        self.extracted.connect(self.__replace_exe)
+
+        # sha256 hex digest the archive has to match
+        self.checksum = ''
+        self.downloadLink = ''
+
+        # The partial download and the reply being written to it
+        self.file = None
+        self.writing: QNetworkReply | None = None
+
+        # Bytes that were on disk before the running reply, replies that aren't the archive are skipped
+        self.offset = 0
+        self.skip = False
+
+    def partPath(self) -> str:
+        # A different checksum is a different release, its partial download isn't continued
+        return os.path.join(self.tmp, f'{self.fileName}.{self.checksum[:12]}.part')
+
     def start(self) -> None:
         logging.info('Updating program...')
 
-        link = 'https://api.github.com/repos/Wolfmyths/Myth-Mod-Manager/releases/latest'
-
-        logging.info('Fetching assets_url at %s', link)
+        logging.info('Fetching assets_url at %s', self.link)
 
         self.setTotalProgress.emit(6)
 
-        self.network = QNetworkAccessManager()
-        request = QNetworkRequest(QUrl(link))
-        
         self.setCurrentProgress.emit(1, 'Getting asset_URL')
 
-        self.__cancelCheck()
+        if self.__cancelCheck():
+            return
 
-        reply = self.network.get(request)
+        self.request = self.network.get(self.link)
+        self.request.finished.connect(self.__handle_assetURL_fetch)
 
-        reply.finished.connect(self.__handle_assetURL_fetch)
 
-    
     def __handle_assetURL_fetch(self) -> None:
 
-        self.__replyErrorCheck()
+        request = self.__finishRequest()
 
-        logging.info('Checking assets')
+        if self.__cancelCheck() or self.__replyErrorCheck(request):
+            return
 
-        reply: QNetworkReply = self.sender()
+        logging.info('Checking assets')
 
-        data: dict = json.loads(reply.readAll().data().decode())
+        data: dict = json.loads(request.readAll().data().decode())
 
         assetUrl: str = data['assets_url']
 
@@ -73,107 +113,270 @@ class Update(QObject):
 
         self.setCurrentProgress.emit(1, 'Getting asset data')
 
-        self.__cancelCheck()
+        self.request = self.network.get(assetUrl)
+        self.request.finished.connect(self.__download_assets)
 
-        assetReply = self.network.get(QNetworkRequest(QUrl(assetUrl)))
-        assetReply.finished.connect(self.__download_assets)
-    
     def __download_assets(self) -> None:
 
-        self.__replyErrorCheck()
+        request = self.__finishRequest()
 
-        self.__cancelCheck()
+        if self.__cancelCheck() or self.__replyErrorCheck(request):
+            return
 
         logging.info('Fetching asset data complete')
 
-        reply: QNetworkReply = self.sender()
+        data: list[dict] = json.loads(request.readAll().data().decode())
+
+        assets = {x['name'] : x for x in data}
+
+        if self.fileName not in assets:
+            self.__fail(f'The latest release has no {self.fileName}')
+            return
+
+        self.downloadLink = assets[self.fileName]['browser_download_url']
+
+        # GitHub lists the digest of the assets, older releases publish a checksum file next to the archive
+        digest: str = assets[self.fileName].get('digest') or ''
+
+        if digest.startswith('sha256:'):
+            self.checksum = digest.removeprefix('sha256:').lower()
+            self.__startDownload()
+
+        elif f'{self.fileName}.sha256' in assets:
+            logging.info('Fetching the checksum of %s', self.fileName)
+
+            self.request = self.network.get(assets[f'{self.fileName}.sha256']['browser_download_url'], cached=False)
+            self.request.finished.connect(self.__checksum_fetch)
+
+        else:
+            self.__fail(f'The latest release has no checksum for {self.fileName}, it was not installed')
+
+    def __checksum_fetch(self) -> None:
+
+        request = self.__finishRequest()
+
+        if self.__cancelCheck() or self.__replyErrorCheck(request):
+            return
+
+        # sha256sum's format, the digest and the file name
+        self.checksum = request.readAll().data().decode().strip().split(' ')[0].lower()
+
+        self.__startDownload()
+
+    def __startDownload(self) -> None:
+        path = self.partPath()
+
+        self.file = open(path, 'r+b' if os.path.isfile(path) else 'wb')
+        self.file.seek(0, os.SEEK_END)
+
+        logging.info('Downloading update at %s, %s bytes are downloaded already', self.downloadLink, self.file.tell())
+
+        self.setCurrentProgress.emit(0, 'Downloading update')
+
+        # The archive isn't worth keeping in the API cache
+        self.request = self.network.get(self.downloadLink, cached=False, headers=self.__rangeHeader())
+        self.request.readyRead.connect(self.__writeChunk)
+        self.request.downloadProgress.connect(self.__downloadProgress)
+        self.request.retrying.connect(self.__resume)
+        self.request.finished.connect(self.__downloadFinished)
+
+    def __rangeHeader(self) -> dict[str, str]:
+        return {'Range' : f'bytes={self.file.tell()}-'} if self.file.tell() else {}
+
+    def __resume(self) -> None:
+        '''A retry continues after the bytes the failed attempt wrote'''
+
+        self.request.headers = self.__rangeHeader()
+
+    def __beginReply(self, reply: QNetworkReply) -> None:
+        '''Lines up the partial download with the body of a new reply'''
+
+        self.writing = reply
+        self.skip = False
+
+        status = reply.attribute(STATUS)
+        contentRange = reply.rawHeader(b'Content-Range').data().decode()
 
-        data: dict = json.loads(reply.readAll().data().decode())
+        if status == 206 and contentRange.startswith('bytes '):
+            self.offset = min(int(contentRange[6:].split('-')[0]), self.file.tell())
 
-        # Incase there are muiltiple assets create a for loop
-        downloadLink: str = None
+        elif status == 200:
+            # The server ignored the range, the whole archive is sent again
+            self.offset = 0
 
-        for asset in data:
-        
-            if asset['name'] == self.fileName:
-                
-                # Found the download link
-                downloadLink = asset['browser_download_url']
+        else:
+            self.skip = True
+            return
 
-                break
-        
-        if downloadLink is not None:
+        self.file.seek(self.offset)
+        self.file.truncate()
 
-            logging.info('Downloading update at %s', downloadLink)
+    def __writeChunk(self) -> None:
+        reply = self.request.reply
 
-            self.setCurrentProgress.emit(0, 'Downloading update')
+        if reply is not self.writing:
+            self.__beginReply(reply)
+
+        data = reply.readAll().data()
+
+        if not self.skip:
+            self.file.write(data)
+
+    def __downloadProgress(self, current: int, total: int) -> None:
+        if total >= 0:
+            self.downloading.emit(self.offset + current, self.offset + total)
+
+    def __downloadFinished(self) -> None:
+
+        if self.request.reply is not None and self.request.reply.bytesAvailable():
+            self.__writeChunk()
+
+        self.file.close()
+
+        request = self.__finishRequest()
+
+        # The part file is kept, the next update continues it
+        if self.__cancelCheck():
+            return
+
+        # Everything was downloaded by an earlier attempt
+        if request.reply is None or request.reply.attribute(STATUS) != 416:
+            if self.__replyErrorCheck(request):
+                return
+
+        self.__install_update()
 
-            updateReply = self.network.get(QNetworkRequest(QUrl(downloadLink)))
-            updateReply.downloadProgress.connect(lambda x, y: self.downloading.emit(x, y))
-            updateReply.finished.connect(self.__install_update)
-    
     def __install_update(self) -> None:
 
-        self.__replyErrorCheck()
+        logging.info('Download complete!\nVerifying %s', self.partPath())
 
-        self.__cancelCheck()
+        self.setCurrentProgress.emit(1, 'Verifying...')
 
-        reply: QNetworkReply = self.sender()
+        # Hashing and extracting the archive would freeze the window
+        threading.Thread(target=self.__extract, daemon=True).start()
 
-        downloadDir = os.path.join(self.tmp, self.fileName)
+    def __extract(self) -> None:
+        '''Verifies the archive and extracts the exe next to the old one, runs in its own thread'''
 
-        logging.info('Download complete!\nWriting update to computer to %s', downloadDir)
+        downloadDir = self.partPath()
 
-        self.setCurrentProgress.emit(1, 'Writing...')
+        try:
+            if hashFile(downloadDir) != self.checksum:
+                # A corrupted download would be continued by the next try otherwise
+                os.remove(downloadDir)
 
-        with open(downloadDir, 'wb') as f:
-            f.write(reply.readAll().data())
-        
-        logging.info('Unzipping')
+                self.extracted.emit(f'{self.fileName} does not match the checksum of the release, the update was not installed')
+                return
 
-        self.setCurrentProgress.emit(1, 'Unzipping...')
+            if self.cancel:
+                self.extracted.emit('')
+                return
 
-        self.__cancelCheck()
-        
-        shutil.unpack_archive(downloadDir, self.tmp)
+            logging.info('Extracting %s', self.exe)
 
-        if os.path.exists(os.path.join(ROOT_PATH, self.exe)):
+            self.setCurrentProgress.emit(1, 'Extracting...')
 
-            logging.info('Renaming old exe')
+            # Next to the old exe, so it can be renamed over it
+            extractFile(downloadDir, f'{self.folder}/{self.exe}', self.__newExe())
+
+        except (KeyError, OSError) as e:
+            self.extracted.emit(str(e))
+            return
+
+        self.extracted.emit('')
+
+    def __newExe(self) -> str:
+        return os.path.join(self.installPath, f'{self.exe}.new')
+
+    def __replace_exe(self, message: str) -> None:
+
+        if message:
+            self.__fail(message)
+            return
+
+        newExe = self.__newExe()
+
+        if self.__cancelCheck():
+            if os.path.exists(newExe):
+                os.remove(newExe)
+
+            return
+
+        exePath = os.path.join(self.installPath, self.exe)
 
-            self.__cancelCheck()
+        oldExe = os.path.join(self.installPath, OLD_EXE)
+
+        if os.path.exists(exePath):
+
+            logging.info('Renaming old exe')
 
             self.addTotalProgress.emit(1)
 
             self.setCurrentProgress.emit(1, 'Renaming old version...')
 
-            os.replace(self.exe, OLD_EXE)
+            # Windows won't replace a running exe, it can only be renamed
+            os.replace(exePath, oldExe)
 
         self.setCurrentProgress.emit(1, 'Moving new version...')
 
-        self.__cancelCheck()
+        logging.info('Moving new update to %s', self.installPath)
+
+        try:
+            os.replace(newExe, exePath)
+
+        except OSError as e:
+            if os.path.exists(oldExe):
+                os.replace(oldExe, exePath)
 
-        logging.info('Moving new update to %s', ROOT_PATH)
+            self.__fail(str(e))
+            return
 
-        shutil.move(os.path.join(self.tmp, self.folder, self.exe), ROOT_PATH)
+        os.remove(self.partPath())
 
         logging.info('Update complete!')
 
         self.succeeded.emit()
 
         self.deleteLater()
-    
-    def __cancelCheck(self):
+
+    def abort(self) -> None:
+        '''Cancels the update, a running download is dropped'''
+
+        self.cancel = True
+
+        if self.request is not None:
+            self.request.abort()
+
+    def __fail(self, message: str) -> None:
+        logging.error('An error occured updating Myth Mod Manager:\n%s', message)
+        self.error.emit(message)
+        self.deleteLater()
+
+    def __cancelCheck(self) -> bool:
+        '''Returns True if the update was canceled, the caller has to stop'''
 
         if self.cancel:
 
             self.doneCanceling.emit()
             self.deleteLater()
-    
-    def __replyErrorCheck(self):
-        reply: QNetworkReply = self.sender()
 
-        if reply.error() != QNetworkReply.NetworkError.NoError:
-            logging.error('An error occured updating Myth Mod Manager:\n%s', str(reply.error()))
-            self.error.emit(str(reply.error()))
-            self.deleteLater()
+        return self.cancel
+
+    def __finishRequest(self) -> NetworkRequest:
+        '''Returns the request that finished, it's deleted along with its reply once the slot returns'''
+
+        request = self.request
+        request.deleteLater()
+
+        self.request = None
+
+        return request
+
+    def __replyErrorCheck(self, request: NetworkRequest) -> bool:
+        '''Returns True if the request failed, the caller has to stop'''
+
+        if request.error() != QNetworkReply.NetworkError.NoError:
+            self.__fail(request.errorString())
+            return True
+
+        return False
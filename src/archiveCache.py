@@ -0,0 +1,168 @@
+import os
+import time
+import shutil
+import logging
+
+from src.JSONParser import JSONParser
+from src.contentStore import ContentStore, hashFile
+from src.cancelToken import CancelToken, copyFile
+from src.constant_vars import ModType, ARCHIVE_CACHE_PATH_DEFAULT, ARCHIVE_CACHE_INDEX, ARCHIVE_CACHE_SIZE_DEFAULT
+
+logging.getLogger(__name__)
+
+class ArchiveCache(JSONParser):
+    '''
+    Keeps a copy of every installed archive under the hash of its contents,
+    so mods can be installed again without finding the archive.
+
+    The manifests of the mods extracted from an archive are kept too, if every file is
+    still in the content store a reinstall links the files instead of extracting the archive.
+
+    The least recently used archives are removed once the cache is over its size budget.
+
+    Each entry in the index is keyed by the archive's hash:
+    + name : File name of the archive
+    + size : Size of the archive in bytes
+    + mtime : Modification time of the installed archive in nanoseconds
+    + source : Path, device and inode of the installed archive
+    + used : Last time the archive was installed
+    + type : The ModType it was installed as
+    + mods : Folders inside of the archive and their manifests
+    '''
+
+    def __init__(self, path: str = ARCHIVE_CACHE_PATH_DEFAULT, budget: int = ARCHIVE_CACHE_SIZE_DEFAULT * 1024 * 1024) -> None:
+        self.cachePath = path
+
+        # Bytes the cached archives can take up
+        self.budget = budget
+
+        os.makedirs(path, exist_ok=True)
+
+        super().__init__(os.path.join(path, ARCHIVE_CACHE_INDEX), default={})
+
+    def archivePath(self, digest: str) -> str | None:
+        '''Returns the path of a cached archive, or None if it isn't cached'''
+
+        entry = self.file.get(digest)
+
+        if entry is None:
+            return None
+
+        path = os.path.join(self.cachePath, digest, entry['name'])
+
+        return path if os.path.isfile(path) else None
+
+    def entries(self) -> list[tuple[str, dict]]:
+        '''Returns every cached archive and its entry, most recently used first'''
+        return sorted(self.file.items(), key=lambda x: x[1]['used'], reverse=True)
+
+    def size(self) -> int:
+        '''Bytes taken up by the cached archives'''
+        return sum(x['size'] for x in self.file.values())
+
+    def lookup(self, src: str, token: CancelToken | None = None) -> str | None:
+        '''
+        Returns the hash of an archive if it's cached, None otherwise.
+
+        Only archives of the same size can be cached. The same file that was hashed when it was installed
+        is found without reading it if its modification time didn't change, any other archive is hashed
+        '''
+
+        stat = os.stat(src)
+
+        sameSize = [x for x, y in self.file.items() if y['size'] == stat.st_size]
+
+        if not sameSize:
+            return None
+
+        source = [os.path.abspath(src), stat.st_dev, stat.st_ino]
+
+        # Another archive can have the same size and modification time
+        for digest in sameSize:
+            if self.file[digest].get('source') == source and self.file[digest].get('mtime') == stat.st_mtime_ns:
+                return digest
+
+        digest = hashFile(src, token)
+
+        return digest if digest in self.file else None
+
+    def get(self, digest: str) -> dict | None:
+        '''Returns an archive's entry and marks it as used'''
+
+        entry = self.file.get(digest)
+
+        if entry is not None:
+            entry['used'] = time.time()
+            self.saveJSON()
+
+        return entry
+
+    def deployable(self, digest: str, store: ContentStore) -> dict[str, dict[str, str]] | None:
+        '''
+        Returns the manifests of an archive's mods if every file is in the content store,
+        which means the mods can be installed without extracting the archive
+        '''
+
+        entry = self.file.get(digest)
+
+        if entry is None or not entry['mods'] or not all(entry['mods'].values()):
+            return None
+
+        for manifest in entry['mods'].values():
+            if not all(store.hasObject(x) for x in manifest.values()):
+                return None
+
+        return entry['mods']
+
+    def add(self, src: str, digest: str, modType: ModType, mods: dict[str, dict[str, str]], token: CancelToken | None = None) -> bool:
+        '''
+        Copies an installed archive into the cache along with the manifests of its mods.
+
+        Returns False if the archive is bigger than the whole budget
+        '''
+
+        size = os.path.getsize(src)
+
+        if size > self.budget:
+            logging.info('%s is bigger than the archive cache, not caching it', src)
+            return False
+
+        archivePath = os.path.join(self.cachePath, digest, os.path.basename(src))
+
+        if digest not in self.file or not os.path.isfile(archivePath):
+
+            os.makedirs(os.path.dirname(archivePath), exist_ok=True)
+
+            # Not a hardlink, overwriting the download in place would change the cached archive under its old hash
+            copyFile(src, archivePath, token)
+
+            logging.info('Cached %s as %s', src, digest)
+
+        stat = os.stat(src)
+
+        self.file[digest] = {'name' : os.path.basename(archivePath), 'size' : size, 'mtime' : stat.st_mtime_ns, 'source' : [os.path.abspath(src), stat.st_dev, stat.st_ino], 'used' : time.time(), 'type' : modType.value, 'mods' : mods}
+
+        self.evict(keep=digest)
+
+        self.saveJSON()
+
+        return True
+
+    def remove(self, digest: str) -> None:
+
+        self.file.pop(digest, None)
+
+        shutil.rmtree(os.path.join(self.cachePath, digest), ignore_errors=True)
+
+        logging.info('Removed %s from the archive cache', digest)
+
+    def evict(self, keep: str | None = None) -> None:
+        '''Removes the least recently used archives until the cache is within its budget'''
+
+        for digest, entry in reversed(self.entries()):
+
+            if self.size() <= self.budget:
+                break
+
+            if digest != keep:
+                self.remove(digest)
@@ -0,0 +1,353 @@
+import os
+import json
+import time
+import logging
+import zipfile
+from typing import Iterator
+
+from src.cancelToken import CancelToken, copyFileObj
+from src.contentStore import hashFile
+from src.constant_vars import ModType, BACKUP_FULL, BACKUP_MANIFEST
+
+logging.getLogger(__name__)
+
+# Folder of each ModType inside of a backup, the same layout as the game directory
+BACKUP_PREFIXES = {ModType.mods : 'mods', ModType.mods_override : 'assets/mod_overrides', ModType.maps : 'Maps'}
+
+# Path of every file and folder in a backup and its size, modification time and hash
+State = dict[str, dict]
+
+def modFolder(arcName: str) -> str:
+    '''Returns the folder of the mod that a path in a backup belongs to, e.g. `assets/mod_overrides/<mod>`'''
+
+    depth = 3 if arcName.startswith('assets/') else 2
+
+    return '/'.join(arcName.split('/')[:depth])
+
+def folderType(folder: str) -> ModType | None:
+    '''Returns the ModType of a mod's folder inside of a backup, e.g. `Maps/<mod>`'''
+
+    prefix, _, mod = folder.rpartition('/')
+
+    return {y : x for x, y in BACKUP_PREFIXES.items()}.get(prefix) if mod else None
+
+def modFolders(state: State) -> list[str]:
+    '''Returns the folder of every mod in a backup's state, e.g. `mods/<mod>`'''
+
+    folders = {modFolder(x.rstrip('/')) for x in state}
+
+    return sorted(x for x in folders if folderType(x) is not None)
+
+def walkSources(sources: list[tuple[str, str]]) -> Iterator[tuple[str, str, bool]]:
+    '''
+    Yields every file and folder of the mod folders, their path inside of the backup and if they're a file.
+
+    `sources` are mod folders and their folder inside of the backup, folders end with '/'
+    '''
+
+    for src, arcPath in sources:
+
+        yield arcPath + '/', src, False
+
+        for root, dirs, files in os.walk(src):
+
+            relRoot = os.path.relpath(root, src).replace(os.sep, '/')
+            arcRoot = arcPath if relRoot == '.' else f'{arcPath}/{relRoot}'
+
+            for dir in dirs:
+                yield f'{arcRoot}/{dir}/', os.path.join(root, dir), False
+
+            for file in files:
+                yield f'{arcRoot}/{file}', os.path.join(root, file), True
+
+def scanSources(sources: list[tuple[str, str]], previous: State | None = None, token: CancelToken | None = None) -> tuple[State, dict[str, str]]:
+    '''
+    Returns the state of the mod folders and where each of its files is on disk.
+
+    A file with the same size and modification time as in `previous` isn't hashed again
+    '''
+
+    previous = previous or {}
+
+    state: State = {}
+    paths: dict[str, str] = {}
+
+    for arcName, path, isFile in walkSources(sources):
+
+        if not isFile:
+            state[arcName] = {'size' : 0, 'mtime' : 0, 'hash' : ''}
+            continue
+
+        stat = os.stat(path)
+
+        old = previous.get(arcName)
+
+        if old is not None and old['size'] == stat.st_size and old['mtime'] == stat.st_mtime:
+            digest = old['hash']
+        else:
+            digest = hashFile(path, token)
+
+        state[arcName] = {'size' : stat.st_size, 'mtime' : stat.st_mtime, 'hash' : digest}
+        paths[arcName] = path
+
+    return state, paths
+
+def diffStates(base: State, current: State) -> tuple[list[str], list[str]]:
+    '''Returns the files and folders added or changed since `base` and the ones that were deleted'''
+
+    changed = [x for x, y in current.items() if x not in base or base[x]['hash'] != y['hash']]
+    deleted = [x for x in base if x not in current]
+
+    return changed, deleted
+
+def expiredBackups(backups: list[dict], keep: int = 0, maxAge: float = 0, now: float | None = None) -> list[str]:
+    '''
+    Returns the names of the backups a retention policy removes, oldest first.
+
+    Only the last `keep` backups are kept and the ones younger than `maxAge` seconds, 0 turns either off.
+    The newest backup is always kept, and so is every backup a kept backup is built on
+    '''
+
+    now = time.time() if now is None else now
+
+    backups = sorted(backups, key=lambda x: (x['created'], x['name']))
+
+    kept = backups[-keep:] if keep else backups
+
+    if maxAge:
+        kept = [x for x in kept if now - x['created'] < maxAge]
+
+    parents = {x['name'] : x.get('parent') for x in backups}
+
+    names: set[str] = set()
+
+    for backup in kept + backups[-1:]:
+
+        name = backup['name']
+
+        while name is not None and name not in names:
+            names.add(name)
+            name = parents.get(name)
+
+    return [x['name'] for x in backups if x['name'] not in names]
+
+class BackupChain():
+    '''
+    Folder of full, incremental and differential backups.
+
+    Every backup is a zip with a manifest next to it and inside of it, the manifest has:
+    + kind : full, incremental or differential
+    + parent : Name of the backup this one builds on, None for full backups
+    + created : Time the backup was made
+    + state : Every file and folder that existed when the backup was made
+    + added : Files and folders stored in this backup's zip
+    + deleted : Files and folders that were removed since its parent
+    + mods : MOD_CONFIG entry of every backed up mod
+    '''
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        os.makedirs(path, exist_ok=True)
+
+    def zipPath(self, name: str) -> str:
+        return os.path.join(self.path, f'{name}.zip')
+
+    def manifestPath(self, name: str) -> str:
+        return os.path.join(self.path, f'{name}.json')
+
+    def backups(self) -> list[dict]:
+        '''Returns the manifests of every backup with its zip, oldest first'''
+
+        manifests: list[dict] = []
+
+        for file in os.listdir(self.path):
+
+            name, extension = os.path.splitext(file)
+
+            if extension != '.json' or not os.path.isfile(self.zipPath(name)):
+                continue
+
+            try:
+                with open(os.path.join(self.path, file), 'r') as f:
+                    manifest = json.load(f)
+
+            except (OSError, ValueError) as e:
+                logging.warning('Could not read the backup manifest %s:\n%s', file, str(e))
+                continue
+
+            manifest['name'] = name
+
+            manifests.append(manifest)
+
+        return sorted(manifests, key=lambda x: (x['created'], x['name']))
+
+    def get(self, name: str) -> dict | None:
+        return next((x for x in self.backups() if x['name'] == name), None)
+
+    def restorable(self) -> list[dict]:
+        '''Returns the manifests of the backups whose chain is complete, oldest first'''
+
+        manifests = self.backups()
+        names = {x['name'] : x['parent'] for x in manifests}
+
+        def complete(name: str | None) -> bool:
+            while name is not None:
+                if name not in names:
+                    return False
+                name = names[name]
+            return True
+
+        return [x for x in manifests if complete(x['name'])]
+
+    def latest(self, kind: str | None = None) -> dict | None:
+        '''Returns the newest backup whose chain is complete, only of the given kind if there is one'''
+
+        for manifest in reversed(self.backups()):
+
+            if kind is not None and manifest['kind'] != kind:
+                continue
+
+            if self.chain(manifest['name']) is not None:
+                return manifest
+
+        return None
+
+    def chain(self, name: str) -> list[dict] | None:
+        '''
+        Returns the backups needed to restore `name`, starting with its full backup.
+
+        Returns None if one of them is missing
+        '''
+
+        manifests = {x['name'] : x for x in self.backups()}
+
+        chain: list[dict] = []
+
+        while name is not None:
+
+            manifest = manifests.get(name)
+
+            if manifest is None:
+                return None
+
+            chain.append(manifest)
+
+            name = manifest['parent']
+
+        return chain[::-1]
+
+    def mods(self, name: str) -> list[str]:
+        '''Returns the folder of every mod in a backup, e.g. `mods/<mod>`'''
+
+        manifest = self.get(name)
+
+        return [] if manifest is None else modFolders(manifest['state'])
+
+    def metadata(self, name: str) -> dict[str, dict | None]:
+        '''Returns the MOD_CONFIG entries of the mods in a backup, read from the manifest inside of its zip'''
+
+        with zipfile.ZipFile(self.zipPath(name)) as zf:
+            return json.loads(zf.read(BACKUP_MANIFEST)).get('mods', {})
+
+    def newName(self, kind: str) -> str:
+
+        name = f'{time.strftime("%Y%m%d-%H%M%S")}-{kind}'
+
+        # Two backups in the same second
+        i = 1
+        while os.path.exists(self.zipPath(name)) or os.path.exists(self.manifestPath(name)):
+            name = f'{time.strftime("%Y%m%d-%H%M%S")}-{kind}-{i}'
+            i += 1
+
+        return name
+
+    def newManifest(self, kind: str, parent: dict | None, state: State) -> dict:
+        '''Returns the manifest of a new backup of `state`, full if there's no parent'''
+
+        if parent is None or kind == BACKUP_FULL:
+            added, deleted = list(state), []
+            kind, parentName = BACKUP_FULL, None
+
+        else:
+            added, deleted = diffStates(parent['state'], state)
+            parentName = parent['name']
+
+        return {'kind' : kind, 'parent' : parentName, 'created' : time.time(), 'state' : state, 'added' : added, 'deleted' : deleted}
+
+    def saveManifest(self, name: str, manifest: dict) -> None:
+        '''Writes the manifest next to its zip, once the zip is complete'''
+
+        with open(self.manifestPath(name), 'w') as f:
+            json.dump({x : y for x, y in manifest.items() if x != 'name'}, f)
+
+    def remove(self, name: str) -> None:
+
+        for path in (self.manifestPath(name), self.zipPath(name)):
+            if os.path.exists(path):
+                os.remove(path)
+
+        logging.info('Removed the backup %s', name)
+
+    def restore(self, name: str, dest: str, token: CancelToken | None = None, paths: list[str] | None = None) -> list[str]:
+        '''
+        Restores the state of a backup into `dest`, each file is read from the newest backup of the chain that has it.
+
+        `paths` only restores the files and folders that start with one of them.
+        Returns the files and folders that were restored
+        '''
+
+        chain = self.chain(name)
+
+        if chain is None:
+            raise FileNotFoundError(f'A backup needed to restore {name} is missing')
+
+        state: State = chain[-1]['state']
+
+        wanted = [x for x in state if paths is None or any(x.startswith(y) for y in paths)]
+
+        # Newest backup that stored each file
+        sources: dict[str, str] = {}
+
+        for manifest in chain:
+            for arcName in manifest['added']:
+                sources[arcName] = manifest['name']
+
+        restored: list[str] = []
+
+        for manifest in chain:
+
+            members = [x for x in wanted if sources.get(x) == manifest['name']]
+
+            if not members:
+                continue
+
+            with zipfile.ZipFile(self.zipPath(manifest['name'])) as zf:
+
+                for arcName in members:
+
+                    if token is not None:
+                        token.check()
+
+                    target = os.path.realpath(os.path.join(dest, *arcName.rstrip('/').split('/')))
+
+                    if not target.startswith(os.path.realpath(dest) + os.sep):
+                        logging.warning('Skipping %s, it points outside of the destination', arcName)
+                        continue
+
+                    if arcName.endswith('/'):
+                        os.makedirs(target, exist_ok=True)
+
+                    else:
+                        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+                        with zf.open(arcName) as fsrc, open(target, 'wb') as fdst:
+                            copyFileObj(fsrc, fdst, token)
+
+                        os.utime(target, (state[arcName]['mtime'], state[arcName]['mtime']))
+
+                    restored.append(arcName)
+
+        logging.info('Restored %s files and folders of %s to %s', len(restored), name, dest)
+
+        return restored
@@ -0,0 +1,450 @@
+import os
+import sys
+import json
+import time
+import zlib
+import random
+import hashlib
+import logging
+import zipfile
+from typing import BinaryIO, Callable, Iterator, Sequence
+
+if sys.platform.startswith('win'):
+    import msvcrt
+else:
+    import fcntl
+
+from src.cancelToken import CancelToken
+from src.backupChain import State, walkSources, modFolders
+from src.parallelZip import compressType, STORE_RATIO
+
+logging.getLogger(__name__)
+
+# Chunks are cut where the content allows it, between these sizes
+CHUNK_MIN = 256 * 1024
+CHUNK_MAX = 4 * 1024 * 1024
+
+# A chunk ends after a run of this many bytes that are all marked by CUT_TABLE, every byte value is marked or not.
+# The cut only depends on the bytes before it, so inserting data into a file only changes the chunks around it.
+# With half of the byte values marked, a run shows up about every 512 KiB of random data such as textures
+CUT_RUN = 18
+CUT_MARK = b'\x01' * CUT_RUN
+
+# Seeded, the same data has to be cut the same way every time
+_values = list(range(256))
+random.Random(0x4d4d4d).shuffle(_values)
+CUT_TABLE = bytes(1 if x < 128 else 0 for x in _values)
+
+# First byte of a stored chunk
+CHUNK_STORED = b'\x00'
+CHUNK_DEFLATED = b'\x01'
+
+# File the repository is locked with, and seconds between tries to lock it
+REPOSITORY_LOCK = 'lock'
+LOCK_POLL = 0.5
+
+def splitChunks(f: BinaryIO, token: CancelToken | None = None) -> Iterator[bytes]:
+    '''
+    Yields a file's content in content-defined chunks.
+
+    The bytes are marked with `bytes.translate()` and the cut is found with `bytes.find()`,
+    both run in C so chunking is about as fast as reading the file
+    '''
+
+    data = b''
+    marks = b''
+
+    while True:
+
+        read = b''
+
+        if len(data) < CHUNK_MAX:
+            read = f.read(CHUNK_MAX)
+
+            data += read
+            marks += read.translate(CUT_TABLE)
+
+        if not data:
+            return
+
+        if token is not None:
+            token.check(len(read))
+
+        cut = marks.find(CUT_MARK, CHUNK_MIN - CUT_RUN, CHUNK_MAX)
+
+        size = CHUNK_MAX if cut == -1 else cut + CUT_RUN
+
+        yield data[:size]
+
+        data, marks = data[size:], marks[size:]
+
+class RepositoryLock():
+    '''
+    Lock on a backup repository, a backup holds it from its first chunk until its snapshot is saved
+    and `prune()` holds it while it removes chunks. Without it a chunk a running backup stored or reused
+    could be pruned before its snapshot is saved.
+
+    The lock is taken on a file, so the system lets go of it if the program closes or crashes
+    '''
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file: BinaryIO | None = None
+
+    def acquire(self, token: CancelToken | None = None, blocking: bool = True) -> bool:
+        '''Waits until the repository is locked, returns False right away if it's locked already and `blocking` is off'''
+
+        self.file = open(self.path, 'a+b')
+
+        while True:
+
+            try:
+                self.file.seek(0)
+
+                if sys.platform.startswith('win'):
+                    msvcrt.locking(self.file.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    fcntl.flock(self.file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+                return True
+
+            except OSError:
+                if not blocking:
+                    self.file.close()
+                    self.file = None
+                    return False
+
+            try:
+                if token is not None:
+                    token.check()
+
+            except BaseException:
+                self.file.close()
+                self.file = None
+                raise
+
+            time.sleep(LOCK_POLL)
+
+    def release(self) -> None:
+
+        if self.file is None:
+            return
+
+        self.file.seek(0)
+
+        if sys.platform.startswith('win'):
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+
+        self.file.close()
+        self.file = None
+
+    def __enter__(self) -> 'RepositoryLock':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
+
+class BackupRepository():
+    '''
+    Backups made of deduplicated chunks.
+
+    Files are split into content-defined chunks that are stored once under their hash,
+    no matter how many mods or snapshots have them. Each snapshot is a small index of the
+    files of every mod and their chunks, so dozens of snapshots take up little more than one.
+
+    A snapshot has:
+    + kind : Always snapshot
+    + created : Time the snapshot was made
+    + state : Every file and folder, a file has its size, modification time and chunks
+    + mods : MOD_CONFIG entry of every backed up mod
+    '''
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.chunks = os.path.join(path, 'chunks')
+        self.snapshotDir = os.path.join(path, 'snapshots')
+
+        os.makedirs(self.chunks, exist_ok=True)
+        os.makedirs(self.snapshotDir, exist_ok=True)
+
+    def chunkPath(self, digest: str) -> str:
+        return os.path.join(self.chunks, digest[:2], digest)
+
+    def snapshotPath(self, name: str) -> str:
+        return os.path.join(self.snapshotDir, f'{name}.json')
+
+    def lock(self, token: CancelToken | None = None) -> RepositoryLock:
+        '''Waits for the repository's lock, add chunks and save the snapshot that uses them while holding it'''
+
+        lock = RepositoryLock(os.path.join(self.path, REPOSITORY_LOCK))
+        lock.acquire(token)
+
+        return lock
+
+    def snapshots(self) -> list[dict]:
+        '''Returns every snapshot, oldest first'''
+
+        snapshots: list[dict] = []
+
+        for file in os.listdir(self.snapshotDir):
+
+            name, extension = os.path.splitext(file)
+
+            if extension != '.json':
+                continue
+
+            try:
+                with open(os.path.join(self.snapshotDir, file), 'r') as f:
+                    snapshot = json.load(f)
+
+            except (OSError, ValueError) as e:
+                logging.warning('Could not read the snapshot %s:\n%s', file, str(e))
+                continue
+
+            snapshot['name'] = name
+
+            snapshots.append(snapshot)
+
+        return sorted(snapshots, key=lambda x: (x['created'], x['name']))
+
+    def restorable(self) -> list[dict]:
+        return self.snapshots()
+
+    def get(self, name: str) -> dict | None:
+        return next((x for x in self.snapshots() if x['name'] == name), None)
+
+    def latest(self) -> dict | None:
+        snapshots = self.snapshots()
+        return snapshots[-1] if snapshots else None
+
+    def mods(self, name: str) -> list[str]:
+        '''Returns the folder of every mod in a snapshot, e.g. `mods/<mod>`'''
+
+        snapshot = self.get(name)
+
+        return [] if snapshot is None else modFolders(snapshot['state'])
+
+    def metadata(self, name: str) -> dict[str, dict | None]:
+        '''Returns the MOD_CONFIG entries of the mods in a snapshot'''
+
+        snapshot = self.get(name)
+
+        return {} if snapshot is None else snapshot.get('mods', {})
+
+    def size(self) -> int:
+        '''Returns the size of every stored chunk in bytes'''
+
+        return sum(os.path.getsize(os.path.join(root, x)) for root, _, files in os.walk(self.chunks) for x in files)
+
+    def addChunk(self, chunk: bytes, compress: bool, level: int) -> str:
+        '''Stores a chunk if it isn't stored yet and returns its hash'''
+
+        digest = hashlib.sha256(chunk).hexdigest()
+
+        chunkPath = self.chunkPath(digest)
+
+        if os.path.isfile(chunkPath):
+            return digest
+
+        data = CHUNK_STORED + chunk
+
+        if compress:
+            deflated = zlib.compress(chunk, level)
+
+            if len(deflated) < len(chunk) * STORE_RATIO:
+                data = CHUNK_DEFLATED + deflated
+
+        os.makedirs(os.path.dirname(chunkPath), exist_ok=True)
+
+        # Renamed once it's complete, a chunk that exists is never partial
+        with open(f'{chunkPath}.tmp', 'wb') as f:
+            f.write(data)
+
+        os.replace(f'{chunkPath}.tmp', chunkPath)
+
+        return digest
+
+    def readChunk(self, digest: str) -> bytes:
+
+        with open(self.chunkPath(digest), 'rb') as f:
+            data = f.read()
+
+        chunk = zlib.decompress(data[1:]) if data[:1] == CHUNK_DEFLATED else data[1:]
+
+        if hashlib.sha256(chunk).hexdigest() != digest:
+            raise OSError(f'The chunk {digest} is damaged')
+
+        return chunk
+
+    def addSources(self, sources: list[tuple[str, str]], previous: State | None = None, token: CancelToken | None = None, report: Callable[[str], None] | None = None, level: int = zlib.Z_DEFAULT_COMPRESSION, stored: Sequence[str] = ()) -> State:
+        '''
+        Stores the chunks of every file of the mod folders and returns their state.
+
+        A file with the same size and modification time as in `previous` reuses its chunks without being read.
+        Files that `compressType()` would store in a zip are stored uncompressed here as well.
+        `report` is called with each file and folder's path in the backup
+        '''
+
+        previous = previous or {}
+
+        state: State = {}
+
+        for arcName, path, isFile in walkSources(sources):
+
+            if report is not None:
+                report(arcName)
+
+            if not isFile:
+                state[arcName] = {'size' : 0, 'mtime' : 0, 'chunks' : []}
+                continue
+
+            if token is not None:
+                token.check()
+
+            stat = os.stat(path)
+
+            old = previous.get(arcName)
+
+            if old is not None and old['size'] == stat.st_size and old['mtime'] == stat.st_mtime:
+                chunks = old['chunks']
+
+            else:
+                compress = compressType(path, stored) == zipfile.ZIP_DEFLATED
+
+                with open(path, 'rb') as f:
+                    chunks = [self.addChunk(x, compress, level) for x in splitChunks(f, token)]
+
+            state[arcName] = {'size' : stat.st_size, 'mtime' : stat.st_mtime, 'chunks' : chunks}
+
+        return state
+
+    def newName(self) -> str:
+
+        name = f'{time.strftime("%Y%m%d-%H%M%S")}-snapshot'
+
+        # Two snapshots in the same second
+        i = 1
+        while os.path.exists(self.snapshotPath(name)):
+            name = f'{time.strftime("%Y%m%d-%H%M%S")}-snapshot-{i}'
+            i += 1
+
+        return name
+
+    def saveSnapshot(self, name: str, state: State, mods: dict[str, dict | None]) -> dict:
+        '''Writes a snapshot's index once all of its chunks are stored'''
+
+        snapshot = {'kind' : 'snapshot', 'created' : time.time(), 'state' : state, 'mods' : mods}
+
+        with open(f'{self.snapshotPath(name)}.tmp', 'w') as f:
+            json.dump(snapshot, f)
+
+        os.replace(f'{self.snapshotPath(name)}.tmp', self.snapshotPath(name))
+
+        logging.info('Saved the snapshot %s with %s files and folders', name, len(state))
+
+        return snapshot
+
+    def remove(self, name: str) -> None:
+        '''Removes a snapshot's index, its chunks are removed by `prune()`'''
+
+        if os.path.exists(self.snapshotPath(name)):
+            os.remove(self.snapshotPath(name))
+
+        logging.info('Removed the snapshot %s', name)
+
+    def prune(self, token: CancelToken | None = None) -> int:
+        '''
+        Removes the chunks that no snapshot uses, including ones left behind by a canceled backup.
+
+        Nothing is removed while a backup holds the lock, its chunks aren't in a snapshot yet.
+        Returns the amount of bytes freed
+        '''
+
+        lock = RepositoryLock(os.path.join(self.path, REPOSITORY_LOCK))
+
+        if not lock.acquire(blocking=False):
+            logging.info('A backup is adding to %s, its unused chunks are pruned next time', self.path)
+            return 0
+
+        with lock:
+            return self.__prune(token)
+
+    def __prune(self, token: CancelToken | None) -> int:
+
+        used = {y for x in self.snapshots() for entry in x['state'].values() for y in entry['chunks']}
+
+        freed = 0
+
+        for root, dirs, files in os.walk(self.chunks):
+            for file in files:
+
+                if token is not None:
+                    token.check()
+
+                if file in used:
+                    continue
+
+                chunkPath = os.path.join(root, file)
+
+                freed += os.path.getsize(chunkPath)
+
+                os.remove(chunkPath)
+
+        logging.info('Pruned %s bytes from the backup repository %s', freed, self.path)
+
+        return freed
+
+    def restore(self, name: str, dest: str, token: CancelToken | None = None, paths: list[str] | None = None) -> list[str]:
+        '''
+        Restores a snapshot into `dest`.
+
+        `paths` only restores the files and folders that start with one of them.
+        Returns the files and folders that were restored
+        '''
+
+        snapshot = self.get(name)
+
+        if snapshot is None:
+            raise FileNotFoundError(f'The snapshot {name} does not exist')
+
+        state: State = snapshot['state']
+
+        restored: list[str] = []
+
+        for arcName, entry in state.items():
+
+            if paths is not None and not any(arcName.startswith(x) for x in paths):
+                continue
+
+            if token is not None:
+                token.check()
+
+            target = os.path.realpath(os.path.join(dest, *arcName.rstrip('/').split('/')))
+
+            if not target.startswith(os.path.realpath(dest) + os.sep):
+                logging.warning('Skipping %s, it points outside of the destination', arcName)
+                continue
+
+            if arcName.endswith('/'):
+                os.makedirs(target, exist_ok=True)
+
+            else:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+
+                with open(target, 'wb') as f:
+                    for digest in entry['chunks']:
+
+                        if token is not None:
+                            token.check()
+
+                        f.write(self.readChunk(digest))
+
+                os.utime(target, (entry['mtime'], entry['mtime']))
+
+            restored.append(arcName)
+
+        logging.info('Restored %s files and folders of %s to %s', len(restored), name, dest)
+
+        return restored
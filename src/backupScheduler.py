@@ -0,0 +1,105 @@
+import os
+import time
+import logging
+
+from PySide6.QtCore import QObject, QTimer
+
+from src.threaded.backupMods import BackupMods
+from src.backupChain import BackupChain
+from src.backupRepository import BackupRepository
+from src.save import OptionsManager
+
+from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, BACKUP_REPOSITORY, BACKUP_SCHEDULE_STARTUP, BACKUP_SCHEDULE_DAILY, BACKUP_DAILY
+
+logging.getLogger(__name__)
+
+# Milliseconds between checks if the daily backup is due
+BACKUP_CHECK_INTERVAL = 60 * 60 * 1000
+
+class BackupScheduler(QObject):
+    '''
+    Backs up the mods in the background depending on the backup schedule option,
+    once on startup or whenever the last backup is a day old.
+
+    Backups before applying a profile are made by `modProfile`, the profile waits for them.
+    A scheduled backup is canceled by any backup the user starts, see `BackupMods.waitForBackups()`
+    '''
+
+    def __init__(self, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG, backupPath: str = BackupMods.backupPath) -> None:
+        super().__init__()
+
+        self.optionsPath = optionsPath
+        self.savePath = savePath
+        self.backupPath = backupPath
+
+        self.optionsManager = OptionsManager(optionsPath)
+
+        self.worker: BackupMods | None = None
+
+        # Time the last scheduled backup was started, a backup where nothing changed isn't saved
+        self.lastRun = 0.0
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(BACKUP_CHECK_INTERVAL)
+        self.timer.timeout.connect(self.checkDaily)
+
+    def startup(self) -> None:
+        schedule = self.optionsManager.getBackupSchedule()
+
+        if schedule == BACKUP_SCHEDULE_STARTUP or self.due():
+            self.startBackup()
+
+        self.timer.start()
+
+    def lastBackup(self) -> float:
+        '''Returns the time the newest zip backup or snapshot was made, 0 without backups'''
+
+        latest = [BackupChain(self.backupPath).latest()]
+
+        if os.path.isdir(os.path.join(self.backupPath, BACKUP_REPOSITORY)):
+            latest.append(BackupRepository(os.path.join(self.backupPath, BACKUP_REPOSITORY)).latest())
+
+        return max((x['created'] for x in latest if x is not None), default=0.0)
+
+    def due(self, now: float | None = None) -> bool:
+        '''Checks if the daily backup should be made'''
+
+        if self.optionsManager.getBackupSchedule() != BACKUP_SCHEDULE_DAILY:
+            return False
+
+        now = time.time() if now is None else now
+
+        return now - max(self.lastRun, self.lastBackup()) >= BACKUP_DAILY
+
+    def checkDaily(self) -> None:
+        if self.due():
+            self.startBackup()
+
+    def running(self) -> bool:
+        return self.worker is not None and self.worker.qthread is not None and self.worker.qthread.isRunning()
+
+    def startBackup(self) -> None:
+        '''Starts a throttled backup in a low priority thread, unless one is running already'''
+
+        if self.running():
+            return
+
+        logging.info('Starting a scheduled backup')
+
+        self.lastRun = time.time()
+
+        self.worker = BackupMods(background=True, optionsPath=self.optionsPath, savePath=self.savePath)
+        self.worker.backupPath = self.backupPath
+
+        self.worker.error.connect(lambda x: logging.error('The scheduled backup failed:\n%s', x))
+        self.worker.succeeded.connect(lambda: logging.info('The scheduled backup is done'))
+
+        self.worker.startInBackground()
+
+    def stop(self) -> None:
+        '''Stops the timer and cancels a running backup, a canceled backup leaves the previous ones as they were'''
+
+        self.timer.stop()
+
+        if self.worker is not None:
+            self.worker.stopBackground()
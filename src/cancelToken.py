@@ -0,0 +1,200 @@
+import os
+import time
+import shutil
+import logging
+import threading
+from typing import BinaryIO, Callable
+
+logging.getLogger(__name__)
+
+# Small enough that a canceled copy stops well within a second on slow drives
+CHUNK_SIZE = 1024 * 1024
+
+# Seconds a throttled task sleeps at once, so it still stops quickly once canceled
+THROTTLE_SLEEP = 0.25
+
+# Seconds between checks if a throttled task has to pause
+PAUSE_INTERVAL = 5
+
+class Canceled(Exception):
+    '''Raised at a checkpoint once a task was canceled'''
+
+class CancelToken():
+    '''
+    Thread safe flag that is shared by a task and everything it calls.
+
+    Long operations call `check()` between chunks or files,
+    which raises `Canceled` so the operation stops where it is.
+
+    Passing a `multiprocessing` event shares the token with other processes
+    '''
+
+    def __init__(self, event = None) -> None:
+        self.__event = threading.Event() if event is None else event
+
+    def cancel(self) -> None:
+        self.__event.set()
+
+    def isCanceled(self) -> bool:
+        return self.__event.is_set()
+
+    def check(self, size: int = 0) -> None:
+        '''`size` is the amount of bytes read since the last check, used by `ThrottledToken`'''
+
+        if self.__event.is_set():
+            raise Canceled()
+
+class ThrottledToken(CancelToken):
+    '''
+    Token of a background task that shouldn't get in the way.
+
+    `check()` sleeps long enough that the bytes passed to it stay under `bandwidth` bytes per second,
+    and waits as long as `paused()` returns True. Both still raise `Canceled` within a moment
+    '''
+
+    def __init__(self, bandwidth: int = 0, paused: Callable[[], bool] | None = None, event = None) -> None:
+        super().__init__(event)
+
+        self.bandwidth = bandwidth
+        self.paused = paused
+
+        # Time the bytes read so far are allowed to be done by, shared by every thread of the task
+        self.ready = time.monotonic()
+        self.lastPauseCheck = 0.0
+
+        self.lock = threading.Lock()
+
+    def check(self, size: int = 0) -> None:
+        super().check()
+
+        self.waitWhilePaused()
+
+        if not self.bandwidth or not size:
+            return
+
+        with self.lock:
+            now = time.monotonic()
+
+            # Time spent idle doesn't add up to a burst later on
+            self.ready = max(self.ready, now) + size / self.bandwidth
+
+            delay = self.ready - now
+
+        self.sleep(delay)
+
+    def waitWhilePaused(self) -> None:
+
+        if self.paused is None:
+            return
+
+        with self.lock:
+            # Checking can be slow, e.g. listing every process
+            if time.monotonic() - self.lastPauseCheck < PAUSE_INTERVAL:
+                return
+
+            self.lastPauseCheck = time.monotonic()
+
+        if not self.paused():
+            return
+
+        logging.info('Pausing until the task can continue')
+
+        while self.paused():
+            self.sleep(PAUSE_INTERVAL)
+
+        logging.info('Continuing the paused task')
+
+        with self.lock:
+            self.ready = time.monotonic()
+            self.lastPauseCheck = self.ready
+
+    def sleep(self, seconds: float) -> None:
+        '''`time.sleep()` that stops once the task was canceled'''
+
+        end = time.monotonic() + seconds
+
+        while (left := end - time.monotonic()) > 0:
+            super().check()
+            time.sleep(min(left, THROTTLE_SLEEP))
+
+        super().check()
+
+def copyFileObj(fsrc: BinaryIO, fdst: BinaryIO, token: CancelToken | None = None, chunkSize: int = CHUNK_SIZE) -> None:
+    '''`shutil.copyfileobj()` that checks the token between chunks'''
+
+    while chunk := fsrc.read(chunkSize):
+
+        if token is not None:
+            token.check(len(chunk))
+
+        fdst.write(chunk)
+
+def copyFile(src: str, dest: str, token: CancelToken | None = None) -> str:
+    '''
+    `shutil.copy2()` that can be canceled in the middle of a file,
+    a partially copied file is removed before `Canceled` is raised
+    '''
+
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, os.path.basename(src))
+
+    try:
+        with open(src, 'rb') as fsrc, open(dest, 'wb') as fdst:
+            copyFileObj(fsrc, fdst, token)
+
+    except Canceled:
+        os.remove(dest)
+        raise
+
+    shutil.copystat(src, dest)
+
+    return dest
+
+def copyTree(src: str, dest: str, token: CancelToken | None = None) -> str:
+    '''
+    `shutil.copytree()` that can be canceled in the middle of a file,
+    the partial destination is removed before `Canceled` is raised
+    '''
+
+    try:
+        return shutil.copytree(src, dest, copy_function=lambda x, y: copyFile(x, y, token))
+
+    except Canceled:
+        logging.info('Copying %s was canceled, removing %s', src, dest)
+        shutil.rmtree(dest, ignore_errors=True)
+        raise
+
+def removeTree(path: str, token: CancelToken | None = None, onerror = None) -> None:
+    '''
+    `shutil.rmtree()` that checks the token between files.
+
+    Whatever was not removed yet is left as it is when `Canceled` is raised
+    '''
+
+    for root, dirs, files in os.walk(path, topdown=False):
+
+        for file in files:
+
+            if token is not None:
+                token.check()
+
+            filePath = os.path.join(root, file)
+
+            try:
+                os.remove(filePath)
+            except OSError:
+                if onerror is None:
+                    raise
+                onerror(os.remove, filePath, None)
+
+        for dir in dirs:
+
+            dirPath = os.path.join(root, dir)
+
+            # Links to directories are listed as directories by os.walk()
+            if os.path.islink(dirPath):
+                os.unlink(dirPath)
+            else:
+                os.rmdir(dirPath)
+
+    os.rmdir(path)
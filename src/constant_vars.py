@@ -37,6 +37,19 @@ class OptionKeys(StrEnum):
     windowsize_h     = auto()
     mmm_update_alert = auto()
     lang             = auto()
+    symlink_mods     = auto()
+    content_store    = auto()
+    archive_cache    = auto()
+    archive_cache_size = auto()
+    backup_mode      = auto()
+    backup_compression = auto()
+    backup_format    = auto()
+    stored_extensions = auto()
+    backup_schedule  = auto()
+    backup_bandwidth = auto()
+    backup_keep      = auto()
+    backup_max_age   = auto()
+    download_bandwidth = auto()
 
     def all_keys() -> list[str]:
         # Splice removes section key
@@ -72,6 +85,16 @@ START_PAYDAY = 'runGame.bat'
 OLD_EXE = 'Myth Mod Manager.exe (Old)' if sys.platform.startswith('win') else 'Myth Mod Manager (old)'
 DISABLED_MODS = 'disabled-mods'
 BACKUP_MODS = 'backup mods'
+BACKUP_MANIFEST = 'mmm-backup.json'
+BACKUP_REPOSITORY = 'repository'
+CONTENT_STORE = 'content-store'
+ARCHIVE_CACHE = 'archive-cache'
+ARCHIVE_CACHE_INDEX = 'index.json'
+HTTP_CACHE = 'http-cache'
+DOWNLOADS = 'mmm-downloads'
+TRASH = 'mmm-trash'
+STAGING = 'mmm-staging'
+TRASH_ENTRY = 'entry.json'
 LOG = 'log.txt'
 
 # Graphics names
@@ -81,6 +104,51 @@ GITHUB_LOGO_W = 'github-mark-white.svg'
 GITHUB_LOGO_B = 'github-mark.svg'
 KOFI_LOGO_B = 'kofi_s_logo_nolabel.webp'
 
+# Backup modes, incremental backups store what changed since the last backup
+# and differential backups what changed since the last full backup
+BACKUP_FULL = 'full'
+BACKUP_INCREMENTAL = 'incremental'
+BACKUP_DIFFERENTIAL = 'differential'
+
+# Backups are zips or snapshots in a deduplicated repository
+BACKUP_FORMAT_ZIP = 'zip'
+BACKUP_FORMAT_REPOSITORY = 'repository'
+
+# When backups are made without clicking Backup Mods
+BACKUP_SCHEDULE_OFF = 'off'
+BACKUP_SCHEDULE_STARTUP = 'startup'
+BACKUP_SCHEDULE_DAILY = 'daily'
+BACKUP_SCHEDULE_PROFILE = 'profile'
+
+# Seconds between daily backups
+BACKUP_DAILY = 60 * 60 * 24
+
+# Backups the retention keeps unless the user picks another amount, 0 would keep every backup forever
+BACKUP_KEEP_DEFAULT = 3
+
+# Compression of backups and the zlib level each one uses
+COMPRESSION_FAST = 'fast'
+COMPRESSION_BALANCED = 'balanced'
+COMPRESSION_SMALL = 'small'
+
+COMPRESSION_LEVELS = {COMPRESSION_FAST : 1, COMPRESSION_BALANCED : 6, COMPRESSION_SMALL : 9}
+
+# Files that are compressed already, deflating them costs time and saves next to nothing
+STORED_EXTENSIONS_DEFAULT = ('.bank', '.movie', '.texture', '.dds', '.ogg', '.png', '.jpg', '.zip', '.rar', '.7z')
+
+# Executables of the game, scheduled backups wait while one of them is running
+GAME_EXECUTABLES = ('payday2_win32_release.exe', 'payday2_release')
+
+# GitHub's API for Myth Mod Manager's releases
+GITHUB_RELEASES_API = 'https://api.github.com/repos/Wolfmyths/Myth-Mod-Manager/releases'
+
+# modworkshop's API
+MODWORKSHOP_API = 'https://api.modworkshop.net'
+
+# Parts a mod download is split in, each is downloaded at the same time, and the smallest part in bytes
+DOWNLOAD_SEGMENTS = 4
+DOWNLOAD_SEGMENT_MIN = 1024 * 1024
+
 # Files in PAYDAY2/Mods/ to ignore
 MODSIGNORE = ('base', 'logs', 'saves', 'downloads')
 
@@ -91,6 +159,38 @@ DATA_MOD = (0, ProfileRole.type, 'mod') # Used to label an item as a mod
 # Default Disabled Folder
 MODS_DISABLED_PATH_DEFAULT = os.path.join(os.path.abspath(ROOT_PATH), DISABLED_MODS)
 
+# Seconds a deleted mod stays in the trash before it gets purged on startup
+TRASH_EXPIRE = 60 * 60 * 24
+
+# Default Content Store Folder
+CONTENT_STORE_PATH_DEFAULT = os.path.join(os.path.abspath(ROOT_PATH), CONTENT_STORE)
+
+# Default Archive Cache Folder and its size budget in MiB
+ARCHIVE_CACHE_PATH_DEFAULT = os.path.join(os.path.abspath(ROOT_PATH), ARCHIVE_CACHE)
+ARCHIVE_CACHE_SIZE_DEFAULT = 4096
+
+# Default HTTP Cache Folder, its size in bytes and the seconds an API answer is used before asking the server again
+HTTP_CACHE_PATH_DEFAULT = os.path.join(os.path.abspath(ROOT_PATH), HTTP_CACHE)
+HTTP_CACHE_SIZE = 50 * 1024 * 1024
+HTTP_CACHE_TTL = 60 * 60
+
+# Default folder for mods downloaded from modworkshop
+DOWNLOADS_PATH_DEFAULT = os.path.join(os.path.abspath(ROOT_PATH), DOWNLOADS)
+
+# Milliseconds before a stalled request is dropped, retries of transient failures,
+# the backoff before the first retry and its limit in milliseconds, and the requests sent to one host at the same time
+NETWORK_TIMEOUT = 30 * 1000
+NETWORK_RETRIES = 3
+NETWORK_BACKOFF = 500
+NETWORK_BACKOFF_MAX = 30 * 1000
+NETWORK_HOST_LIMIT = 4
+
+# Update checks sent to modworkshop at the same time, more would only wait for a connection to it
+MAX_UPDATE_REQUESTS = NETWORK_HOST_LIMIT
+
+# HTTP statuses that are worth asking again for, the server is overloaded or a gateway failed
+NETWORK_RETRY_STATUS = (408, 429, 502, 503, 504)
+
 # Graphics folder path
 UI_GRAPHICS_PATH = os.path.join(os.path.abspath(os.path.dirname(__file__)), 'graphics')
 
@@ -0,0 +1,201 @@
+import os
+import errno
+import shutil
+import hashlib
+import logging
+
+from src.cancelToken import CancelToken
+from src.constant_vars import CONTENT_STORE_PATH_DEFAULT
+
+logging.getLogger(__name__)
+
+CHUNK_SIZE = 1024 * 1024
+
+def hashFile(path: str, token: CancelToken | None = None) -> str:
+    '''Returns the sha256 hex digest of a file, read in chunks so big files don't fill memory'''
+
+    digest = hashlib.sha256()
+
+    with open(path, 'rb') as f:
+        while chunk := f.read(CHUNK_SIZE):
+
+            if token is not None:
+                token.check(len(chunk))
+
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+class ContentStore():
+    '''
+    Content-addressed file store, each file is kept once under its hash.
+
+    Mod files in the game directory are hardlinks to the stored files,
+    so identical files across mods and versions only take up space once.
+
+    Hardlinks can't cross drives, if the store and the game directory
+    are on different drives the mod is left as it is.
+
+    A hardlink shares its content with the stored file, so a mod file that is edited
+    in place changes the stored file and every other mod linked to it. Stored files are
+    hashed again before they're deployed or linked to, one that changed is dropped from the store.
+    '''
+
+    def __init__(self, path: str = CONTENT_STORE_PATH_DEFAULT) -> None:
+        self.path = path
+        self.objects = os.path.join(path, 'objects')
+
+    def objectPath(self, digest: str) -> str:
+        '''Returns the path of a stored file given its hash, does not check if it exists'''
+        return os.path.join(self.objects, digest[:2], digest)
+
+    def hasObject(self, digest: str) -> bool:
+        return os.path.isfile(self.objectPath(digest))
+
+    def verify(self, digest: str, token: CancelToken | None = None) -> bool:
+        '''
+        Checks if a stored file still matches its hash.
+
+        A file that doesn't is removed from the store, the mods linked to it keep their copy
+        '''
+
+        objectPath = self.objectPath(digest)
+
+        if hashFile(objectPath, token) == digest:
+            return True
+
+        logging.warning('%s in the content store was edited through a mod linked to it, removing it from the store', digest)
+
+        os.remove(objectPath)
+
+        return False
+
+    def ingest(self, modPath: str, token: CancelToken | None = None) -> dict[str, str]:
+        '''
+        Adds every file of a mod into the store and replaces
+        the mod's files with hardlinks to the stored files.
+
+        Returns the mod's manifest, a dict of relative file paths and their hashes.
+
+        Canceling leaves the mod intact, files are only swapped one at a time.
+        If the store is on another drive the links that were made are undone and an empty manifest is returned
+        '''
+
+        manifest: dict[str, str] = {}
+
+        # Every file that was stored or swapped for a link, so a failed ingest can be undone
+        done: list[tuple[str, str, bool]] = []
+
+        for root, dirs, files in os.walk(modPath):
+            for file in files:
+
+                filePath = os.path.join(root, file)
+
+                if os.path.islink(filePath):
+                    continue
+
+                digest = hashFile(filePath, token)
+
+                try:
+                    self.__link(filePath, digest, done, token)
+
+                except OSError as e:
+                    if e.errno != errno.EXDEV:
+                        raise
+
+                    logging.warning('%s is not on the same drive as the content store %s, skipping...', modPath, self.path)
+
+                    self.__rollback(done)
+                    return {}
+
+                manifest[os.path.relpath(filePath, modPath).replace(os.sep, '/')] = digest
+
+        logging.info('Added %s files of %s to the content store', len(manifest), os.path.basename(modPath))
+
+        return manifest
+
+    def deploy(self, manifest: dict[str, str], dest: str, token: CancelToken | None = None) -> None:
+        '''
+        Recreates a mod at `dest` from its manifest by hardlinking the stored files.
+
+        Raises OSError if a stored file was edited since it was stored
+        '''
+
+        for relPath, digest in manifest.items():
+
+            if not self.verify(digest, token):
+                raise OSError(f'The stored file of {relPath} was changed')
+
+            filePath = os.path.join(dest, *relPath.split('/'))
+
+            os.makedirs(os.path.dirname(filePath), exist_ok=True)
+
+            if os.path.exists(filePath):
+                os.remove(filePath)
+
+            os.link(self.objectPath(digest), filePath)
+
+        logging.info('Deployed %s files from the content store to %s', len(manifest), dest)
+
+    def prune(self) -> int:
+        '''
+        Removes stored files that no mod links to anymore.
+
+        Returns the amount of files removed
+        '''
+
+        removed = 0
+
+        if not os.path.isdir(self.objects):
+            return removed
+
+        for root, dirs, files in os.walk(self.objects):
+            for file in files:
+
+                objectPath = os.path.join(root, file)
+
+                if os.stat(objectPath).st_nlink <= 1:
+                    os.remove(objectPath)
+                    removed += 1
+
+        logging.info('Pruned %s unused files from the content store', removed)
+
+        return removed
+
+    def __link(self, filePath: str, digest: str, done: list[tuple[str, str, bool]], token: CancelToken | None = None) -> None:
+        objectPath = self.objectPath(digest)
+
+        if os.path.isfile(objectPath) and os.path.samefile(objectPath, filePath):
+            return
+
+        # A stored file that was edited is replaced by this one instead of being linked to
+        if os.path.isfile(objectPath) and self.verify(digest, token):
+
+            # Swapping the duplicate with a hardlink, os.replace() is atomic so the file never goes missing
+            tmpPath = f'{filePath}.mmm-link'
+            os.link(objectPath, tmpPath)
+            os.replace(tmpPath, filePath)
+
+            done.append((filePath, objectPath, False))
+
+        else:
+            os.makedirs(os.path.dirname(objectPath), exist_ok=True)
+            os.link(filePath, objectPath)
+
+            done.append((filePath, objectPath, True))
+
+    def __rollback(self, done: list[tuple[str, str, bool]]) -> None:
+        '''Gives the files of an unfinished ingest their own copy again, newest first'''
+
+        for filePath, objectPath, stored in reversed(done):
+
+            if stored:
+                # The mod's file is the original, only the store's link to it is removed
+                os.remove(objectPath)
+                continue
+
+            tmpPath = f'{filePath}.mmm-link'
+            shutil.copy2(objectPath, tmpPath)
+            os.replace(tmpPath, filePath)
+
+        logging.info('Undid %s links to the content store', len(done))
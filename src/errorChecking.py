@@ -5,6 +5,9 @@ import webbrowser
 import sys
 import subprocess
 
+if sys.platform.startswith('win'):
+    import _winapi
+
 from semantic_version import Version
 
 from PySide6.QtCore import QCoreApplication as qapp
@@ -50,6 +53,8 @@ def isInstalled(mod: str, optionsPath: str = OPTIONS_CONFIG) -> bool:
 
     for path in possiblePaths:
 
+        # os.path.isdir() follows links, so a mod linked by the symlink mode
+        # counts as installed while a link to a missing mod does not
         if os.path.isdir(os.path.join(path, mod)):
             installed = True
             break
@@ -57,6 +62,93 @@ def isInstalled(mod: str, optionsPath: str = OPTIONS_CONFIG) -> bool:
     logging.debug('errorChecking.isInstalled(): %s, %s', mod, installed)
     return installed
 
+def isLink(path: str) -> bool:
+    '''Checks if the path is a symlink or a windows directory junction'''
+
+    if os.path.islink(path):
+        return True
+
+    if sys.platform.startswith('win'):
+        try:
+            return os.lstat(path).st_reparse_tag == stat.IO_REPARSE_TAG_MOUNT_POINT
+        except OSError:
+            return False
+
+    return False
+
+def createLink(src: str, dest: str) -> None:
+    '''
+    Creates a directory link at `dest` that points to `src`
+
+    Windows only allows symlinks with developer mode or admin rights,
+    so a directory junction is created instead if the symlink fails
+    '''
+
+    try:
+        os.symlink(src, dest, target_is_directory=True)
+
+    except OSError:
+        if not sys.platform.startswith('win'):
+            raise
+
+        _winapi.CreateJunction(src, dest)
+
+    logging.info('Linked %s to %s', dest, src)
+
+def removeLink(path: str) -> None:
+    '''Removes a link made by `createLink()` without touching the directory it points to'''
+
+    if sys.platform.startswith('win'):
+        os.rmdir(path)
+    else:
+        os.unlink(path)
+
+    logging.info('Removed link %s', path)
+
+def runningProcesses() -> list[str]:
+    '''Returns the lowercase executable name of every running process'''
+
+    if sys.platform.startswith('win'):
+        # CREATE_NO_WINDOW, a console would flash up every time this is called
+        output = subprocess.run(['tasklist', '/FO', 'CSV', '/NH'], capture_output=True, text=True, creationflags=0x08000000).stdout
+
+        return [x.split('","')[0].strip('"').lower() for x in output.splitlines() if x]
+
+    if os.path.isdir('/proc'):
+        names: list[str] = []
+
+        for pid in os.listdir('/proc'):
+
+            if not pid.isdigit():
+                continue
+
+            try:
+                with open(os.path.join('/proc', pid, 'comm'), 'r') as f:
+                    names.append(f.read().strip().lower())
+
+            # The process ended in the meantime
+            except OSError:
+                continue
+
+        return names
+
+    output = subprocess.run(['ps', '-A', '-o', 'comm='], capture_output=True, text=True).stdout
+
+    return [os.path.basename(x.strip()).lower() for x in output.splitlines() if x]
+
+def isProcessRunning(names: tuple[str, ...]) -> bool:
+    '''Checks if a process with one of these executable names is running'''
+
+    try:
+        running = set(runningProcesses())
+
+    except OSError as e:
+        logging.warning('Could not list the running processes:\n%s', str(e))
+        return False
+
+    # Linux cuts the names in /proc down to 15 characters
+    return any(x.lower() in running or x.lower()[:15] in running for x in names)
+
 def getFileType(filePath: str) -> str | bool:
     '''
     Returns a string of the file format
@@ -74,7 +166,7 @@ def getFileType(filePath: str) -> str | bool:
 
             output = 'dir'
 
-        elif filePath.endswith(('.zip', '.rar', '.7z')):
+        elif filePath.endswith(('.zip', '.rar', '.7z', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')):
 
             output = 'zip'
         
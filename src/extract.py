@@ -0,0 +1,733 @@
+import os
+import sys
+import queue
+import time
+import shutil
+import logging
+import zipfile
+import tarfile
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import BinaryIO, Callable
+
+import patoolib
+
+from src.cancelToken import CancelToken, Canceled
+from src.contentStore import ContentStore
+import src.errorChecking as errorChecking
+
+logging.getLogger(__name__)
+
+# Big reads keep the decompressor busy instead of waiting on small writes,
+# it's still small enough to check the cancel token several times a second
+BUFFER_SIZE = 4 * 1024 * 1024
+
+# Zips smaller than this are extracted by one thread, starting threads isn't worth it for them
+PARALLEL_ZIP_SIZE = 256 * 1024 * 1024
+
+# Seconds between progress reports sent from a pool process
+PROGRESS_INTERVAL = 0.1
+
+# Called with the entry being extracted, the bytes of the archive read so far and the archive's size
+Progress = Callable[[str, int, int], None]
+
+class _ProgressReader():
+    '''
+    Wraps the archive's file to count how much of it was read,
+    which works the same for every format and compression
+    '''
+
+    def __init__(self, file: BinaryIO, size: int) -> None:
+        self.file = file
+        self.size = size
+        self.done = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.file.read(size)
+
+        # Seeking back (zip headers) doesn't count twice
+        self.done = max(self.done, self.file.tell())
+
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self.file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def seekable(self) -> bool:
+        return True
+
+class _Extraction():
+    '''State of one archive being extracted'''
+
+    def __init__(self, dest: str, token: CancelToken | None, report: Callable[[str], None], targets: dict[str, str] | None = None) -> None:
+        self.dest = os.path.realpath(dest)
+        self.token = token
+        self.report = report
+
+        # Folders inside of the archive and where their contents go, longest first so nested roots match first
+        self.targets = None if targets is None else sorted(
+            (([x for x in root.split('/') if x], os.path.realpath(path)) for root, path in targets.items()),
+            key=lambda x: len(x[0]),
+            reverse=True
+        )
+
+        # Files and folders that didn't exist before the extraction
+        self.created: list[str] = []
+        self.seen: set[str] = set()
+
+        # Every file written and the size the archive says it has
+        self.written: dict[str, int] = {}
+
+        # Compressed bytes extracted by the threads of `extractZipParallel()`
+        self.bytesRead: int | None = None
+
+        # Set once a thread of `extractZipParallel()` failed, so the others stop too
+        self.abort = threading.Event()
+        self.lock = threading.Lock()
+
+    def check(self) -> None:
+        if self.token is not None:
+            self.token.check()
+
+        if self.abort.is_set():
+            raise Canceled()
+
+    def progress(self, name: str) -> None:
+        with self.lock:
+            self.report(name)
+
+    def track(self, path: str) -> None:
+        '''Remembers `path` if the extraction is the one creating it'''
+
+        if path not in self.seen:
+            self.seen.add(path)
+
+            if not os.path.lexists(path):
+                self.created.append(path)
+
+    def target(self, name: str) -> str | None:
+        '''
+        Returns where an entry should be written.
+
+        Returns None if the entry isn't part of a target or points outside of it
+        '''
+
+        parts = [x for x in name.replace('\\', '/').split('/') if x not in ('', '.')]
+
+        if self.targets is None:
+            base = self.dest
+
+        else:
+            for root, base in self.targets:
+                if parts[:len(root)] == root:
+                    parts = parts[len(root):]
+                    break
+            else:
+                return None
+
+            self.track(base)
+
+        # The entry of the folder itself, or a file that is a target of its own
+        if not parts:
+            return base if self.targets is not None and not name.endswith('/') else None
+
+        target = os.path.realpath(os.path.join(base, *parts))
+
+        # Entries like '../file' would be written outside of the destination
+        if not target.startswith(base + os.sep):
+            logging.warning('Skipping %s, it points outside of the destination', name)
+            return None
+
+        if self.targets is None:
+            self.track(os.path.join(base, parts[0]))
+
+        return target
+
+    def write(self, fsrc: BinaryIO, target: str, name: str, size: int) -> None:
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+        self.written[target] = size
+
+        self.progress(name)
+
+        try:
+            with open(target, 'wb') as fdst:
+
+                while chunk := fsrc.read(BUFFER_SIZE):
+
+                    self.check()
+
+                    fdst.write(chunk)
+
+                    self.progress(name)
+
+        except Canceled:
+            os.remove(target)
+            raise
+
+    def extractZip(self, reader: _ProgressReader) -> None:
+
+        with zipfile.ZipFile(reader) as zf:
+
+            for info in zf.infolist():
+
+                self.check()
+
+                target = self.target(info.filename)
+
+                if target is None:
+                    continue
+
+                if info.is_dir():
+                    os.makedirs(target, exist_ok=True)
+                    continue
+
+                with zf.open(info) as fsrc:
+                    self.write(fsrc, target, info.filename, info.file_size)
+
+    def extractZipParallel(self, src: str, threads: int) -> None:
+        '''
+        Extracts a zip with several threads, each one with its own handle of the archive.
+
+        zlib releases the GIL while inflating, so the entries are decompressed on several cores.
+        Each thread gets a share of the central directory with about as many compressed bytes as the others
+        '''
+
+        with zipfile.ZipFile(src) as zf:
+            infos = zf.infolist()
+
+        # Resolved before the threads start, tracking what the extraction creates isn't thread safe
+        files: list[tuple[zipfile.ZipInfo, str]] = []
+
+        for info in infos:
+
+            self.check()
+
+            target = self.target(info.filename)
+
+            if target is None:
+                continue
+
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+            else:
+                files.append((info, target))
+
+        shares: list[list[tuple[zipfile.ZipInfo, str]]] = [[] for _ in range(threads)]
+        loads = [0] * threads
+
+        # Biggest entries first, each one goes to the thread with the least work so far
+        for info, target in sorted(files, key=lambda x: x[0].compress_size, reverse=True):
+
+            i = loads.index(min(loads))
+
+            shares[i].append((info, target))
+            loads[i] += info.compress_size
+
+        self.bytesRead = 0
+
+        def extractShare(share: list[tuple[zipfile.ZipInfo, str]]) -> None:
+
+            with zipfile.ZipFile(src) as zf:
+
+                for info, target in share:
+
+                    self.check()
+
+                    with zf.open(info) as fsrc:
+                        self.write(fsrc, target, info.filename, info.file_size)
+
+                    with self.lock:
+                        self.bytesRead += info.compress_size
+                        self.report(info.filename)
+
+        with ThreadPoolExecutor(threads) as executor:
+
+            futures = [executor.submit(extractShare, x) for x in shares if x]
+
+            for future in as_completed(futures):
+                if future.exception() is not None:
+                    self.abort.set()
+
+        errors = [x.exception() for x in futures if x.exception() is not None]
+
+        # The other threads stopped with Canceled because of the error that happened first
+        for e in errors:
+            if not isinstance(e, Canceled):
+                raise e
+
+        if errors:
+            raise errors[0]
+
+    def extractTar(self, reader: _ProgressReader) -> None:
+
+        # Stream mode reads the archive once from start to end, compressed tars can't be seeked cheaply anyway
+        with tarfile.open(fileobj=reader, mode='r|*') as tf:
+
+            for member in tf:
+
+                self.check()
+
+                target = self.target(member.name)
+
+                if target is None:
+                    continue
+
+                if member.isdir():
+                    os.makedirs(target, exist_ok=True)
+
+                elif member.isfile():
+                    self.write(tf.extractfile(member), target, member.name, member.size)
+
+                else:
+                    # Links and devices aren't something a mod needs
+                    logging.warning('Skipping %s, only files and folders are extracted', member.name)
+
+    def verify(self) -> None:
+        '''Raises OSError if a file is missing or doesn't have the size listed in the archive'''
+
+        for path, size in self.written.items():
+
+            if not os.path.isfile(path) or os.path.getsize(path) != size:
+                raise OSError(f'{path} was not fully extracted')
+
+    def cleanup(self) -> None:
+        '''Removes everything this extraction created'''
+
+        for path in reversed(self.created):
+
+            logging.info('Removing partially extracted %s', path)
+
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            elif os.path.lexists(path):
+                os.remove(path)
+
+def isSupported(src: str) -> bool:
+    '''Returns True if the archive can be extracted without patool'''
+
+    try:
+        return zipfile.is_zipfile(src) or tarfile.is_tarfile(src)
+
+    except OSError:
+        return False
+
+def extractArchive(src: str, dest: str, token: CancelToken | None = None, progress: Progress | None = None, targets: dict[str, str] | None = None, threads: int = 1) -> list[str]:
+    '''
+    Streams the entries of a zip or tar archive (gz, bz2, xz) straight to `dest`.
+
+    Zips bigger than `PARALLEL_ZIP_SIZE` are extracted by up to `threads` threads.
+
+    `targets` maps folders inside of the archive ('' for the whole archive) to the folder
+    their contents are extracted to, `dest` is ignored and anything outside of them is skipped.
+
+    The extraction can be canceled mid-way, if it doesn't finish or a file doesn't match
+    the size in the archive, every file and folder it created is removed before the exception is raised.
+
+    Returns the paths of the top level files and folders that were created
+    '''
+
+    size = os.path.getsize(src)
+
+    with open(src, 'rb') as f:
+
+        reader = _ProgressReader(f, size)
+
+        def report(entry: str) -> None:
+            if progress is not None:
+                progress(entry, reader.done if extraction.bytesRead is None else extraction.bytesRead, size)
+
+        extraction = _Extraction(dest, token, report, targets)
+
+        try:
+            if zipfile.is_zipfile(f):
+
+                if threads > 1 and size >= PARALLEL_ZIP_SIZE:
+                    logging.info('Extracting %s with %s threads', os.path.basename(src), threads)
+                    extraction.extractZipParallel(src, threads)
+
+                else:
+                    f.seek(0)
+                    extraction.extractZip(reader)
+
+            else:
+                f.seek(0)
+                extraction.extractTar(reader)
+
+            extraction.verify()
+
+        except BaseException:
+            extraction.cleanup()
+            raise
+
+    logging.info('Extracted %s to %s', src, dest)
+
+    return extraction.created
+
+def extractFile(src: str, name: str, dest: str) -> None:
+    '''
+    Streams the entry `name` of a zip or tar archive to the file `dest`, the rest of the archive isn't extracted.
+
+    Zips jump straight to the entry, tars are read up to it. The entry's permissions are kept.
+
+    Raises KeyError if the archive doesn't have the entry
+    '''
+
+    mode = 0
+
+    try:
+        with open(src, 'rb') as f:
+
+            if zipfile.is_zipfile(f):
+                f.seek(0)
+
+                with zipfile.ZipFile(f) as zf:
+                    info = zf.getinfo(name)
+
+                    # Unix permissions are kept in the high bits
+                    mode = info.external_attr >> 16
+
+                    with zf.open(info) as fsrc, open(dest, 'wb') as fdst:
+                        shutil.copyfileobj(fsrc, fdst, BUFFER_SIZE)
+
+            else:
+                f.seek(0)
+
+                # Streamed, the members before the entry aren't kept in memory
+                with tarfile.open(fileobj=f, mode='r|*') as tf:
+
+                    for member in tf:
+                        if member.isfile() and member.name.removeprefix('./') == name:
+                            mode = member.mode
+
+                            with tf.extractfile(member) as fsrc, open(dest, 'wb') as fdst:
+                                shutil.copyfileobj(fsrc, fdst, BUFFER_SIZE)
+
+                            break
+
+                    else:
+                        raise KeyError(f'There is no item named {name!r} in the archive')
+
+    except BaseException:
+        if os.path.exists(dest):
+            os.remove(dest)
+        raise
+
+    if mode & 0o777:
+        os.chmod(dest, mode & 0o777)
+
+    logging.info('Extracted %s from %s to %s', name, src, dest)
+
+def _moveIntoPlace(staged: str, dest: str, old: str) -> None:
+    '''
+    Renames a staged mod to its destination, both have to be on the same drive.
+
+    An older version of the mod is renamed to `old` first,
+    so the destination only ever has a complete version of the mod
+    '''
+
+    if errorChecking.isLink(dest):
+        _replaceLinked(staged, dest)
+        return
+
+    if os.path.lexists(dest):
+        os.rename(dest, old)
+
+    else:
+        old = None
+
+    try:
+        os.rename(staged, dest)
+
+    except OSError:
+        # Putting the old version back
+        if old is not None:
+            os.rename(old, dest)
+        raise
+
+    if old is not None:
+        if os.path.isdir(old):
+            shutil.rmtree(old, ignore_errors=True)
+        else:
+            os.remove(old)
+
+def _replaceLinked(staged: str, link: str) -> None:
+    '''
+    Replaces the mod a link of the symlink mode points to and links it again,
+    so the mod stays in the disabled directory and can still be disabled.
+
+    The disabled directory can be on another drive, the mod is moved there instead of renamed
+    '''
+
+    target = os.path.realpath(link)
+    old = f'{target}.mmm-old'
+
+    errorChecking.removeLink(link)
+
+    if os.path.lexists(target):
+        os.rename(target, old)
+    else:
+        old = None
+
+    try:
+        shutil.move(staged, target)
+
+    except OSError:
+        # A partial copy, the old version is put back
+        if os.path.lexists(target):
+            shutil.rmtree(target, ignore_errors=True)
+
+        if old is not None:
+            os.rename(old, target)
+
+        errorChecking.createLink(target, link)
+        raise
+
+    errorChecking.createLink(target, link)
+
+    if old is not None:
+        shutil.rmtree(old, ignore_errors=True)
+
+def extractJob(src: str, dest: str, staging: str, token: CancelToken | None = None, progress: Progress | None = None, targets: dict[str, str] | None = None, threads: int = 1) -> list[str]:
+    '''
+    Extracts an archive into its own folder inside of `staging`, which has to be on the
+    same drive as the destinations. Once everything is extracted and verified,
+    each mod is renamed into place, a failed or canceled job never leaves a partial mod behind.
+
+    `targets` maps folders inside of the archive to where they're installed,
+    without it every top level file and folder of the archive is installed into `dest`.
+
+    Formats that `extractArchive()` can't handle are extracted by patool,
+    big zips are extracted by up to `threads` threads.
+
+    Returns the paths of the files and folders that were installed
+    '''
+
+    os.makedirs(staging, exist_ok=True)
+
+    jobDir = tempfile.mkdtemp(prefix='job-', dir=staging)
+
+    try:
+        archiveDir = os.path.join(jobDir, 'archive')
+
+        stagedTargets = None if targets is None else {x : os.path.join(jobDir, str(i)) for i, x in enumerate(targets)}
+
+        if isSupported(src):
+            extractArchive(src, archiveDir, token, progress, stagedTargets, threads)
+
+        else:
+            logging.info('%s is not a zip or tar archive, extracting it with patool', os.path.basename(src))
+
+            os.mkdir(archiveDir)
+
+            patoolib.extract_archive(src, outdir=archiveDir, verbosity=-1, interactive=False)
+
+            for root, staged in (stagedTargets or {}).items():
+                os.rename(os.path.join(archiveDir, *root.split('/')), staged)
+
+        if token is not None:
+            token.check()
+
+        if targets is None:
+            pairs = [(os.path.join(archiveDir, x), os.path.join(dest, x)) for x in os.listdir(archiveDir)] if os.path.isdir(archiveDir) else []
+        else:
+            pairs = [(stagedTargets[x], targets[x]) for x in targets]
+
+        return _installStaged(pairs, jobDir, src)
+
+    finally:
+        shutil.rmtree(jobDir, ignore_errors=True)
+
+def _installStaged(pairs: list[tuple[str, str]], jobDir: str, src: str) -> list[str]:
+    '''Renames every staged mod into place once all of them are known to exist'''
+
+    for staged, final in pairs:
+        if not os.path.lexists(staged):
+            raise OSError(f'{os.path.basename(final)} was not found in {os.path.basename(src)}')
+
+    for i, (staged, final) in enumerate(pairs):
+        os.makedirs(os.path.dirname(final), exist_ok=True)
+        _moveIntoPlace(staged, final, os.path.join(jobDir, f'old-{i}'))
+
+    logging.info('Installed %s from %s', [x[1] for x in pairs], src)
+
+    return [x[1] for x in pairs]
+
+def deployJob(src: str, store: ContentStore, manifests: dict[str, dict[str, str]], targets: dict[str, str], staging: str, token: CancelToken | None = None) -> list[str]:
+    '''
+    Installs the mods of an archive that was installed before without extracting it,
+    each mod is recreated in `staging` from the content store and renamed into place like `extractJob()`.
+
+    `manifests` maps folders inside of the archive to their manifest in the content store.
+
+    Returns the paths of the folders that were installed
+    '''
+
+    os.makedirs(staging, exist_ok=True)
+
+    jobDir = tempfile.mkdtemp(prefix='job-', dir=staging)
+
+    try:
+        pairs: list[tuple[str, str]] = []
+
+        for i, (root, final) in enumerate(targets.items()):
+
+            if token is not None:
+                token.check()
+
+            staged = os.path.join(jobDir, str(i))
+
+            os.mkdir(staged)
+
+            store.deploy(manifests[root], staged, token)
+
+            pairs.append((staged, final))
+
+        return _installStaged(pairs, jobDir, src)
+
+    finally:
+        shutil.rmtree(jobDir, ignore_errors=True)
+
+# Set in each pool process by `_initPoolProcess()`
+_cancelEvent = None
+_progressQueue = None
+
+def _initPoolProcess(cancelEvent, progressQueue) -> None:
+    global _cancelEvent, _progressQueue
+
+    _cancelEvent = cancelEvent
+    _progressQueue = progressQueue
+
+def _poolJob(src: str, dest: str, staging: str, targets: dict[str, str] | None) -> list[str]:
+    '''`extractJob()` inside of a pool process, progress is sent back through a queue'''
+
+    lastReport = 0.0
+
+    def progress(entry: str, done: int, total: int) -> None:
+        nonlocal lastReport
+
+        now = time.monotonic()
+
+        if now - lastReport >= PROGRESS_INTERVAL or done >= total:
+            lastReport = now
+            _progressQueue.put((src, entry, done, total))
+
+    return extractJob(src, dest, staging, CancelToken(_cancelEvent), progress, targets)
+
+def isRotational(path: str) -> bool | None:
+    '''
+    Returns True if the path is on a spinning hard drive.
+
+    Returns None if the drive type can't be found, which is always the case outside of Linux
+    '''
+
+    if not sys.platform.startswith('linux'):
+        return None
+
+    try:
+        device = os.stat(path).st_dev
+
+        # Partitions don't have a queue folder, their parent disk does
+        block = os.path.realpath(f'/sys/dev/block/{os.major(device)}:{os.minor(device)}')
+
+        for folder in (block, os.path.dirname(block)):
+
+            rotational = os.path.join(folder, 'queue', 'rotational')
+
+            if os.path.isfile(rotational):
+                with open(rotational, 'r') as f:
+                    return f.read().strip() == '1'
+
+    except OSError:
+        pass
+
+    return None
+
+def poolSize(jobs: int, dests: list[str]) -> int:
+    '''
+    Returns how many archives should be extracted at the same time.
+
+    A hard drive gets slower the more it has to seek between files,
+    so only two archives are extracted at once if any destination is on one
+    '''
+
+    cpus = os.cpu_count() or 1
+
+    drives = [isRotational(x) for x in dests]
+
+    if any(drives):
+        size = 2
+    elif drives and all(x is False for x in drives):
+        size = min(cpus, 8)
+    else:
+        size = min(cpus, 4)
+
+    return max(1, min(size, jobs))
+
+def zipThreads(dest: str) -> int:
+    '''
+    Returns how many threads extract a single big zip.
+
+    A hard drive would spend its time seeking between the files of each thread, so it only gets one
+    '''
+
+    if isRotational(dest):
+        return 1
+
+    return min(os.cpu_count() or 1, 8)
+
+class ExtractionPool():
+    '''
+    Extracts several archives at the same time in separate processes,
+    decompressing is CPU bound so threads would be held back by the GIL.
+
+    Used as a context manager, the processes are started when entering it
+    '''
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+
+        # Spawned processes don't inherit the parent's Qt state like forked ones would
+        self.context = multiprocessing.get_context('spawn')
+
+        self.cancelEvent = self.context.Event()
+        self.progressQueue = self.context.Queue()
+
+    def __enter__(self) -> 'ExtractionPool':
+
+        self.executor = ProcessPoolExecutor(
+            self.size,
+            mp_context=self.context,
+            initializer=_initPoolProcess,
+            initargs=(self.cancelEvent, self.progressQueue)
+        )
+
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def submit(self, src: str, dest: str, staging: str, targets: dict[str, str] | None = None) -> Future:
+        return self.executor.submit(_poolJob, src, dest, staging, targets)
+
+    def cancel(self) -> None:
+        self.cancelEvent.set()
+
+    def progress(self) -> list[tuple[str, str, int, int]]:
+        '''Returns the progress reports sent since the last call, as (archive, entry, done, total)'''
+
+        reports = []
+
+        while not self.progressQueue.empty():
+            try:
+                reports.append(self.progressQueue.get_nowait())
+            except queue.Empty:
+                break
+
+        return reports
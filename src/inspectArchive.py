@@ -0,0 +1,237 @@
+import os
+import logging
+import zipfile
+import tarfile
+from typing import NamedTuple
+
+from src.constant_vars import ModType
+
+logging.getLogger(__name__)
+
+# Files that mark the folder they're in as the root of a mod
+MOD_MARKERS = ('mod.txt',)
+OVERRIDE_MARKERS = ('main.xml',)
+
+# Folders that mark their parent folder as the root of a mod
+MAP_FOLDERS = ('levels',)
+OVERRIDE_FOLDERS = ('assets', 'units', 'guis', 'anims', 'effects', 'environments', 'fonts', 'movies', 'soundbanks', 'strings', 'textures', 'physic_effects', 'settings')
+
+# Folders archivers add that are never part of a mod
+IGNORED_FOLDERS = ('__macosx',)
+
+# When a root has markers of several types the first one in this tuple wins
+PRIORITY = (ModType.mods, ModType.maps, ModType.mods_override)
+
+ARCHIVE_EXTENSIONS = ('.tar.gz', '.tar.bz2', '.tar.xz', '.tgz', '.tbz2', '.txz', '.tar', '.zip', '.rar', '.7z')
+
+class ModRoot(NamedTuple):
+    '''A mod found inside of an archive or folder'''
+
+    # Path of the mod's folder inside of the archive, '' if the archive itself is the mod
+    root: str
+
+    # Name of the folder the mod is installed as
+    name: str
+
+    modType: ModType
+
+def archiveName(path: str) -> str:
+    '''Returns the file name of an archive without its extension(s)'''
+
+    name = os.path.basename(path)
+
+    for extension in ARCHIVE_EXTENSIONS:
+        if name.lower().endswith(extension):
+            return name[:-len(extension)]
+
+    return os.path.splitext(name)[0]
+
+def listArchive(src: str) -> list[str] | None:
+    '''
+    Returns the paths of every file and folder in the archive without extracting anything.
+
+    Zip files only have their central directory read, tar files only their headers.
+    Returns None for formats that can't be read without patool
+    '''
+
+    try:
+        if zipfile.is_zipfile(src):
+            with zipfile.ZipFile(src) as zf:
+                return zf.namelist()
+
+        if tarfile.is_tarfile(src):
+            with tarfile.open(src, 'r|*') as tf:
+                return [x.name + '/' if x.isdir() else x.name for x in tf]
+
+    except (OSError, zipfile.BadZipFile, tarfile.TarError) as e:
+        logging.warning('Could not read the contents of %s:\n%s', src, str(e))
+
+    return None
+
+def classify(paths: list[str], name: str) -> list[ModRoot]:
+    '''
+    Finds the mods in a list of paths and what type each one is.
+
+    `name` is used when the top level folder is the mod itself.
+    Returns an empty list if nothing looks like a mod
+    '''
+
+    # Root of a mod and the types its markers point to
+    candidates: dict[str, set[ModType]] = {}
+
+    for path in paths:
+
+        parts = [x for x in path.replace('\\', '/').split('/') if x not in ('', '.')]
+
+        if not parts:
+            continue
+
+        isDir = path.endswith('/')
+
+        # Files or folders in the path that mark the folder above them
+        for i, part in enumerate(parts):
+
+            lowered = part.lower()
+            isLast = i == len(parts) - 1
+            root = '/'.join(parts[:i])
+
+            if isLast and not isDir:
+                if lowered in MOD_MARKERS:
+                    candidates.setdefault(root, set()).add(ModType.mods)
+                elif lowered in OVERRIDE_MARKERS:
+                    candidates.setdefault(root, set()).add(ModType.mods_override)
+
+            elif lowered in MAP_FOLDERS:
+                candidates.setdefault(root, set()).add(ModType.maps)
+
+            elif lowered in OVERRIDE_FOLDERS:
+                candidates.setdefault(root, set()).add(ModType.mods_override)
+
+    roots: list[ModRoot] = []
+
+    # Shallowest first, folders inside of a found mod belong to that mod
+    for root in sorted(candidates, key=lambda x: (x.count('/') if x else -1, x)):
+
+        if any(x.root == '' or root.startswith(x.root + '/') for x in roots):
+            continue
+
+        types: set[ModType] = set()
+
+        for candidate, candidateTypes in candidates.items():
+            if root == '' or candidate == root or candidate.startswith(root + '/'):
+                types.update(candidateTypes)
+
+        modType = next(x for x in PRIORITY if x in types)
+
+        roots.append(ModRoot(root, root.split('/')[-1] if root else name, modType))
+
+    logging.debug('Mods found in %s: %s', name, roots)
+
+    return roots
+
+def _levels(roots: list[ModRoot]) -> set[str]:
+    '''Folders with a mod somewhere inside of them, '' is the top of the archive'''
+
+    levels = {''}
+
+    for root in (x.root for x in roots):
+        parts = root.split('/')
+        levels.update('/'.join(parts[:i]) for i in range(1, len(parts)))
+
+    return levels
+
+def unmatched(paths: list[str], roots: list[ModRoot]) -> list[str]:
+    '''
+    Returns the folders next to or above the found mods that aren't part of any of them.
+
+    Nothing inside of them looks like a mod, but installing only the found mods would lose their files
+    '''
+
+    rootPaths = {x.root for x in roots}
+
+    if not roots or '' in rootPaths:
+        return []
+
+    levels = _levels(roots)
+
+    folders: set[str] = set()
+
+    for path in paths:
+
+        parts = [x for x in path.replace('\\', '/').split('/') if x not in ('', '.')]
+
+        # The last part is a file unless the path ends with a slash
+        depth = len(parts) + 1 if path.endswith('/') else len(parts)
+
+        for i in range(1, depth):
+
+            folder = '/'.join(parts[:i])
+
+            if parts[i - 1].lower() in IGNORED_FOLDERS:
+                break
+
+            if '/'.join(parts[:i - 1]) in levels and folder not in levels and folder not in rootPaths:
+                folders.add(folder)
+
+    return sorted(folders)
+
+def looseFiles(paths: list[str], roots: list[ModRoot]) -> list[str]:
+    '''Returns the files next to or above the found mods, like a readme next to the mod folders'''
+
+    if not roots or '' in {x.root for x in roots}:
+        return []
+
+    levels = _levels(roots)
+
+    files: list[str] = []
+
+    for path in paths:
+
+        if path.endswith('/'):
+            continue
+
+        parts = [x for x in path.replace('\\', '/').split('/') if x not in ('', '.')]
+
+        if parts and '/'.join(parts[:-1]) in levels:
+            files.append('/'.join(parts))
+
+    return sorted(files)
+
+def inspectArchive(src: str) -> list[ModRoot] | None:
+    '''
+    Returns the mods inside of an archive without extracting it.
+
+    Returns None if the archive can't be read, or an empty list if nothing looks like a mod
+    '''
+
+    paths = listArchive(src)
+
+    if paths is None:
+        return None
+
+    return classify(paths, archiveName(src))
+
+def inspectDir(path: str) -> list[ModRoot]:
+    '''Returns the mods inside of a folder'''
+
+    paths: list[str] = []
+
+    for root, dirs, files in os.walk(path):
+
+        relRoot = os.path.relpath(root, path).replace(os.sep, '/')
+        relRoot = '' if relRoot == '.' else relRoot + '/'
+
+        paths.extend(relRoot + x + '/' for x in dirs)
+        paths.extend(relRoot + x for x in files)
+
+    return classify(paths, os.path.basename(path))
+
+def detectType(roots: list[ModRoot] | None) -> ModType | None:
+    '''Returns the type every mod in the list agrees on, or None'''
+
+    if not roots:
+        return None
+
+    types = {x.modType for x in roots}
+
+    return types.pop() if len(types) == 1 else None
@@ -12,8 +12,10 @@ from src.widgets.aboutQWidget import About
 from src.widgets.QDialog.newUpdateQDialog import updateDetected
 from src.save import OptionsManager, Save
 from src.api.checkUpdate import checkUpdate
+from src.threaded.purgeTrash import PurgeTrash
+from src.backupScheduler import BackupScheduler
 
-from src.constant_vars import ICON, PROGRAM_NAME, VERSION, MOD_CONFIG, OPTIONS_CONFIG, ROOT_PATH
+from src.constant_vars import ICON, PROGRAM_NAME, VERSION, MOD_CONFIG, OPTIONS_CONFIG, ROOT_PATH, TRASH_EXPIRE
 from src import errorChecking
 
 class MainWindow(qtw.QMainWindow):
@@ -41,6 +43,9 @@ class MainWindow(qtw.QMainWindow):
         self.options.ignoredMods.ignoredModsListWidget.itemsRemoved.connect(self.manager.modsTable.refreshMods)
         self.options.themeSwitched.connect(lambda x: self.manager.modsTable.swapIcons(x))
         self.options.themeSwitched.connect(lambda x: self.about.updateIcons(x))
+        self.profile.profileApplied.connect(lambda x: self.manager.modsTable.setModsEnabled(x))
+        self.options.optionsMisc.modsRestored.connect(lambda x: self.manager.modsTable.restoreMods(x))
+        self.options.optionsMisc.modsInstalled.connect(lambda x: self.manager.modsTable.addInstalledMods(x))
 
         for page in (
                         (self.manager, ''),
@@ -60,6 +65,14 @@ class MainWindow(qtw.QMainWindow):
             self.run_checkUpdate = checkUpdate()
             self.run_checkUpdate.updateDetected.connect(lambda x, y: self.updateDetected(x, y))
 
+        # Permanently removes mods that have been in the trash for a while
+        self.purgeTrash = PurgeTrash(TRASH_EXPIRE, optionsPath=optionsPath, savePath=savePath)
+        self.purgeTrash.startInBackground()
+
+        # Backs up the mods on startup or daily, depending on the backup schedule
+        self.backupScheduler = BackupScheduler(optionsPath, savePath)
+        self.backupScheduler.startup()
+
     def applyStaticText(self) -> None:
         tab = self.tab.tabBar()
         tab.setTabText(0, qapp.translate('MainWindow', 'Manager'))
@@ -80,6 +93,9 @@ class MainWindow(qtw.QMainWindow):
         self.optionsManager.setWindowSize(self.size())
         self.optionsManager.writeData()
 
+        self.purgeTrash.stopBackground()
+        self.backupScheduler.stop()
+
         if isinstance(self.app, qtw.QApplication):
             self.app.closeAllWindows()
         return super().closeEvent(event)
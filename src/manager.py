@@ -9,6 +9,8 @@ import PySide6.QtGui as qtg
 
 from src.widgets.managerQTableWidget import ModListWidget
 from src.widgets.QDialog.announcementQDialog import Notice
+from src.widgets.QDialog.insertStringQDialog import insertString
+from src.widgets.QDialog.downloadModQDialog import DownloadModDialog
 from src.save import Save, OptionsManager
 import src.errorChecking as errorChecking
 from src.constant_vars import ModType, MOD_CONFIG, OPTIONS_CONFIG
@@ -27,6 +29,7 @@ class ModManager(qtw.QWidget):
 
         self.saveManager = Save(saveManagerPath)
         self.optionsManager = OptionsManager(optionsManagerPath)
+        self.optionsManagerPath = optionsManagerPath
 
         layout = qtw.QVBoxLayout()
 
@@ -41,6 +44,12 @@ class ModManager(qtw.QWidget):
         self.startGame = qtw.QPushButton(self)
         self.startGame.clicked.connect(self.startPayday)
 
+        self.checkUpdates = qtw.QPushButton(self)
+        self.checkUpdates.clicked.connect(lambda: self.modsTable.checkAllModUpdates())
+
+        self.downloadMod = qtw.QPushButton(self)
+        self.downloadMod.clicked.connect(self.downloadModworkshopMod)
+
         modLabelLayout = qtw.QHBoxLayout()
         modLabelLayout.setSpacing(100)
         modLabelLayout.setAlignment(qt.AlignmentFlag.AlignHCenter)
@@ -68,7 +77,7 @@ class ModManager(qtw.QWidget):
 
         self.modsTable.refreshMods()
 
-        for widget in (self.refresh, self.openGameDir, self.startGame, self.labelFrame, self.search, self.modsTable):
+        for widget in (self.refresh, self.openGameDir, self.startGame, self.checkUpdates, self.downloadMod, self.labelFrame, self.search, self.modsTable):
             layout.addWidget(widget)
         
         self.applyStaticText()
@@ -80,6 +89,8 @@ class ModManager(qtw.QWidget):
         self.refresh.setText(qapp.translate("ModManager", "Refresh Mods"))
         self.openGameDir.setText(qapp.translate("ModManager", 'Open Game Directory'))
         self.startGame.setText(qapp.translate("ModManager", 'Start PAYDAY 2'))
+        self.checkUpdates.setText(qapp.translate("ModManager", 'Check Mod Updates'))
+        self.downloadMod.setText(qapp.translate("ModManager", 'Download Mod from modworkshop'))
         self.search.setPlaceholderText(qapp.translate("ModManager", 'Search... use "tag:" with no spaces to search for tags, use a comma "," to seperate tags'))
     
     def updateModCount(self) -> None:
@@ -119,6 +130,36 @@ class ModManager(qtw.QWidget):
                 qapp.translate("ModManager", 'Could not start PAYDAY 2 from MMM'))
             notice.exec()
 
+    def downloadModworkshopMod(self) -> None:
+        '''Asks for a modworkshop asset id, downloads the mod and installs it like a dropped archive'''
+
+        prompt = insertString(qapp.translate("ModManager", 'Enter the modworkshop id of the mod, it is the number at the end of its page\'s address:'))
+        prompt.exec()
+
+        if not prompt.result() or not prompt.userInput.strip():
+            return
+
+        assetID = prompt.userInput.strip().rstrip('/').rsplit('/', 1)[-1]
+
+        if not assetID.isdigit():
+            notice = Notice(qapp.translate("ModManager", 'This is not a modworkshop id:') + f' {prompt.userInput}')
+            notice.exec()
+            return
+
+        download = DownloadModDialog(assetID, self.optionsManagerPath)
+        download.exec()
+
+        if not download.result() or download.path is None:
+            return
+
+        # The archive is kept if the mod wasn't installed, so it can be installed again without downloading it
+        if self.modsTable.installMods(download.path):
+            try:
+                os.remove(download.path)
+
+            except OSError as e:
+                logging.warning('Could not remove the downloaded %s:\n%s', download.path, str(e))
+
     def deselectAllShortcut(self) -> None:
         selectedItems = self.modsTable.selectedItems()
         if selectedItems:
@@ -0,0 +1,259 @@
+import os
+import zlib
+import shutil
+import logging
+import zipfile
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Iterable, Sequence
+
+from src.cancelToken import CancelToken, Canceled, CHUNK_SIZE, copyFileObj
+from src.extract import isRotational
+
+logging.getLogger(__name__)
+
+# Compressed members up to this size are kept in memory until they're written, bigger ones go to a temporary file
+SPOOL_SIZE = 8 * 1024 * 1024
+
+# Files of other types are sampled with this many bytes from their middle,
+# they're stored if the sample doesn't get smaller than this ratio
+SAMPLE_SIZE = 64 * 1024
+STORE_RATIO = 0.9
+
+# zipfile has no public way to write a member that is compressed already, `writeCompressed()` does what
+# `ZipFile.write()` does with these. They're the same in every Python version pyproject.toml allows,
+# if they're missing the members are compressed by the writer alone
+ZIPFILE_INTERNALS = ('_lock', '_writecheck', '_didModify', 'start_dir')
+
+def compressThreads(path: str) -> int:
+    '''
+    Returns how many threads compress the files in `path`.
+
+    A hard drive would spend its time seeking between the files each thread reads, so it only gets one
+    '''
+
+    if isRotational(path):
+        return 1
+
+    return min(os.cpu_count() or 1, 8)
+
+def compressType(path: str, stored: Sequence[str] = ()) -> int:
+    '''
+    Returns if a file is deflated or stored as it is.
+
+    Files with an extension in `stored` are never compressed, small files always are.
+    Other files are stored if a sample of them barely compresses
+    '''
+
+    if os.path.splitext(path)[1].lower() in stored:
+        return zipfile.ZIP_STORED
+
+    size = os.path.getsize(path)
+
+    if size <= SAMPLE_SIZE:
+        return zipfile.ZIP_DEFLATED
+
+    # The middle of the file, past any header
+    with open(path, 'rb') as f:
+        f.seek((size - SAMPLE_SIZE) // 2)
+        sample = f.read(SAMPLE_SIZE)
+
+    if len(zlib.compress(sample, 1)) > len(sample) * STORE_RATIO:
+        return zipfile.ZIP_STORED
+
+    return zipfile.ZIP_DEFLATED
+
+def memberInfo(path: str, arcName: str, compressType: int, level: int = zlib.Z_DEFAULT_COMPRESSION) -> zipfile.ZipInfo:
+    '''Returns the ZipInfo of a file, it keeps the file's modification time'''
+
+    info = zipfile.ZipInfo.from_file(path, arcName, strict_timestamps=False)
+    info.compress_type = compressType
+
+    # Public since Python 3.13
+    if hasattr(info, 'compress_level'):
+        info.compress_level = level
+    else:
+        info._compresslevel = level
+
+    return info
+
+def canWriteCompressed(zf: zipfile.ZipFile) -> bool:
+    '''Returns if `writeCompressed()` works with this version of zipfile'''
+    return all(hasattr(zf, x) for x in ZIPFILE_INTERNALS)
+
+def writeFile(zf: zipfile.ZipFile, info: zipfile.ZipInfo, path: str, token: CancelToken | None = None) -> None:
+    '''Compresses a file into the zip in chunks so it can be canceled mid-way'''
+
+    with open(path, 'rb') as fsrc, zf.open(info, 'w', force_zip64=True) as fdst:
+        copyFileObj(fsrc, fdst, token)
+
+def compressFile(path: str, arcName: str, check: Callable[[int], None] | None = None, level: int = zlib.Z_DEFAULT_COMPRESSION, stored: Sequence[str] = ()) -> tuple[zipfile.ZipInfo, BinaryIO | None]:
+    '''
+    Deflates a file into a temporary file the way `zipfile` would, without a zip to write it to.
+
+    Returns the ZipInfo of the member, with its CRC and sizes, and the compressed data ready to be read.
+    A file that is stored uncompressed has no data, the writer copies it into the zip itself
+    '''
+
+    info = memberInfo(path, arcName, compressType(path, stored), level)
+
+    if info.compress_type == zipfile.ZIP_STORED:
+        return info, None
+
+    # Raw deflate stream, zip members don't have the zlib header
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+
+    data = tempfile.SpooledTemporaryFile(SPOOL_SIZE)
+
+    crc = 0
+    size = 0
+
+    try:
+        with open(path, 'rb') as f:
+            while chunk := f.read(CHUNK_SIZE):
+
+                if check is not None:
+                    check(len(chunk))
+
+                crc = zlib.crc32(chunk, crc)
+                size += len(chunk)
+
+                data.write(compressor.compress(chunk))
+
+        data.write(compressor.flush())
+
+    except BaseException:
+        data.close()
+        raise
+
+    info.CRC = crc
+    info.file_size = size
+    info.compress_size = data.tell()
+
+    data.seek(0)
+
+    return info, data
+
+def writeCompressed(zf: zipfile.ZipFile, info: zipfile.ZipInfo, data: BinaryIO) -> None:
+    '''
+    Appends a member compressed by `compressFile()` to the zip.
+
+    zipfile can't take data that is compressed already,
+    so this writes the local header and the data the same way `ZipFile.write()` does once it's done compressing
+    '''
+
+    zip64 = info.file_size > zipfile.ZIP64_LIMIT or info.compress_size > zipfile.ZIP64_LIMIT
+
+    with zf._lock:
+        zf._writecheck(info)
+        zf._didModify = True
+
+        info.header_offset = zf.fp.tell()
+
+        zf.fp.write(info.FileHeader(zip64))
+        shutil.copyfileobj(data, zf.fp, CHUNK_SIZE)
+
+        zf.start_dir = zf.fp.tell()
+
+        zf.filelist.append(info)
+        zf.NameToInfo[info.filename] = info
+
+def writeMembers(zf: zipfile.ZipFile, members: Iterable[tuple[str, str | None]], threads: int = 1, token: CancelToken | None = None, report: Callable[[str], None] | None = None, level: int = zlib.Z_DEFAULT_COMPRESSION, stored: Sequence[str] = ()) -> None:
+    '''
+    Writes files into the zip under their path in the archive, members without a file are folders.
+
+    With more than one thread the files are deflated at the same time, zlib releases the GIL while compressing.
+    This thread is the only one writing to the zip, it writes the members in their order as they're done.
+    Only a few members are compressed ahead of the writer so big backups don't pile up in memory or on disk.
+
+    `level` is the zlib compression level and `stored` the extensions that aren't compressed, see `compressType()`.
+    `report` is called with each member's path before it's written
+    '''
+
+    if threads > 1 and not canWriteCompressed(zf):
+        logging.warning('This version of zipfile can not take members that are compressed already, compressing on one thread')
+        threads = 1
+
+    if threads <= 1:
+        for arcName, filePath in members:
+
+            if report is not None:
+                report(arcName)
+
+            if filePath is None:
+                zf.writestr(arcName, b'')
+                continue
+
+            if token is not None:
+                token.check()
+
+            writeFile(zf, memberInfo(filePath, arcName, compressType(filePath, stored), level), filePath, token)
+
+        return
+
+    # Stops the other threads once the writer gives up
+    abort = threading.Event()
+
+    def check(size: int = 0) -> None:
+        if abort.is_set():
+            raise Canceled()
+
+        if token is not None:
+            token.check(size)
+
+    members = iter(members)
+
+    pending: deque[tuple[str, str | None, Future | None]] = deque()
+
+    try:
+        with ThreadPoolExecutor(threads) as executor:
+
+            def fill() -> None:
+                while len(pending) < threads * 2 and (member := next(members, None)) is not None:
+                    arcName, filePath = member
+                    pending.append((arcName, filePath, None if filePath is None else executor.submit(compressFile, filePath, arcName, check, level, stored)))
+
+            try:
+                fill()
+
+                while pending:
+
+                    arcName, filePath, future = pending.popleft()
+
+                    fill()
+
+                    if report is not None:
+                        report(arcName)
+
+                    if future is None:
+                        zf.writestr(arcName, b'')
+                        continue
+
+                    info, data = future.result()
+
+                    # Copying a stored file needs no CPU, it's not worth a temporary copy
+                    if data is None:
+                        writeFile(zf, info, filePath, token)
+                        continue
+
+                    with data:
+                        writeCompressed(zf, info, data)
+
+                    check()
+
+            except BaseException:
+                abort.set()
+
+                for _, _, future in pending:
+                    if future is not None:
+                        future.cancel()
+
+                raise
+
+    finally:
+        # Members compressed after the writer stopped
+        for _, _, future in pending:
+            if future is not None and future.done() and not future.cancelled() and future.exception() is None and future.result()[1] is not None:
+                future.result()[1].close()
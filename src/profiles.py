@@ -2,24 +2,26 @@ from __future__ import annotations
 
 import PySide6.QtWidgets as qtw
 import PySide6.QtGui as qtg
-from PySide6.QtCore import QCoreApplication as qapp
-
-import src.errorChecking as errorChecking
+from PySide6.QtCore import QCoreApplication as qapp, Signal
 
 from src.widgets.QDialog.announcementQDialog import Notice
 from src.widgets.progressWidget import ProgressWidget
 from src.widgets.modProfileQTreeWidget import ProfileList
-from src.widgets.managerQTableWidget import ModListWidget
-from src.threaded.moveToDisabledDir import MoveToDisabledDir
-from src.threaded.moveToEnabledDir import MoveToEnabledModDir
-from src.save import Save
+from src.threaded.applyProfile import ApplyProfile
+from src.threaded.backupMods import BackupMods
+from src.save import Save, OptionsManager
 
-from src.constant_vars import MOD_CONFIG, PROFILES_JSON
+from src.constant_vars import MOD_CONFIG, PROFILES_JSON, BACKUP_SCHEDULE_PROFILE
 
 class modProfile(qtw.QWidget):
+
+    # Dict of the mods that were changed and if they're now enabled
+    profileApplied = Signal(dict)
+
     def __init__(self, savePath = MOD_CONFIG, profilePath: str = PROFILES_JSON) -> None:
         super().__init__()
 
+        self.savePath = savePath
         self.saveManager = Save(savePath)
 
         layout = qtw.QVBoxLayout()
@@ -38,21 +40,22 @@ class modProfile(qtw.QWidget):
 
     def applyMods(self, mods: list[str]) -> None:
 
-        enableMods = ProgressWidget(MoveToEnabledModDir(*[x for x in mods if errorChecking.isInstalled(x)]))
-        enableMods.exec()
+        # The profile only moves the mods once they're backed up, a failed or canceled backup stops it
+        if OptionsManager.getBackupSchedule() == BACKUP_SCHEDULE_PROFILE:
+
+            backup = ProgressWidget(BackupMods(savePath=self.savePath))
+            backup.exec()
+
+            if not backup.result():
+                return
 
-        disableMods = ProgressWidget(MoveToDisabledDir(*[x for x in self.saveManager.mods() if errorChecking.isInstalled(x) and x not in mods]))
-        disableMods.exec()
+        worker = ApplyProfile(*mods, savePath=self.savePath)
+        worker.applied.connect(lambda x: self.profileApplied.emit(x))
 
-        # Refresh table so it is updated after all of this is done
-        # TODO: Refactor to make this not loop through all widgets
-        widget: ModListWidget
-        for widget in qtw.QApplication.allWidgets():
-            if isinstance(widget, ModListWidget):
-                widget.refreshMods()
-                break
+        applyProfile = ProgressWidget(worker)
+        applyProfile.exec()
 
-        notInstalledMods = [x for x in mods if not errorChecking.isInstalled(x)]
+        notInstalledMods = worker.notInstalled
 
         if notInstalledMods:
             notice = Notice(
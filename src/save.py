@@ -6,7 +6,7 @@ from configparser import ConfigParser
 from PySide6.QtCore import QSize, QLocale
 
 from src.JSONParser import JSONParser
-from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, ModType, LIGHT, MODS_DISABLED_PATH_DEFAULT, ModKeys, OptionKeys
+from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, ModType, LIGHT, MODS_DISABLED_PATH_DEFAULT, ARCHIVE_CACHE_SIZE_DEFAULT, BACKUP_FULL, BACKUP_KEEP_DEFAULT, BACKUP_FORMAT_ZIP, BACKUP_SCHEDULE_OFF, COMPRESSION_BALANCED, STORED_EXTENSIONS_DEFAULT, ModKeys, OptionKeys
 
 class Save(JSONParser):
     '''Manages the data of each mod'''
@@ -29,6 +29,10 @@ class Save(JSONParser):
     def getMod(self, mod: str) -> dict | None:
         return self.file.get(mod, None)
 
+    def setMod(self, mod: str, data: dict) -> None:
+        '''Replaces a mod's whole entry, used to restore deleted mods'''
+        self.file[mod] = data
+
     def addMods(self, *mods: tuple[list[str], ModType]) -> None:
         '''
         Saves new mods to the config file
@@ -263,6 +267,126 @@ class OptionsManager():
     def setDispath(path: str = MODS_DISABLED_PATH_DEFAULT) -> None:
         OptionsManager.config.set(OptionKeys.section.value, OptionKeys.dispath.value, os.path.abspath(path))
 
+    @staticmethod
+    def getSymlinkMods() -> bool:
+        return OptionsManager.config.getboolean(OptionKeys.section.value, OptionKeys.symlink_mods.value, fallback=False)
+
+    @staticmethod
+    def setSymlinkMods(symlink: bool = False) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.symlink_mods.value, str(symlink))
+
+    @staticmethod
+    def getContentStore() -> bool:
+        return OptionsManager.config.getboolean(OptionKeys.section.value, OptionKeys.content_store.value, fallback=False)
+
+    @staticmethod
+    def setContentStore(store: bool = False) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.content_store.value, str(store))
+
+    @staticmethod
+    def getArchiveCache() -> bool:
+        return OptionsManager.config.getboolean(OptionKeys.section.value, OptionKeys.archive_cache.value, fallback=False)
+
+    @staticmethod
+    def setArchiveCache(cache: bool = False) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.archive_cache.value, str(cache))
+
+    @staticmethod
+    def getArchiveCacheSize() -> int:
+        '''Size budget of the archive cache in MiB'''
+        return OptionsManager.config.getint(OptionKeys.section.value, OptionKeys.archive_cache_size.value, fallback=ARCHIVE_CACHE_SIZE_DEFAULT)
+
+    @staticmethod
+    def setArchiveCacheSize(size: int = ARCHIVE_CACHE_SIZE_DEFAULT) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.archive_cache_size.value, str(size))
+
+    @staticmethod
+    def getBackupMode() -> str:
+        return OptionsManager.config.get(OptionKeys.section.value, OptionKeys.backup_mode.value, fallback=BACKUP_FULL)
+
+    @staticmethod
+    def setBackupMode(mode: str = BACKUP_FULL) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.backup_mode.value, mode)
+
+    @staticmethod
+    def getBackupFormat() -> str:
+        return OptionsManager.config.get(OptionKeys.section.value, OptionKeys.backup_format.value, fallback=BACKUP_FORMAT_ZIP)
+
+    @staticmethod
+    def setBackupFormat(format: str = BACKUP_FORMAT_ZIP) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.backup_format.value, format)
+
+    @staticmethod
+    def getBackupCompression() -> str:
+        return OptionsManager.config.get(OptionKeys.section.value, OptionKeys.backup_compression.value, fallback=COMPRESSION_BALANCED)
+
+    @staticmethod
+    def setBackupCompression(compression: str = COMPRESSION_BALANCED) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.backup_compression.value, compression)
+
+    @staticmethod
+    def getStoredExtensions() -> list[str]:
+        '''
+        Extensions of the files that backups store without compressing them.
+
+        The option can be edited by hand, so each extension is lowercased and gets its leading dot
+        '''
+
+        if not OptionsManager.hasOption(OptionKeys.stored_extensions.value):
+            return list(STORED_EXTENSIONS_DEFAULT)
+
+        extensions = (x.strip().lower() for x in OptionsManager.getList(OptionKeys.section.value, OptionKeys.stored_extensions.value))
+
+        return [x if x.startswith('.') else f'.{x}' for x in extensions if x]
+
+    @staticmethod
+    def setStoredExtensions(extensions: Sequence[str] = STORED_EXTENSIONS_DEFAULT) -> None:
+        OptionsManager.setList(OptionKeys.section.value, OptionKeys.stored_extensions.value, extensions)
+
+    @staticmethod
+    def getBackupSchedule() -> str:
+        return OptionsManager.config.get(OptionKeys.section.value, OptionKeys.backup_schedule.value, fallback=BACKUP_SCHEDULE_OFF)
+
+    @staticmethod
+    def setBackupSchedule(schedule: str = BACKUP_SCHEDULE_OFF) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.backup_schedule.value, schedule)
+
+    @staticmethod
+    def getBackupBandwidth() -> int:
+        '''MiB per second scheduled backups read at most, 0 doesn't limit them'''
+        return OptionsManager.config.getint(OptionKeys.section.value, OptionKeys.backup_bandwidth.value, fallback=0)
+
+    @staticmethod
+    def setBackupBandwidth(bandwidth: int = 0) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.backup_bandwidth.value, str(bandwidth))
+
+    @staticmethod
+    def getDownloadBandwidth() -> int:
+        '''MiB per second mod downloads use at most, 0 doesn't limit them'''
+        return OptionsManager.config.getint(OptionKeys.section.value, OptionKeys.download_bandwidth.value, fallback=0)
+
+    @staticmethod
+    def setDownloadBandwidth(bandwidth: int = 0) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.download_bandwidth.value, str(bandwidth))
+
+    @staticmethod
+    def getBackupKeep() -> int:
+        '''Amount of backups kept, 0 keeps every backup'''
+        return OptionsManager.config.getint(OptionKeys.section.value, OptionKeys.backup_keep.value, fallback=BACKUP_KEEP_DEFAULT)
+
+    @staticmethod
+    def setBackupKeep(keep: int = BACKUP_KEEP_DEFAULT) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.backup_keep.value, str(keep))
+
+    @staticmethod
+    def getBackupMaxAge() -> int:
+        '''Days a backup is kept, 0 keeps backups forever'''
+        return OptionsManager.config.getint(OptionKeys.section.value, OptionKeys.backup_max_age.value, fallback=0)
+
+    @staticmethod
+    def setBackupMaxAge(days: int = 0) -> None:
+        OptionsManager.config.set(OptionKeys.section.value, OptionKeys.backup_max_age.value, str(days))
+
     @staticmethod
     def getWindowSize() -> QSize:
         width = OptionsManager.config.getint(OptionKeys.section.value, OptionKeys.windowsize_w.value, fallback=800)
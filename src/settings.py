@@ -11,9 +11,12 @@ from src.save import OptionsManager
 from src.getPath import Pathing
 from src.style import StyleManager
 from src.widgets.ignoredModsQListWidget import IgnoredMods
-from src.constant_vars import DARK, LIGHT, OPTIONS_CONFIG, ROOT_PATH, OptionKeys, LANG_FOLDER_PATH
+from src.constant_vars import DARK, LIGHT, OPTIONS_CONFIG, ROOT_PATH, OptionKeys, LANG_FOLDER_PATH, BACKUP_FULL, BACKUP_INCREMENTAL, BACKUP_DIFFERENTIAL, BACKUP_FORMAT_ZIP, BACKUP_FORMAT_REPOSITORY, BACKUP_SCHEDULE_OFF, BACKUP_SCHEDULE_STARTUP, BACKUP_SCHEDULE_DAILY, BACKUP_SCHEDULE_PROFILE, COMPRESSION_FAST, COMPRESSION_BALANCED, COMPRESSION_SMALL
 from src.widgets.QDialog.newUpdateQDialog import updateDetected
 from src.widgets.QDialog.announcementQDialog import Notice
+from src.widgets.QDialog.trashQDialog import TrashBin
+from src.widgets.QDialog.archiveCacheQDialog import CachedArchives
+from src.widgets.QDialog.restoreBackupQDialog import RestoreBackup
 
 from src.api.checkUpdate import checkUpdate
 
@@ -172,6 +175,42 @@ class Options(qtw.QWidget):
 
         if self.optionChanged.get(OptionKeys.mmm_update_alert):
             self.optionsManager.setMMMUpdateAlert(self.optionsGeneral.updateAlertCheckbox.isChecked())
+
+        if self.optionChanged.get(OptionKeys.symlink_mods):
+            self.optionsManager.setSymlinkMods(self.optionsGeneral.symlinkModsCheckbox.isChecked())
+
+        if self.optionChanged.get(OptionKeys.content_store):
+            self.optionsManager.setContentStore(self.optionsGeneral.contentStoreCheckbox.isChecked())
+
+        if self.optionChanged.get(OptionKeys.archive_cache):
+            self.optionsManager.setArchiveCache(self.optionsGeneral.archiveCacheCheckbox.isChecked())
+
+        if self.optionChanged.get(OptionKeys.archive_cache_size):
+            self.optionsManager.setArchiveCacheSize(self.optionsGeneral.archiveCacheSize.value())
+
+        if self.optionChanged.get(OptionKeys.backup_format):
+            self.optionsManager.setBackupFormat(self.optionsMisc.backupFormat.currentData())
+
+        if self.optionChanged.get(OptionKeys.backup_mode):
+            self.optionsManager.setBackupMode(self.optionsMisc.backupMode.currentData())
+
+        if self.optionChanged.get(OptionKeys.backup_compression):
+            self.optionsManager.setBackupCompression(self.optionsMisc.backupCompression.currentData())
+
+        if self.optionChanged.get(OptionKeys.backup_schedule):
+            self.optionsManager.setBackupSchedule(self.optionsMisc.backupSchedule.currentData())
+
+        if self.optionChanged.get(OptionKeys.backup_bandwidth):
+            self.optionsManager.setBackupBandwidth(self.optionsMisc.backupBandwidth.value())
+
+        if self.optionChanged.get(OptionKeys.backup_keep):
+            self.optionsManager.setBackupKeep(self.optionsMisc.backupKeep.value())
+
+        if self.optionChanged.get(OptionKeys.backup_max_age):
+            self.optionsManager.setBackupMaxAge(self.optionsMisc.backupMaxAge.value())
+
+        if self.optionChanged.get(OptionKeys.download_bandwidth):
+            self.optionsManager.setDownloadBandwidth(self.optionsMisc.downloadBandwidth.value())
         
         if self.optionChanged.get(OptionKeys.lang):
             app: qtw.QApplication = qtw.QApplication.instance()
@@ -217,6 +256,42 @@ class Options(qtw.QWidget):
         if self.optionChanged.get(OptionKeys.mmm_update_alert) or reset:
             self.optionsGeneral.updateAlertCheckbox.setChecked(self.optionsManager.getMMMUpdateAlert())
 
+        if self.optionChanged.get(OptionKeys.symlink_mods) or reset:
+            self.optionsGeneral.symlinkModsCheckbox.setChecked(self.optionsManager.getSymlinkMods())
+
+        if self.optionChanged.get(OptionKeys.content_store) or reset:
+            self.optionsGeneral.contentStoreCheckbox.setChecked(self.optionsManager.getContentStore())
+
+        if self.optionChanged.get(OptionKeys.archive_cache) or reset:
+            self.optionsGeneral.archiveCacheCheckbox.setChecked(self.optionsManager.getArchiveCache())
+
+        if self.optionChanged.get(OptionKeys.archive_cache_size) or reset:
+            self.optionsGeneral.archiveCacheSize.setValue(self.optionsManager.getArchiveCacheSize())
+
+        if self.optionChanged.get(OptionKeys.backup_format) or reset:
+            self.optionsMisc.backupFormat.setCurrentIndex(self.optionsMisc.backupFormat.findData(self.optionsManager.getBackupFormat()))
+
+        if self.optionChanged.get(OptionKeys.backup_mode) or reset:
+            self.optionsMisc.backupMode.setCurrentIndex(self.optionsMisc.backupMode.findData(self.optionsManager.getBackupMode()))
+
+        if self.optionChanged.get(OptionKeys.backup_compression) or reset:
+            self.optionsMisc.backupCompression.setCurrentIndex(self.optionsMisc.backupCompression.findData(self.optionsManager.getBackupCompression()))
+
+        if self.optionChanged.get(OptionKeys.backup_schedule) or reset:
+            self.optionsMisc.backupSchedule.setCurrentIndex(self.optionsMisc.backupSchedule.findData(self.optionsManager.getBackupSchedule()))
+
+        if self.optionChanged.get(OptionKeys.backup_bandwidth) or reset:
+            self.optionsMisc.backupBandwidth.setValue(self.optionsManager.getBackupBandwidth())
+
+        if self.optionChanged.get(OptionKeys.backup_keep) or reset:
+            self.optionsMisc.backupKeep.setValue(self.optionsManager.getBackupKeep())
+
+        if self.optionChanged.get(OptionKeys.backup_max_age) or reset:
+            self.optionsMisc.backupMaxAge.setValue(self.optionsManager.getBackupMaxAge())
+
+        if self.optionChanged.get(OptionKeys.download_bandwidth) or reset:
+            self.optionsMisc.downloadBandwidth.setValue(self.optionsManager.getDownloadBandwidth())
+
         if self.optionChanged.get(OptionKeys.lang) or reset:
             self.optionsGeneral.language.setCurrentText(language_code_to_string.get(self.optionsManager.getLang()))
 
@@ -263,6 +338,26 @@ class OptionsGeneral(OptionsSectionBase):
         self.language.addItems(list(language_string_to_code.keys()))
         self.language.currentTextChanged.connect(lambda x: self.langChanged(language_string_to_code.get(x)))
 
+        self.symlinkModsCheckbox = qtw.QCheckBox(self)
+        self.symlinkModsCheckbox.setChecked(self.optionsManager.getSymlinkMods())
+        self.symlinkModsCheckbox.clicked.connect(self.setSymlinkMods)
+
+        self.contentStoreCheckbox = qtw.QCheckBox(self)
+        self.contentStoreCheckbox.setChecked(self.optionsManager.getContentStore())
+        self.contentStoreCheckbox.clicked.connect(self.setContentStore)
+
+        self.archiveCacheCheckbox = qtw.QCheckBox(self)
+        self.archiveCacheCheckbox.setChecked(self.optionsManager.getArchiveCache())
+        self.archiveCacheCheckbox.clicked.connect(self.setArchiveCache)
+
+        # In MiB
+        self.archiveCacheSize = qtw.QSpinBox(self)
+        self.archiveCacheSize.setRange(256, 1024 * 1024)
+        self.archiveCacheSize.setSingleStep(256)
+        self.archiveCacheSize.setSuffix(' MB')
+        self.archiveCacheSize.setValue(self.optionsManager.getArchiveCacheSize())
+        self.archiveCacheSize.valueChanged.connect(self.setArchiveCacheSize)
+
         gbLayout = qtw.QHBoxLayout()
 
         self.buttonFrame = qtw.QGroupBox(self)
@@ -306,6 +401,7 @@ class OptionsGeneral(OptionsSectionBase):
         self.gameDirLabel = qtw.QLabel(self)
         self.disabledModDirLabel = qtw.QLabel(self)
         self.LanguageLabel = qtw.QLabel(self)
+        self.archiveCacheSizeLabel = qtw.QLabel(self)
 
         # Setting rows for General Sub Section Layout
         for label, widget in (
@@ -314,6 +410,11 @@ class OptionsGeneral(OptionsSectionBase):
                                 (self.LanguageLabel, self.language)
                               ):
             self.generalLayout.addRow(label, widget)
+
+        self.generalLayout.addRow(self.symlinkModsCheckbox)
+        self.generalLayout.addRow(self.contentStoreCheckbox)
+        self.generalLayout.addRow(self.archiveCacheCheckbox)
+        self.generalLayout.addRow(self.archiveCacheSizeLabel, self.archiveCacheSize)
         
         self.general.setLayout(self.generalLayout)
         
@@ -336,6 +437,16 @@ class OptionsGeneral(OptionsSectionBase):
         self.disabledModDirLabel.setText(qapp.translate("OptionsGeneral", "Disabled Mods Path:"))
         self.LanguageLabel.setText(qapp.translate("OptionsGeneral", "Language:"))
 
+        self.symlinkModsCheckbox.setText(qapp.translate("OptionsGeneral", "Enable mods with symlinks instead of moving them"))
+        self.symlinkModsCheckbox.setToolTip(qapp.translate("OptionsGeneral", "Mods stay in the disabled mods path and are linked into the game directory, so enabling and disabling is instant"))
+
+        self.contentStoreCheckbox.setText(qapp.translate("OptionsGeneral", "Store identical mod files only once"))
+        self.contentStoreCheckbox.setToolTip(qapp.translate("OptionsGeneral", "Installed mod files are kept once in MMM's content store and hardlinked into the game directory, the store must be on the same drive as the game"))
+
+        self.archiveCacheCheckbox.setText(qapp.translate("OptionsGeneral", "Keep a copy of installed archives"))
+        self.archiveCacheCheckbox.setToolTip(qapp.translate("OptionsGeneral", "Archives can be installed again from Options > Misc > Cached Archives, with the content store on they're installed without being extracted"))
+        self.archiveCacheSizeLabel.setText(qapp.translate("OptionsGeneral", "Archive Cache Size:"))
+
         self.gbUpdates.setTitle(qapp.translate("OptionsGeneral", "Updates"))
         self.updateAlertCheckbox.setText(qapp.translate("OptionsGeneral", 'Update alerts on startup'))
         self.checkUpdateButton.setText(qapp.translate("OptionsGeneral", "Check for updates"))
@@ -360,6 +471,22 @@ class OptionsGeneral(OptionsSectionBase):
         changed = True if self.updateAlertCheckbox.isChecked() != self.optionsManager.getMMMUpdateAlert() else False
         self.pendingChanges.emit(OptionKeys.mmm_update_alert, changed)
     
+    def setSymlinkMods(self) -> None:
+        changed = True if self.symlinkModsCheckbox.isChecked() != self.optionsManager.getSymlinkMods() else False
+        self.pendingChanges.emit(OptionKeys.symlink_mods, changed)
+
+    def setContentStore(self) -> None:
+        changed = True if self.contentStoreCheckbox.isChecked() != self.optionsManager.getContentStore() else False
+        self.pendingChanges.emit(OptionKeys.content_store, changed)
+
+    def setArchiveCache(self) -> None:
+        changed = True if self.archiveCacheCheckbox.isChecked() != self.optionsManager.getArchiveCache() else False
+        self.pendingChanges.emit(OptionKeys.archive_cache, changed)
+
+    def setArchiveCacheSize(self, size: int) -> None:
+        changed = True if size != self.optionsManager.getArchiveCacheSize() else False
+        self.pendingChanges.emit(OptionKeys.archive_cache_size, changed)
+
     def checkUpdate(self) -> None:
         def updateFound(latestVersion: str, changelog: str) -> None:
             notice = updateDetected(latestVersion, changelog)
@@ -432,9 +559,19 @@ class OptionsShortcuts(OptionsSectionBase):
         ]))
 
 class OptionsMisc(OptionsSectionBase):
+
+    # Dict of mods restored from the trash or a backup and their MOD_CONFIG entries
+    modsRestored = Signal(dict)
+
+    # Dict of the paths of mods installed from the archive cache and their ModType
+    modsInstalled = Signal(dict)
+
     def __init__(self, parent: Options = None) -> None:
         super().__init__(parent= parent)
 
+        parent = self.parentWidget()
+        self.optionsManager: OptionsManager = parent.optionsManager
+
         layout = qtw.QVBoxLayout()
         
         self.miscGroup = qtw.QGroupBox(self)
@@ -444,13 +581,107 @@ class OptionsMisc(OptionsSectionBase):
         self.backupMods = qtw.QPushButton(self)
         self.backupMods.clicked.connect(self.startBackupMods)
 
+        self.backupFormatLabel = qtw.QLabel(self)
+
+        self.backupFormat = qtw.QComboBox(self)
+        self.backupFormat.setEditable(False)
+        self.backupFormat.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+        for format in (BACKUP_FORMAT_ZIP, BACKUP_FORMAT_REPOSITORY):
+            self.backupFormat.addItem('', format)
+
+        self.backupFormat.setCurrentIndex(self.backupFormat.findData(self.optionsManager.getBackupFormat()))
+        self.backupFormat.currentIndexChanged.connect(lambda x: self.backupFormatChanged(self.backupFormat.itemData(x)))
+
+        self.backupModeLabel = qtw.QLabel(self)
+
+        self.backupMode = qtw.QComboBox(self)
+        self.backupMode.setEditable(False)
+        self.backupMode.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+        for mode in (BACKUP_FULL, BACKUP_INCREMENTAL, BACKUP_DIFFERENTIAL):
+            self.backupMode.addItem('', mode)
+
+        self.backupMode.setCurrentIndex(self.backupMode.findData(self.optionsManager.getBackupMode()))
+        self.backupMode.currentIndexChanged.connect(lambda x: self.backupModeChanged(self.backupMode.itemData(x)))
+
+        # Snapshots are always complete, there's no mode to pick
+        self.backupMode.setEnabled(self.backupFormat.currentData() == BACKUP_FORMAT_ZIP)
+
+        self.backupCompressionLabel = qtw.QLabel(self)
+
+        self.backupCompression = qtw.QComboBox(self)
+        self.backupCompression.setEditable(False)
+        self.backupCompression.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+        for compression in (COMPRESSION_FAST, COMPRESSION_BALANCED, COMPRESSION_SMALL):
+            self.backupCompression.addItem('', compression)
+
+        self.backupCompression.setCurrentIndex(self.backupCompression.findData(self.optionsManager.getBackupCompression()))
+        self.backupCompression.currentIndexChanged.connect(lambda x: self.backupCompressionChanged(self.backupCompression.itemData(x)))
+
+        self.backupScheduleLabel = qtw.QLabel(self)
+
+        self.backupSchedule = qtw.QComboBox(self)
+        self.backupSchedule.setEditable(False)
+        self.backupSchedule.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+
+        for schedule in (BACKUP_SCHEDULE_OFF, BACKUP_SCHEDULE_STARTUP, BACKUP_SCHEDULE_DAILY, BACKUP_SCHEDULE_PROFILE):
+            self.backupSchedule.addItem('', schedule)
+
+        self.backupSchedule.setCurrentIndex(self.backupSchedule.findData(self.optionsManager.getBackupSchedule()))
+        self.backupSchedule.currentIndexChanged.connect(lambda x: self.backupScheduleChanged(self.backupSchedule.itemData(x)))
+
+        self.backupBandwidthLabel = qtw.QLabel(self)
+
+        # In MiB per second, 0 is unlimited
+        self.backupBandwidth = qtw.QSpinBox(self)
+        self.backupBandwidth.setRange(0, 1024)
+        self.backupBandwidth.setSuffix(' MB/s')
+        self.backupBandwidth.setValue(self.optionsManager.getBackupBandwidth())
+        self.backupBandwidth.valueChanged.connect(self.backupBandwidthChanged)
+
+        self.backupKeepLabel = qtw.QLabel(self)
+
+        # 0 keeps every backup
+        self.backupKeep = qtw.QSpinBox(self)
+        self.backupKeep.setRange(0, 1000)
+        self.backupKeep.setValue(self.optionsManager.getBackupKeep())
+        self.backupKeep.valueChanged.connect(self.backupKeepChanged)
+
+        self.backupMaxAgeLabel = qtw.QLabel(self)
+
+        # In days, 0 keeps backups forever
+        self.backupMaxAge = qtw.QSpinBox(self)
+        self.backupMaxAge.setRange(0, 3650)
+        self.backupMaxAge.setValue(self.optionsManager.getBackupMaxAge())
+        self.backupMaxAge.valueChanged.connect(self.backupMaxAgeChanged)
+
+        self.downloadBandwidthLabel = qtw.QLabel(self)
+
+        # In MiB per second, 0 is unlimited
+        self.downloadBandwidth = qtw.QSpinBox(self)
+        self.downloadBandwidth.setRange(0, 1024)
+        self.downloadBandwidth.setSuffix(' MB/s')
+        self.downloadBandwidth.setValue(self.optionsManager.getDownloadBandwidth())
+        self.downloadBandwidth.valueChanged.connect(self.downloadBandwidthChanged)
+
+        self.restoreBackup = qtw.QPushButton(self)
+        self.restoreBackup.clicked.connect(self.openRestoreBackup)
+
+        self.trashBin = qtw.QPushButton(self)
+        self.trashBin.clicked.connect(self.openTrashBin)
+
+        self.cachedArchives = qtw.QPushButton(self)
+        self.cachedArchives.clicked.connect(self.openCachedArchives)
+
         self.log = qtw.QPushButton(self)
         self.log.clicked.connect(self.openCrashLogs)
 
         self.modLog = qtw.QPushButton(self)
         self.modLog.clicked.connect(self.openCrashLogBLT)
 
-        for widget in (self.backupMods, self.log, self.modLog):
+        for widget in (self.backupMods, self.backupFormatLabel, self.backupFormat, self.backupModeLabel, self.backupMode, self.backupCompressionLabel, self.backupCompression, self.backupScheduleLabel, self.backupSchedule, self.backupBandwidthLabel, self.backupBandwidth, self.backupKeepLabel, self.backupKeep, self.backupMaxAgeLabel, self.backupMaxAge, self.downloadBandwidthLabel, self.downloadBandwidth, self.restoreBackup, self.trashBin, self.cachedArchives, self.log, self.modLog):
             miscGroupLayout.addWidget(widget)
         
         self.miscGroup.setLayout(miscGroupLayout)
@@ -468,12 +699,100 @@ class OptionsMisc(OptionsSectionBase):
         self.backupMods.setText(qapp.translate("OptionsMisc", "Backup Mods"))
         self.backupMods.setToolTip(qapp.translate("OptionsMisc", "Copies and compresses all of your mods to MMM's installation folder"))
 
+        self.backupFormatLabel.setText(qapp.translate("OptionsMisc", "Backup Format:"))
+
+        self.backupFormat.setItemText(0, qapp.translate("OptionsMisc", "Zip Archives"))
+        self.backupFormat.setItemText(1, qapp.translate("OptionsMisc", "Deduplicated Repository"))
+        self.backupFormat.setToolTip(qapp.translate("OptionsMisc", "A repository stores files that are the same across mods and backups once, many snapshots take up little more space than one"))
+
+        self.backupModeLabel.setText(qapp.translate("OptionsMisc", "Backup Mode:"))
+
+        self.backupMode.setItemText(0, qapp.translate("OptionsMisc", "Full"))
+        self.backupMode.setItemText(1, qapp.translate("OptionsMisc", "Incremental"))
+        self.backupMode.setItemText(2, qapp.translate("OptionsMisc", "Differential"))
+        self.backupMode.setToolTip(qapp.translate("OptionsMisc", "Incremental backups only have the files changed since the last backup, differential backups the files changed since the last full backup"))
+
+        self.backupCompressionLabel.setText(qapp.translate("OptionsMisc", "Backup Compression:"))
+
+        self.backupCompression.setItemText(0, qapp.translate("OptionsMisc", "Fast"))
+        self.backupCompression.setItemText(1, qapp.translate("OptionsMisc", "Balanced"))
+        self.backupCompression.setItemText(2, qapp.translate("OptionsMisc", "Small"))
+        self.backupCompression.setToolTip(qapp.translate("OptionsMisc", "Textures, sound banks and movies are compressed already, they're always stored as they are"))
+
+        self.backupScheduleLabel.setText(qapp.translate("OptionsMisc", "Scheduled Backups:"))
+
+        self.backupSchedule.setItemText(0, qapp.translate("OptionsMisc", "Off"))
+        self.backupSchedule.setItemText(1, qapp.translate("OptionsMisc", "On Startup"))
+        self.backupSchedule.setItemText(2, qapp.translate("OptionsMisc", "Daily"))
+        self.backupSchedule.setItemText(3, qapp.translate("OptionsMisc", "Before Applying a Profile"))
+        self.backupSchedule.setToolTip(qapp.translate("OptionsMisc", "Backups on startup and daily backups run in the background and wait while PAYDAY 2 is running"))
+
+        self.backupBandwidthLabel.setText(qapp.translate("OptionsMisc", "Scheduled Backup Speed Limit:"))
+        self.backupBandwidth.setSpecialValueText(qapp.translate("OptionsMisc", "Unlimited"))
+        self.backupBandwidth.setToolTip(qapp.translate("OptionsMisc", "How fast backups in the background read your mods, so they don't slow down your drive"))
+
+        self.backupKeepLabel.setText(qapp.translate("OptionsMisc", "Backups to Keep:"))
+        self.backupKeep.setSpecialValueText(qapp.translate("OptionsMisc", "All"))
+        self.backupKeep.setToolTip(qapp.translate("OptionsMisc", "Older backups are removed after each backup, unless a newer backup is built on them"))
+
+        self.backupMaxAgeLabel.setText(qapp.translate("OptionsMisc", "Remove Backups After:"))
+        self.backupMaxAge.setSuffix(' ' + qapp.translate("OptionsMisc", "days"))
+        self.backupMaxAge.setSpecialValueText(qapp.translate("OptionsMisc", "Never"))
+        self.backupMaxAge.setToolTip(qapp.translate("OptionsMisc", "The newest backup is always kept"))
+
+        self.downloadBandwidthLabel.setText(qapp.translate("OptionsMisc", "Mod Download Speed Limit:"))
+        self.downloadBandwidth.setSpecialValueText(qapp.translate("OptionsMisc", "Unlimited"))
+        self.downloadBandwidth.setToolTip(qapp.translate("OptionsMisc", "How fast mods are downloaded from modworkshop, so they don't slow down your connection"))
+
+        self.restoreBackup.setText(qapp.translate("OptionsMisc", "Restore Mods..."))
+        self.restoreBackup.setToolTip(qapp.translate("OptionsMisc", "Restore some of the mods of a backup"))
+
+        self.trashBin.setText(qapp.translate("OptionsMisc", "Deleted Mods..."))
+        self.trashBin.setToolTip(qapp.translate("OptionsMisc", "Restore deleted mods or empty the trash"))
+
+        self.cachedArchives.setText(qapp.translate("OptionsMisc", "Cached Archives..."))
+        self.cachedArchives.setToolTip(qapp.translate("OptionsMisc", "Install mods again from the archive cache"))
+
         self.log.setText(qapp.translate("OptionsMisc", "Open Crash Logs..."))
         self.log.setToolTip(qapp.translate("OptionsMisc", "Opens the crash log directory used by vanilla Payday 2"))
 
         self.modLog.setText(qapp.translate("OptionsMisc", "Open Mod Crash Logs..."))
         self.modLog.setToolTip(qapp.translate("OptionsMisc", "Opens the crash log directory that BLT uses"))
     
+    def backupFormatChanged(self, format: str) -> None:
+        self.backupMode.setEnabled(format == BACKUP_FORMAT_ZIP)
+
+        changed = True if format != self.optionsManager.getBackupFormat() else False
+        self.pendingChanges.emit(OptionKeys.backup_format, changed)
+
+    def backupModeChanged(self, mode: str) -> None:
+        changed = True if mode != self.optionsManager.getBackupMode() else False
+        self.pendingChanges.emit(OptionKeys.backup_mode, changed)
+
+    def backupCompressionChanged(self, compression: str) -> None:
+        changed = True if compression != self.optionsManager.getBackupCompression() else False
+        self.pendingChanges.emit(OptionKeys.backup_compression, changed)
+
+    def backupScheduleChanged(self, schedule: str) -> None:
+        changed = True if schedule != self.optionsManager.getBackupSchedule() else False
+        self.pendingChanges.emit(OptionKeys.backup_schedule, changed)
+
+    def backupBandwidthChanged(self, bandwidth: int) -> None:
+        changed = True if bandwidth != self.optionsManager.getBackupBandwidth() else False
+        self.pendingChanges.emit(OptionKeys.backup_bandwidth, changed)
+
+    def backupKeepChanged(self, keep: int) -> None:
+        changed = True if keep != self.optionsManager.getBackupKeep() else False
+        self.pendingChanges.emit(OptionKeys.backup_keep, changed)
+
+    def backupMaxAgeChanged(self, days: int) -> None:
+        changed = True if days != self.optionsManager.getBackupMaxAge() else False
+        self.pendingChanges.emit(OptionKeys.backup_max_age, changed)
+
+    def downloadBandwidthChanged(self, bandwidth: int) -> None:
+        changed = True if bandwidth != self.optionsManager.getDownloadBandwidth() else False
+        self.pendingChanges.emit(OptionKeys.download_bandwidth, changed)
+
     def openCrashLogBLT(self) -> None:
         modPath = Pathing().mods()
 
@@ -490,6 +809,21 @@ class OptionsMisc(OptionsSectionBase):
             )
             notice.exec()
     
+    def openRestoreBackup(self) -> None:
+        dialog = RestoreBackup()
+        dialog.modsRestored.connect(lambda x: self.modsRestored.emit(x))
+        dialog.exec()
+
+    def openTrashBin(self) -> None:
+        dialog = TrashBin()
+        dialog.modsRestored.connect(lambda x: self.modsRestored.emit(x))
+        dialog.exec()
+
+    def openCachedArchives(self) -> None:
+        dialog = CachedArchives()
+        dialog.modsInstalled.connect(lambda x: self.modsInstalled.emit(x))
+        dialog.exec()
+
     def startBackupMods(self) -> None:
         
         startFileMover = ProgressWidget(BackupMods())
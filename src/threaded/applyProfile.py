@@ -0,0 +1,135 @@
+import os
+import logging
+
+from PySide6.QtCore import Signal, QCoreApplication as qapp
+
+from src.threaded.workerQObject import Worker
+from src.cancelToken import CancelToken, Canceled
+
+from src.constant_vars import ModType, MOD_CONFIG, OPTIONS_CONFIG
+
+class ApplyProfile(Worker):
+    '''
+    Enables the mods of a profile and disables every other installed mod.
+
+    Only the mods whose state actually changes are moved, if something goes wrong
+    every mod that was already moved is put back to how it was.
+    '''
+
+    # Dict of the mods that were changed and if they're now enabled
+    applied = Signal(dict)
+
+    def __init__(self, *mods: str, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
+        super().__init__(optionsPath=optionsPath, savePath=savePath)
+
+        self.mods = mods
+
+        self.notInstalled: list[str] = []
+
+    def plan(self) -> tuple[list[str], list[str], list[str]]:
+        '''
+        Compares the profile to what is in the mod directories
+
+        Returning Indexes:
+        + 0: Mods to enable
+        + 1: Mods to disable
+        + 2: Mods in the profile that aren't installed
+        '''
+
+        def listDir(path: str) -> set[str]:
+            return set(os.listdir(path)) if os.path.isdir(path) else set()
+
+        # Each directory is read once instead of checking every mod with errorChecking.isInstalled()
+        enabledDirs = {ModType.mods : listDir(self.p.mods()),
+                       ModType.mods_override : listDir(self.p.mod_overrides()),
+                       ModType.maps : listDir(self.p.maps())}
+
+        disabledDir = listDir(self.optionsManager.getDispath())
+
+        installed = disabledDir.union(*enabledDirs.values())
+
+        profile = set(self.mods)
+
+        toEnable: list[str] = []
+        toDisable: list[str] = []
+
+        for mod in self.saveManager.mods():
+
+            modType = self.saveManager.getType(mod)
+
+            if modType is None or mod not in installed:
+                continue
+
+            isEnabled = mod in enabledDirs[modType]
+
+            if mod in profile and not isEnabled:
+                toEnable.append(mod)
+
+            elif mod not in profile and isEnabled:
+                toDisable.append(mod)
+
+        notInstalled = [x for x in self.mods if x not in installed]
+
+        logging.info('Profile plan, enabling: %s | disabling: %s | not installed: %s', toEnable, toDisable, notInstalled)
+
+        return toEnable, toDisable, notInstalled
+
+    def start(self) -> None:
+        '''Applies the profile as one job'''
+
+        # Mods that were changed and if they were enabled, used to roll back
+        journal: list[tuple[str, bool]] = []
+
+        try:
+            toEnable, toDisable, self.notInstalled = self.plan()
+
+            self.setTotalProgress.emit(len(toEnable) + len(toDisable))
+
+            for mod, enable in [(x, False) for x in toDisable] + [(x, True) for x in toEnable]:
+
+                self.cancelCheck()
+
+                if enable:
+                    self.setCurrentProgress.emit(1, qapp.translate('ApplyProfile', 'Enabling') + f' {mod}')
+                    changed = self.enableMod(mod)
+                else:
+                    self.setCurrentProgress.emit(1, qapp.translate('ApplyProfile', 'Disabling') + f' {mod}')
+                    changed = self.disableMod(mod)
+
+                if changed:
+                    journal.append((mod, enable))
+
+            self.applied.emit({mod : enabled for mod, enabled in journal})
+
+            self.succeeded.emit()
+
+        except Canceled:
+
+            self.rollback(journal)
+
+            self.canceled()
+
+        except Exception as e:
+
+            self.rollback(journal)
+
+            self.error.emit(qapp.translate('ApplyProfile', 'An error occured while applying a profile, the changes were undone:') + f'\n{e}')
+
+    def rollback(self, journal: list[tuple[str, bool]]) -> None:
+        '''Undoes the journal's changes, newest first'''
+
+        # The undo has to finish even if the task was canceled
+        self.cancelToken = CancelToken()
+
+        for mod, enabled in reversed(journal):
+
+            logging.info('Rolling back %s', mod)
+
+            try:
+                if enabled:
+                    self.disableMod(mod)
+                else:
+                    self.enableMod(mod)
+
+            except Exception as e:
+                logging.error('Could not roll back %s:\n%s', mod, str(e))
@@ -1,126 +1,307 @@
 import os
-import shutil
+import json
+import threading
 import logging
+import zipfile
 
 from PySide6.QtCore import QCoreApplication as qapp
 
 from src.threaded.workerQObject import Worker
-from src.constant_vars import ModType, BACKUP_MODS, MODSIGNORE, MOD_CONFIG
+from src.backupChain import BackupChain, BACKUP_PREFIXES, scanSources, diffStates, modFolder, expiredBackups
+from src.cancelToken import Canceled, ThrottledToken
+from src.backupRepository import BackupRepository
+from src.parallelZip import writeMembers, compressThreads
+import src.errorChecking as errorChecking
+
+from src.constant_vars import ModType, BACKUP_MODS, BACKUP_MANIFEST, BACKUP_REPOSITORY, BACKUP_FORMAT_REPOSITORY, BACKUP_FULL, BACKUP_INCREMENTAL, BACKUP_DIFFERENTIAL, COMPRESSION_LEVELS, COMPRESSION_BALANCED, MODSIGNORE, MOD_CONFIG, OPTIONS_CONFIG, GAME_EXECUTABLES
+
+# Seconds between checks if the backup that is running is done
+BACKUP_WAIT = 0.1
 
 class BackupMods(Worker):
+    '''
+    Backs up every mod into a zip in the backup folder of the exe directory.
+
+    Files are streamed from wherever the mod is, its enabled or disabled directory,
+    straight into the zip. Nothing is copied to a temporary folder first.
+
+    Depending on the backup mode the zip has every mod, or only the files that changed since
+    the last backup (incremental) or since the last full backup (differential).
+    Each backup has a manifest of every file, so a restore can put the chain back together.
+
+    With the repository backup format, each backup is a snapshot of deduplicated chunks instead.
+
+    Once the backup is done, the backups the retention options no longer keep are removed.
+    A backup in the background reads no faster than the backup bandwidth option
+    and waits while the game is running
+    '''
+
+    backupPath = os.path.join(os.path.abspath(os.curdir), BACKUP_MODS)
+
+    # Folder of the mod being backed up inside of the backup
+    currentMod: str | None = None
+
+    # Only one backup writes to the backup folder at a time, whether it's scheduled, manual or before a profile
+    lock = threading.Lock()
+    running: 'BackupMods | None' = None
 
-    bundledFilePath = os.path.join(os.path.abspath(os.curdir), BACKUP_MODS)
+    def __init__(self, background: bool = False, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
+        super().__init__(optionsPath=optionsPath, savePath=savePath)
+
+        self.background = background
+
+        if background:
+            self.cancelToken = ThrottledToken(paused=lambda: errorChecking.isProcessRunning(GAME_EXECUTABLES))
 
     def start(self) -> None:
-            '''Takes all of the mods and compresses them into a zip file, the output is in the exe directory'''
+            '''Takes all of the mods and backs them up, the output is in the exe directory'''
+
+            try:
+                self.waitForBackups()
 
-            # Step 1: Gather Options
+                if self.background:
+                    self.cancelToken.bandwidth = self.optionsManager.getBackupBandwidth() * 1024 * 1024
 
-            disPath = self.optionsManager.getDispath()
+                sources = self.gatherMods()
 
-            # Step 2: Set Paths
+                self.setTotalProgress.emit(len(sources) + 3)
 
-            modPath = self.p.mods()
+                # Mods can be restored with their tags, type and modworkshop id
+                metadata = {x : self.saveManager.getMod(x) for x in (os.path.basename(y) for _, y in sources)}
 
-            mod_overridePath = self.p.mod_overrides()
+                if self.optionsManager.getBackupFormat() == BACKUP_FORMAT_REPOSITORY:
+                    self.snapshot(sources, metadata)
+                else:
+                    self.zipChain(sources, metadata)
 
-            maps_path = self.p.maps()
+                self.applyRetention()
 
-            bundledModsPath = os.path.join(self.bundledFilePath, 'mods')
+                self.succeeded.emit()
 
-            bundledOverridePath = os.path.join(self.bundledFilePath, 'assets', 'mod_overrides')
+            except Canceled:
+                self.canceled()
 
-            bundledMapsPath = os.path.join(self.bundledFilePath, 'Maps')
+            except Exception as e:
+                self.error.emit(
+                    qapp.translate('BackupMods', 'An error was raised while backing up mods') +
+                    f':\n{e}'
+                )
 
-            outputPathDict = {ModType.mods_override : bundledOverridePath, ModType.mods : bundledModsPath, ModType.maps : bundledMapsPath}
+            finally:
+                if BackupMods.running is self:
+                    BackupMods.running = None
+                    BackupMods.lock.release()
 
-            srcPathDict = {ModType.mods_override : mod_overridePath, ModType.mods : modPath, ModType.maps : maps_path}
+    def waitForBackups(self) -> None:
+        '''
+        Waits until no other backup is running.
 
-            try:
+        A scheduled backup gives way to any other backup, and a backup the user started cancels a scheduled one.
+        Raises `Canceled` if a scheduled backup finds another backup running
+        '''
+
+        while not BackupMods.lock.acquire(timeout=BACKUP_WAIT):
+
+            other = BackupMods.running
+
+            if self.background:
+                logging.info('Another backup is running, skipping the scheduled backup')
+                raise Canceled()
+
+            if other is not None and other.background and not other.cancel:
+                logging.info('Canceling the scheduled backup, another backup was started')
+
+                self.setCurrentProgress.emit(0, qapp.translate('BackupMods', 'Waiting for the scheduled backup to stop'))
+
+                other.cancel = True
+
+            self.cancelCheck()
+
+        BackupMods.running = self
+
+    def zipChain(self, sources: list[tuple[str, str]], metadata: dict[str, dict | None]) -> None:
+        '''Writes a full, incremental or differential zip backup depending on the backup mode'''
+
+        chain = BackupChain(self.backupPath)
+
+        mode = self.optionsManager.getBackupMode()
+
+        self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Looking for changed files'))
+
+        # Files that didn't change since the last backup aren't hashed again
+        latest = chain.latest()
+
+        state, paths = scanSources(sources, latest['state'] if latest else None, self.cancelToken)
+
+        parent = {BACKUP_INCREMENTAL : latest, BACKUP_DIFFERENTIAL : chain.latest(BACKUP_FULL)}.get(mode)
+
+        # Another backup of the same files would only take up space
+        if latest is not None and diffStates(latest['state'], state) == ([], []):
+            logging.info('Nothing changed since the backup %s', latest['name'])
+
+            self.setCurrentProgress.emit(len(sources) + 1, qapp.translate('BackupMods', 'Nothing changed since the last backup'))
+            return
 
-                # Step 4: Create Folders
+        manifest = chain.newManifest(mode, parent, state)
+        manifest['mods'] = metadata
 
-                # Every mod
-                mods = list([x for x in os.listdir(modPath) if x not in MODSIGNORE] + os.listdir(mod_overridePath) + os.listdir(disPath) + os.listdir(maps_path))
+        name = chain.newName(manifest['kind'])
 
-                self.setTotalProgress.emit(len(mods) + 3)
+        self.zipBackup(chain.zipPath(name), [(x, paths.get(x)) for x in manifest['added']], manifest)
 
-                self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Validating backup folder paths'))
+        chain.saveManifest(name, manifest)
 
-                # Creating backup environment
-                for path in (self.bundledFilePath, bundledModsPath, bundledMapsPath):
+        logging.info('Wrote the %s backup %s with %s changes', manifest['kind'], name, len(manifest['added']) + len(manifest['deleted']))
 
-                    if not os.path.isdir(path):
+        self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Backed up mods to') + f' {chain.zipPath(name)}')
 
-                        os.mkdir(path)
+    def snapshot(self, sources: list[tuple[str, str]], metadata: dict[str, dict | None]) -> None:
+        '''Adds a snapshot to the backup repository, only chunks that aren't stored yet take up space'''
 
-                # Because this dir is a nested one, needs os.makedirs unlike the others
-                if not os.path.isdir(bundledOverridePath):
+        repository = BackupRepository(os.path.join(self.backupPath, BACKUP_REPOSITORY))
 
-                    os.makedirs(bundledOverridePath)
+        latest = repository.latest()
 
-                # Step 5: Copy each mod into the backup folder
-                for mod in (x for x in mods):
+        self.currentMod = None
 
-                    self.cancelCheck()
+        level, stored = self.compression()
 
-                    self.setCurrentProgress.emit(1,
-                        qapp.translate('BackupMods', 'Copying') +
-                        f' {mod} ' +
-                        qapp.translate('BackupMods', 'to') +
-                        f' {BACKUP_MODS}'
-                    )
+        # Chunks aren't pruned until the snapshot that uses them is saved
+        with repository.lock(self.cancelToken):
 
-                    modType = self.saveManager.getType(mod)
+            # Files that didn't change since the last snapshot aren't read again
+            state = repository.addSources(sources, latest['state'] if latest else None, self.cancelToken, self.report, level, stored)
 
-                    # In the case this file is not a mod
-                    if modType is None:
-                        logging.warning('File %s is not a mod or does not have an entry in %s. Skipping...', mod, MOD_CONFIG)
-                        continue
+            if latest is not None and latest['state'] == state:
+                logging.info('Nothing changed since the snapshot %s', latest['name'])
 
-                    # If the mod is disabled then the src will go to the disabled mods directory
-                    src = os.path.join(srcPathDict[modType], mod) if self.saveManager.getEnabled(mod) else os.path.join(disPath, mod)
+                self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Nothing changed since the last backup'))
+                return
 
-                    output = os.path.join(outputPathDict[modType], mod)
+            repository.saveSnapshot(repository.newName(), state, metadata)
 
-                    # shutil.copytree() can't overwrite files, so if it already exists it must be deleted first
-                    if os.path.exists(output):
+        self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Backed up mods to') + f' {repository.path}')
 
-                        logging.info('%s already exists within the backup, overwriting...', mod)
+    def applyRetention(self) -> None:
+        '''Removes the zip backups and snapshots that the retention options don't keep'''
 
-                        shutil.rmtree(output)
+        self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Removing old backups'))
 
-                    shutil.copytree(src, output)
-                
+        keep = self.optionsManager.getBackupKeep()
+        maxAge = self.optionsManager.getBackupMaxAge() * 60 * 60 * 24
+
+        if not keep and not maxAge:
+            return
+
+        stores: list[BackupChain | BackupRepository] = [BackupChain(self.backupPath)]
+
+        if os.path.isdir(os.path.join(self.backupPath, BACKUP_REPOSITORY)):
+            stores.append(BackupRepository(os.path.join(self.backupPath, BACKUP_REPOSITORY)))
+
+        for store in stores:
+
+            backups = store.backups() if isinstance(store, BackupChain) else store.snapshots()
+
+            expired = expiredBackups(backups, keep, maxAge)
+
+            for name in expired:
                 self.cancelCheck()
+                store.remove(name)
 
-                # Step 6: Zip Backup folder
-                self.setCurrentProgress.emit(1,
-                    qapp.translate('BackupMods', 'Zipping to') +
-                    f' {self.bundledFilePath}\n' +
-                    qapp.translate('BackupMods', 'This might take some time...')
-                )
+            # The chunks only the removed snapshots used
+            if expired and isinstance(store, BackupRepository):
+                store.prune(self.cancelToken)
 
-                # This should overwrite if it already exists
-                shutil.make_archive(BACKUP_MODS, 'zip', self.bundledFilePath)
+            logging.info('Removed %s old backup(s) from %s', len(expired), self.backupPath)
 
-                # Step 7: Cleanup
+    def compression(self) -> tuple[int, list[str]]:
+        '''Returns the zlib level of the backup compression option and the extensions that are stored uncompressed'''
 
-                self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Cleanup'))
+        level = COMPRESSION_LEVELS.get(self.optionsManager.getBackupCompression(), COMPRESSION_LEVELS[COMPRESSION_BALANCED])
 
-                # Delete Folder
-                shutil.rmtree(self.bundledFilePath)
+        return level, self.optionsManager.getStoredExtensions()
 
-                self.succeeded.emit()
+    def report(self, arcName: str) -> None:
+        '''Moves the progress along once the backup gets to the next mod'''
 
-            except Exception as e:
+        # Each mod's files are next to each other
+        if modFolder(arcName) != self.currentMod:
+            self.currentMod = modFolder(arcName)
+            self.setCurrentProgress.emit(1, qapp.translate('BackupMods', 'Compressing') + f' {os.path.basename(self.currentMod)}')
+
+    def gatherMods(self) -> list[tuple[str, str]]:
+        '''Returns the folder of every mod and the folder it has inside of the backup'''
+
+        disPath = self.optionsManager.getDispath()
+
+        srcPathDict = {ModType.mods_override : self.p.mod_overrides(), ModType.mods : self.p.mods(), ModType.maps : self.p.maps()}
+
+        folders = [x for x in os.listdir(srcPathDict[ModType.mods]) if x not in MODSIGNORE] + os.listdir(disPath)
+
+        for path in (srcPathDict[ModType.mods_override], srcPathDict[ModType.maps]):
+            if os.path.isdir(path):
+                folders += os.listdir(path)
+
+        sources: list[tuple[str, str]] = []
+
+        # Every mod, with the symlink mode an enabled mod is listed in both the game and disabled directories
+        for mod in dict.fromkeys(folders):
+
+            modType = self.saveManager.getType(mod)
+
+            # In the case this file is not a mod
+            if modType is None:
+                logging.warning('File %s is not a mod or does not have an entry in %s. Skipping...', mod, MOD_CONFIG)
+                continue
+
+            # The disabled mods directory holds the mod's files if it is disabled
+            # or if it is enabled through a link made by the symlink mode
+            src = os.path.join(disPath, mod)
+
+            if not os.path.isdir(src):
+                src = os.path.join(srcPathDict[modType], mod)
+
+            if not os.path.isdir(src):
+                logging.warning('%s is not a folder. Skipping...', src)
+                continue
+
+            sources.append((src, f'{BACKUP_PREFIXES[modType]}/{mod}'))
+
+        return sources
+
+    def zipBackup(self, zipPath: str, members: list[tuple[str, str | None]], manifest: dict) -> None:
+        '''
+        Compresses the files into `zipPath` under their path in the backup,
+        on several threads unless the mods are on a hard drive. Folders end with '/' and have no file.
+        Files that are compressed already, like textures and sound banks, are stored as they are.
+
+        The zip is written to a temporary file first, a canceled backup leaves the previous one as it was
+        '''
+
+        partPath = f'{zipPath}.part'
+
+        self.currentMod = None
+
+        level, stored = self.compression()
+
+        try:
+            with zipfile.ZipFile(partPath, 'w', zipfile.ZIP_DEFLATED) as zf:
+
+                # Every type has its folder even without mods
+                for prefix in ('mods/', 'assets/', 'assets/mod_overrides/', 'Maps/'):
+                    zf.writestr(prefix, b'')
+
+                # A backup in the background shouldn't take every core
+                threads = 1 if self.background else compressThreads(self.p.mods())
+
+                writeMembers(zf, members, threads, self.cancelToken, self.report, level, stored)
+
+                # The backup can be restored without the manifest next to it
+                zf.writestr(BACKUP_MANIFEST, json.dumps(manifest))
 
-                # If something goes wrong, delete the unfinished bundled file
-                if os.path.exists(self.bundledFilePath):
-                    shutil.rmtree(self.bundledFilePath)
+            os.replace(partPath, zipPath)
 
-                if not self.cancel:
-                    self.error.emit(
-                        qapp.translate('BackupMods', 'An error was raised while backing up mods') +
-                        f':\n{e}'
-                    )
+        except BaseException:
+            if os.path.exists(partPath):
+                os.remove(partPath)
+            raise
@@ -5,6 +5,9 @@ import shutil
 from PySide6.QtCore import QCoreApplication as qapp
 
 from src.threaded.workerQObject import Worker
+from src.cancelToken import Canceled
+import src.errorChecking as errorChecking
+from src.trash import Trash
 
 from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG
 
@@ -15,7 +18,10 @@ class DeleteMod(Worker):
         self.mods = mods
 
     def start(self) -> None:
-        '''Removes the mod(s) from the user's computer'''
+        '''
+        Moves the mod(s) to the trash, if there is no trash on
+        the same drive as the mod it is removed from the user's computer
+        '''
 
         logging.info('Deleting mods from computer: %s', ', '.join(self.mods))
 
@@ -23,6 +29,8 @@ class DeleteMod(Worker):
 
         disPath = self.optionsManager.getDispath()
 
+        trash = Trash(self.optionsManager.getGamepath(), disPath)
+
         try: 
             for modName in self.mods:
 
@@ -30,20 +38,36 @@ class DeleteMod(Worker):
 
                 self.setCurrentProgress.emit(1, qapp.translate('DeleteMod', 'Deleting') + f'{modName}')
 
-                enabled = self.saveManager.getEnabled(modName)
-
-                type = self.saveManager.getType(modName) if enabled else 'disabled'
+                modType = self.saveManager.getType(modName)
+                modData = self.saveManager.getMod(modName)
 
                 self.saveManager.removeMods(modName)
 
-                path = self.p.mod(type, modName) if type != 'disabled' else disPath
+                # With the symlink mode a mod can be both linked in the game directory
+                # and stored in the disabled directory, so every location is checked
+                paths = [os.path.join(disPath, modName)]
+
+                if modType is not None:
+                    modPath = self.p.mod(modType, modName)
+
+                    if errorChecking.isLink(modPath):
+                        errorChecking.removeLink(modPath)
+                    else:
+                        paths.append(modPath)
 
-                if os.path.isdir(path):
-                    shutil.rmtree(path, onerror=self.onError)
-                else:
-                    logging.error('An error was raised in FileMover.deleteMod(), %s path does not exist:\n%s', os.path.basename(path), path)
+                paths = [x for x in paths if os.path.isdir(x)]
+
+                if not paths:
+                    logging.error('An error was raised in DeleteMod.start(), %s does not exist in the game directory or in:\n%s', modName, disPath)
+
+                for path in paths:
+                    if not trash.put(path, modName, modData):
+                        shutil.rmtree(path, onerror=self.onError)
 
             self.succeeded.emit()
 
+        except Canceled:
+            self.canceled()
+
         except Exception as e:
             self.error.emit(qapp.translate('DeleteMod', 'An error was raised while deleting a mod:') + f'\n{e}')
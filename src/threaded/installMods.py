@@ -0,0 +1,56 @@
+import os
+import logging
+
+from PySide6.QtCore import QCoreApplication as qapp
+
+from src.threaded.unZipMod import UnZipMod
+from src.cancelToken import Canceled
+import src.errorChecking as errorChecking
+from src.constant_vars import ModType, CONTENT_STORE_PATH_DEFAULT, ARCHIVE_CACHE_PATH_DEFAULT
+
+class InstallMods(UnZipMod):
+    '''
+    Installs dropped folders and archives in one task.
+
+    Archives are extracted like `UnZipMod`, folders are moved into their mod directory.
+    `installed` holds every mod folder that was installed, so the manager only has to add those
+    '''
+
+    def __init__(self, folders: list[tuple[str, ModType]], archives: list[tuple[str, ModType]], storePath: str = CONTENT_STORE_PATH_DEFAULT, cachePath: str = ARCHIVE_CACHE_PATH_DEFAULT) -> None:
+        super().__init__(*archives, storePath=storePath, cachePath=cachePath)
+
+        self.folders = folders
+
+    def install(self) -> None:
+
+        super().install()
+
+        self.addTotalProgress.emit(len(self.folders))
+
+        for src, modType in self.folders:
+
+            self.cancelCheck()
+
+            mod = os.path.basename(src)
+
+            self.setCurrentProgress.emit(1, qapp.translate('InstallMods', 'Installing') + f' {mod}')
+
+            modDestPath = self.p.mod(modType, mod)
+
+            # A mod enabled by the symlink mode is replaced in the disabled directory, the link keeps pointing to it
+            target = os.path.realpath(modDestPath) if errorChecking.isLink(modDestPath) else modDestPath
+
+            try:
+                self.move(src, target)
+
+            except Canceled:
+                raise
+
+            except OSError as e:
+                logging.error('Could not move %s:\n%s', src, str(e))
+                self.failed[mod] = str(e)
+                continue
+
+            self.storeMod(target)
+
+            self.installed[modDestPath] = modType
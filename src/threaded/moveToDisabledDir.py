@@ -1,9 +1,7 @@
-import os
-import logging
-
 from PySide6.QtCore import QCoreApplication as qapp
 
 from src.threaded.workerQObject import Worker
+from src.cancelToken import Canceled
 
 from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG
 
@@ -18,8 +16,6 @@ class MoveToDisabledDir(Worker):
 
         self.setTotalProgress.emit(len(self.mods))
 
-        disabledModsPath = self.optionsManager.getDispath()
-
         try:
 
             for mod in self.mods:
@@ -28,18 +24,12 @@ class MoveToDisabledDir(Worker):
 
                 self.setCurrentProgress.emit(1, qapp.translate('MoveToDisabledDir', 'Disabling') + f' {mod}')
 
-                modDest = os.path.join(disabledModsPath, mod)
-
-                # Checking if the mod is already in the disabled mods folder
-                if not os.path.isdir(modDest):
-
-                    modPath = self.p.mod(self.saveManager.getType(mod), mod)
-
-                    self.move(modPath, modDest)
-                else:
-                    logging.info('%s is already in the disabled directory', mod)
+                self.disableMod(mod)
 
             self.succeeded.emit()
 
+        except Canceled:
+            self.canceled()
+
         except Exception as e:
             self.error.emit(qapp.translate('MoveToDisabledDir', 'An error occured while disabling a mod:') + f'\n{e}')
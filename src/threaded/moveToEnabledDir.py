@@ -1,9 +1,7 @@
-import logging
-import os
-
 from PySide6.QtCore import QCoreApplication as qapp
 
 from src.threaded.workerQObject import Worker
+from src.cancelToken import Canceled
 
 from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG
 
@@ -21,25 +19,18 @@ class MoveToEnabledModDir(Worker):
 
             self.setTotalProgress.emit(len(self.mods))
 
-            disabledModsPath = self.optionsManager.getDispath()
-
             for mod in self.mods:
 
                 self.cancelCheck()
 
                 self.setCurrentProgress.emit(1, qapp.translate('MoveToEnabledModDir', 'Enabling') + f' {mod}')
 
-                modPath = os.path.join(disabledModsPath, mod)
-
-                if os.path.isdir(modPath):
-
-                    modDestPath = self.p.mod(self.saveManager.getType(mod), mod)
-
-                    self.move(modPath, modDestPath)
-                else:
-                    logging.warning('%s was not found in:\n%s\nIgnoring...', mod, disabledModsPath)
+                self.enableMod(mod)
             
             self.succeeded.emit()
 
+        except Canceled:
+            self.canceled()
+
         except Exception as e:
             self.error.emit(qapp.translate('MoveToEnabledModDir', 'An error occured while enabling a mod:') + f'\n{e}')
@@ -0,0 +1,70 @@
+import os
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from PySide6.QtCore import QThread, QCoreApplication as qapp
+
+from src.threaded.workerQObject import Worker
+from src.cancelToken import Canceled
+from src.trash import Trash
+
+from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG, CONTENT_STORE_PATH_DEFAULT
+
+class PurgeTrash(Worker):
+    '''
+    Permanently removes mods from the trash, several at a time.
+
+    The threads removing the mods run with the priority of the worker's thread,
+    so a purge started by `startInBackground()` stays at the lowest priority
+    '''
+
+    def __init__(self, olderThan: float = 0, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG, storePath: str = CONTENT_STORE_PATH_DEFAULT) -> None:
+        super().__init__(optionsPath=optionsPath, savePath=savePath, storePath=storePath)
+
+        # Seconds since a mod was deleted before it can be purged
+        self.olderThan = olderThan
+
+    def start(self) -> None:
+
+        try:
+            trash = Trash(self.optionsManager.getGamepath(), self.optionsManager.getDispath())
+
+            now = time.time()
+
+            expired = [x for x in trash.entries() if now - x['deleted'] >= self.olderThan]
+
+            logging.info('Purging %s mod(s) from the trash', len(expired))
+
+            self.setTotalProgress.emit(len(expired))
+
+            priority = QThread.currentThread().priority()
+
+            # Deleting is mostly waiting on the drive, so threads remove entries in parallel
+            with ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), initializer=self.setPriority, initargs=(priority,)) as pool:
+
+                futures = {pool.submit(trash.purge, x, self.cancelToken, self.onError) : x['mod'] for x in expired}
+
+                for future in as_completed(futures):
+
+                    future.result()
+
+                    self.setCurrentProgress.emit(1, qapp.translate('PurgeTrash', 'Purged') + f' {futures[future]}')
+
+            # Files that were only used by the purged mods
+            if expired and self.optionsManager.getContentStore():
+                self.contentStore.prune()
+
+            self.succeeded.emit()
+
+        except Canceled:
+            self.canceled()
+
+        except Exception as e:
+            self.error.emit(qapp.translate('PurgeTrash', 'An error was raised while emptying the trash:') + f'\n{e}')
+
+    def setPriority(self, priority: QThread.Priority) -> None:
+        '''Runs in each thread of the pool, threads Qt didn't start can't inherit a priority'''
+
+        if priority != QThread.Priority.InheritPriority:
+            QThread.currentThread().setPriority(priority)
@@ -0,0 +1,141 @@
+import os
+import shutil
+import logging
+import tempfile
+
+from PySide6.QtCore import QCoreApplication as qapp
+
+from src.threaded.workerQObject import Worker
+from src.backupChain import BackupChain, folderType
+from src.backupRepository import BackupRepository
+from src.cancelToken import Canceled
+from src.trash import Trash
+import src.errorChecking as errorChecking
+from src.constant_vars import STAGING, ModKeys, OPTIONS_CONFIG, MOD_CONFIG
+
+class RestoreMods(Worker):
+    '''
+    Restores some of the mods of a backup.
+
+    Only the files of the chosen mods are read from the backup, the rest isn't unpacked.
+    Each mod goes back where it was, its type directory or the disabled directory,
+    a version that is installed now is moved to the trash first.
+    Enabled mods are linked from the disabled directory if the symlink mode is on
+
+    `restored` has the MOD_CONFIG entry of every restored mod, read from the metadata stored with the backup
+    '''
+
+    def __init__(self, backup: BackupChain | BackupRepository, name: str, folders: list[str], optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
+        '''
+        `backup` is the folder of zip backups or the backup repository that has the backup `name`,
+        `folders` are the mods' folders inside of the backup, e.g. `mods/<mod>`
+        '''
+        super().__init__(optionsPath, savePath)
+
+        self.backup = backup
+        self.name = name
+        self.folders = folders
+
+        self.restored: dict[str, dict | None] = {}
+        self.failed: dict[str, str] = {}
+
+    def start(self) -> None:
+
+        # Same drive as the mod directories so restored mods can be renamed into place
+        staging = os.path.join(self.optionsManager.getGamepath(), STAGING)
+
+        jobDir = None
+
+        try:
+            metadata = self.backup.metadata(self.name)
+
+            self.setTotalProgress.emit(len(self.folders) + 1)
+
+            self.setCurrentProgress.emit(1, qapp.translate('RestoreMods', 'Reading the backup'))
+
+            os.makedirs(staging, exist_ok=True)
+
+            jobDir = tempfile.mkdtemp(prefix='restore-', dir=staging)
+
+            self.backup.restore(self.name, jobDir, self.cancelToken, [f'{x}/' for x in self.folders])
+
+            trash = Trash(self.optionsManager.getGamepath(), self.optionsManager.getDispath())
+
+            for folder in self.folders:
+
+                self.cancelCheck()
+
+                mod = os.path.basename(folder)
+
+                self.setCurrentProgress.emit(1, qapp.translate('RestoreMods', 'Restoring') + f' {mod}')
+
+                try:
+                    self.restoreMod(mod, os.path.join(jobDir, *folder.split('/')), folder, metadata.get(mod), trash)
+
+                except Canceled:
+                    raise
+
+                except OSError as e:
+                    logging.error('Could not restore %s:\n%s', mod, str(e))
+                    self.failed[mod] = str(e)
+
+            if self.failed:
+                self.error.emit(
+                    qapp.translate('RestoreMods', 'Some mods could not be restored:') + '\n' +
+                    '\n'.join(f'{mod}: {message}' for mod, message in self.failed.items())
+                )
+            else:
+                self.succeeded.emit()
+
+        except Canceled:
+            self.canceled()
+
+        except Exception as e:
+            self.error.emit(
+                qapp.translate('RestoreMods', 'An error was raised while restoring mods') +
+                f':\n{e}'
+            )
+
+        finally:
+            if jobDir is not None:
+                shutil.rmtree(jobDir, onerror=self.onError)
+
+            if os.path.isdir(staging) and not os.listdir(staging):
+                os.rmdir(staging)
+
+    def restoreMod(self, mod: str, staged: str, folder: str, data: dict | None, trash: Trash) -> None:
+        '''Moves a mod restored into the staging folder to where it was when it was backed up'''
+
+        if not os.path.isdir(staged):
+            raise OSError(f'{folder} is not in the backup')
+
+        enabledPath = self.p.mod(folderType(folder), mod)
+        disabledPath = os.path.join(self.optionsManager.getDispath(), mod)
+
+        # Mods without an entry were enabled, disabled mods are in MOD_CONFIG
+        enabled = data is None or data.get(ModKeys.enabled.value, True)
+
+        # The version that is installed now, which could be on the other side if it was enabled or disabled since
+        for path in (enabledPath, disabledPath):
+
+            if errorChecking.isLink(path):
+                errorChecking.removeLink(path)
+
+            elif os.path.isdir(path) and not trash.put(path, mod, self.saveManager.getMod(mod)):
+                raise OSError(f'{path} could not be moved to the trash')
+
+        dest = enabledPath if enabled else disabledPath
+
+        # With the symlink mode on an enabled mod is kept in the disabled directory and linked like any other mod
+        symlinked = enabled and self.optionsManager.getSymlinkMods()
+
+        os.makedirs(os.path.dirname(disabledPath if symlinked else dest), exist_ok=True)
+
+        self.move(staged, disabledPath if symlinked else dest)
+
+        if symlinked and not self.enableMod(mod, folderType(folder)):
+            raise OSError(f'{mod} could not be linked into {os.path.dirname(enabledPath)}')
+
+        self.restored[mod] = data
+
+        logging.info('Restored %s from the backup %s to %s', mod, self.name, dest)
@@ -1,57 +1,361 @@
 import os
+import time
+import shutil
 import logging
+from concurrent.futures import Future, wait, FIRST_COMPLETED
 
 import patoolib
 
 from PySide6.QtCore import QCoreApplication as qapp
 
 from src.threaded.workerQObject import Worker
-from src.constant_vars import ModType
+from src.cancelToken import Canceled
+from src.extract import extractJob, deployJob, poolSize, zipThreads, ExtractionPool
+from src.inspectArchive import listArchive, classify, unmatched, looseFiles, archiveName
+from src.contentStore import hashFile
+from src.archiveCache import ArchiveCache
+from src.constant_vars import ModType, STAGING, CONTENT_STORE_PATH_DEFAULT, ARCHIVE_CACHE_PATH_DEFAULT
 
 class UnZipMod(Worker):
-    def __init__(self, *mods: tuple[str, ModType]) -> None:
-        super().__init__()
+    '''
+    Extracts archives into their mod directories.
+
+    Each archive is inspected first to find the mods inside of it, only those folders are
+    extracted and each is installed under its own name. The given ModType is used for archives
+    with one mod, archives with several mods install each one where its contents say it goes.
+
+    Archives are extracted into a staging folder in the game directory first,
+    each mod is renamed into place once its archive was fully extracted.
+
+    Several archives are extracted at the same time in a process pool,
+    an archive that fails doesn't stop the others and is listed in the error afterwards.
+    A single big zip is extracted by several threads instead.
+
+    With the archive cache on, installed archives are kept by their hash. An archive that
+    was installed before is installed from the content store without being extracted
+    '''
+
+    # Seconds between progress updates, thousands of small entries would flood the GUI otherwise
+    progressInterval = 0.1
+
+    def __init__(self, *mods: tuple[str, ModType], storePath: str = CONTENT_STORE_PATH_DEFAULT, cachePath: str = ARCHIVE_CACHE_PATH_DEFAULT) -> None:
+        super().__init__(storePath=storePath)
 
         self.mods = mods
 
-    def start(self) -> None:
-        '''Extracts a mod and puts it into a destination based off the ModType Enum given'''
+        self.cachePath = cachePath
+
+        self.lastProgress = 0.0
+
+        # Bytes read of each archive, used for the combined progress
+        self.archiveProgress: dict[str, int] = {}
+        self.archiveSizes = 0
+
+        # Archives that failed and why
+        self.failed: dict[str, str] = {}
+
+        # Paths of the mod folders that were installed and their type, so only they have to be added to the manager
+        self.installed: dict[str, ModType] = {}
+
+        # Hash, ModType and targets of each archive that is added to the archive cache once installed,
+        # archives that can't be cached yet are hashed once they're installed
+        self.cacheJobs: dict[str, tuple[str | None, ModType, dict[str, str] | None]] = {}
+        self.archiveCache: ArchiveCache | None = None
+
+    def extractProgress(self, src: str, entry: str, done: int, total: int) -> None:
+        '''Reports the entry being extracted and how much of the archives were read'''
+
+        self.archiveProgress[src] = done
 
-        self.setTotalProgress.emit(len(self.mods))
+        now = time.monotonic()
 
-        modDestDict = {ModType.mods : self.p.mods(), ModType.mods_override : self.p.mod_overrides(), ModType.maps : self.p.maps()}
+        if now - self.lastProgress < self.progressInterval and done < total:
+            return
+
+        self.lastProgress = now
+
+        # In KiB, QProgressBar can't hold the size of big archives in bytes
+        self.setSubProgress.emit(sum(self.archiveProgress.values()) // 1024, max(self.archiveSizes // 1024, 1))
+        self.setCurrentProgress.emit(0, qapp.translate("UnZipMod", "Unpacking") + f" {os.path.basename(src)}\n{entry}")
+
+    def archiveDone(self, src: str, created: list[str]) -> None:
+
+        self.setCurrentProgress.emit(1, qapp.translate("UnZipMod", "Unpacked") + f" {os.path.basename(src)}")
+
+        destTypes = {os.path.normcase(y) : x for x, y in self.modDestDict.items()}
+
+        for path in created:
+
+            # Loose files of the archive are installed into a folder of their own
+            if os.path.isfile(path):
+                path = os.path.dirname(path)
+
+            modType = destTypes.get(os.path.normcase(os.path.dirname(path)))
+
+            if modType is not None and os.path.isdir(path):
+                self.installed[path] = modType
+
+        manifests = {x : self.storeMod(x) for x in created}
+
+        if src not in self.cacheJobs:
+            return
+
+        digest, modType, targets = self.cacheJobs[src]
+
+        # Folder inside of the archive each installed mod came from
+        roots = {y : x for x, y in targets.items()} if targets else {x : os.path.basename(x) for x in created}
 
         try:
+            if digest is None:
+                digest = hashFile(src, self.cancelToken)
 
-            for modURL in self.mods:
+            self.archiveCache.add(src, digest, modType, {roots[x] : y for x, y in manifests.items()}, self.cancelToken)
 
-                src = modURL[0]
+        except OSError as e:
+            # The mods are installed, a full cache isn't worth failing over
+            logging.warning('Could not add %s to the archive cache:\n%s', src, str(e))
 
-                mod = os.path.basename(src)
+    def installFromCache(self, src: str, modType: ModType, modDestDict: dict[ModType, str]) -> bool:
+        '''
+        Installs an archive from the content store if it was installed before and every file is still stored.
 
-                modType = modURL[1]
+        Returns False if the archive has to be extracted
+        '''
 
-                self.cancelCheck()
+        self.setCurrentProgress.emit(0, qapp.translate("UnZipMod", "Checking") + f" {os.path.basename(src)}")
 
-                self.setCurrentProgress.emit(1, qapp.translate("UnZipMod", "Unpacking") + f" {mod}")
+        digest = self.archiveCache.lookup(src, self.cancelToken)
 
-                logging.info('Unzipping %s to %s', src, modDestDict[modType])
+        self.cacheJobs[src] = (digest, modType, None)
 
-                if os.path.isfile(src):
-                    patoolib.extract_archive(src, outdir=modDestDict[modType])
+        if digest is None or self.archiveCache.get(digest) is None or not self.optionsManager.getContentStore():
+            return False
 
-                else:
-                    logging.warning('%s does not exist', src)
+        manifests = self.archiveCache.deployable(digest, self.contentStore)
 
-            self.succeeded.emit()
-        
-        except patoolib.util.PatoolError as e:
-            self.error.emit(
-                qapp.translate("UnZipMod", 'An error was raised in unZipMod:') +
-                f'\n{e}\n' +
-                qapp.translate("UnZipMod", 'Try extracting the mod manually first')
-            )
+        if manifests is None:
+            logging.info('Files of %s are no longer in the content store, extracting it', src)
+            return False
+
+        targets = self.plan(src, modType, modDestDict) or {x : os.path.join(modDestDict[modType], x) for x in manifests}
+
+        if set(targets) != set(manifests):
+            return False
+
+        try:
+            created = deployJob(src, self.contentStore, manifests, targets, self.staging, self.cancelToken)
+
+        except OSError as e:
+            logging.warning('Could not install %s from the content store, extracting it:\n%s', src, str(e))
+            return False
+
+        logging.info('Installed %s from the archive cache without extracting it', src)
+
+        self.cacheJobs.pop(src)
+
+        self.archiveDone(src, created)
+
+        return True
+
+    def plan(self, src: str, modType: ModType, modDestDict: dict[ModType, str]) -> dict[str, str] | None:
+        '''
+        Returns the folders inside of the archive and where they're installed.
+
+        Returns None if the archive couldn't be inspected or has no recognizable mod,
+        in which case the whole archive is extracted into the given ModType's directory.
+        Folders next to the mods that aren't recognized are installed into the given ModType's directory too,
+        loose files next to them into a folder named after the archive
+        '''
+
+        paths = listArchive(src)
+
+        roots = None if paths is None else classify(paths, archiveName(src))
+
+        if not roots:
+            logging.info('No mod folders were recognized in %s, extracting all of it', src)
+            return None
+
+        if len(roots) == 1:
+            targets = {roots[0].root : os.path.join(modDestDict[modType], roots[0].name)}
+        else:
+            targets = {x.root : os.path.join(modDestDict[x.modType], x.name) for x in roots}
+
+        for folder in unmatched(paths, roots):
+
+            dest = os.path.join(modDestDict[modType], folder.split('/')[-1])
+
+            if dest in targets.values():
+                logging.warning('%s in %s was not installed, a mod from the archive is already installed as %s', folder, src, dest)
+                continue
+
+            logging.warning('No mod was recognized in %s of %s, installing it as %s', folder, src, dest)
+
+            targets[folder] = dest
+
+        looseDir = os.path.join(modDestDict[modType], archiveName(src))
+
+        for file in looseFiles(paths, roots):
+
+            dest = os.path.join(looseDir, file.split('/')[-1])
+
+            if looseDir in targets.values() or dest in targets.values():
+                logging.warning('%s in %s was not installed, %s is already installed from the archive', file, src, dest)
+                continue
+
+            logging.warning('%s of %s is not inside of a mod, installing it into %s', file, src, looseDir)
+
+            targets[file] = dest
+
+        return targets
+
+    def archiveFailed(self, src: str, e: Exception) -> None:
+
+        logging.error('Could not extract %s:\n%s', src, str(e))
+
+        message = str(e)
+
+        if isinstance(e, patoolib.util.PatoolError):
+            message += '\n' + qapp.translate("UnZipMod", 'Try extracting the mod manually first')
+
+        self.failed[os.path.basename(src)] = message
+
+        self.setCurrentProgress.emit(1, qapp.translate("UnZipMod", "Could not unpack") + f" {os.path.basename(src)}")
+
+    def start(self) -> None:
+        '''Extracts a mod and puts it into a destination based off the ModType Enum given'''
+
+        self.modDestDict = {ModType.mods : self.p.mods(), ModType.mods_override : self.p.mod_overrides(), ModType.maps : self.p.maps()}
+
+        # Same drive as the mod directories so installed mods can be renamed into place
+        self.staging = os.path.join(self.optionsManager.getGamepath(), STAGING)
+
+        if self.optionsManager.getArchiveCache():
+            self.archiveCache = ArchiveCache(self.cachePath, self.optionsManager.getArchiveCacheSize() * 1024 * 1024)
+
+        try:
+            self.install()
+
+            if self.failed:
+                self.error.emit(
+                    qapp.translate("UnZipMod", 'Some mods could not be installed:') + '\n' +
+                    '\n'.join(f'{mod}: {message}' for mod, message in self.failed.items())
+                )
+            else:
+                self.succeeded.emit()
+
+        except Canceled:
+            self.canceled()
 
         except Exception as e:
             self.error.emit(
-                qapp.translate("UnZipMod", 'An error was raised in unZipMod:') + f'\n{e}') 
+                qapp.translate("UnZipMod", 'An error was raised in unZipMod:') + f'\n{e}')
+
+        finally:
+            if os.path.isdir(self.staging) and not os.listdir(self.staging):
+                os.rmdir(self.staging)
+
+    def install(self) -> None:
+
+        modDestDict = self.modDestDict
+
+        jobs: list[tuple[str, str, dict[str, str] | None]] = []
+
+        self.clearStaging()
+
+        for src, _ in self.mods:
+            if not os.path.isfile(src):
+                logging.warning('%s does not exist', src)
+
+        mods = [x for x in self.mods if os.path.isfile(x[0])]
+
+        self.setTotalProgress.emit(len(mods))
+
+        for src, modType in mods:
+
+            if self.archiveCache is not None and self.installFromCache(src, modType, modDestDict):
+                continue
+
+            targets = self.plan(src, modType, modDestDict)
+            logging.info('Unzipping %s to %s', src, targets or modDestDict[modType])
+            jobs.append((src, modDestDict[modType], targets))
+
+            if src in self.cacheJobs:
+                self.cacheJobs[src] = (self.cacheJobs[src][0], modType, targets)
+
+        self.archiveSizes = sum(os.path.getsize(x[0]) for x in jobs)
+
+        size = poolSize(len(jobs), list({x[1] for x in jobs}))
+
+        # Starting processes isn't worth it for a single archive
+        if size <= 1:
+            self.extractInThread(jobs)
+        else:
+            self.extractInPool(jobs, size)
+
+    def clearStaging(self) -> None:
+        '''Removes jobs left behind if the program was closed in the middle of an install'''
+
+        if not os.path.isdir(self.staging):
+            return
+
+        for job in os.listdir(self.staging):
+            logging.warning('Removing an unfinished install from the staging folder: %s', job)
+            shutil.rmtree(os.path.join(self.staging, job), onerror=self.onError)
+
+    def extractInThread(self, jobs: list[tuple[str, str, dict[str, str] | None]]) -> None:
+
+        for src, dest, targets in jobs:
+
+            self.cancelCheck()
+
+            self.setCurrentProgress.emit(0, qapp.translate("UnZipMod", "Unpacking") + f" {os.path.basename(src)}")
+
+            try:
+                created = extractJob(src, dest, self.staging, self.cancelToken, lambda x, y, z: self.extractProgress(src, x, y, z), targets, zipThreads(dest))
+
+            except Canceled:
+                raise
+
+            except Exception as e:
+                self.archiveFailed(src, e)
+                continue
+
+            self.archiveDone(src, created)
+
+    def extractInPool(self, jobs: list[tuple[str, str, dict[str, str] | None]], size: int) -> None:
+
+        logging.info('Extracting %s archives with %s processes', len(jobs), size)
+
+        with ExtractionPool(size) as pool:
+
+            futures: dict[Future, str] = {pool.submit(src, dest, self.staging, targets) : src for src, dest, targets in jobs}
+
+            pending = set(futures)
+
+            try:
+                while pending:
+
+                    done, pending = wait(pending, timeout=self.progressInterval, return_when=FIRST_COMPLETED)
+
+                    self.cancelCheck()
+
+                    for report in pool.progress():
+                        self.extractProgress(*report)
+
+                    for future in done:
+
+                        src = futures[future]
+
+                        try:
+                            created = future.result()
+
+                        except Exception as e:
+                            self.archiveFailed(src, e)
+                            continue
+
+                        self.archiveDone(src, created)
+
+            except Canceled:
+                # Each process removes its job from the staging folder
+                pool.cancel()
+                raise
@@ -2,13 +2,15 @@ import logging
 import shutil
 import os
 
-from PySide6.QtCore import Signal, QObject, QCoreApplication as qapp
+from PySide6.QtCore import Qt as qt, Signal, QObject, QThread, QCoreApplication as qapp
 
 from src.save import Save, OptionsManager
 from src.getPath import Pathing
+from src.contentStore import ContentStore
+from src.cancelToken import CancelToken, Canceled, copyFile
 import src.errorChecking as errorChecking
 
-from src.constant_vars import MOD_CONFIG, OPTIONS_CONFIG
+from src.constant_vars import ModType, MOD_CONFIG, OPTIONS_CONFIG, CONTENT_STORE_PATH_DEFAULT
 
 class Worker(QObject):
     setTotalProgress = Signal(int)
@@ -17,15 +19,18 @@ class Worker(QObject):
 
     setCurrentProgress = Signal(int, str)
 
+    # Progress within the current step, value and maximum
+    setSubProgress = Signal(int, int)
+
     succeeded = Signal()
 
     doneCanceling = Signal()
 
     error = Signal(str)
 
-    cancel = False
+    qthread: QThread = None
 
-    def __init__(self, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG) -> None:
+    def __init__(self, optionsPath: str = OPTIONS_CONFIG, savePath: str = MOD_CONFIG, storePath: str = CONTENT_STORE_PATH_DEFAULT) -> None:
         super().__init__()
         logging.getLogger(__name__)
 
@@ -34,29 +39,173 @@ class Worker(QObject):
 
         self.p = Pathing(optionsPath)
 
+        self.contentStore = ContentStore(storePath)
+
+        self.cancelToken = CancelToken()
+
     def start() -> None:
         ...
 
+    @property
+    def cancel(self) -> bool:
+        return self.cancelToken.isCanceled()
+
+    @cancel.setter
+    def cancel(self, value: bool) -> None:
+        if value:
+            self.cancelToken.cancel()
+
+    def startInBackground(self, priority: QThread.Priority = QThread.Priority.LowestPriority) -> None:
+        '''Runs `start()` in its own thread without a ProgressWidget'''
+
+        self.qthread = QThread()
+        self.qthread.started.connect(self.start)
+
+        self.moveToThread(self.qthread)
+
+        # Called from the worker's thread, a queued call waits for the GUI thread, which might be waiting on `qthread`
+        for signal in (self.succeeded, self.error, self.doneCanceling):
+            signal.connect(self.qthread.quit, qt.ConnectionType.DirectConnection)
+
+        self.qthread.start(priority)
+
+    def stopBackground(self) -> None:
+        '''Cancels a worker started by `startInBackground()` and waits for it to finish'''
+
+        if self.qthread is None or not self.qthread.isRunning():
+            return
+
+        self.cancel = True
+
+        self.qthread.quit()
+        self.qthread.wait()
+
     def cancelCheck(self) -> None:
-        if self.cancel:
-            logging.info('%s was canceled', self.__class__)
-            self.doneCanceling.emit()
+        '''Checkpoint for long tasks, raises `Canceled` once the task was canceled'''
+        self.cancelToken.check()
+
+    def canceled(self) -> None:
+        '''Called by `start()` when it stopped because of `Canceled`'''
+
+        logging.info('%s was canceled', self.__class__)
+        self.doneCanceling.emit()
+
+    def enableMod(self, mod: str, modType: ModType | None = None) -> bool:
+        '''
+        Returns a mod from the disabled directory to the game directory.
+
+        With the symlink mode on, the mod stays in the disabled directory
+        and a link to it is created in the game directory instead.
+
+        `modType` is the type directory to enable it in, by default the one saved in MOD_CONFIG.
+        Returns True if the mod was enabled
+        '''
+
+        disabledModsPath = self.optionsManager.getDispath()
+
+        modPath = os.path.join(disabledModsPath, mod)
+        modDestPath = self.p.mod(modType or self.saveManager.getType(mod), mod)
+
+        if not os.path.isdir(modPath):
+            logging.warning('%s was not found in:\n%s\nIgnoring...', mod, disabledModsPath)
+            return False
+
+        # Links left behind by the symlink mode that point to nothing
+        if errorChecking.isLink(modDestPath) and not os.path.isdir(modDestPath):
+            errorChecking.removeLink(modDestPath)
+
+        if self.optionsManager.getSymlinkMods():
+
+            if os.path.isdir(modDestPath):
+                logging.info('%s is already enabled', mod)
+                return False
+
+            errorChecking.createLink(modPath, modDestPath)
+
+        else:
+
+            if errorChecking.isLink(modDestPath):
+                errorChecking.removeLink(modDestPath)
+
+            self.move(modPath, modDestPath)
+
+        return True
+
+    def disableMod(self, mod: str) -> bool:
+        '''
+        Moves a mod from the game directory to the disabled directory.
+
+        If the mod is a link made by the symlink mode, only the link is removed.
+
+        Returns True if the mod was disabled
+        '''
+
+        modPath = self.p.mod(self.saveManager.getType(mod), mod)
+        modDest = os.path.join(self.optionsManager.getDispath(), mod)
+
+        if errorChecking.isLink(modPath):
+            errorChecking.removeLink(modPath)
+            return True
+
+        # Checking if the mod is already in the disabled mods folder
+        if os.path.isdir(modDest):
+            logging.info('%s is already in the disabled directory', mod)
+            return False
+
+        self.move(modPath, modDest)
+
+        return True
+
+    def storeMod(self, modPath: str) -> dict[str, str]:
+        '''
+        Adds a newly installed mod into the content store if the option is on.
+
+        Returns the mod's manifest, which is empty if the mod wasn't stored
+        '''
+
+        if not self.optionsManager.getContentStore() or not os.path.isdir(modPath):
+            return {}
+
+        self.setCurrentProgress.emit(0, qapp.translate('Worker', 'Deduplicating') + f' {os.path.basename(modPath)}')
+
+        return self.contentStore.ingest(modPath, self.cancelToken)
 
     def move(self, src: str, dest: str) -> None:
-        '''`shutil.move()` with some extra exception handling'''
+        '''
+        `shutil.move()` with some extra exception handling
+
+        Moving across drives copies the files, which can be canceled mid-way.
+        The partial copy is removed and `src` is left as it was.
+
+        Raises OSError if `dest` is a link of the symlink mode, the mod it points to has to be replaced instead
+        '''
+
+        # Removing it would fail and the mod would be moved inside of the folder it points to
+        if errorChecking.isLink(dest):
+            raise OSError(f'{dest} is a link to {os.path.realpath(dest)}')
 
         # Overwrite mod
         if os.path.exists(dest):
             shutil.rmtree(dest, onerror=self.onError)
 
         # Will try to move the file, if there is an exception, fix the issue and try again
-        while not self.cancel:
+        while True:
+
+            self.cancelCheck()
 
             try:
-                shutil.move(src, dest)
+                shutil.move(src, dest, copy_function=lambda x, y: copyFile(x, y, self.cancelToken))
                 logging.info('Moved file %s to destination %s', src, dest)
                 break
 
+            except Canceled:
+                logging.info('Moving %s was canceled, removing %s', src, dest)
+
+                if os.path.exists(src) and os.path.isdir(dest):
+                    shutil.rmtree(dest, onerror=self.onError)
+
+                raise
+
             except PermissionError:
                 
                 # Grab all files in mod
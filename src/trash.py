@@ -0,0 +1,141 @@
+import os
+import json
+import time
+import uuid
+import logging
+
+from src.cancelToken import CancelToken, removeTree
+from src.constant_vars import TRASH, TRASH_ENTRY
+
+logging.getLogger(__name__)
+
+class Trash():
+    '''
+    Deleted mods are renamed into a trash directory on the same drive,
+    which is instant no matter the size of the mod.
+
+    The mods can be restored until the trash is purged.
+
+    There is a trash in the game directory and one next to the disabled mods directory.
+    '''
+
+    def __init__(self, gamePath: str, disPath: str) -> None:
+        # Both can be the same directory if the disabled mods are inside of the game directory
+        self.trashDirs = list(dict.fromkeys((os.path.join(gamePath, TRASH), os.path.join(os.path.dirname(disPath), TRASH))))
+
+    def __trashDirFor(self, path: str) -> str | None:
+        '''Returns the trash directory that is on the same drive as the path'''
+
+        device = os.lstat(path).st_dev
+
+        for trashDir in self.trashDirs:
+
+            parent = os.path.dirname(trashDir)
+
+            if os.path.isdir(parent) and os.stat(parent).st_dev == device:
+                return trashDir
+
+        return None
+
+    def put(self, path: str, mod: str, data: dict | None = None) -> bool:
+        '''
+        Moves the path into the trash.
+
+        `data` is the mod's entry in MOD_CONFIG so it can be restored later.
+
+        Returns False if there is no trash on the same drive as the path
+        '''
+
+        trashDir = self.__trashDirFor(path)
+
+        if trashDir is None:
+            logging.warning('There is no trash on the same drive as %s', path)
+            return False
+
+        entryDir = os.path.join(trashDir, f'{time.time_ns()}-{uuid.uuid4().hex[:8]}')
+
+        os.makedirs(entryDir)
+
+        with open(os.path.join(entryDir, TRASH_ENTRY), 'w') as f:
+            f.write(json.dumps({'mod' : mod, 'path' : path, 'data' : data, 'deleted' : time.time()}))
+
+        os.rename(path, os.path.join(entryDir, os.path.basename(path)))
+
+        logging.info('Moved %s to the trash: %s', mod, entryDir)
+
+        return True
+
+    def entries(self) -> list[dict]:
+        '''
+        Returns every entry in the trash, oldest first.
+
+        Each entry is a dict with the keys:
+        + dir : The entry's directory inside of the trash
+        + mod : Name of the mod
+        + path : Where the mod was before it was deleted
+        + data : The mod's entry in MOD_CONFIG
+        + deleted : The time the mod was deleted
+        '''
+
+        entries: list[dict] = []
+
+        for trashDir in self.trashDirs:
+
+            if not os.path.isdir(trashDir):
+                continue
+
+            for entry in os.listdir(trashDir):
+
+                entryDir = os.path.join(trashDir, entry)
+
+                try:
+                    with open(os.path.join(entryDir, TRASH_ENTRY), 'r') as f:
+                        data: dict = json.loads(f.read())
+
+                except (OSError, json.decoder.JSONDecodeError):
+                    logging.warning('Skipping a broken trash entry: %s', entryDir)
+                    continue
+
+                data['dir'] = entryDir
+
+                entries.append(data)
+
+        return sorted(entries, key=lambda x: x['deleted'])
+
+    def restore(self, entry: dict) -> bool:
+        '''
+        Moves a mod back to where it was deleted from.
+
+        Returns False if something is already there
+        '''
+
+        if os.path.lexists(entry['path']):
+            logging.warning('Could not restore %s, %s already exists', entry['mod'], entry['path'])
+            return False
+
+        os.rename(os.path.join(entry['dir'], os.path.basename(entry['path'])), entry['path'])
+
+        os.remove(os.path.join(entry['dir'], TRASH_ENTRY))
+        os.rmdir(entry['dir'])
+
+        logging.info('Restored %s to %s', entry['mod'], entry['path'])
+
+        return True
+
+    def purge(self, entry: dict, token: CancelToken | None = None, onerror = None) -> None:
+        '''
+        Permanently removes an entry from the trash.
+
+        The entry's file is removed last, so a canceled purge
+        leaves an entry that can still be purged later
+        '''
+
+        modPath = os.path.join(entry['dir'], os.path.basename(entry['path']))
+
+        if os.path.lexists(modPath):
+            removeTree(modPath, token, onerror)
+
+        os.remove(os.path.join(entry['dir'], TRASH_ENTRY))
+        os.rmdir(entry['dir'])
+
+        logging.info('Purged %s from the trash', entry['mod'])
@@ -0,0 +1,102 @@
+import time
+
+import PySide6.QtWidgets as qtw
+from PySide6.QtCore import Qt as qt, Signal, QCoreApplication as qapp
+
+from src.widgets.QDialog.QDialog import Dialog
+from src.widgets.progressWidget import ProgressWidget
+from src.threaded.unZipMod import UnZipMod
+
+from src.archiveCache import ArchiveCache
+from src.save import OptionsManager
+from src.constant_vars import OPTIONS_CONFIG, ARCHIVE_CACHE_PATH_DEFAULT, ModType
+
+class CachedArchives(Dialog):
+
+    # Dict of the paths of installed mod folders and their ModType
+    modsInstalled = Signal(dict)
+
+    def __init__(self, optionsPath: str = OPTIONS_CONFIG, cachePath: str = ARCHIVE_CACHE_PATH_DEFAULT) -> None:
+        super().__init__()
+
+        self.setWindowTitle(qapp.translate('CachedArchives', 'Cached Archives'))
+        self.setMinimumSize(400, 300)
+
+        self.optionsPath = optionsPath
+        self.optionsManager = OptionsManager(optionsPath)
+
+        self.archiveCache = ArchiveCache(cachePath, self.optionsManager.getArchiveCacheSize() * 1024 * 1024)
+
+        layout = qtw.QVBoxLayout()
+
+        self.label = qtw.QLabel(self)
+        self.label.setWordWrap(True)
+
+        self.archiveList = qtw.QListWidget(self)
+        self.archiveList.setHorizontalScrollBarPolicy(qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.archiveList.setSelectionMode(qtw.QListWidget.SelectionMode.ExtendedSelection)
+
+        self.buttonBox = qtw.QDialogButtonBox(qtw.QDialogButtonBox.StandardButton.Close)
+        self.buttonBox.rejected.connect(self.reject)
+
+        self.installButton = self.buttonBox.addButton(qapp.translate('CachedArchives', 'Install'), qtw.QDialogButtonBox.ButtonRole.ActionRole)
+        self.installButton.clicked.connect(self.install)
+
+        self.removeButton = self.buttonBox.addButton(qapp.translate('CachedArchives', 'Remove'), qtw.QDialogButtonBox.ButtonRole.DestructiveRole)
+        self.removeButton.clicked.connect(self.remove)
+
+        for widget in (self.label, self.archiveList, self.buttonBox):
+            layout.addWidget(widget)
+
+        self.setLayout(layout)
+
+        self.refreshList()
+
+    def refreshList(self) -> None:
+        self.archiveList.clear()
+
+        for digest, entry in self.archiveCache.entries():
+            used = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['used']))
+
+            item = qtw.QListWidgetItem(f'{entry["name"]} ({entry["size"] / 1024 / 1024:.1f} MB, {used})')
+            item.setData(qt.ItemDataRole.UserRole, digest)
+
+            self.archiveList.addItem(item)
+
+        self.label.setText(
+            qapp.translate('CachedArchives', 'Archives of installed mods, the least recently used are removed once the cache is full:') +
+            f' {self.archiveCache.size() / 1024 / 1024:.1f} / {self.archiveCache.budget / 1024 / 1024:.0f} MB'
+        )
+
+    def install(self) -> None:
+        mods: list[tuple[str, ModType]] = []
+
+        for item in self.archiveList.selectedItems():
+            digest: str = item.data(qt.ItemDataRole.UserRole)
+
+            path = self.archiveCache.archivePath(digest)
+
+            if path is not None:
+                mods.append((path, ModType(self.archiveCache.file[digest]['type'])))
+
+        if not mods:
+            return
+
+        worker = UnZipMod(*mods, cachePath=self.archiveCache.cachePath)
+
+        unzip = ProgressWidget(worker)
+        unzip.exec()
+
+        # The installs moved the archives to the front of the cache
+        self.archiveCache.loadJSON()
+        self.refreshList()
+
+        self.modsInstalled.emit(worker.installed)
+
+    def remove(self) -> None:
+        for item in self.archiveList.selectedItems():
+            self.archiveCache.remove(item.data(qt.ItemDataRole.UserRole))
+
+        self.archiveCache.saveJSON()
+
+        self.refreshList()
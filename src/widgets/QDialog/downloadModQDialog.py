@@ -0,0 +1,104 @@
+import os
+
+import PySide6.QtWidgets as qtw
+from PySide6.QtCore import QCoreApplication as qapp
+
+from src.widgets.QDialog.QDialog import Dialog
+from src.widgets.QDialog.announcementQDialog import Notice
+from src.api.downloadMod import DownloadMod, RUNNING, PAUSED
+from src.api.network import NetworkService
+from src.save import OptionsManager
+from src.constant_vars import OPTIONS_CONFIG, DOWNLOADS_PATH_DEFAULT, MODWORKSHOP_API
+
+class DownloadModDialog(Dialog):
+    '''
+    Shows the download of a modworkshop mod, it can be paused or canceled.
+
+    `path` is the downloaded archive once the dialog was accepted
+    '''
+
+    def __init__(self, assetID: str, optionsPath: str = OPTIONS_CONFIG, dest: str = DOWNLOADS_PATH_DEFAULT, apiUrl: str = MODWORKSHOP_API, network: NetworkService | None = None) -> None:
+        super().__init__()
+
+        self.setWindowTitle(qapp.translate('DownloadModDialog', 'Downloading Mod'))
+        self.setMinimumWidth(400)
+
+        self.path: str | None = None
+
+        # In MiB per second
+        bandwidth = OptionsManager(optionsPath).getDownloadBandwidth() * 1024 * 1024
+
+        self.worker = DownloadMod(assetID, dest, bandwidth=bandwidth, apiUrl=apiUrl, network=network)
+        self.worker.downloading.connect(self.updateProgress)
+        self.worker.succeeded.connect(self.succeeded)
+        self.worker.error.connect(self.errorRaised)
+        self.worker.doneCanceling.connect(self.reject)
+
+        layout = qtw.QVBoxLayout()
+
+        self.message = qtw.QLabel(self, text=qapp.translate('DownloadModDialog', 'Looking up mod') + f' {assetID}')
+
+        self.progressBar = qtw.QProgressBar(self)
+        self.progressBar.setMaximum(0)
+
+        self.buttonBox = qtw.QDialogButtonBox(qtw.QDialogButtonBox.StandardButton.Cancel)
+        self.buttonBox.rejected.connect(self.reject)
+
+        self.pauseButton = self.buttonBox.addButton(qapp.translate('DownloadModDialog', 'Pause'), qtw.QDialogButtonBox.ButtonRole.ActionRole)
+        self.pauseButton.clicked.connect(self.togglePause)
+
+        # Nothing can be paused until the file is being downloaded
+        self.pauseButton.setEnabled(False)
+
+        for widget in (self.message, self.progressBar, self.buttonBox):
+            layout.addWidget(widget)
+
+        self.setLayout(layout)
+
+    def updateProgress(self, received: int, total: int) -> None:
+        self.message.setText(qapp.translate('DownloadModDialog', 'Downloading') + f' {os.path.basename(self.worker.path)}')
+
+        # A file without a known size shows a busy bar
+        self.progressBar.setMaximum(total)
+        self.progressBar.setValue(received)
+
+        self.pauseButton.setEnabled(True)
+
+    def togglePause(self) -> None:
+
+        if self.worker.state == RUNNING:
+            self.worker.pause()
+
+        elif self.worker.state == PAUSED:
+            self.worker.resume()
+
+        # The label follows the download, which might not have been paused
+        if self.worker.state == PAUSED:
+            self.pauseButton.setText(qapp.translate('DownloadModDialog', 'Resume'))
+        else:
+            self.pauseButton.setText(qapp.translate('DownloadModDialog', 'Pause'))
+
+    def succeeded(self, path: str) -> None:
+        self.path = path
+        self.accept()
+
+    def errorRaised(self, message: str) -> None:
+        error = Notice(message, headline=qapp.translate('DownloadModDialog', 'Error'))
+        error.exec()
+
+        self.reject()
+
+    def exec(self) -> int:
+        self.worker.start()
+        return super().exec()
+
+# EVENT OVERRIDES
+    def reject(self) -> None:
+        '''Cancels a running download first, the dialog closes once it stopped'''
+
+        if self.worker.state in (RUNNING, PAUSED):
+            self.message.setText(qapp.translate('DownloadModDialog', 'Canceling...'))
+            self.worker.cancel()
+            return
+
+        super().reject()
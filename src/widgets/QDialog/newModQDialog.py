@@ -1,27 +1,141 @@
 import os
+import threading
 
 import PySide6.QtWidgets as qtw
-from PySide6.QtCore import Qt as qt, QCoreApplication as qapp
+from PySide6.QtCore import Qt as qt, QCoreApplication as qapp, QAbstractTableModel, QModelIndex, QPersistentModelIndex, Signal
 
 from src.widgets.QDialog.QDialog import Dialog
+from src.inspectArchive import inspectArchive, inspectDir, detectType
 
 from src.constant_vars import ModType
 
+# Type of each checkable column, the first column is the mod's name
+TYPE_COLUMNS = (ModType.mods, ModType.mods_override, ModType.maps)
+
+class ModLocationModel(QAbstractTableModel):
+    '''
+    Table of the mods being installed and the type chosen for each one.
+
+    Every ModType has its own checkable column, checking one unchecks the others in that row
+    '''
+
+    # Emitted with the amount of mods that don't have a type yet
+    missingChanged = Signal(int)
+
+    def __init__(self, mods: list[str], detected: dict[str, ModType], parent = None) -> None:
+        super().__init__(parent)
+
+        self.mods = mods
+        self.types: list[ModType | None] = [detected.get(x) for x in mods]
+
+        # Row of each mod, types found after the dialog opened are looked up by name
+        self.rows = {x : i for i, x in enumerate(mods)}
+
+        # Counted instead of checking every row after each click
+        self.missing = self.types.count(None)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.mods)
+
+    def columnCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(TYPE_COLUMNS) + 1
+
+    def headerData(self, section: int, orientation: qt.Orientation, role: int = qt.ItemDataRole.DisplayRole):
+
+        if orientation != qt.Orientation.Horizontal or role != qt.ItemDataRole.DisplayRole:
+            return None
+
+        if section == 0:
+            return qapp.translate('newModLocation', 'Name')
+
+        return TYPE_COLUMNS[section - 1].value
+
+    def flags(self, index: QModelIndex | QPersistentModelIndex) -> qt.ItemFlag:
+
+        flags = qt.ItemFlag.ItemIsEnabled | qt.ItemFlag.ItemIsSelectable
+
+        if index.column() > 0:
+            flags |= qt.ItemFlag.ItemIsUserCheckable
+
+        return flags
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = qt.ItemDataRole.DisplayRole):
+
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+
+        if column == 0:
+            if role in (qt.ItemDataRole.DisplayRole, qt.ItemDataRole.ToolTipRole):
+                return self.mods[row]
+
+        elif role == qt.ItemDataRole.CheckStateRole:
+            return qt.CheckState.Checked if self.types[row] == TYPE_COLUMNS[column - 1] else qt.CheckState.Unchecked
+
+        return None
+
+    def setData(self, index: QModelIndex | QPersistentModelIndex, value, role: int = qt.ItemDataRole.EditRole) -> bool:
+
+        if not index.isValid() or index.column() == 0 or role != qt.ItemDataRole.CheckStateRole:
+            return False
+
+        # A checked type can't be unchecked, every mod needs one
+        if qt.CheckState(value) == qt.CheckState.Checked:
+            self.setType([index.row()], TYPE_COLUMNS[index.column() - 1])
+
+        return True
+
+    def setDetected(self, mod: str, modType: ModType) -> None:
+        '''Checks the type found for a mod, unless one was picked for it already'''
+
+        row = self.rows.get(mod)
+
+        if row is not None and self.types[row] is None:
+            self.setType([row], modType)
+
+    def setType(self, rows: list[int], modType: ModType) -> None:
+        '''Sets the type of every given row'''
+
+        if not rows:
+            return
+
+        for row in rows:
+
+            if self.types[row] is None:
+                self.missing -= 1
+
+            self.types[row] = modType
+
+        self.dataChanged.emit(self.index(min(rows), 1), self.index(max(rows), len(TYPE_COLUMNS)), [qt.ItemDataRole.CheckStateRole])
+
+        self.missingChanged.emit(self.missing)
+
 class newModLocation(Dialog):
 
-    typeDict: dict[str : ModType] = {}
-    
-    def __init__(self, *modName: str) -> None:
+    # Emitted from the thread that inspects the mods with a mod's name and its type
+    typeDetected = Signal(str, object)
+
+    def __init__(self, *modName: str, detected: dict[str, ModType] | None = None, inspect: bool = False) -> None:
+        '''
+        `detected` has the types found by inspecting the mods, those are checked already.
+
+        With `inspect` on the mods are inspected after the dialog opens, each type is checked once it's found
+        '''
         super().__init__()
 
+        self.typeDict: dict[str, ModType] = {}
+
         self.setWindowTitle(qapp.translate('newModLocation', 'Installing mods'))
 
-        self.setMaximumSize(400, 850)
-        self.setMinimumSize(320, 180)
-        self.setSizePolicy(qtw.QSizePolicy.Policy.MinimumExpanding, qtw.QSizePolicy.Policy.Preferred)
+        self.setMinimumSize(480, 320)
+        self.resize(520, 480)
 
         self.modName = modName
-                            
+
+        self.model = ModLocationModel([os.path.basename(x) for x in modName], detected or {}, self)
+        self.model.missingChanged.connect(self.isAllChecked)
+
         layout = qtw.QVBoxLayout()
 
         self.label = qtw.QLabel(
@@ -29,48 +143,38 @@ class newModLocation(Dialog):
             text=qapp.translate('newModLocation', 'Please select where the mods should be installed:')
         )
 
-        scrollArea = qtw.QScrollArea(self)
-        scrollArea.setWidgetResizable(True)
-        scrollArea.setVerticalScrollBarPolicy(qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scrollArea.setHorizontalScrollBarPolicy(qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-
-        frame = qtw.QFrame(scrollArea)
-
-        scrollArea.setWidget(frame)
+        # Only the visible rows are drawn, so it opens as fast for a thousand mods as for one
+        self.modView = qtw.QTableView(self)
+        self.modView.setModel(self.model)
+        self.modView.setSelectionMode(qtw.QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.modView.setSelectionBehavior(qtw.QAbstractItemView.SelectionBehavior.SelectRows)
+        self.modView.setHorizontalScrollBarPolicy(qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.modView.verticalHeader().hide()
 
-        frameLayout = qtw.QVBoxLayout()
-        frameLayout.setSpacing(5)
+        header = self.modView.horizontalHeader()
+        header.setHighlightSections(False)
+        header.setSectionResizeMode(0, qtw.QHeaderView.ResizeMode.Stretch)
 
-        for mod in (os.path.basename(x) for x in modName):
+        for column in range(1, self.model.columnCount()):
+            header.setSectionResizeMode(column, qtw.QHeaderView.ResizeMode.ResizeToContents)
 
-            group = qtw.QGroupBox(f'{mod}')
-            group.setObjectName(mod)
+        # Sets the type of every selected mod at once
+        bulkLayout = qtw.QHBoxLayout()
 
-            radioButtonMod = qtw.QRadioButton(ModType.mods.value, group)
-            radioButtonMod.setObjectName(f'{mod} {ModType.mods}')
-            radioButtonMod.setChecked(False)
-            radioButtonMod.clicked.connect(self.isAllChecked)
+        self.bulkLabel = qtw.QLabel(self, text=qapp.translate('newModLocation', 'Selected mods:'))
 
-            radioButtonOverride = qtw.QRadioButton(ModType.mods_override.value, group)
-            radioButtonOverride.setObjectName(f'{mod} {ModType.mods_override}')
-            radioButtonOverride.clicked.connect(self.isAllChecked)
-            radioButtonOverride.setChecked(False)
+        self.typeBox = qtw.QComboBox(self)
+        self.typeBox.setFocusPolicy(qt.FocusPolicy.NoFocus)
 
-            radioButtonMaps = qtw.QRadioButton(ModType.maps.value, group)
-            radioButtonMaps.setObjectName(f'{mod} {ModType.maps}')
-            radioButtonMaps.clicked.connect(self.isAllChecked)
-            radioButtonMaps.setChecked(False)
+        for modType in TYPE_COLUMNS:
+            self.typeBox.addItem(modType.value, modType)
 
-            h1 = qtw.QHBoxLayout()
-            h1.addWidget(radioButtonMod)
-            h1.addWidget(radioButtonOverride)
-            h1.addWidget(radioButtonMaps)
+        self.applyButton = qtw.QPushButton(qapp.translate('newModLocation', 'Apply Type'), self)
+        self.applyButton.clicked.connect(self.applyToSelection)
 
-            group.setLayout(h1)
-
-            frameLayout.addWidget(group)
-
-        frame.setLayout(frameLayout)
+        bulkLayout.addWidget(self.bulkLabel)
+        bulkLayout.addWidget(self.typeBox, 1)
+        bulkLayout.addWidget(self.applyButton)
 
         buttons = qtw.QDialogButtonBox.StandardButton.Ok | qtw.QDialogButtonBox.StandardButton.Cancel
 
@@ -79,59 +183,62 @@ class newModLocation(Dialog):
         self.buttonBox.accepted.connect(self.accept)
         self.buttonBox.rejected.connect(self.reject)
 
-        for widget in (self.label, scrollArea, self.buttonBox):
-            layout.addWidget(widget)
+        layout.addWidget(self.label)
+        layout.addWidget(self.modView)
+        layout.addLayout(bulkLayout)
+        layout.addWidget(self.buttonBox)
 
         self.setLayout(layout)
-    
-    def changeOkButtonState(self, bool: bool) -> None:
-        self.buttonBox.button(qtw.QDialogButtonBox.StandardButton.Ok).setEnabled(bool)
-    
-    def isAllChecked(self) -> None:
 
-        groups: list[qtw.QGroupBox] = self.findChildren(qtw.QGroupBox)
+        self.isAllChecked()
 
-        for group in groups:
+        # Set once the dialog closes, the mods that weren't inspected yet are skipped
+        self.stopInspecting = threading.Event()
 
-            buttons: list[qtw.QRadioButton] = group.findChildren(qtw.QRadioButton)
+        if inspect:
+            self.typeDetected.connect(self.model.setDetected)
 
-            if any((buttons[0].isChecked(), buttons[1].isChecked(), buttons[2].isChecked())):
-                continue
-            else:
-                return
-        
-        self.changeOkButtonState(True)
+            threading.Thread(target=self.inspect, args=(modName,), daemon=True).start()
 
-    def getData(self) -> None:
+    def inspect(self, paths: tuple[str, ...]) -> None:
+        '''
+        Looks inside of each mod for its type, runs in its own thread.
 
-        items: list[qtw.QGroupBox] = self.findChildren(qtw.QGroupBox)
+        An archive's file list is read without extracting it, but a .tar.gz is decompressed to get it
+        '''
 
-        count = 0
+        for path in paths:
 
-        # Buttons[0] is mods, buttons[1] is override, buttons[2] is Maps
-        for item in items:
+            if self.stopInspecting.is_set():
+                return
 
-            buttons: list[qtw.QRadioButton] = item.findChildren(qtw.QRadioButton)
+            modType = detectType(inspectDir(path) if os.path.isdir(path) else inspectArchive(path))
 
-            modName = os.path.basename(self.modName[count])
+            if modType is not None and not self.stopInspecting.is_set():
+                self.typeDetected.emit(os.path.basename(path), modType)
 
-            if buttons[0].isChecked():
+    def changeOkButtonState(self, bool: bool) -> None:
+        self.buttonBox.button(qtw.QDialogButtonBox.StandardButton.Ok).setEnabled(bool)
 
-                self.typeDict[modName] = ModType.mods
-            elif buttons[1].isChecked():
+    def isAllChecked(self) -> None:
+        self.changeOkButtonState(self.model.missing == 0)
 
-                self.typeDict[modName] = ModType.mods_override
-            
-            elif buttons[2].isChecked():
+    def applyToSelection(self) -> None:
+        rows = [x.row() for x in self.modView.selectionModel().selectedRows()]
 
-                self.typeDict[modName] = ModType.maps
+        self.model.setType(rows, self.typeBox.currentData())
 
-            count += 1
+    def getData(self) -> None:
+        self.typeDict = {x : y for x, y in zip(self.model.mods, self.model.types) if y is not None}
+
+    def done(self, arg__1: int) -> None:
+        self.stopInspecting.set()
+        return super().done(arg__1)
 
     def accept(self) -> None:
         self.getData()
         return super().accept()
-    
+
     def reject(self) -> None:
         self.setResult(0)
-        return super().reject()
\ No newline at end of file
+        return super().reject()
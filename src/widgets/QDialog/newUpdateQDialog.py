@@ -3,7 +3,6 @@ import logging
 import PySide6.QtWidgets as qtw
 import PySide6.QtGui as qtg
 from PySide6.QtCore import Qt as qt, QCoreApplication as qapp
-from PySide6.QtNetwork import QNetworkReply
 
 from semantic_version import Version
 
@@ -120,7 +119,7 @@ class updateDetected(Dialog):
         logging.info('Task %s was canceled...')
         self.message.setText(qapp.translate('updateDetected', 'Canceling... (Finishing current step)'))
 
-        self.autoUpdate.cancel = True
+        self.autoUpdate.abort()
     
     def doNotAskAgain(self) -> None:
         logging.info('Do not alert me to updates button was pressed')
@@ -132,8 +131,7 @@ class updateDetected(Dialog):
     def downloadStarted(self, current: int, total: int) -> None:
 
         if self.autoUpdate.cancel:
-            reply: QNetworkReply = self.autoUpdate.network.sender()
-            reply.abort()
+            self.autoUpdate.abort()
             self.reject()
 
         if not self.downloadState:
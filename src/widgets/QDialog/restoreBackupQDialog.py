@@ -0,0 +1,151 @@
+import os
+import time
+
+import PySide6.QtWidgets as qtw
+from PySide6.QtCore import Qt as qt, Signal, QCoreApplication as qapp
+
+from src.widgets.QDialog.QDialog import Dialog
+from src.widgets.QDialog.announcementQDialog import Notice
+from src.widgets.QDialog.deleteWarningQDialog import Confirmation
+from src.widgets.progressWidget import ProgressWidget
+from src.threaded.backupMods import BackupMods
+from src.threaded.restoreMods import RestoreMods
+
+from src.backupChain import BackupChain, folderType
+from src.backupRepository import BackupRepository
+from src.constant_vars import OPTIONS_CONFIG, BACKUP_REPOSITORY
+
+class RestoreBackup(Dialog):
+
+    # Dict of restored mods and their MOD_CONFIG entries
+    modsRestored = Signal(dict)
+
+    def __init__(self, backupPath: str = BackupMods.backupPath, optionsPath: str = OPTIONS_CONFIG) -> None:
+        super().__init__()
+
+        self.setWindowTitle(qapp.translate('RestoreBackup', 'Restore Mods'))
+        self.setMinimumSize(400, 300)
+
+        self.optionsPath = optionsPath
+
+        # Zip backups, and snapshots if a repository was made
+        self.stores: list[BackupChain | BackupRepository] = [BackupChain(backupPath)]
+
+        if os.path.isdir(os.path.join(backupPath, BACKUP_REPOSITORY)):
+            self.stores.append(BackupRepository(os.path.join(backupPath, BACKUP_REPOSITORY)))
+
+        layout = qtw.QVBoxLayout()
+
+        self.label = qtw.QLabel(
+            self,
+            text=qapp.translate('RestoreBackup', 'Select the mods to restore, mods that are installed now are moved to the trash:')
+        )
+        self.label.setWordWrap(True)
+
+        self.backupBox = qtw.QComboBox(self)
+        self.backupBox.setEditable(False)
+        self.backupBox.setFocusPolicy(qt.FocusPolicy.NoFocus)
+        self.backupBox.currentIndexChanged.connect(self.refreshMods)
+
+        self.modList = qtw.QListWidget(self)
+        self.modList.setHorizontalScrollBarPolicy(qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.modList.setSelectionMode(qtw.QListWidget.SelectionMode.ExtendedSelection)
+
+        self.buttonBox = qtw.QDialogButtonBox(qtw.QDialogButtonBox.StandardButton.Close)
+        self.buttonBox.rejected.connect(self.reject)
+
+        self.restoreButton = self.buttonBox.addButton(qapp.translate('RestoreBackup', 'Restore'), qtw.QDialogButtonBox.ButtonRole.ActionRole)
+        self.restoreButton.clicked.connect(self.restore)
+
+        self.deleteButton = self.buttonBox.addButton(qapp.translate('RestoreBackup', 'Delete Backup'), qtw.QDialogButtonBox.ButtonRole.DestructiveRole)
+        self.deleteButton.clicked.connect(self.deleteBackup)
+
+        for widget in (self.label, self.backupBox, self.modList, self.buttonBox):
+            layout.addWidget(widget)
+
+        self.setLayout(layout)
+
+        self.refreshBackups()
+
+    def refreshBackups(self) -> None:
+        self.backupBox.clear()
+
+        manifests = [(x, i) for i, store in enumerate(self.stores) for x in store.restorable()]
+
+        # Newest first
+        for manifest, i in sorted(manifests, key=lambda x: x[0]['created'], reverse=True):
+
+            created = time.strftime('%Y-%m-%d %H:%M', time.localtime(manifest['created']))
+
+            self.backupBox.addItem(f'{created} ({manifest["kind"]})', (i, manifest['name']))
+
+        self.refreshMods()
+
+    def refreshMods(self) -> None:
+        self.modList.clear()
+
+        if self.backupBox.currentData() is None:
+            return
+
+        store, name = self.currentBackup()
+
+        # Listed from the manifest, the zips aren't opened
+        for folder in store.mods(name):
+
+            item = qtw.QListWidgetItem(f'{folder.rsplit("/", 1)[1]} ({folderType(folder).value})')
+            item.setData(qt.ItemDataRole.UserRole, folder)
+
+            self.modList.addItem(item)
+
+    def currentBackup(self) -> tuple[BackupChain | BackupRepository, str]:
+        i, name = self.backupBox.currentData()
+
+        return self.stores[i], name
+
+    def restore(self) -> None:
+        folders = [x.data(qt.ItemDataRole.UserRole) for x in self.modList.selectedItems()]
+
+        if self.backupBox.currentData() is None or not folders:
+            return
+
+        store, name = self.currentBackup()
+
+        worker = RestoreMods(store, name, folders, optionsPath=self.optionsPath)
+
+        restore = ProgressWidget(worker)
+        restore.exec()
+
+        if worker.restored:
+            self.modsRestored.emit(worker.restored)
+
+    def deleteBackup(self) -> None:
+        if self.backupBox.currentData() is None:
+            return
+
+        store, name = self.currentBackup()
+
+        # Incremental and differential backups can't be restored without the backups they build on
+        if isinstance(store, BackupChain) and any(x['parent'] == name for x in store.backups()):
+            notice = Notice(
+                qapp.translate('RestoreBackup', 'Other backups build on this backup, delete them first'),
+                qapp.translate('RestoreBackup', 'The backup was not deleted')
+            )
+            notice.exec()
+            return
+
+        warning = Confirmation(
+            qapp.translate('RestoreBackup', 'Delete Backup'),
+            qapp.translate('RestoreBackup', 'Are you sure you want to permanently delete this backup?') + f'\n{self.backupBox.currentText()}'
+        )
+        warning.exec()
+
+        if not warning.result():
+            return
+
+        store.remove(name)
+
+        # Chunks that only this snapshot used
+        if isinstance(store, BackupRepository):
+            store.prune()
+
+        self.refreshBackups()
@@ -0,0 +1,107 @@
+import time
+
+import PySide6.QtWidgets as qtw
+from PySide6.QtCore import Qt as qt, Signal, QCoreApplication as qapp
+
+from src.widgets.QDialog.QDialog import Dialog
+from src.widgets.QDialog.announcementQDialog import Notice
+from src.widgets.QDialog.deleteWarningQDialog import Confirmation
+from src.widgets.progressWidget import ProgressWidget
+from src.threaded.purgeTrash import PurgeTrash
+
+from src.trash import Trash
+from src.save import OptionsManager
+from src.constant_vars import OPTIONS_CONFIG
+
+class TrashBin(Dialog):
+
+    # Dict of restored mods and their MOD_CONFIG entries
+    modsRestored = Signal(dict)
+
+    def __init__(self, optionsPath: str = OPTIONS_CONFIG) -> None:
+        super().__init__()
+
+        self.setWindowTitle(qapp.translate('TrashBin', 'Deleted Mods'))
+        self.setMinimumSize(400, 300)
+
+        self.optionsPath = optionsPath
+        self.optionsManager = OptionsManager(optionsPath)
+
+        self.trash = Trash(self.optionsManager.getGamepath(), self.optionsManager.getDispath())
+
+        layout = qtw.QVBoxLayout()
+
+        self.label = qtw.QLabel(
+            self,
+            text=qapp.translate('TrashBin', 'Deleted mods can be restored until the trash is emptied:')
+        )
+        self.label.setWordWrap(True)
+
+        self.trashList = qtw.QListWidget(self)
+        self.trashList.setHorizontalScrollBarPolicy(qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.trashList.setSelectionMode(qtw.QListWidget.SelectionMode.ExtendedSelection)
+
+        self.buttonBox = qtw.QDialogButtonBox(qtw.QDialogButtonBox.StandardButton.Close)
+        self.buttonBox.rejected.connect(self.reject)
+
+        self.restoreButton = self.buttonBox.addButton(qapp.translate('TrashBin', 'Restore'), qtw.QDialogButtonBox.ButtonRole.ActionRole)
+        self.restoreButton.clicked.connect(self.restore)
+
+        self.emptyButton = self.buttonBox.addButton(qapp.translate('TrashBin', 'Empty Trash'), qtw.QDialogButtonBox.ButtonRole.DestructiveRole)
+        self.emptyButton.clicked.connect(self.emptyTrash)
+
+        for widget in (self.label, self.trashList, self.buttonBox):
+            layout.addWidget(widget)
+
+        self.setLayout(layout)
+
+        self.refreshList()
+
+    def refreshList(self) -> None:
+        self.trashList.clear()
+
+        for entry in self.trash.entries():
+            deleted = time.strftime('%Y-%m-%d %H:%M', time.localtime(entry['deleted']))
+
+            item = qtw.QListWidgetItem(f'{entry["mod"]} ({deleted})')
+            item.setData(qt.ItemDataRole.UserRole, entry)
+
+            self.trashList.addItem(item)
+
+    def restore(self) -> None:
+        restored: dict[str, dict | None] = {}
+        failed: list[str] = []
+
+        for item in self.trashList.selectedItems():
+            entry: dict = item.data(qt.ItemDataRole.UserRole)
+
+            if self.trash.restore(entry):
+                restored[entry['mod']] = entry['data']
+            else:
+                failed.append(entry['mod'])
+
+        self.refreshList()
+
+        if restored:
+            self.modsRestored.emit(restored)
+
+        if failed:
+            notice = Notice(
+                qapp.translate('TrashBin', 'These mods could not be restored because a mod with the same name is installed:') +
+                f'\n{", ".join(failed)}',
+                qapp.translate('TrashBin', 'Some mods were not restored')
+            )
+            notice.exec()
+
+    def emptyTrash(self) -> None:
+        warning = Confirmation(
+            qapp.translate('TrashBin', 'Empty Trash'),
+            qapp.translate('TrashBin', 'Are you sure you want to permanently delete every mod in the trash?')
+        )
+        warning.exec()
+
+        if warning.result():
+            purge = ProgressWidget(PurgeTrash(optionsPath=self.optionsPath))
+            purge.exec()
+
+            self.refreshList()
@@ -63,11 +63,9 @@ class ManagerMenu(ModContextMenu):
             event.accept()
             return
 
-        if self.qParent.saveManager.getModworkshopAssetID(selectedItems[0].text()):
-            self.visitModPage.setEnabled(True)
-            self.checkUpdate.setEnabled(True)
-        else:
-            self.visitModPage.setEnabled(False)
-            self.checkUpdate.setEnabled(False)
+        self.visitModPage.setEnabled(bool(self.qParent.saveManager.getModworkshopAssetID(selectedItems[0].text())))
+
+        # Every selected mod is checked
+        self.checkUpdate.setEnabled(any(self.qParent.saveManager.getModworkshopAssetID(x.text()) for x in selectedItems))
 
         return super().showEvent(event)
@@ -9,21 +9,26 @@ from src.widgets.QMenu.managerQMenu import ManagerMenu
 from src.widgets.progressWidget import ProgressWidget
 from src.widgets.QDialog.deleteWarningQDialog import Confirmation
 from src.widgets.QDialog.newModQDialog import newModLocation
-from src.widgets.QDialog.announcementQDialog import Notice
 from src.widgets.tagViewerQWidget import TagViewer
 
 from src.threaded.moveToDisabledDir import MoveToDisabledDir
 from src.threaded.moveToEnabledDir import MoveToEnabledModDir
-from src.threaded.changeModType import ChangeModType
 from src.threaded.deleteMod import DeleteMod
-from src.threaded.unZipMod import UnZipMod
+from src.threaded.installMods import InstallMods
 
 from src.getPath import Pathing
 import src.errorChecking as errorChecking
 from src.save import Save, OptionsManager
-from src.constant_vars import MODSIGNORE, ModType, UI_GRAPHICS_PATH, MODWORKSHOP_LOGO_B, MODWORKSHOP_LOGO_W, LIGHT, MOD_CONFIG, OPTIONS_CONFIG, ModRole, ModKeys
+from src.constant_vars import MODSIGNORE, ModType, UI_GRAPHICS_PATH, MODWORKSHOP_LOGO_B, MODWORKSHOP_LOGO_W, LIGHT, MOD_CONFIG, OPTIONS_CONFIG, MODWORKSHOP_API, ModRole, ModKeys
 from src.api.api import findModworkshopAssetID, findModVersion
-from src.api.checkModUpdate import checkModUpdate
+from src.api.checkModUpdate import checkModUpdates
+from src.api.network import NetworkService
+
+# States of a mod in the update column
+UPDATE_CHECKING = 'checking'
+UPDATE_AVAILABLE = 'available'
+UPDATE_CURRENT = 'current'
+UPDATE_FAILED = 'failed'
 
 class ModListWidget(qtw.QTableWidget):
 
@@ -41,12 +46,13 @@ class ModListWidget(qtw.QTableWidget):
         self.setEditTriggers(qtw.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.setAcceptDrops(True)
 
-        self.setColumnCount(4)
+        self.setColumnCount(5)
 
         self.setColumnWidth(0, 400)
         self.setColumnWidth(1, 130)
         self.setColumnWidth(2, 100)
         self.setColumnWidth(3, 100)
+        self.setColumnWidth(4, 130)
 
         horizontalHeader = self.horizontalHeader()
 
@@ -57,6 +63,7 @@ class ModListWidget(qtw.QTableWidget):
         horizontalHeader.setSectionResizeMode(1, qtw.QHeaderView.ResizeMode.ResizeToContents)
         horizontalHeader.setSectionResizeMode(2, qtw.QHeaderView.ResizeMode.ResizeToContents)
         horizontalHeader.setSectionResizeMode(3, qtw.QHeaderView.ResizeMode.Interactive)
+        horizontalHeader.setSectionResizeMode(4, qtw.QHeaderView.ResizeMode.Interactive)
 
         self.sortState = {'col' : 0, 'ascending': qt.SortOrder.AscendingOrder}
 
@@ -67,6 +74,11 @@ class ModListWidget(qtw.QTableWidget):
         self.contextMenu = ManagerMenu(self)
         self.tagViewer = None
 
+        # Result of the last update check of each mod and the latest version, kept through refreshes
+        self.updates: dict[str, tuple[str, str]] = {}
+
+        self.api: checkModUpdates | None = None
+
         self.applyStaticText()
     
     def applyStaticText(self) -> None:
@@ -74,9 +86,13 @@ class ModListWidget(qtw.QTableWidget):
             qapp.translate("ModListWidget", 'Name'),
             qapp.translate("ModListWidget", 'Type'),
             qapp.translate("ModListWidget", 'Enabled'),
-            qapp.translate("ModListWidget", 'Version'))
+            qapp.translate("ModListWidget", 'Version'),
+            qapp.translate("ModListWidget", 'Update'))
         )
 
+        for i in range(self.rowCount()):
+            self.getUpdateItem(i).setText(self.updateText(self.getNameItem(i).text()))
+
         # Update Enabled Item Tags
         enabled_text = self.horizontalHeaderItem(2).text()
         disabled_text = qapp.translate("ModListWidget", 'Disabled')
@@ -104,6 +120,9 @@ class ModListWidget(qtw.QTableWidget):
     def getVersionItem(self, row: int) -> qtw.QTableWidgetItem:
         return self.item(row, 3)
     
+    def getUpdateItem(self, row: int) -> qtw.QTableWidgetItem:
+        return self.item(row, 4)
+
     def getSelectedNameItems(self) -> list[qtw.QTableWidgetItem]:
         return self.selectedItems()[::self.columnCount()]
     
@@ -156,6 +175,9 @@ class ModListWidget(qtw.QTableWidget):
 
         self.insertRow(self.rowCount())
 
+        # Every column has an item, `getSelectedNameItems()` counts on it
+        self.setItem(self.rowCount() - 1, 4, qtw.QTableWidgetItem(self.updateText(kwargs.get('name', ''))))
+
         for key, value in kwargs.items():
 
             match key:
@@ -204,8 +226,6 @@ class ModListWidget(qtw.QTableWidget):
 
         items = self.getSelectedNameItems()
 
-        disabledModDir = self.optionsManager.getDispath()
-
         startFileMover = ProgressWidget(MoveToDisabledDir(*[x.text() for x in items]))
         startFileMover.exec()
 
@@ -214,8 +234,10 @@ class ModListWidget(qtw.QTableWidget):
             row = item.row()
 
             modName = item.text()
+            modType = ModType(self.getTypeItem(row).text())
 
-            if os.path.isdir(os.path.join(disabledModDir, modName)):
+            # Checking the game directory since the symlink mode keeps a copy of every mod in the disabled directory
+            if not os.path.isdir(self.p.mod(modType, modName)):
 
                 self.saveManager.setEnabled(modName, False)
 
@@ -233,7 +255,7 @@ class ModListWidget(qtw.QTableWidget):
         '''
 
         warning = Confirmation(title='Deletion Confirmation', 
-                               body='Are you sure you want to delete these mod(s) from your computer?\n(This action cannot be reversed)')
+                               body='Are you sure you want to delete these mod(s) from your computer?\n(They can be restored from Options > Misc > Deleted Mods until the trash is emptied)')
         warning.exec()
 
         if warning.result():
@@ -277,6 +299,43 @@ class ModListWidget(qtw.QTableWidget):
         
         self.saveManager.saveJSON()
 
+    def setModsEnabled(self, mods: dict[str, bool]) -> None:
+        '''
+        Updates the enabled state of mods in MOD_CONFIG and
+        in the GUI without refreshing the whole table
+        '''
+
+        rows = {self.getNameItem(x).text() : x for x in range(self.rowCount())}
+
+        for modName, enabled in mods.items():
+
+            self.saveManager.setEnabled(modName, enabled)
+
+            row = rows.get(modName)
+
+            # Hidden mods don't have a row
+            if row is None:
+                continue
+
+            self.getEnabledItem(row).setText(
+                qapp.translate("ModListWidget", 'Enabled') if enabled else qapp.translate("ModListWidget", 'Disabled')
+            )
+
+        self.saveManager.saveJSON()
+
+        if self.sortState['col'] == 2:
+            self.sort(self.sortState['col'], False)
+
+    def restoreMods(self, mods: dict[str, dict | None]) -> None:
+        '''Puts back the MOD_CONFIG entries of mods restored from the trash'''
+
+        for modName, data in mods.items():
+            if data is not None:
+                self.saveManager.setMod(modName, data)
+
+        self.refreshMods()
+        self.itemChanged.emit(qtw.QTableWidgetItem())
+
     # This isn't used anywhere, might be removed later
     def isMultipleSelected(self) -> bool:
         return len(self.selectedItems()) > 1
@@ -302,29 +361,74 @@ class ModListWidget(qtw.QTableWidget):
             if self.saveManager.getIgnored(mod):
                 continue
 
-            type = self.saveManager.getType(mod)
-            isEnabled = not os.path.isdir(os.path.join(disModFolder, mod))
-            modPath = self.p.mod(type, mod) if isEnabled else os.path.join(disModFolder, mod)
-            version = str(findModVersion(modPath))
-            tags = self.saveManager.getTags(mod)
+            self.addMod(**self.readMod(mod, disModFolder))
+        
+        self.saveManager.saveJSON()
 
-            assetID = self.saveManager.getModworkshopAssetID(mod)
+        # Clear selections from the disabled mod check
+        self.clearSelection()
 
-            if not assetID:
-                assetID = findModworkshopAssetID(modPath)
+        if sorting:
+            self.sort(self.sortState['col'], False)
 
-            self.saveManager.setEnabled(mod, isEnabled)
-            
-            self.saveManager.setModWorkshopAssetID(mod, assetID)
-            
-            logging.debug('Adding mod to table, %s|%s|%s|%s|%s|%s', mod, type, isEnabled, version, assetID, tags)
+    def readMod(self, mod: str, disModFolder: str) -> dict:
+        '''
+        Reads a mod's state from its folder and updates its entry in MOD_CONFIG.
+
+        Returns the kwargs `addMod()` takes
+        '''
 
-            self.addMod(name=mod, type=type, enabled=isEnabled, version=version, tags=tags)
+        type = self.saveManager.getType(mod)
+
+        # A mod is enabled if it's in the game directory, either moved there or linked by the symlink mode
+        isEnabled = os.path.isdir(self.p.mod(type, mod))
+        modPath = self.p.mod(type, mod) if isEnabled else os.path.join(disModFolder, mod)
+        version = str(findModVersion(modPath))
+        tags = self.saveManager.getTags(mod)
+
+        assetID = self.saveManager.getModworkshopAssetID(mod)
+
+        if not assetID:
+            assetID = findModworkshopAssetID(modPath)
+
+        self.saveManager.setEnabled(mod, isEnabled)
         
-        self.saveManager.saveJSON()
+        self.saveManager.setModWorkshopAssetID(mod, assetID)
+        
+        logging.debug('Adding mod to table, %s|%s|%s|%s|%s|%s', mod, type, isEnabled, version, assetID, tags)
 
-        # Clear selections from the disabled mod check
-        self.clearSelection()
+        return {'name' : mod, 'type' : type, 'enabled' : isEnabled, 'version' : version, 'tags' : tags}
+
+    def addInstalledMods(self, mods: dict[str, ModType], sorting: bool = True) -> None:
+        '''
+        Adds newly installed mods to MOD_CONFIG and the table without refreshing the whole table,
+        rows of mods that were installed over an older version are replaced.
+
+        `mods` has the path of each installed mod folder and its ModType
+        '''
+
+        if not mods:
+            return
+
+        names = [os.path.basename(x) for x in mods]
+
+        self.saveManager.addMods(*[([os.path.basename(x)], y) for x, y in mods.items()])
+
+        # Going from the bottom so removing a row doesn't move the others
+        for row in reversed(range(self.rowCount())):
+            if self.getNameItem(row).text() in names:
+                self.removeRow(row)
+
+        disModFolder = self.optionsManager.getDispath()
+
+        for mod in names:
+
+            if self.saveManager.getIgnored(mod):
+                continue
+
+            self.addMod(**self.readMod(mod, disModFolder))
+
+        self.saveManager.saveJSON()
 
         if sorting:
             self.sort(self.sortState['col'], False)
@@ -398,9 +502,15 @@ class ModListWidget(qtw.QTableWidget):
 
         # Disabled Mods Folder
         if os.path.exists(disabledModsPath):
+
+            # The symlink mode keeps enabled mods in the disabled directory too
+            enabledMods = set(mod_override + mods + maps)
             
             for mod in disabledModsFolder:
 
+                if mod in enabledMods:
+                    continue
+
                 if self.saveManager.hasMod(mod):
 
                     modType = self.saveManager.getType(mod)
@@ -431,27 +541,64 @@ class ModListWidget(qtw.QTableWidget):
             errorChecking.openWebPage(f'https://modworkshop.net/mod/{assetID}')
     
     def checkModUpdate(self) -> None:
-        notice_title = qapp.translate("ModListWidget", 'Mod Update Check Results')
-        def updateDetected(newVersion: str) -> None:
-            Notice(
-                qapp.translate("ModListWidget", 'A new version has been found for') + f' {modName}!' + '\n' + qapp.translate("ModListWidget", 'Local') + f': {modVersion}\nModworkshop: {newVersion}',
-                notice_title
-            ).exec()
-        def uptoDate() -> None:
-            Notice(modName + ' ' + qapp.translate("ModListWidget", 'is up to date'), notice_title).exec()
-
-        item = self.getSelectedNameItems()[0]
-        modName = self.getNameItem(self.row(item)).text()
-        modVersion = self.getVersionItem(self.row(item)).text()
-        assetID = self.saveManager.getModworkshopAssetID(modName)
+        '''Checks the selected mods for updates'''
 
-        if not assetID:
-            logging.warning('ModListWidget.checkModUpdate(), %s is missing an assetID', modName)
-            return
+        self.checkModUpdates([x.text() for x in self.getSelectedNameItems()])
+
+    def checkAllModUpdates(self) -> None:
+        self.checkModUpdates([self.getNameItem(x).text() for x in range(self.rowCount())])
+
+    def checkModUpdates(self, mods: list[str], apiUrl: str = MODWORKSHOP_API, network: NetworkService | None = None) -> checkModUpdates | None:
+        '''
+        Checks the mods that have a modworkshop asset id for updates, all at once.
+
+        The results are shown in the update column as they come in.
+        Returns the running check, None if none of the mods can be checked
+        '''
+
+        rows = {self.getNameItem(x).text() : x for x in range(self.rowCount())}
 
-        self.api = checkModUpdate(assetID, modVersion)
-        self.api.upToDate.connect(uptoDate)
-        self.api.updateDetected.connect(lambda x: updateDetected(x))
+        mods = {x : (self.saveManager.getModworkshopAssetID(x), self.getVersionItem(rows[x]).text()) for x in mods if x in rows}
+
+        for mod, (assetID, version) in list(mods.items()):
+            if not assetID:
+                logging.warning('ModListWidget.checkModUpdates(), %s is missing an assetID', mod)
+                del mods[mod]
+
+        if not mods:
+            return None
+
+        for mod in mods:
+            self.setUpdate(mod, UPDATE_CHECKING)
+
+        self.api = checkModUpdates(mods, apiUrl=apiUrl, network=network)
+        self.api.modChecked.connect(lambda x, y, z: self.setUpdate(x, UPDATE_AVAILABLE if z else UPDATE_CURRENT, y))
+        self.api.modFailed.connect(lambda x: self.setUpdate(x, UPDATE_FAILED))
+        self.api.start()
+
+        return self.api
+
+    def setUpdate(self, mod: str, state: str, version: str = '') -> None:
+        '''Shows the result of a mod's update check in its row'''
+
+        self.updates[mod] = (state, version)
+
+        for row in range(self.rowCount()):
+            if self.getNameItem(row).text() == mod:
+                self.getUpdateItem(row).setText(self.updateText(mod))
+                break
+
+    def updateText(self, mod: str) -> str:
+        state, version = self.updates.get(mod, ('', ''))
+
+        texts = {
+            UPDATE_CHECKING : qapp.translate("ModListWidget", 'Checking...'),
+            UPDATE_AVAILABLE : qapp.translate("ModListWidget", 'Update available') + f': {version}',
+            UPDATE_CURRENT : qapp.translate("ModListWidget", 'Up to date'),
+            UPDATE_FAILED : qapp.translate("ModListWidget", 'Check failed')
+        }
+
+        return texts.get(state, '')
 
     def openModDir(self) -> None:
         if not len(self.getSelectedNameItems()) <= 0:
@@ -530,44 +677,39 @@ class ModListWidget(qtw.QTableWidget):
             if not item.icon().isNull():
                 item.setIcon(qtg.QIcon(os.path.join(UI_GRAPHICS_PATH, reverseDict[newIcon])))
 
-    def installMods(self, *urls: str) -> None:
+    def installMods(self, *urls: str) -> bool:
+        '''Returns True if every mod was installed'''
+
+        fileTypes = {x : errorChecking.getFileType(x) for x in urls}
 
-        dirs: list[str] = [x for x in urls if errorChecking.getFileType(x) == 'dir']
-        zips: list[str] = [x for x in urls if errorChecking.getFileType(x) == 'zip']
+        dirs: list[str] = [x for x in urls if fileTypes[x] == 'dir']
+        zips: list[str] = [x for x in urls if fileTypes[x] == 'zip']
 
-        # Gather where the user wants each mod to go
-        notice = newModLocation(*[x for x in list(dirs + zips)])
+        # Gather where the user wants each mod to go, the types found inside of the mods are checked as they're found
+        notice = newModLocation(*dirs, *zips, inspect=True)
         notice.exec()
 
         if not notice.result():
-            return
+            return False
 
         # Dictionary holding the destination for each mod
         dict_ = notice.typeDict
 
-        # Combine the mod location and URL into a Tuple
-        if dirs:
-
-            dirTuple: list[tuple[str, ModType]] = []
-
-            for dir in dirs:
-                dirTuple.append((dir, dict_[os.path.basename(dir)]))
-
-            startFileMover = ProgressWidget(ChangeModType(*dirTuple))
-            startFileMover.exec()
-
-        if zips:
+        # Folders are moved and archives extracted in one task
+        worker = InstallMods(
+            [(x, dict_[os.path.basename(x)]) for x in dirs],
+            [(x, dict_[os.path.basename(x)]) for x in zips]
+        )
 
-            zipsTuple: list[tuple[str, ModType]] = []
+        startFileMover = ProgressWidget(worker)
+        startFileMover.exec()
 
-            for zip in zips:
-                zipsTuple.append((zip, dict_[os.path.basename(zip)]))
+        # Only the new mods are read, the rest of the table stays as it is
+        self.addInstalledMods(worker.installed)
 
-            startFileMover = ProgressWidget(UnZipMod(*zipsTuple))
-            startFileMover.exec()
-    
         self.itemChanged.emit(qtw.QTableWidgetItem())
-        self.refreshMods()
+
+        return not worker.failed and not worker.cancel
 
 # EVENT OVERRIDES
     def mousePressEvent(self, event: qtg.QMouseEvent) -> None:
@@ -33,13 +33,17 @@ class ProgressWidget(Dialog):
         # Progress bar
         self.progressBar = qtw.QProgressBar()
 
+        # Progress within the current step, only shown by tasks that report it
+        self.subProgressBar = qtw.QProgressBar()
+        self.subProgressBar.hide()
+
         # Button
         buttons = qtw.QDialogButtonBox.StandardButton.Cancel
 
         self.buttonBox = qtw.QDialogButtonBox(buttons)
         self.buttonBox.rejected.connect(self.cancel)
 
-        for widget in (self.infoLabel, self.progressBar, self.buttonBox):
+        for widget in (self.infoLabel, self.progressBar, self.subProgressBar, self.buttonBox):
             layout.addWidget(widget)
         
         self.setLayout(layout)
@@ -58,6 +62,7 @@ class ProgressWidget(Dialog):
         self.mode.setTotalProgress.connect(lambda x: self.progressBar.setMaximum(x))
         self.mode.setCurrentProgress.connect(lambda x, y: self.updateProgressBar(x, y))
         self.mode.addTotalProgress.connect(lambda x: self.progressBar.setMaximum(self.progressBar.maximum() + x))
+        self.mode.setSubProgress.connect(lambda x, y: self.updateSubProgressBar(x, y))
         self.mode.doneCanceling.connect(self.reject)
         self.mode.error.connect(lambda x: self.errorRaised(x))
         self.mode.succeeded.connect(self.succeeded)
@@ -95,8 +100,8 @@ class ProgressWidget(Dialog):
     
     def cancel(self) -> None:
         '''
-        Sets the cancel flag to true in which FileMover() will exit the function
-        after it's done a step and pass the success signal
+        Cancels the task's token, the task stops at its next
+        checkpoint (within a chunk of data) and emits doneCanceling
         '''
 
         isModeCanceled = self.mode.cancel
@@ -120,3 +125,10 @@ class ProgressWidget(Dialog):
 
         self.infoLabel.setText(y)
         self.progressBar.setValue(newValue)
+
+    def updateSubProgressBar(self, x: int, y: int) -> None:
+        '''Sets the value and maximum of the progress bar for the current step'''
+
+        self.subProgressBar.show()
+        self.subProgressBar.setMaximum(y)
+        self.subProgressBar.setValue(x)
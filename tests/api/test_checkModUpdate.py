@@ -0,0 +1,34 @@
+from pytestqt.qtbot import QtBot
+
+from src.api.checkModUpdate import checkModUpdates
+from src.api.network import NetworkService
+
+def test_checkModUpdates(qtbot: QtBot, local_server, tmp_path) -> None:
+    local_server.delay = 0.05
+
+    for i in range(10):
+        local_server.routes[f'/mods/{i}/version'] = (200, {}, b'1.2.0')
+
+    local_server.routes['/mods/10/version'] = (200, {}, b'not a version')
+
+    mods = {f'mod{i}' : (str(i), '1.2.0' if i % 2 else '1.0.0') for i in range(12)}
+
+    checker = checkModUpdates(mods, maxRequests=3, apiUrl=local_server.url, network=NetworkService(str(tmp_path)))
+
+    checked: dict[str, tuple[str, bool]] = {}
+    failed: list[str] = []
+
+    checker.modChecked.connect(lambda x, y, z: checked.update({x : (y, z)}))
+    checker.modFailed.connect(failed.append)
+
+    with qtbot.waitSignal(checker.finished, timeout=10000):
+        checker.start()
+
+    assert len(local_server.requests) == 12
+    assert local_server.maxActive <= 3
+
+    assert checked['mod0'] == ('1.2.0', True)
+    assert checked['mod1'] == ('1.2.0', False)
+
+    # A reply that isn't a version and a mod modworkshop doesn't know
+    assert sorted(failed) == ['mod10', 'mod11']
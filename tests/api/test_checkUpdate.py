@@ -1,9 +1,10 @@
 from PySide6.QtNetwork import QNetworkReply
 
 from src.api.checkUpdate import checkUpdate
+from src.api.network import NetworkService
 
 #TODO: Test this better with mocking
-def test_checkUpdate() -> None:
-    obj = checkUpdate()
+def test_checkUpdate(tmp_path) -> None:
+    obj = checkUpdate(NetworkService(str(tmp_path)))
 
-    assert obj.reply.error() == QNetworkReply.NetworkError.NoError
+    assert obj.request.error() == QNetworkReply.NetworkError.NoError
@@ -0,0 +1,107 @@
+import os
+import json
+import time
+import random
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+import src.api.downloadMod as downloadMod
+from src.api.downloadMod import DownloadMod
+from src.api.network import NetworkService
+
+@pytest.fixture
+def small_segments(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(downloadMod, 'DOWNLOAD_SEGMENT_MIN', 16 * 1024)
+
+def test_downloadMod(qtbot: QtBot, local_server, tmp_path, small_segments, serve_mod) -> None:
+    data = random.Random(1).randbytes(100 * 1024)
+
+    requested = serve_mod(data)
+
+    worker = DownloadMod('1234', os.path.join(tmp_path, 'downloads'), apiUrl=local_server.url, network=NetworkService(os.path.join(tmp_path, 'cache')))
+
+    with qtbot.waitSignal(worker.succeeded, timeout=10000) as blocker:
+        worker.start()
+
+    path = os.path.join(tmp_path, 'downloads', 'mod.zip')
+
+    assert blocker.args == [path]
+
+    with open(path, 'rb') as f:
+        assert f.read() == data
+
+    assert os.listdir(os.path.join(tmp_path, 'downloads')) == ['mod.zip']
+
+    # Four ranges that cover the file
+    assert len(requested) == 4
+    assert sorted(requested, key=lambda x: int(x[6:].split('-')[0]))[0] == 'bytes=0-25599'
+
+def test_noRanges(qtbot: QtBot, local_server, tmp_path, small_segments, serve_mod) -> None:
+    data = random.Random(2).randbytes(100 * 1024)
+
+    serve_mod(data, ranges=False)
+
+    worker = DownloadMod('1234', str(tmp_path), apiUrl=local_server.url, network=NetworkService(os.path.join(tmp_path, 'cache')))
+
+    with qtbot.waitSignal(worker.succeeded, timeout=10000):
+        worker.start()
+
+    with open(os.path.join(tmp_path, 'mod.zip'), 'rb') as f:
+        assert f.read() == data
+
+def test_pauseResume(qtbot: QtBot, local_server, tmp_path, small_segments, serve_mod) -> None:
+    data = random.Random(3).randbytes(64 * 1024)
+
+    requested = serve_mod(data)
+
+    # 64 KiB at 64 KiB per second
+    worker = DownloadMod('1234', str(tmp_path), bandwidth=64 * 1024, apiUrl=local_server.url, network=NetworkService(os.path.join(tmp_path, 'cache')))
+
+    started = time.monotonic()
+
+    with qtbot.waitSignal(worker.downloading, timeout=10000):
+        worker.start()
+
+    worker.pause()
+
+    received = worker.received()
+
+    assert 0 < received < len(data)
+
+    qtbot.wait(300)
+
+    assert worker.received() == received
+
+    with qtbot.waitSignal(worker.succeeded, timeout=10000):
+        worker.resume()
+
+    assert time.monotonic() - started >= 0.7
+
+    with open(os.path.join(tmp_path, 'mod.zip'), 'rb') as f:
+        assert f.read() == data
+
+    # Resuming only asked for what was missing
+    assert len(requested) == 8
+    assert all(int(x[6:].split('-')[0]) % (16 * 1024) for x in requested[4:])
+
+def test_cancel(qtbot: QtBot, local_server, tmp_path, small_segments, serve_mod) -> None:
+    serve_mod(random.Random(4).randbytes(64 * 1024))
+
+    worker = DownloadMod('1234', str(tmp_path), bandwidth=16 * 1024, apiUrl=local_server.url, network=NetworkService(os.path.join(tmp_path, 'cache')))
+
+    with qtbot.waitSignal(worker.downloading, timeout=10000):
+        worker.start()
+
+    with qtbot.waitSignal(worker.doneCanceling, timeout=1000):
+        worker.cancel()
+
+    assert sorted(os.listdir(tmp_path)) == ['cache']
+
+def test_notHosted(qtbot: QtBot, local_server, tmp_path) -> None:
+    local_server.routes['/mods/1234'] = (200, {}, json.dumps({'id' : 1234, 'download_type' : 'link', 'download_id' : 0}).encode())
+
+    worker = DownloadMod('1234', str(tmp_path), apiUrl=local_server.url, network=NetworkService(os.path.join(tmp_path, 'cache')))
+
+    with qtbot.waitSignal(worker.error, timeout=10000):
+        worker.start()
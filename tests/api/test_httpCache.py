@@ -0,0 +1,88 @@
+from pytestqt.qtbot import QtBot
+
+from PySide6.QtCore import QUrl, QDateTime
+from PySide6.QtNetwork import QNetworkAccessManager, QNetworkReply
+
+from src.api.httpCache import HttpCache
+
+def fetch(qtbot: QtBot, cache: HttpCache, url: str) -> bytes:
+    '''Gets `url` through the cache like the API classes do, returns the body'''
+
+    reply = cache.get(url)
+
+    with qtbot.waitSignal(reply.finished, timeout=5000):
+        pass
+
+    fallback = cache.finished(reply)
+
+    if fallback is not None:
+        with qtbot.waitSignal(fallback.finished, timeout=5000):
+            pass
+
+        cache.finished(fallback)
+        reply = fallback
+
+    assert reply.error() == QNetworkReply.NetworkError.NoError
+
+    return reply.readAll().data()
+
+def expire(cache: HttpCache, url: str) -> None:
+    '''Makes the cached answer stale, as if the TTL had passed'''
+
+    metaData = cache.cache.metaData(QUrl(url))
+    metaData.setExpirationDate(QDateTime.currentDateTimeUtc().addSecs(-1))
+    cache.cache.updateMetaData(metaData)
+
+def test_httpCache(qtbot: QtBot, local_server, tmp_path) -> None:
+    headers: list[str | None] = []
+
+    def version(handler) -> tuple[int, dict[str, str], bytes]:
+        headers.append(handler.headers.get('If-None-Match'))
+
+        if handler.headers.get('If-None-Match') == '"1"':
+            return 304, {'ETag' : '"1"'}, b''
+
+        return 200, {'ETag' : '"1"'}, b'1.2.0'
+
+    local_server.routes['/mods/1/version'] = version
+
+    url = f'{local_server.url}/mods/1/version'
+
+    cache = HttpCache(QNetworkAccessManager(), str(tmp_path), ttl=3600)
+
+    assert fetch(qtbot, cache, url) == b'1.2.0'
+
+    # Within the TTL the server isn't asked
+    assert fetch(qtbot, cache, url) == b'1.2.0'
+    assert headers == [None]
+
+    # Once it's stale the answer is revalidated, the server only sends a 304
+    expire(cache, url)
+
+    assert fetch(qtbot, cache, url) == b'1.2.0'
+    assert headers == [None, '"1"']
+
+    # The TTL starts over after the 304
+    assert fetch(qtbot, cache, url) == b'1.2.0'
+    assert headers == [None, '"1"']
+
+    # A new run of the program uses the same cache
+    cache = HttpCache(QNetworkAccessManager(), str(tmp_path), ttl=3600)
+
+    assert cache.isFresh(url)
+
+def test_offline(qtbot: QtBot, local_server, tmp_path) -> None:
+    local_server.routes['/mods/1/version'] = (200, {}, b'1.2.0')
+
+    url = f'{local_server.url}/mods/1/version'
+
+    cache = HttpCache(QNetworkAccessManager(), str(tmp_path))
+
+    fetch(qtbot, cache, url)
+    expire(cache, url)
+
+    local_server.shutdown()
+    local_server.server_close()
+
+    # The server is gone, the stale answer is used
+    assert fetch(qtbot, cache, url) == b'1.2.0'
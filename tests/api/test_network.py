@@ -0,0 +1,102 @@
+import time
+
+from pytestqt.qtbot import QtBot
+
+from PySide6.QtNetwork import QNetworkReply
+
+from src.api.network import NetworkService, NetworkRequest
+
+def wait(qtbot: QtBot, requests: list[NetworkRequest]) -> None:
+    for request in requests:
+        if request.reply is None or request.reply.isRunning() or request.waiting:
+            with qtbot.waitSignal(request.finished, timeout=10000):
+                pass
+
+def test_retry(qtbot: QtBot, local_server, tmp_path) -> None:
+    attempts: list[int] = []
+
+    def flaky(handler) -> tuple[int, dict[str, str], bytes]:
+        attempts.append(1)
+
+        if len(attempts) < 3:
+            return 503, {}, b''
+
+        return 200, {}, b'1.2.0'
+
+    local_server.routes['/flaky'] = flaky
+    local_server.routes['/missing'] = (404, {}, b'')
+
+    service = NetworkService(str(tmp_path))
+    service.backoff = 10
+
+    flakyRequest = service.get(f'{local_server.url}/flaky', cached=False)
+    missingRequest = service.get(f'{local_server.url}/missing', cached=False)
+
+    wait(qtbot, [flakyRequest, missingRequest])
+
+    assert flakyRequest.error() == QNetworkReply.NetworkError.NoError
+    assert flakyRequest.readAll().data() == b'1.2.0'
+    assert flakyRequest.attempt == 2
+
+    # A mod that doesn't exist won't exist on the next try either
+    assert missingRequest.error() == QNetworkReply.NetworkError.ContentNotFoundError
+    assert local_server.requests.count('/missing') == 1
+
+def test_hostLimit(qtbot: QtBot, local_server, tmp_path) -> None:
+    local_server.delay = 0.05
+
+    for i in range(8):
+        local_server.routes[f'/mods/{i}/version'] = (200, {}, b'1.2.0')
+
+    service = NetworkService(str(tmp_path), hostLimit=2)
+
+    requests = [service.get(f'{local_server.url}/mods/{i}/version') for i in range(8)]
+
+    wait(qtbot, requests)
+
+    assert all(x.error() == QNetworkReply.NetworkError.NoError for x in requests)
+    assert len(local_server.requests) == 8
+    assert local_server.maxActive <= 2
+
+def test_timeout(qtbot: QtBot, local_server, tmp_path) -> None:
+
+    def stalled(handler) -> tuple[int, dict[str, str], bytes]:
+        time.sleep(0.5)
+        return 200, {}, b''
+
+    local_server.routes['/stalled'] = stalled
+
+    service = NetworkService(str(tmp_path), timeout=100)
+    service.backoff = 10
+
+    request = service.get(f'{local_server.url}/stalled', cached=False, retries=1)
+
+    wait(qtbot, [request])
+
+    assert request.error() == QNetworkReply.NetworkError.OperationCanceledError
+    assert local_server.requests == ['/stalled', '/stalled']
+
+def test_abort(qtbot: QtBot, local_server, tmp_path) -> None:
+    local_server.delay = 0.2
+    local_server.routes['/a'] = (200, {}, b'a')
+    local_server.routes['/b'] = (200, {}, b'b')
+
+    service = NetworkService(str(tmp_path), hostLimit=1)
+
+    running = service.get(f'{local_server.url}/a', cached=False)
+    queued = service.get(f'{local_server.url}/b', cached=False)
+
+    # Still waiting for a free slot
+    with qtbot.waitSignal(queued.finished, timeout=1000):
+        queued.abort()
+
+    assert queued.reply is None
+
+    with qtbot.waitSignal(running.finished, timeout=1000):
+        running.abort()
+
+    # Aborting isn't retried
+    assert running.error() == QNetworkReply.NetworkError.OperationCanceledError
+    assert running.attempt == 0
+
+    assert service.active[running.host()] == 0
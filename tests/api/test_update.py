@@ -1,6 +1,114 @@
+import os
+import io
+import json
+import hashlib
+import tarfile
+import threading
+
 import pytest
+from pytestqt.qtbot import QtBot
+
+from src.api.network import NetworkService
+import src.api.update
+from src.api.update import Update
+from src.constant_vars import OLD_EXE
+
+@pytest.fixture
+def release(local_server, tmp_path) -> tuple[Update, bytes, str]:
+    '''Serves a release like GitHub does, returns the Update, the archive and its sha256 digest'''
+
+    data = io.BytesIO()
+
+    with tarfile.open(fileobj=data, mode='w:gz') as tf:
+
+        for name, content in ((f'{Update.folder}/{Update.exe}', b'new exe' * 100000), (f'{Update.folder}/readme.txt', b'readme')):
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mode = 0o755
+
+            tf.addfile(info, io.BytesIO(content))
+
+    archive = data.getvalue()
+    digest = hashlib.sha256(archive).hexdigest()
+
+    def download(handler) -> tuple[int, dict[str, str], bytes]:
+        requested = handler.headers.get('Range')
+
+        if requested is None:
+            return 200, {}, archive
+
+        start = int(requested.removeprefix('bytes=').rstrip('-'))
+
+        return 206, {'Content-Range' : f'bytes {start}-{len(archive) - 1}/{len(archive)}'}, archive[start:]
+
+    local_server.routes['/releases/latest'] = (200, {}, json.dumps({'assets_url' : f'{local_server.url}/assets'}).encode())
+    local_server.routes['/assets'] = (200, {}, json.dumps([{
+        'name' : Update.fileName,
+        'browser_download_url' : f'{local_server.url}/download',
+        'digest' : f'sha256:{digest}'
+    }]).encode())
+    local_server.routes['/download'] = download
+
+    installPath = os.path.join(tmp_path, 'install')
+    os.makedirs(installPath)
+    os.makedirs(os.path.join(tmp_path, 'tmp'))
+
+    with open(os.path.join(installPath, Update.exe), 'wb') as f:
+        f.write(b'old exe')
+
+    update = Update(NetworkService(os.path.join(tmp_path, 'cache')), f'{local_server.url}/releases/latest', installPath, os.path.join(tmp_path, 'tmp'))
+
+    return update, archive, digest
+
+def test_update(qtbot: QtBot, local_server, release: tuple[Update, bytes, str], monkeypatch: pytest.MonkeyPatch) -> None:
+    update, archive, digest = release
+
+    threads: list[threading.Thread] = []
+    hashFile = src.api.update.hashFile
+
+    monkeypatch.setattr(src.api.update, 'hashFile', lambda *args: threads.append(threading.current_thread()) or hashFile(*args))
+
+    installPath = update.installPath
+    tmp = update.tmp
+
+    # An earlier download stopped half way
+    with open(os.path.join(tmp, f'{Update.fileName}.{digest[:12]}.part'), 'wb') as f:
+        f.write(archive[:len(archive) // 2])
+
+    headers: list[str | None] = []
+    download = local_server.routes['/download']
+    local_server.routes['/download'] = lambda x: headers.append(x.headers.get('Range')) or download(x)
+
+    with qtbot.waitSignal(update.succeeded, timeout=10000):
+        update.start()
+
+    # Only the missing half was downloaded
+    assert headers == [f'bytes={len(archive) // 2}-']
+
+    # The archive isn't verified on the GUI thread and every request was let go
+    assert threads and threads[0] is not threading.main_thread()
+    assert update.request is None
+
+    with open(os.path.join(installPath, Update.exe), 'rb') as f:
+        assert f.read() == b'new exe' * 100000
+
+    with open(os.path.join(installPath, OLD_EXE), 'rb') as f:
+        assert f.read() == b'old exe'
+
+    # Only the exe was extracted and the download was removed
+    assert sorted(os.listdir(installPath)) == sorted([Update.exe, OLD_EXE])
+    assert os.listdir(tmp) == []
+
+def test_checksum(qtbot: QtBot, local_server, release: tuple[Update, bytes, str]) -> None:
+    update, archive, digest = release
+
+    local_server.routes['/download'] = (200, {}, archive[:-1] + bytes([archive[-1] ^ 1]))
+
+    with qtbot.waitSignal(update.error, timeout=10000):
+        update.start()
+
+    with open(os.path.join(update.installPath, Update.exe), 'rb') as f:
+        assert f.read() == b'old exe'
 
-#TODO: Make this able to be tested, might need to restructure parts of the update class
-@pytest.mark.skip
-def test_update() -> None:
-    pass
\ No newline at end of file
+    # The corrupted download isn't continued by the next try
+    assert os.listdir(update.tmp) == []
@@ -1,12 +1,223 @@
-from typing import Generator
+from typing import Generator, Callable
 import tempfile
+import threading
+import time
 import os
 import json
+import zipfile
 from configparser import ConfigParser
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 import pytest
 
-from src.constant_vars import OptionKeys, ModKeys, ModType, LIGHT
+from src.api.network import NetworkService
+from src.cancelToken import CancelToken
+from src.threaded.backupMods import BackupMods
+from src.backupChain import BackupChain, scanSources
+from src.save import OptionsManager, Save
+from src.getPath import Pathing
+from src.constant_vars import OptionKeys, ModKeys, ModType, LIGHT, HTTP_CACHE, BACKUP_MODS
+
+class LocalServer(ThreadingHTTPServer):
+    '''
+    HTTP server on localhost that stands in for modworkshop and GitHub.
+
+    `routes` maps a path to its status, headers and body, or to a function that gets the request handler and returns them.
+    Every request path is added to `requests`, `maxActive` is the most requests that were handled at the same time
+    '''
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+
+            # Keeps the connection alive between requests
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self) -> None:
+
+                with server.lock:
+                    server.requests.append(self.path)
+                    server.active += 1
+                    server.maxActive = max(server.maxActive, server.active)
+
+                try:
+                    time.sleep(server.delay)
+
+                    route = server.routes.get(self.path, (404, {}, b''))
+
+                    status, headers, body = route(self) if callable(route) else route
+
+                    self.send_response(status)
+
+                    for key, value in headers.items():
+                        self.send_header(key, value)
+
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+
+                    self.wfile.write(body)
+
+                finally:
+                    with server.lock:
+                        server.active -= 1
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        super().__init__(('127.0.0.1', 0), Handler)
+
+        self.routes: dict[str, tuple[int, dict[str, str], bytes] | Callable] = {}
+        self.requests: list[str] = []
+
+        # Seconds each request takes
+        self.delay = 0.0
+
+        self.active = 0
+        self.maxActive = 0
+
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f'http://127.0.0.1:{self.server_address[1]}'
+
+@pytest.fixture
+def local_server() -> Generator:
+    server = LocalServer()
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture(autouse=True)
+def network_service(tmp_path_factory: pytest.TempPathFactory, monkeypatch: pytest.MonkeyPatch) -> NetworkService:
+    '''
+    The service widgets get from `NetworkService.instance()`, so tests don't cache answers in the repo.
+
+    Its cache isn't in `tmp_path`, tests check what they leave behind there
+    '''
+
+    service = NetworkService(str(tmp_path_factory.mktemp(HTTP_CACHE)))
+
+    monkeypatch.setattr(NetworkService, 'shared', service)
+
+    return service
+
+@pytest.fixture
+def serve_mod(local_server: LocalServer) -> Callable[..., list[str | None]]:
+    '''
+    Answers like modworkshop's API for mod 1234 with the given archive,
+    the function returns the Range header of every download request
+    '''
+
+    def serve(data: bytes, ranges: bool = True) -> list[str | None]:
+
+        requested: list[str | None] = []
+
+        def download(handler) -> tuple[int, dict[str, str], bytes]:
+            requested.append(handler.headers.get('Range'))
+
+            if not ranges or handler.headers.get('Range') is None:
+                return 200, {}, data
+
+            start, end = (int(x) for x in handler.headers['Range'].removeprefix('bytes=').split('-'))
+
+            return 206, {'Content-Range' : f'bytes {start}-{end}/{len(data)}'}, data[start:end + 1]
+
+        local_server.routes['/mods/1234'] = (200, {}, json.dumps({'id' : 1234, 'download_type' : 'file', 'download_id' : 55}).encode())
+        local_server.routes['/files/55'] = (200, {}, json.dumps({'id' : 55, 'name' : '../mod.zip', 'size' : len(data)}).encode())
+        local_server.routes['/files/55/download'] = download
+
+        return requested
+
+    return serve
+
+class CountdownToken(CancelToken):
+    '''Cancels itself after being checked a set amount of times'''
+
+    def __init__(self, checks: int) -> None:
+        super().__init__()
+        self.checks = checks
+
+    def check(self, size: int = 0) -> None:
+        self.checks -= 1
+
+        if self.checks < 0:
+            self.cancel()
+
+        super().check()
+
+@pytest.fixture
+def countdown_token() -> type[CountdownToken]:
+    return CountdownToken
+
+@pytest.fixture
+def write_files() -> Callable[..., None]:
+    '''Writes `amount` files of random bytes named 0.txt, 1.txt... into a folder'''
+
+    def write(path: str, amount: int, size: int = 10) -> None:
+        os.makedirs(path, exist_ok=True)
+
+        for i in range(amount):
+            with open(os.path.join(path, f'{i}.txt'), 'wb') as f:
+                f.write(os.urandom(size))
+
+    return write
+
+@pytest.fixture
+def write_backup() -> Callable[..., str]:
+    '''Writes a zip backup of `sources` into a chain without `BackupMods`, the function returns its name'''
+
+    def write(chain: BackupChain, kind: str, parent: dict | None, sources: list[tuple[str, str]]) -> str:
+        state, paths = scanSources(sources, parent['state'] if parent else None)
+
+        manifest = chain.newManifest(kind, parent, state)
+        name = chain.newName(manifest['kind'])
+
+        with zipfile.ZipFile(chain.zipPath(name), 'w') as zf:
+            for arcName in manifest['added']:
+                if arcName.endswith('/'):
+                    zf.writestr(arcName, b'')
+                else:
+                    zf.write(paths[arcName], arcName)
+
+        chain.saveManifest(name, manifest)
+
+        return name
+
+    return write
+
+@pytest.fixture
+def backup_worker(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> BackupMods:
+    '''BackupMods that backs up the mods of `create_mod_dirs` into its backups folder'''
+
+    # Created first, Worker reads the default config file
+    worker = BackupMods()
+
+    dispath = os.path.join(create_mod_dirs, 'disabledMods')
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.setDispath(dispath)
+    parser.writeData()
+
+    # Pathing uses 'Maps', the fixture creates 'maps'
+    if os.path.isdir(os.path.join(create_mod_dirs, 'maps')):
+        os.rename(os.path.join(create_mod_dirs, 'maps'), os.path.join(create_mod_dirs, 'Maps'))
+
+    worker.saveManager = Save(createTemp_Mod_ini)
+    worker.optionsManager = parser
+    worker.p = Pathing(createTemp_Config_ini)
+    worker.backupPath = os.path.join(create_mod_dirs, BACKUP_MODS)
+
+    return worker
 
 @pytest.fixture(scope='session')
 def getDir() -> str:
@@ -0,0 +1,116 @@
+import os
+import time
+import tempfile
+
+import pytest
+
+from src.archiveCache import ArchiveCache
+from src.contentStore import ContentStore, hashFile
+from src.constant_vars import ModType
+
+@pytest.fixture
+def create_cache() -> tuple[ArchiveCache, str]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        for name in ('first', 'second', 'third'):
+            with open(os.path.join(tmp_dir, f'{name}.zip'), 'wb') as f:
+                f.write(os.urandom(100))
+
+        yield ArchiveCache(os.path.join(tmp_dir, 'cache'), budget=250), tmp_dir
+
+def test_add(create_cache: tuple[ArchiveCache, str]) -> None:
+    cache, tmp_dir = create_cache
+
+    assert cache.add(os.path.join(tmp_dir, 'first.zip'), 'abc', ModType.mods, {'first' : {'mod.txt' : '123'}})
+
+    path = cache.archivePath('abc')
+
+    assert os.path.basename(path) == 'first.zip'
+    assert cache.size() == 100
+
+    # The index is saved
+    assert ArchiveCache(cache.cachePath).file['abc']['mods'] == {'first' : {'mod.txt' : '123'}}
+
+def test_evict(create_cache: tuple[ArchiveCache, str]) -> None:
+    cache, tmp_dir = create_cache
+
+    cache.add(os.path.join(tmp_dir, 'first.zip'), 'first', ModType.mods, {})
+    time.sleep(0.01)
+    cache.add(os.path.join(tmp_dir, 'second.zip'), 'second', ModType.mods, {})
+    time.sleep(0.01)
+
+    # Using the first archive makes the second one the least recently used
+    cache.get('first')
+    cache.add(os.path.join(tmp_dir, 'third.zip'), 'third', ModType.mods, {})
+
+    assert {x[0] for x in cache.entries()} == {'first', 'third'}
+    assert cache.archivePath('second') is None
+    assert not os.path.exists(os.path.join(cache.cachePath, 'second'))
+
+def test_tooBig(create_cache: tuple[ArchiveCache, str]) -> None:
+    cache, tmp_dir = create_cache
+
+    cache.budget = 50
+
+    assert not cache.add(os.path.join(tmp_dir, 'first.zip'), 'first', ModType.mods, {})
+    assert cache.entries() == []
+
+def test_deployable(create_cache: tuple[ArchiveCache, str]) -> None:
+    cache, tmp_dir = create_cache
+
+    modPath = os.path.join(tmp_dir, 'mod')
+    os.mkdir(modPath)
+
+    with open(os.path.join(modPath, 'mod.txt'), 'w') as f:
+        f.write('{}')
+
+    store = ContentStore(os.path.join(tmp_dir, 'store'))
+    manifest = store.ingest(modPath)
+
+    cache.add(os.path.join(tmp_dir, 'first.zip'), 'first', ModType.mods, {'mod' : manifest})
+    cache.add(os.path.join(tmp_dir, 'second.zip'), 'second', ModType.mods, {'mod' : {'mod.txt' : 'missing'}})
+
+    assert cache.deployable('first', store) == {'mod' : manifest}
+    assert cache.deployable('second', store) is None
+
+def test_lookup(create_cache: tuple[ArchiveCache, str], monkeypatch: pytest.MonkeyPatch) -> None:
+    cache, tmp_dir = create_cache
+
+    first = os.path.join(tmp_dir, 'first.zip')
+    digest = hashFile(first)
+
+    hashed = []
+    monkeypatch.setattr('src.archiveCache.hashFile', lambda *args: hashed.append(args[0]) or hashFile(*args))
+
+    # No cached archive has its size
+    assert cache.lookup(first) is None
+
+    cache.add(first, digest, ModType.mods, {})
+
+    # Found by its size and modification time
+    assert cache.lookup(first) == digest
+    assert hashed == []
+
+    os.utime(first, ns=(0, 0))
+
+    assert cache.lookup(first) == digest
+    assert cache.lookup(os.path.join(tmp_dir, 'second.zip')) is None
+    assert hashed == [first, os.path.join(tmp_dir, 'second.zip')]
+
+    # A different archive with the same size and modification time is hashed too
+    other = os.path.join(tmp_dir, 'other.zip')
+
+    with open(other, 'wb') as f:
+        f.write(os.urandom(100))
+
+    cache.add(first, digest, ModType.mods, {})
+    os.utime(other, ns=(os.stat(first).st_atime_ns, os.stat(first).st_mtime_ns))
+
+    assert cache.lookup(other) is None
+    assert hashed[-1] == other
+
+    # The cached archive is a copy, overwriting the download doesn't change it
+    with open(first, 'wb') as f:
+        f.write(os.urandom(100))
+
+    assert hashFile(cache.archivePath(digest)) == digest
@@ -0,0 +1,101 @@
+import tempfile
+import os
+
+import pytest
+
+from src.backupChain import BackupChain, diffStates, modFolder, folderType, expiredBackups
+from src.constant_vars import ModType, BACKUP_FULL, BACKUP_INCREMENTAL
+
+@pytest.fixture
+def create_mod() -> tuple[BackupChain, str]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        mod = os.path.join(tmp_dir, 'game', 'mods', 'mod')
+        os.makedirs(os.path.join(mod, 'assets'))
+
+        for file, text in (('main.xml', '<table/>'), (os.path.join('assets', 'a.texture'), 'texture')):
+            with open(os.path.join(mod, file), 'w') as f:
+                f.write(text)
+
+        yield BackupChain(os.path.join(tmp_dir, 'backups')), mod
+
+def test_modFolder() -> None:
+    assert modFolder('mods/mod/assets/a.texture') == 'mods/mod'
+    assert modFolder('assets/mod_overrides/mod/main.xml') == 'assets/mod_overrides/mod'
+    assert modFolder('Maps/map/') == 'Maps/map'
+
+def test_folderType() -> None:
+    assert folderType('mods/mod') == ModType.mods
+    assert folderType('assets/mod_overrides/mod') == ModType.mods_override
+    assert folderType('Maps/map') == ModType.maps
+    assert folderType('mods') is None
+    assert folderType('assets/mod') is None
+
+def test_diffStates() -> None:
+    base = {'mods/mod/a' : {'hash' : '1'}, 'mods/mod/b' : {'hash' : '2'}}
+    current = {'mods/mod/a' : {'hash' : '1'}, 'mods/mod/b' : {'hash' : '3'}, 'mods/mod/c' : {'hash' : '4'}}
+
+    assert diffStates(base, current) == (['mods/mod/b', 'mods/mod/c'], [])
+    assert diffStates(current, base) == (['mods/mod/b'], ['mods/mod/c'])
+
+def test_chain(create_mod: tuple[BackupChain, str], write_backup) -> None:
+    chain, mod = create_mod
+
+    sources = [(mod, 'mods/mod')]
+
+    full = write_backup(chain, BACKUP_FULL, None, sources)
+
+    with open(os.path.join(mod, 'main.xml'), 'w') as f:
+        f.write('<table name="changed"/>')
+
+    os.remove(os.path.join(mod, 'assets', 'a.texture'))
+
+    incremental = write_backup(chain, BACKUP_INCREMENTAL, chain.latest(), sources)
+
+    manifest = chain.get(incremental)
+
+    assert chain.mods(incremental) == ['mods/mod']
+
+    assert manifest['parent'] == full
+    assert manifest['added'] == ['mods/mod/main.xml']
+    assert manifest['deleted'] == ['mods/mod/assets/a.texture']
+
+    dest = os.path.join(os.path.dirname(chain.path), 'restored')
+
+    chain.restore(incremental, dest)
+
+    with open(os.path.join(dest, 'mods', 'mod', 'main.xml')) as f:
+        assert f.read() == '<table name="changed"/>'
+
+    assert not os.path.exists(os.path.join(dest, 'mods', 'mod', 'assets', 'a.texture'))
+    assert os.path.isdir(os.path.join(dest, 'mods', 'mod', 'assets'))
+
+    # Without its full backup the incremental one can't be restored
+    chain.remove(full)
+
+    assert chain.chain(incremental) is None
+    assert chain.latest() is None
+
+    with pytest.raises(FileNotFoundError):
+        chain.restore(incremental, dest)
+
+def test_expiredBackups() -> None:
+    day = 60 * 60 * 24
+
+    backups = [
+        {'name' : 'full', 'created' : 0, 'parent' : None},
+        {'name' : 'incremental', 'created' : day, 'parent' : 'full'},
+        {'name' : 'full2', 'created' : 2 * day, 'parent' : None},
+        {'name' : 'differential', 'created' : 3 * day, 'parent' : 'full2'}
+    ]
+
+    assert expiredBackups(backups) == []
+
+    # The differential backup needs its full backup
+    assert expiredBackups(backups, keep=1) == ['full', 'incremental']
+    assert expiredBackups(backups, keep=3) == []
+
+    assert expiredBackups(backups, maxAge=1.5 * day, now=3 * day) == ['full', 'incremental']
+
+    # The newest backup is kept no matter how old it is
+    assert expiredBackups(backups, maxAge=day, now=10 * day) == ['full', 'incremental']
@@ -0,0 +1,125 @@
+import tempfile
+import random
+import io
+import os
+
+import pytest
+
+from src.backupRepository import BackupRepository, splitChunks, CHUNK_MIN, CHUNK_MAX
+from src.cancelToken import Canceled
+
+@pytest.fixture
+def create_repository() -> tuple[BackupRepository, str]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        mod = os.path.join(tmp_dir, 'game', 'mods', 'mod')
+        os.makedirs(os.path.join(mod, 'assets'))
+
+        with open(os.path.join(mod, 'assets', 'a.texture'), 'wb') as f:
+            f.write(random.Random(1).randbytes(6 * 1024 * 1024))
+
+        with open(os.path.join(mod, 'main.xml'), 'w') as f:
+            f.write('<table/>')
+
+        yield BackupRepository(os.path.join(tmp_dir, 'repository')), mod
+
+def test_splitChunks() -> None:
+    data = random.Random(2).randbytes(16 * 1024 * 1024)
+
+    chunks = list(splitChunks(io.BytesIO(data)))
+
+    assert b''.join(chunks) == data
+    assert all(CHUNK_MIN <= len(x) <= CHUNK_MAX for x in chunks[:-1])
+
+    # Inserting bytes at the start only changes the first chunk
+    shifted = list(splitChunks(io.BytesIO(b'new header' + data)))
+
+    assert shifted[1:] == chunks[1:]
+
+    assert list(splitChunks(io.BytesIO(b''))) == []
+
+def test_snapshots(create_repository: tuple[BackupRepository, str]) -> None:
+    repository, mod = create_repository
+
+    sources = [(mod, 'mods/mod')]
+
+    first = repository.newName()
+    repository.saveSnapshot(first, repository.addSources(sources), {'mod' : {'type' : 'mods'}})
+
+    chunks = len(os.listdir(repository.chunks))
+    size = repository.size()
+
+    with open(os.path.join(mod, 'main.xml'), 'w') as f:
+        f.write('<table name="changed"/>')
+
+    second = repository.newName()
+    repository.saveSnapshot(second, repository.addSources(sources, repository.latest()['state']), {'mod' : {'type' : 'mods'}})
+
+    # Only the changed file's chunk was added
+    assert [x['name'] for x in repository.snapshots()] == [first, second]
+    assert repository.size() - size < 1024
+    assert repository.mods(second) == ['mods/mod']
+    assert repository.metadata(second) == {'mod' : {'type' : 'mods'}}
+
+    dest = os.path.join(os.path.dirname(repository.path), 'restored')
+
+    repository.restore(first, dest, paths=['mods/mod/'])
+
+    with open(os.path.join(dest, 'mods', 'mod', 'main.xml')) as f:
+        assert f.read() == '<table/>'
+
+    with open(os.path.join(dest, 'mods', 'mod', 'assets', 'a.texture'), 'rb') as f, open(os.path.join(mod, 'assets', 'a.texture'), 'rb') as g:
+        assert f.read() == g.read()
+
+    # The old main.xml is only used by the first snapshot
+    repository.remove(first)
+
+    assert repository.prune() > 0
+    assert repository.prune() == 0
+
+    repository.restore(second, dest)
+
+    with open(os.path.join(dest, 'mods', 'mod', 'main.xml')) as f:
+        assert f.read() == '<table name="changed"/>'
+
+    assert len(os.listdir(repository.chunks)) <= chunks
+
+def test_damagedChunk(create_repository: tuple[BackupRepository, str]) -> None:
+    repository, mod = create_repository
+
+    state = repository.addSources([(mod, 'mods/mod')])
+
+    digest = state['mods/mod/main.xml']['chunks'][0]
+
+    with open(repository.chunkPath(digest), 'wb') as f:
+        f.write(b'\x00damaged')
+
+    with pytest.raises(OSError):
+        repository.readChunk(digest)
+
+def test_cancel(create_repository: tuple[BackupRepository, str], countdown_token) -> None:
+    repository, mod = create_repository
+
+    with pytest.raises(Canceled):
+        repository.addSources([(mod, 'mods/mod')], token=countdown_token(2))
+
+    assert repository.snapshots() == []
+
+def test_lock(create_repository: tuple[BackupRepository, str], countdown_token) -> None:
+    repository, mod = create_repository
+
+    # A backup that is running, its chunks aren't in a snapshot yet
+    with repository.lock():
+        repository.addSources([(mod, 'mods/mod')])
+
+        chunks = sum(len(x[2]) for x in os.walk(repository.chunks))
+
+        assert repository.prune() == 0
+        assert sum(len(x[2]) for x in os.walk(repository.chunks)) == chunks
+
+        # A second backup waits until it's canceled
+        with pytest.raises(Canceled):
+            repository.lock(countdown_token(1))
+
+    assert repository.prune() > 0
+    assert sum(len(x[2]) for x in os.walk(repository.chunks)) == 0
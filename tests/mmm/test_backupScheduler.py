@@ -0,0 +1,30 @@
+import time
+
+from src.backupScheduler import BackupScheduler
+from src.backupChain import BackupChain
+from src.constant_vars import BACKUP_FULL, BACKUP_DAILY, BACKUP_SCHEDULE_OFF, BACKUP_SCHEDULE_DAILY
+
+def test_due(createTemp_Config_ini: str, tmp_path, write_backup) -> None:
+    scheduler = BackupScheduler(createTemp_Config_ini, backupPath=str(tmp_path))
+
+    assert not scheduler.due()
+
+    scheduler.optionsManager.setBackupSchedule(BACKUP_SCHEDULE_DAILY)
+
+    try:
+        # Never backed up
+        assert scheduler.due()
+
+        write_backup(BackupChain(str(tmp_path)), BACKUP_FULL, None, [])
+
+        assert scheduler.lastBackup() > 0
+        assert not scheduler.due()
+        assert scheduler.due(time.time() + BACKUP_DAILY)
+
+        # A backup where nothing changed isn't saved, it still counts
+        scheduler.lastRun = time.time() + BACKUP_DAILY
+
+        assert not scheduler.due(time.time() + BACKUP_DAILY)
+
+    finally:
+        scheduler.optionsManager.setBackupSchedule(BACKUP_SCHEDULE_OFF)
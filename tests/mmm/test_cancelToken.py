@@ -0,0 +1,100 @@
+import os
+import time
+
+import pytest
+
+from src.cancelToken import CancelToken, ThrottledToken, Canceled, copyFile, copyTree, removeTree
+from src.threaded.workerQObject import Worker
+
+def test_token() -> None:
+    token = CancelToken()
+
+    token.check()
+
+    token.cancel()
+
+    assert token.isCanceled()
+
+    with pytest.raises(Canceled):
+        token.check()
+
+def test_throttledToken(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr('src.cancelToken.PAUSE_INTERVAL', 0.05)
+
+    token = ThrottledToken(bandwidth=10 * 1024 * 1024)
+
+    start = time.monotonic()
+
+    for _ in range(3):
+        token.check(1024 * 1024)
+
+    # 3 MiB at 10 MiB/s
+    assert time.monotonic() - start >= 0.25
+
+    # Paused twice, then it continues
+    pauses = iter([True, True, False])
+
+    token = ThrottledToken(paused=lambda: next(pauses))
+    token.check()
+
+    assert next(pauses, None) is None
+
+    token = ThrottledToken(paused=lambda: True)
+    token.cancel()
+
+    with pytest.raises(Canceled):
+        token.check()
+
+def test_copyFile(tmp_path, countdown_token) -> None:
+    src = os.path.join(tmp_path, 'file')
+
+    # Three chunks
+    with open(src, 'wb') as f:
+        f.write(os.urandom(1024 * 1024 * 3))
+
+    with pytest.raises(Canceled):
+        copyFile(src, os.path.join(tmp_path, 'copy'), countdown_token(1))
+
+    assert not os.path.exists(os.path.join(tmp_path, 'copy'))
+
+    copyFile(src, os.path.join(tmp_path, 'copy'), CancelToken())
+
+    assert os.path.getsize(os.path.join(tmp_path, 'copy')) == os.path.getsize(src)
+
+def test_copyTree(tmp_path, write_files, countdown_token) -> None:
+    src = os.path.join(tmp_path, 'src')
+    dest = os.path.join(tmp_path, 'dest')
+
+    write_files(src, 5)
+
+    with pytest.raises(Canceled):
+        copyTree(src, dest, countdown_token(3))
+
+    assert not os.path.exists(dest)
+    assert len(os.listdir(src)) == 5
+
+def test_removeTree(tmp_path, write_files, countdown_token) -> None:
+    path = os.path.join(tmp_path, 'mod')
+
+    write_files(os.path.join(path, 'sub'), 5)
+
+    with pytest.raises(Canceled):
+        removeTree(path, countdown_token(2))
+
+    assert len(os.listdir(os.path.join(path, 'sub'))) == 3
+
+    removeTree(path, CancelToken())
+
+    assert not os.path.exists(path)
+
+def test_workerCancel() -> None:
+    worker = Worker()
+
+    worker.cancelCheck()
+
+    worker.cancel = True
+
+    assert worker.cancel
+
+    with pytest.raises(Canceled):
+        worker.cancelCheck()
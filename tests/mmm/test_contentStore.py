@@ -0,0 +1,135 @@
+import tempfile
+import shutil
+import os
+import errno
+
+import pytest
+
+from src.contentStore import ContentStore, hashFile
+
+@pytest.fixture
+def create_store() -> tuple[ContentStore, str]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        for mod in ('mod v1', 'mod v2'):
+            os.makedirs(os.path.join(tmp_dir, 'mods', mod, 'assets'))
+
+            with open(os.path.join(tmp_dir, 'mods', mod, 'assets', 'big.texture'), 'wb') as f:
+                f.write(b'texture' * 1000)
+
+            with open(os.path.join(tmp_dir, 'mods', mod, 'main.xml'), 'w') as f:
+                f.write(f'<table name="{mod}"/>')
+
+        yield ContentStore(os.path.join(tmp_dir, 'store')), os.path.join(tmp_dir, 'mods')
+
+def test_ingest(create_store: tuple[ContentStore, str]) -> None:
+    store, mods = create_store
+
+    manifest1 = store.ingest(os.path.join(mods, 'mod v1'))
+    manifest2 = store.ingest(os.path.join(mods, 'mod v2'))
+
+    assert set(manifest1.keys()) == {'assets/big.texture', 'main.xml'}
+    assert manifest1['assets/big.texture'] == manifest2['assets/big.texture']
+    assert manifest1['main.xml'] != manifest2['main.xml']
+
+    texture1 = os.path.join(mods, 'mod v1', 'assets', 'big.texture')
+    texture2 = os.path.join(mods, 'mod v2', 'assets', 'big.texture')
+
+    assert os.path.samefile(texture1, texture2)
+    assert os.path.samefile(texture1, store.objectPath(hashFile(texture1)))
+    assert len(os.listdir(store.objects)) == 3
+
+    # Ingesting a mod twice doesn't change anything
+    assert store.ingest(os.path.join(mods, 'mod v1')) == manifest1
+
+def test_deploy(create_store: tuple[ContentStore, str]) -> None:
+    store, mods = create_store
+
+    manifest = store.ingest(os.path.join(mods, 'mod v1'))
+
+    dest = os.path.join(mods, 'mod v1 copy')
+    store.deploy(manifest, dest)
+
+    assert os.path.samefile(os.path.join(dest, 'main.xml'), os.path.join(mods, 'mod v1', 'main.xml'))
+    assert os.path.isfile(os.path.join(dest, 'assets', 'big.texture'))
+
+def test_edited(create_store: tuple[ContentStore, str]) -> None:
+    store, mods = create_store
+
+    digest = store.ingest(os.path.join(mods, 'mod v1'))['assets/big.texture']
+
+    texture1 = os.path.join(mods, 'mod v1', 'assets', 'big.texture')
+    texture2 = os.path.join(mods, 'mod v2', 'assets', 'big.texture')
+
+    # Edited in place, the stored file is the same file
+    with open(texture1, 'r+b') as f:
+        f.write(b'edited')
+
+    # The unedited file is stored instead of being linked to the edited one
+    manifest = store.ingest(os.path.join(mods, 'mod v2'))
+
+    assert manifest['assets/big.texture'] == digest
+    assert os.path.samefile(texture2, store.objectPath(digest))
+    assert not os.path.samefile(texture1, texture2)
+
+    with open(texture2, 'r+b') as f:
+        f.write(b'edited')
+
+    with pytest.raises(OSError):
+        store.deploy(manifest, os.path.join(mods, 'mod v2 copy'))
+
+    assert not store.hasObject(digest)
+
+    # The mods keep their files
+    with open(texture1, 'rb') as f, open(texture2, 'rb') as g:
+        assert f.read(6) == g.read(6) == b'edited'
+
+def test_prune(create_store: tuple[ContentStore, str]) -> None:
+    store, mods = create_store
+
+    manifest = store.ingest(os.path.join(mods, 'mod v1'))
+    store.ingest(os.path.join(mods, 'mod v2'))
+
+    assert store.prune() == 0
+
+    shutil.rmtree(os.path.join(mods, 'mod v1'))
+
+    assert store.prune() == 1
+    assert not store.hasObject(manifest['main.xml'])
+    assert store.hasObject(manifest['assets/big.texture'])
+
+def test_ingest_otherDrive(create_store: tuple[ContentStore, str], monkeypatch: pytest.MonkeyPatch) -> None:
+    store, mods = create_store
+
+    store.ingest(os.path.join(mods, 'mod v1'))
+
+    modPath = os.path.join(mods, 'mod v2')
+
+    # Walked after the other files, which are linked by then
+    os.makedirs(os.path.join(modPath, 'assets', 'other drive'))
+
+    with open(os.path.join(modPath, 'assets', 'other drive', 'mounted.txt'), 'w') as f:
+        f.write('mounted')
+
+    link = os.link
+
+    def crossDevice(src: str, dest: str) -> None:
+        if 'other drive' in src:
+            raise OSError(errno.EXDEV, 'Invalid cross-device link')
+
+        link(src, dest)
+
+    monkeypatch.setattr(os, 'link', crossDevice)
+
+    assert store.ingest(modPath) == {}
+
+    texture = os.path.join(modPath, 'assets', 'big.texture')
+
+    # The links that were made are undone
+    assert not os.path.samefile(texture, os.path.join(mods, 'mod v1', 'assets', 'big.texture'))
+    assert os.stat(texture).st_nlink == 1
+    assert os.stat(os.path.join(modPath, 'main.xml')).st_nlink == 1
+    assert sum(len(x[2]) for x in os.walk(store.objects)) == 2
+
+    with open(texture, 'rb') as f:
+        assert f.read() == b'texture' * 1000
@@ -30,6 +30,26 @@ def test_getFileType():
 
         assert src.errorChecking.getFileType(tmp.name) == False
 
+def test_links():
+
+    with tempfile.TemporaryDirectory() as tmp:
+
+        src_dir = os.path.join(tmp, 'mod')
+        link = os.path.join(tmp, 'link')
+        os.mkdir(src_dir)
+
+        assert src.errorChecking.isLink(src_dir) == False
+
+        src.errorChecking.createLink(src_dir, link)
+
+        assert src.errorChecking.isLink(link)
+        assert os.path.samefile(src_dir, link)
+
+        src.errorChecking.removeLink(link)
+
+        assert not os.path.lexists(link)
+        assert os.path.isdir(src_dir)
+
 def test_permissionCheck():
 
     with tempfile.TemporaryDirectory() as tmp:
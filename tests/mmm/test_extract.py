@@ -0,0 +1,199 @@
+import os
+import shutil
+import zipfile
+
+import pytest
+
+from src.extract import isSupported, extractArchive, extractJob, extractFile
+from src.cancelToken import CancelToken, Canceled
+
+@pytest.mark.parametrize('format', ('zip', 'tar', 'gztar', 'bztar', 'xztar'))
+def test_extractArchive(tmp_path, format: str, write_files) -> None:
+    src = os.path.join(tmp_path, 'src')
+    dest = os.path.join(tmp_path, 'dest')
+
+    write_files(os.path.join(src, 'mod', 'sub'), 3, 1024)
+
+    archive = shutil.make_archive(os.path.join(tmp_path, 'mod'), format, src)
+
+    assert isSupported(archive)
+
+    progress: list[tuple[str, int, int]] = []
+
+    extractArchive(archive, dest, CancelToken(), lambda x, y, z: progress.append((x, y, z)))
+
+    assert sorted(os.listdir(os.path.join(dest, 'mod', 'sub'))) == ['0.txt', '1.txt', '2.txt']
+
+    for i in range(3):
+        with open(os.path.join(src, 'mod', 'sub', f'{i}.txt'), 'rb') as a, open(os.path.join(dest, 'mod', 'sub', f'{i}.txt'), 'rb') as b:
+            assert a.read() == b.read()
+
+    assert progress
+    assert progress[-1][2] == os.path.getsize(archive)
+    assert all(y <= z for x, y, z in progress)
+
+@pytest.mark.parametrize('format', ('zip', 'gztar'))
+def test_extractFile(tmp_path, format: str, write_files) -> None:
+    src = os.path.join(tmp_path, 'src')
+
+    write_files(os.path.join(src, 'folder'), 3, 1024)
+
+    archive = shutil.make_archive(os.path.join(tmp_path, 'release'), format, src)
+
+    dest = os.path.join(tmp_path, 'file')
+
+    extractFile(archive, 'folder/1.txt', dest)
+
+    with open(os.path.join(src, 'folder', '1.txt'), 'rb') as a, open(dest, 'rb') as b:
+        assert a.read() == b.read()
+
+    # Only the one entry was written
+    assert sorted(os.listdir(tmp_path)) == sorted(['src', 'file', os.path.basename(archive)])
+
+    with pytest.raises(KeyError):
+        extractFile(archive, 'folder/missing.txt', os.path.join(tmp_path, 'missing'))
+
+    assert not os.path.exists(os.path.join(tmp_path, 'missing'))
+
+def test_notSupported(tmp_path) -> None:
+    path = os.path.join(tmp_path, 'mod.rar')
+
+    with open(path, 'wb') as f:
+        f.write(b'Rar!\x1a\x07\x00')
+
+    assert isSupported(path) == False
+
+def test_unsafePath(tmp_path) -> None:
+    archive = os.path.join(tmp_path, 'mod.zip')
+    dest = os.path.join(tmp_path, 'dest')
+
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr('../outside.txt', 'data')
+        zf.writestr('mod/inside.txt', 'data')
+
+    extractArchive(archive, dest)
+
+    assert not os.path.exists(os.path.join(tmp_path, 'outside.txt'))
+    assert os.path.isfile(os.path.join(dest, 'mod', 'inside.txt'))
+
+def test_cancel(tmp_path, write_files, countdown_token) -> None:
+    src = os.path.join(tmp_path, 'src')
+    dest = os.path.join(tmp_path, 'dest')
+
+    write_files(os.path.join(src, 'mod'), 5)
+
+    archive = shutil.make_archive(os.path.join(tmp_path, 'mod'), 'gztar', src)
+
+    with pytest.raises(Canceled):
+        extractArchive(archive, dest, countdown_token(4))
+
+    # Everything the archive created is removed
+    assert os.listdir(dest) == []
+
+def test_extractJob(tmp_path, write_files) -> None:
+    staging = os.path.join(tmp_path, 'staging')
+    dest = os.path.join(tmp_path, 'mods')
+
+    write_files(os.path.join(tmp_path, 'src', 'wrapper', 'mod'), 3)
+    archive = shutil.make_archive(os.path.join(tmp_path, 'mod'), 'zip', os.path.join(tmp_path, 'src'))
+
+    # An older version of the mod with a file the new version doesn't have
+    write_files(os.path.join(dest, 'mod', 'old'), 1)
+
+    created = extractJob(archive, dest, staging, targets={'wrapper/mod' : os.path.join(dest, 'mod')})
+
+    assert created == [os.path.join(dest, 'mod')]
+    assert sorted(os.listdir(os.path.join(dest, 'mod'))) == ['0.txt', '1.txt', '2.txt']
+    assert os.listdir(staging) == []
+
+def test_extractJobLinked(tmp_path, monkeypatch: pytest.MonkeyPatch, write_files) -> None:
+    staging = os.path.join(tmp_path, 'staging')
+    dest = os.path.join(tmp_path, 'mods')
+    disabled = os.path.join(tmp_path, 'disabled', 'mod')
+
+    write_files(os.path.join(tmp_path, 'src', 'mod'), 3)
+    archive = shutil.make_archive(os.path.join(tmp_path, 'mod'), 'zip', os.path.join(tmp_path, 'src'))
+
+    # Enabled by the symlink mode, the mod itself is in the disabled directory
+    write_files(os.path.join(disabled, 'old'), 1)
+    os.makedirs(dest)
+    os.symlink(disabled, os.path.join(dest, 'mod'), target_is_directory=True)
+
+    def diskFull(*args) -> None:
+        raise OSError('disk full')
+
+    move = shutil.move
+    monkeypatch.setattr(shutil, 'move', diskFull)
+
+    # A failed install puts the old version and the link back
+    with pytest.raises(OSError, match='disk full'):
+        extractJob(archive, dest, staging)
+
+    assert os.path.islink(os.path.join(dest, 'mod'))
+    assert os.listdir(disabled) == ['old']
+
+    monkeypatch.setattr(shutil, 'move', move)
+
+    extractJob(archive, dest, staging)
+
+    # The copy in the disabled directory is replaced and still linked
+    assert os.path.islink(os.path.join(dest, 'mod'))
+    assert os.path.samefile(os.path.join(dest, 'mod'), disabled)
+    assert sorted(os.listdir(disabled)) == ['0.txt', '1.txt', '2.txt']
+    assert os.listdir(os.path.join(tmp_path, 'disabled')) == ['mod']
+    assert os.listdir(staging) == []
+
+def test_extractJobCancel(tmp_path, write_files, countdown_token) -> None:
+    staging = os.path.join(tmp_path, 'staging')
+    dest = os.path.join(tmp_path, 'mods')
+
+    write_files(os.path.join(tmp_path, 'src', 'mod'), 5)
+    archive = shutil.make_archive(os.path.join(tmp_path, 'mod'), 'zip', os.path.join(tmp_path, 'src'))
+
+    write_files(os.path.join(dest, 'mod'), 1)
+
+    with pytest.raises(Canceled):
+        extractJob(archive, dest, staging, countdown_token(4))
+
+    # The installed version is untouched and nothing is left in the staging folder
+    assert os.listdir(os.path.join(dest, 'mod')) == ['0.txt']
+    assert os.listdir(staging) == []
+
+def test_parallelZip(tmp_path, monkeypatch: pytest.MonkeyPatch, write_files) -> None:
+    src = os.path.join(tmp_path, 'src')
+    dest = os.path.join(tmp_path, 'dest')
+
+    monkeypatch.setattr('src.extract.PARALLEL_ZIP_SIZE', 0)
+
+    for folder in ('a', 'b', os.path.join('b', 'c')):
+        write_files(os.path.join(src, 'mod', folder), 5, 4096)
+
+    archive = shutil.make_archive(os.path.join(tmp_path, 'mod'), 'zip', src)
+
+    progress: list[tuple[str, int, int]] = []
+
+    created = extractArchive(archive, dest, CancelToken(), lambda x, y, z: progress.append((x, y, z)), threads=3)
+
+    assert created == [os.path.join(dest, 'mod')]
+
+    for root, dirs, files in os.walk(src):
+        for file in files:
+            with open(os.path.join(root, file), 'rb') as a, open(os.path.join(dest, os.path.relpath(root, src), file), 'rb') as b:
+                assert a.read() == b.read()
+
+    assert all(y <= z for x, y, z in progress)
+
+def test_parallelZipCancel(tmp_path, monkeypatch: pytest.MonkeyPatch, write_files, countdown_token) -> None:
+    src = os.path.join(tmp_path, 'src')
+    dest = os.path.join(tmp_path, 'dest')
+
+    monkeypatch.setattr('src.extract.PARALLEL_ZIP_SIZE', 0)
+
+    write_files(os.path.join(src, 'mod'), 20)
+
+    archive = shutil.make_archive(os.path.join(tmp_path, 'mod'), 'zip', src)
+
+    with pytest.raises(Canceled):
+        extractArchive(archive, dest, countdown_token(10), threads=3)
+
+    assert os.listdir(dest) == []
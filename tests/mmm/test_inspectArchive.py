@@ -0,0 +1,83 @@
+import os
+import zipfile
+
+from src.inspectArchive import ModRoot, archiveName, classify, unmatched, looseFiles, inspectArchive, inspectDir, detectType
+from src.constant_vars import ModType
+
+def test_archiveName() -> None:
+    assert archiveName('/mods/cool mod.zip') == 'cool mod'
+    assert archiveName('cool mod.tar.gz') == 'cool mod'
+    assert archiveName('cool.mod.7z') == 'cool.mod'
+
+def test_classify() -> None:
+
+    # Wrapper folder with several mods of different types inside
+    paths = [
+        'wrapper/',
+        'wrapper/readme.txt',
+        'wrapper/blt mod/mod.txt',
+        'wrapper/blt mod/lua/main.lua',
+        'wrapper/blt mod/assets/guis/icon.texture',
+        'wrapper/override/units/gun/gun.model',
+        'wrapper/map/main.xml',
+        'wrapper/map/levels/heist/world.xml',
+    ]
+
+    assert classify(paths, 'archive') == [
+        ModRoot('wrapper/blt mod', 'blt mod', ModType.mods),
+        ModRoot('wrapper/map', 'map', ModType.maps),
+        ModRoot('wrapper/override', 'override', ModType.mods_override),
+    ]
+
+    # Mod files at the top of the archive
+    assert classify(['main.xml', 'assets/sound.bank'], 'archive') == [ModRoot('', 'archive', ModType.mods_override)]
+
+    assert classify(['readme.txt', 'folder/picture.png'], 'archive') == []
+
+def test_unmatched() -> None:
+
+    # Folders without a marker next to and above the mods
+    paths = [
+        'wrapper/readme.txt',
+        'wrapper/blt mod/mod.txt',
+        'wrapper/blt mod/lua/main.lua',
+        'wrapper/optional/lua/extra.lua',
+        'wrapper/empty/',
+        'bonus/picture.png',
+        '__MACOSX/wrapper/._readme.txt',
+    ]
+
+    roots = classify(paths, 'archive')
+
+    assert roots == [ModRoot('wrapper/blt mod', 'blt mod', ModType.mods)]
+    assert unmatched(paths, roots) == ['bonus', 'wrapper/empty', 'wrapper/optional']
+    assert looseFiles(paths + ['notes.txt'], roots) == ['notes.txt', 'wrapper/readme.txt']
+
+    # Nothing is left out if the archive is the mod
+    assert unmatched(['main.xml', 'extra/file.txt'], classify(['main.xml', 'extra/file.txt'], 'archive')) == []
+    assert looseFiles(['main.xml', 'extra/file.txt'], classify(['main.xml', 'extra/file.txt'], 'archive')) == []
+
+def test_inspectArchive(tmp_path) -> None:
+    archive = os.path.join(tmp_path, 'cool mod.zip')
+
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr('Cool Mod v2/Cool Mod/mod.txt', '{}')
+
+    roots = inspectArchive(archive)
+
+    assert roots == [ModRoot('Cool Mod v2/Cool Mod', 'Cool Mod', ModType.mods)]
+    assert detectType(roots) == ModType.mods
+
+    with open(os.path.join(tmp_path, 'broken.zip'), 'wb') as f:
+        f.write(b'not an archive')
+
+    assert inspectArchive(os.path.join(tmp_path, 'broken.zip')) is None
+    assert detectType(None) is None
+
+def test_inspectDir(create_mod_dirs: str) -> None:
+    modPath = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+
+    with open(os.path.join(modPath, 'mod.txt'), 'w') as f:
+        f.write('{}')
+
+    assert inspectDir(modPath) == [ModRoot('', 'make game easy mod', ModType.mods)]
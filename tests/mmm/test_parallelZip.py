@@ -0,0 +1,113 @@
+import tempfile
+import zipfile
+import os
+
+import pytest
+
+from src import parallelZip
+from src.parallelZip import writeMembers, compressType
+from src.cancelToken import Canceled
+
+@pytest.fixture
+def create_files(write_files) -> str:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+
+        write_files(os.path.join(tmp_dir, 'mod'), 20, 1024)
+
+        # Compressible and bigger than a spooled member
+        with open(os.path.join(tmp_dir, 'mod', 'big.texture'), 'wb') as f:
+            f.write(b'texture' * 300000)
+
+        os.utime(os.path.join(tmp_dir, 'mod', '0.txt'), (946684800, 946684800))
+
+        yield tmp_dir
+
+def members(path: str) -> list[tuple[str, str | None]]:
+    files = sorted(os.listdir(os.path.join(path, 'mod')))
+
+    return [('mods/mod/', None)] + [(f'mods/mod/{x}', os.path.join(path, 'mod', x)) for x in files]
+
+def test_compressType(create_files: str) -> None:
+    mod = os.path.join(create_files, 'mod')
+
+    with open(os.path.join(mod, 'noise.bin'), 'wb') as f:
+        f.write(os.urandom(256 * 1024))
+
+    assert compressType(os.path.join(mod, 'big.texture'), ('.texture', )) == zipfile.ZIP_STORED
+    assert compressType(os.path.join(mod, 'big.texture')) == zipfile.ZIP_DEFLATED
+
+    # Random data doesn't compress, small files are deflated without sampling them
+    assert compressType(os.path.join(mod, 'noise.bin')) == zipfile.ZIP_STORED
+    assert compressType(os.path.join(mod, '0.txt')) == zipfile.ZIP_DEFLATED
+
+@pytest.mark.parametrize('threads', [1, 4])
+def test_writeMembers(create_files: str, threads: int, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(parallelZip, 'SPOOL_SIZE', 1024 * 1024)
+
+    zipPath = os.path.join(create_files, 'backup.zip')
+
+    reported: list[str] = []
+
+    with zipfile.ZipFile(zipPath, 'w', zipfile.ZIP_DEFLATED) as zf:
+        writeMembers(zf, members(create_files), threads, report=reported.append)
+        zf.writestr('manifest.json', '{}')
+
+    assert reported == [x for x, _ in members(create_files)]
+
+    with zipfile.ZipFile(zipPath) as zf:
+        assert zf.testzip() is None
+
+        # Written in order
+        assert zf.namelist() == reported + ['manifest.json']
+
+        assert zf.getinfo('mods/mod/').is_dir()
+        assert zf.getinfo('mods/mod/0.txt').date_time == (2000, 1, 1, 0, 0, 0)
+
+        info = zf.getinfo('mods/mod/big.texture')
+        assert info.compress_size < info.file_size
+
+        for arcName, filePath in members(create_files)[1:]:
+            with open(filePath, 'rb') as f:
+                assert zf.read(arcName) == f.read()
+
+@pytest.mark.parametrize('threads', [1, 4])
+def test_writeMembersStored(create_files: str, threads: int) -> None:
+    zipPath = os.path.join(create_files, 'backup.zip')
+
+    with zipfile.ZipFile(zipPath, 'w', zipfile.ZIP_DEFLATED) as zf:
+        writeMembers(zf, members(create_files), threads, level=1, stored=('.texture', ))
+
+    with zipfile.ZipFile(zipPath) as zf:
+        assert zf.testzip() is None
+
+        assert zf.getinfo('mods/mod/big.texture').compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo('mods/mod/0.txt').compress_type == zipfile.ZIP_DEFLATED
+
+        with open(os.path.join(create_files, 'mod', 'big.texture'), 'rb') as f:
+            assert zf.read('mods/mod/big.texture') == f.read()
+
+def test_writeMembersFallback(create_files: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    zipPath = os.path.join(create_files, 'backup.zip')
+
+    # A zipfile that changed its internals
+    monkeypatch.setattr(parallelZip, 'ZIPFILE_INTERNALS', parallelZip.ZIPFILE_INTERNALS + ('_removed', ))
+    monkeypatch.setattr(parallelZip, 'compressFile', lambda *args: pytest.fail('A member was compressed on another thread'))
+
+    with zipfile.ZipFile(zipPath, 'w', zipfile.ZIP_DEFLATED) as zf:
+        writeMembers(zf, members(create_files), 4)
+
+    with zipfile.ZipFile(zipPath) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == [x for x, _ in members(create_files)]
+
+def test_writeMembersCancel(create_files: str, countdown_token) -> None:
+    zipPath = os.path.join(create_files, 'backup.zip')
+
+    with zipfile.ZipFile(zipPath, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with pytest.raises(Canceled):
+            writeMembers(zf, members(create_files), 4, countdown_token(10))
+
+    # The members written before the cancel are still a valid zip
+    with zipfile.ZipFile(zipPath) as zf:
+        assert zf.testzip() is None
+        assert len(zf.namelist()) < len(members(create_files))
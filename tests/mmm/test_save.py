@@ -4,7 +4,7 @@ import pytest
 
 from PySide6.QtCore import QSize
 
-from src.constant_vars import ModKeys, OptionKeys, ModType
+from src.constant_vars import ModKeys, OptionKeys, ModType, STORED_EXTENSIONS_DEFAULT, BACKUP_SCHEDULE_OFF, BACKUP_SCHEDULE_DAILY
 from src.save import Save, OptionsManager
 
 EXPECTED_MODS = ('super fun mod', 'best mod ever', 'make game easy mod')
@@ -93,3 +93,36 @@ def test_OptionsMethods(createTemp_Config_ini: str) -> None:
     options.setLang('language')
     options.writeData()
     assert options.getLang() == 'language'
+
+    assert options.getStoredExtensions() == list(STORED_EXTENSIONS_DEFAULT)
+
+    options.setStoredExtensions(['.bank', '.MOVIE'])
+    options.writeData()
+    assert options.getStoredExtensions() == ['.bank', '.movie']
+
+    # Written by hand
+    options.setStoredExtensions(['bank', ' .MOVIE ', ''])
+    options.writeData()
+    assert options.getStoredExtensions() == ['.bank', '.movie']
+
+    assert options.getBackupSchedule() == BACKUP_SCHEDULE_OFF
+
+    options.setBackupSchedule(BACKUP_SCHEDULE_DAILY)
+    options.setBackupBandwidth(20)
+    options.setBackupKeep(5)
+    options.setBackupMaxAge(30)
+    options.setDownloadBandwidth(5)
+    options.writeData()
+    assert options.getBackupSchedule() == BACKUP_SCHEDULE_DAILY
+    assert options.getBackupBandwidth() == 20
+    assert options.getBackupKeep() == 5
+    assert options.getBackupMaxAge() == 30
+    assert options.getDownloadBandwidth() == 5
+
+    # The options are shared by every OptionsManager, other tests expect the defaults
+    options.setBackupSchedule()
+    options.setBackupBandwidth()
+    options.setBackupKeep()
+    options.setBackupMaxAge()
+    options.setDownloadBandwidth()
+    options.writeData()
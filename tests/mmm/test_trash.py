@@ -0,0 +1,36 @@
+import os
+
+from src.trash import Trash
+from src.constant_vars import TRASH
+
+def test_trash(create_mod_dirs: str) -> None:
+    trash = Trash(create_mod_dirs, os.path.join(create_mod_dirs, 'disabledMods'))
+
+    assert trash.trashDirs == [os.path.join(create_mod_dirs, TRASH)]
+
+    modPath = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+
+    with open(os.path.join(modPath, 'mod.txt'), 'w') as f:
+        f.write('mod')
+
+    assert trash.put(modPath, 'make game easy mod', {'type' : 'mods'})
+
+    assert not os.path.exists(modPath)
+
+    entries = trash.entries()
+
+    assert len(entries) == 1
+    assert entries[0]['mod'] == 'make game easy mod'
+    assert entries[0]['data'] == {'type' : 'mods'}
+
+    # Something with the same name was installed in the meantime
+    os.mkdir(modPath)
+
+    assert trash.restore(entries[0]) == False
+
+    os.rmdir(modPath)
+
+    assert trash.restore(entries[0])
+
+    assert os.path.isfile(os.path.join(modPath, 'mod.txt'))
+    assert trash.entries() == []
@@ -7,7 +7,7 @@ import PySide6.QtWidgets as qtw
 from PySide6.QtCore import Qt as qt
 
 from src.settings import Options
-from src.constant_vars import DARK, LIGHT, OptionKeys
+from src.constant_vars import DARK, LIGHT, OptionKeys, BACKUP_INCREMENTAL, BACKUP_FORMAT_REPOSITORY, BACKUP_SCHEDULE_DAILY, COMPRESSION_SMALL, BACKUP_KEEP_DEFAULT
 
 MOCK_DISMODS = os.path.abspath('path\\to\\disabled\\mods')
 MOCK_GAMEPATH = os.path.abspath('path\\to\\gamepath')
@@ -46,6 +46,42 @@ def test_langChanged(create_Settings: Options) -> None:
 
     assert create_Settings.optionChanged[OptionKeys.lang] == True
 
+def test_setSymlinkMods(create_Settings: Options) -> None:
+    create_Settings.optionsGeneral.symlinkModsCheckbox.setChecked(True)
+    create_Settings.optionsGeneral.setSymlinkMods()
+
+    assert create_Settings.optionChanged[OptionKeys.symlink_mods] == True
+
+def test_backupModeChanged(create_Settings: Options) -> None:
+    create_Settings.optionsMisc.backupMode.setCurrentIndex(create_Settings.optionsMisc.backupMode.findData(BACKUP_INCREMENTAL))
+
+    assert create_Settings.optionChanged[OptionKeys.backup_mode] == True
+
+def test_backupFormatChanged(create_Settings: Options) -> None:
+    create_Settings.optionsMisc.backupFormat.setCurrentIndex(create_Settings.optionsMisc.backupFormat.findData(BACKUP_FORMAT_REPOSITORY))
+
+    assert create_Settings.optionChanged[OptionKeys.backup_format] == True
+    assert create_Settings.optionsMisc.backupMode.isEnabled() == False
+
+def test_backupScheduleChanged(create_Settings: Options) -> None:
+    create_Settings.optionsMisc.backupSchedule.setCurrentIndex(create_Settings.optionsMisc.backupSchedule.findData(BACKUP_SCHEDULE_DAILY))
+    create_Settings.optionsMisc.backupKeep.setValue(BACKUP_KEEP_DEFAULT + 2)
+    create_Settings.optionsMisc.downloadBandwidth.setValue(2)
+
+    assert create_Settings.optionChanged[OptionKeys.backup_schedule] == True
+    assert create_Settings.optionChanged[OptionKeys.backup_keep] == True
+    assert create_Settings.optionChanged[OptionKeys.download_bandwidth] == True
+
+    create_Settings.cancelChanges()
+
+    assert create_Settings.optionsMisc.backupKeep.value() == BACKUP_KEEP_DEFAULT
+    assert create_Settings.optionsMisc.downloadBandwidth.value() == 0
+
+def test_backupCompressionChanged(create_Settings: Options) -> None:
+    create_Settings.optionsMisc.backupCompression.setCurrentIndex(create_Settings.optionsMisc.backupCompression.findData(COMPRESSION_SMALL))
+
+    assert create_Settings.optionChanged[OptionKeys.backup_compression] == True
+
 def test_cancelChanges(create_Settings: Options) -> None:
     assert create_Settings.applyButton.isEnabled()
 
@@ -54,6 +90,7 @@ def test_cancelChanges(create_Settings: Options) -> None:
     assert create_Settings.applyButton.isEnabled() == False
 
     assert sum(list(create_Settings.optionChanged.values())) == 0
+    assert create_Settings.optionsGeneral.symlinkModsCheckbox.isChecked() == False
 
 def test_applySettings(qtbot: QtBot, create_Settings: Options) -> None:
     qtbot.addWidget(create_Settings)
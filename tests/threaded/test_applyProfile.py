@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from src.threaded.applyProfile import ApplyProfile
+from src.getPath import Pathing
+from src.save import OptionsManager
+
+@pytest.fixture
+def create_worker(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> tuple[ApplyProfile, str]:
+    dispath = os.path.join(create_mod_dirs, 'disabledMods')
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.setDispath(dispath)
+    parser.writeData()
+
+    os.rename(os.path.join(create_mod_dirs, 'mods', 'make game easy mod'), os.path.join(dispath, 'make game easy mod'))
+    os.mkdir(os.path.join(create_mod_dirs, 'Maps'))
+    os.rename(os.path.join(create_mod_dirs, 'maps', 'super fun mod'), os.path.join(create_mod_dirs, 'Maps', 'super fun mod'))
+
+    worker = ApplyProfile('make game easy mod', 'super fun mod', 'not installed mod', optionsPath=createTemp_Config_ini, savePath=createTemp_Mod_ini)
+    worker.p = Pathing(createTemp_Config_ini)
+
+    return worker, create_mod_dirs
+
+def test_plan(create_worker: tuple[ApplyProfile, str]) -> None:
+    worker = create_worker[0]
+
+    toEnable, toDisable, notInstalled = worker.plan()
+
+    assert toEnable == ['make game easy mod']
+    assert toDisable == ['best mod ever']
+    assert notInstalled == ['not installed mod']
+
+def test_thread(create_worker: tuple[ApplyProfile, str]) -> None:
+    worker, create_mod_dirs = create_worker
+
+    results = []
+    worker.applied.connect(lambda x: results.append(x))
+
+    worker.start()
+
+    assert results == [{'best mod ever' : False, 'make game easy mod' : True}]
+    assert worker.notInstalled == ['not installed mod']
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'mods', 'make game easy mod'))
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'disabledMods', 'best mod ever'))
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'Maps', 'super fun mod'))
+
+def test_rollback(create_worker: tuple[ApplyProfile, str]) -> None:
+    worker, create_mod_dirs = create_worker
+
+    enableMod = worker.enableMod
+
+    def failingEnableMod(mod: str) -> bool:
+        if mod == 'make game easy mod':
+            raise PermissionError(mod)
+        return enableMod(mod)
+
+    worker.enableMod = failingEnableMod
+
+    errors = []
+    worker.error.connect(lambda x: errors.append(x))
+
+    worker.start()
+
+    assert len(errors) == 1
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'assets', 'mod_overrides', 'best mod ever'))
+    assert not os.path.exists(os.path.join(create_mod_dirs, 'disabledMods', 'best mod ever'))
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'disabledMods', 'make game easy mod'))
@@ -1,12 +1,17 @@
 import os
 import shutil
+import zipfile
+import threading
+import time
 
 import pytest
 
 from src.threaded.backupMods import BackupMods
 from src.getPath import Pathing
 from src.save import OptionsManager, Save
-from src.constant_vars import BACKUP_MODS
+from src.backupChain import BackupChain
+from src.backupRepository import BackupRepository
+from src.constant_vars import BACKUP_MODS, BACKUP_MANIFEST, BACKUP_REPOSITORY, BACKUP_FULL, BACKUP_INCREMENTAL, BACKUP_DIFFERENTIAL, BACKUP_FORMAT_ZIP, BACKUP_FORMAT_REPOSITORY, BACKUP_KEEP_DEFAULT
 
 #TODO: os.mkdir() isn't working
 @pytest.mark.skip
@@ -35,3 +40,230 @@ def test_thread(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod
     assert os.listdir(os.path.join(bundledFilePath, 'mods')) == ['make game easy mod']
     assert os.listdir(os.path.join(bundledFilePath, 'assets', 'mod_overrides')) == ['best mod ever']
     assert os.listdir(os.path.join(bundledFilePath, 'Maps')) == ['super fun mod']
+
+def test_stream(create_mod_dirs: str, backup_worker, write_files) -> None:
+    dispath = os.path.join(create_mod_dirs, 'disabledMods')
+
+    write_files(os.path.join(create_mod_dirs, 'mods', 'make game easy mod', 'sub'), 2)
+
+    # A disabled mod is backed up from the disabled mods directory
+    shutil.move(os.path.join(create_mod_dirs, 'assets', 'mod_overrides', 'best mod ever'), dispath)
+    write_files(os.path.join(dispath, 'best mod ever'), 1)
+
+    worker = backup_worker
+    worker.start()
+
+    backups = BackupChain(worker.backupPath).backups()
+
+    assert len(backups) == 1
+    assert backups[0]['kind'] == BACKUP_FULL
+
+    # Nothing is copied next to the zip first
+    assert sorted(os.listdir(worker.backupPath)) == sorted([backups[0]['name'] + '.zip', backups[0]['name'] + '.json'])
+
+    with zipfile.ZipFile(os.path.join(worker.backupPath, backups[0]['name'] + '.zip')) as zf:
+        names = set(zf.namelist())
+
+    assert {'mods/make game easy mod/sub/0.txt', 'mods/make game easy mod/sub/1.txt', 'assets/mod_overrides/best mod ever/0.txt', 'Maps/super fun mod/', BACKUP_MANIFEST} <= names
+
+@pytest.mark.parametrize('mode', (BACKUP_INCREMENTAL, BACKUP_DIFFERENTIAL))
+def test_changes(create_mod_dirs: str, mode: str, backup_worker, write_files) -> None:
+    modPath = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+    write_files(modPath, 3)
+
+    worker = backup_worker
+    worker.optionsManager.setBackupMode(mode)
+    worker.optionsManager.writeData()
+
+    # The first backup is always full
+    worker.start()
+
+    with open(os.path.join(modPath, '0.txt'), 'wb') as f:
+        f.write(b'changed')
+
+    os.remove(os.path.join(modPath, '1.txt'))
+    write_files(os.path.join(modPath, 'new'), 1)
+
+    worker.start()
+
+    # Nothing changed
+    worker.start()
+
+    worker.optionsManager.setBackupMode(BACKUP_FULL)
+    worker.optionsManager.writeData()
+
+    chain = BackupChain(worker.backupPath)
+    backups = chain.backups()
+
+    assert [x['kind'] for x in backups] == [BACKUP_FULL, mode]
+    assert sorted(backups[1]['added']) == ['mods/make game easy mod/0.txt', 'mods/make game easy mod/new/', 'mods/make game easy mod/new/0.txt']
+    assert backups[1]['deleted'] == ['mods/make game easy mod/1.txt']
+
+    dest = os.path.join(create_mod_dirs, 'restored')
+    chain.restore(backups[1]['name'], dest)
+
+    restored = os.path.join(dest, 'mods', 'make game easy mod')
+
+    assert sorted(os.listdir(restored)) == ['0.txt', '2.txt', 'new']
+
+    with open(os.path.join(restored, '0.txt'), 'rb') as f:
+        assert f.read() == b'changed'
+
+def test_snapshot(create_mod_dirs: str, backup_worker, write_files) -> None:
+    modPath = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+    write_files(modPath, 3, 1024)
+
+    worker = backup_worker
+    worker.optionsManager.setBackupFormat(BACKUP_FORMAT_REPOSITORY)
+    worker.optionsManager.writeData()
+
+    worker.start()
+
+    with open(os.path.join(modPath, '0.txt'), 'wb') as f:
+        f.write(b'changed')
+
+    worker.start()
+
+    # Nothing changed
+    worker.start()
+
+    worker.optionsManager.setBackupFormat(BACKUP_FORMAT_ZIP)
+    worker.optionsManager.writeData()
+
+    repository = BackupRepository(os.path.join(worker.backupPath, BACKUP_REPOSITORY))
+    snapshots = repository.snapshots()
+
+    assert len(snapshots) == 2
+    assert BackupChain(worker.backupPath).backups() == []
+
+    # The unchanged files are stored once
+    assert sum(len(files) for _, _, files in os.walk(repository.chunks)) == 4
+
+    assert snapshots[1]['mods']['make game easy mod']['type'] == 'mods'
+
+    dest = os.path.join(create_mod_dirs, 'restored')
+    repository.restore(snapshots[0]['name'], dest)
+
+    restored = os.path.join(dest, 'mods', 'make game easy mod')
+
+    assert sorted(os.listdir(restored)) == ['0.txt', '1.txt', '2.txt']
+
+    with open(os.path.join(restored, '1.txt'), 'rb') as f, open(os.path.join(modPath, '1.txt'), 'rb') as g:
+        assert f.read() == g.read()
+
+def test_retention(create_mod_dirs: str, backup_worker, write_files) -> None:
+    worker = backup_worker
+    worker.optionsManager.setBackupKeep(2)
+    worker.optionsManager.writeData()
+
+    modPath = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+
+    try:
+        for i in range(3):
+            write_files(modPath, i + 1)
+            worker.start()
+
+        # The oldest full backup was removed
+        assert len(BackupChain(worker.backupPath).backups()) == 2
+
+    finally:
+        worker.optionsManager.setBackupKeep()
+        worker.optionsManager.writeData()
+
+def test_unchanged(create_mod_dirs: str, backup_worker, write_files) -> None:
+    worker = backup_worker
+
+    assert worker.optionsManager.getBackupMode() == BACKUP_FULL
+    assert worker.optionsManager.getBackupKeep() == BACKUP_KEEP_DEFAULT
+
+    for _ in range(2):
+        worker.start()
+
+    # A full backup of the same files isn't written twice
+    assert len(BackupChain(worker.backupPath).backups()) == 1
+
+    write_files(os.path.join(create_mod_dirs, 'mods', 'make game easy mod'), 1)
+
+    for _ in range(BACKUP_KEEP_DEFAULT + 1):
+        with open(os.path.join(create_mod_dirs, 'mods', 'make game easy mod', '0.txt'), 'ab') as f:
+            f.write(b'changed')
+
+        worker.start()
+
+    # Only the newest backups are kept by default
+    assert len(BackupChain(worker.backupPath).backups()) == BACKUP_KEEP_DEFAULT
+
+def test_background(backup_worker) -> None:
+    worker = backup_worker
+
+    background = BackupMods(background=True)
+    background.saveManager, background.optionsManager, background.p = worker.saveManager, worker.optionsManager, worker.p
+    background.backupPath = worker.backupPath
+
+    background.optionsManager.setBackupBandwidth(5)
+
+    try:
+        background.start()
+
+        assert background.cancelToken.bandwidth == 5 * 1024 * 1024
+        assert len(BackupChain(background.backupPath).backups()) == 1
+
+    finally:
+        background.optionsManager.setBackupBandwidth(0)
+
+def test_oneAtATime(backup_worker) -> None:
+    worker = backup_worker
+
+    background = BackupMods(background=True)
+    background.saveManager, background.optionsManager, background.p = worker.saveManager, worker.optionsManager, worker.p
+    background.backupPath = worker.backupPath
+
+    canceled = []
+    background.doneCanceling.connect(lambda: canceled.append(True))
+
+    # A scheduled backup doesn't start while another backup runs
+    BackupMods.lock.acquire()
+    BackupMods.running = worker
+
+    try:
+        background.start()
+    finally:
+        BackupMods.running = None
+        BackupMods.lock.release()
+
+    assert canceled
+    assert BackupChain(worker.backupPath).backups() == []
+
+    # A backup the user started cancels the scheduled one and waits for it
+    running = BackupMods(background=True)
+
+    def scheduled() -> None:
+        while not running.cancel:
+            time.sleep(0.01)
+
+        BackupMods.running = None
+        BackupMods.lock.release()
+
+    BackupMods.lock.acquire()
+    BackupMods.running = running
+
+    thread = threading.Thread(target=scheduled)
+    thread.start()
+
+    worker.start()
+    thread.join()
+
+    assert running.cancel
+    assert len(BackupChain(worker.backupPath).backups()) == 1
+    assert BackupMods.running is None and not BackupMods.lock.locked()
+
+def test_cancel(create_mod_dirs: str, backup_worker, write_files, countdown_token) -> None:
+    write_files(os.path.join(create_mod_dirs, 'mods', 'make game easy mod'), 5)
+
+    worker = backup_worker
+    worker.cancelToken = countdown_token(8)
+
+    worker.start()
+
+    assert BackupChain(worker.backupPath).backups() == []
+    assert not [x for x in os.listdir(worker.backupPath) if x.endswith('.part')]
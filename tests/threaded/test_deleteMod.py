@@ -4,6 +4,7 @@ import shutil
 from src.threaded.deleteMod import DeleteMod
 from src.getPath import Pathing
 from src.save import OptionsManager, Save
+from src.trash import Trash
 
 
 def test_thread(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> None:
@@ -20,3 +21,8 @@ def test_thread(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod
     worker.start()
 
     assert os.path.isdir(os.path.join(create_mod_dirs, 'mods', 'make game easy mod')) == False
+
+    # Deleted mods can be restored until the trash is purged
+    entries = Trash(create_mod_dirs, parser.getDispath()).entries()
+
+    assert [x['mod'] for x in entries] == ['make game easy mod']
@@ -0,0 +1,82 @@
+import os
+import shutil
+
+import pytest
+
+from src.threaded.installMods import InstallMods
+from src.constant_vars import ModType
+from src.getPath import Pathing
+from src.save import OptionsManager, Save
+
+def test_thread(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, write_files) -> None:
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.writeData()
+
+    folder = os.path.join(create_mod_dirs, 'downloads', 'folder mod')
+    write_files(folder, 2)
+
+    write_files(os.path.join(create_mod_dirs, 'zip', 'zipped mod'), 2)
+    archive = shutil.make_archive(os.path.join(create_mod_dirs, 'downloads', 'zipped mod'), 'zip', os.path.join(create_mod_dirs, 'zip'))
+
+    worker = InstallMods([(folder, ModType.mods_override)], [(archive, ModType.mods)])
+    worker.optionsManager = parser
+    worker.saveManager = Save(createTemp_Mod_ini)
+    worker.p = Pathing(createTemp_Config_ini)
+
+    succeeded = []
+    worker.succeeded.connect(lambda: succeeded.append(True))
+
+    worker.start()
+
+    assert succeeded
+    assert worker.installed == {
+        os.path.join(create_mod_dirs, 'mods', 'zipped mod') : ModType.mods,
+        os.path.join(create_mod_dirs, 'assets', 'mod_overrides', 'folder mod') : ModType.mods_override
+    }
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'assets', 'mod_overrides', 'folder mod'))
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'mods', 'zipped mod'))
+    assert not os.path.exists(folder)
+
+def test_linked(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, write_files) -> None:
+    dispath = os.path.join(create_mod_dirs, 'disabledMods')
+
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.setDispath(dispath)
+    parser.writeData()
+
+    # Enabled by the symlink mode
+    enabled = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+    disabled = os.path.join(dispath, 'make game easy mod')
+
+    shutil.move(enabled, disabled)
+    write_files(disabled, 1)
+    os.symlink(disabled, enabled, target_is_directory=True)
+
+    folder = os.path.join(create_mod_dirs, 'downloads', 'make game easy mod')
+    os.makedirs(folder)
+
+    with open(os.path.join(folder, 'new.txt'), 'w') as f:
+        f.write('new version')
+
+    worker = InstallMods([(folder, ModType.mods)], [])
+    worker.optionsManager = parser
+    worker.saveManager = Save(createTemp_Mod_ini)
+    worker.p = Pathing(createTemp_Config_ini)
+
+    worker.start()
+
+    # The disabled copy is replaced and the link still points to it
+    assert worker.failed == {}
+    assert os.path.islink(enabled)
+    assert os.path.samefile(enabled, disabled)
+    assert os.listdir(disabled) == ['new.txt']
+
+    # Moving over the link itself is refused instead of moving into the folder it points to
+    os.makedirs(folder)
+
+    with pytest.raises(OSError):
+        worker.move(folder, enabled)
+
+    assert os.listdir(disabled) == ['new.txt']
@@ -26,3 +26,28 @@ def test_thread(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod
 
     assert os.path.exists(enabledDir)
     assert not os.path.exists(disabledDir)
+
+def test_thread_symlink(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> None:
+    dispath = os.path.join(create_mod_dirs, 'disabledMods')
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.setDispath(dispath)
+    parser.setSymlinkMods(True)
+    parser.writeData()
+
+    enabledDir = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+    disabledDir = os.path.join(create_mod_dirs, 'disabledMods', 'make game easy mod')
+
+    shutil.move(enabledDir, disabledDir)
+
+    worker = MoveToEnabledModDir('make game easy mod', optionsPath=createTemp_Config_ini, savePath=createTemp_Mod_ini)
+
+    worker.p = Pathing(createTemp_Config_ini)
+
+    worker.start()
+
+    parser.setSymlinkMods(False)
+    parser.writeData()
+
+    assert os.path.islink(enabledDir)
+    assert os.path.samefile(enabledDir, disabledDir)
@@ -0,0 +1,58 @@
+import os
+import time
+
+from pytest import MonkeyPatch
+from pytestqt.qtbot import QtBot
+from PySide6.QtCore import QThread
+
+from src.threaded.purgeTrash import PurgeTrash
+from src.save import OptionsManager
+from src.trash import Trash
+
+def test_thread(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> None:
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.setDispath(os.path.join(create_mod_dirs, 'disabledMods'))
+    parser.writeData()
+
+    trash = Trash(create_mod_dirs, os.path.join(create_mod_dirs, 'disabledMods'))
+
+    trash.put(os.path.join(create_mod_dirs, 'mods', 'make game easy mod'), 'make game easy mod')
+
+    # Entries that have not expired yet are kept
+    worker = PurgeTrash(60 * 60, optionsPath=createTemp_Config_ini, savePath=createTemp_Mod_ini)
+    worker.start()
+
+    assert len(trash.entries()) == 1
+
+    time.sleep(0.01)
+
+    worker = PurgeTrash(optionsPath=createTemp_Config_ini, savePath=createTemp_Mod_ini)
+    worker.start()
+
+    assert trash.entries() == []
+
+def test_background(qtbot: QtBot, create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, monkeypatch: MonkeyPatch) -> None:
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.writeData()
+
+    trash = Trash(create_mod_dirs, parser.getDispath())
+
+    trash.put(os.path.join(create_mod_dirs, 'mods', 'make game easy mod'), 'make game easy mod')
+
+    priorities = []
+
+    purge = Trash.purge
+    monkeypatch.setattr(Trash, 'purge', lambda *args: priorities.append(QThread.currentThread().priority()) or purge(*args))
+
+    worker = PurgeTrash(optionsPath=createTemp_Config_ini, savePath=createTemp_Mod_ini)
+
+    with qtbot.waitSignal(worker.succeeded, timeout=10000):
+        worker.startInBackground()
+
+    worker.qthread.wait()
+
+    # The deletions run at the priority of the background thread
+    assert priorities == [QThread.Priority.LowestPriority]
+    assert trash.entries() == []
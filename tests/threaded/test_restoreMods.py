@@ -0,0 +1,124 @@
+import os
+import shutil
+
+from src.threaded.restoreMods import RestoreMods
+from src.backupChain import BackupChain
+from src.trash import Trash
+from src.constant_vars import ModKeys
+
+def test_restore(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, backup_worker, write_files) -> None:
+    dispath = os.path.join(create_mod_dirs, 'disabledMods')
+
+    easyMod = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+    write_files(os.path.join(easyMod, 'sub'), 2)
+
+    # A disabled mod goes back to the disabled mods directory
+    shutil.move(os.path.join(create_mod_dirs, 'assets', 'mod_overrides', 'best mod ever'), dispath)
+    write_files(os.path.join(dispath, 'best mod ever'), 1)
+
+    backup = backup_worker
+    backup.saveManager.setEnabled('best mod ever', False)
+    backup.saveManager.setTags(['favorite'], 'best mod ever')
+    backup.start()
+
+    chain = BackupChain(backup.backupPath)
+    name = chain.latest()['name']
+
+    assert chain.mods(name) == ['Maps/super fun mod', 'assets/mod_overrides/best mod ever', 'mods/make game easy mod']
+
+    # Changed and deleted after the backup
+    with open(os.path.join(easyMod, 'sub', '0.txt'), 'wb') as f:
+        f.write(b'changed')
+
+    os.remove(os.path.join(easyMod, 'sub', '1.txt'))
+    shutil.rmtree(os.path.join(dispath, 'best mod ever'))
+    shutil.rmtree(os.path.join(create_mod_dirs, 'Maps', 'super fun mod'))
+
+    worker = RestoreMods(
+        chain, name, ['mods/make game easy mod', 'assets/mod_overrides/best mod ever'],
+        optionsPath=createTemp_Config_ini, savePath=createTemp_Mod_ini
+    )
+    worker.optionsManager = backup.optionsManager
+    worker.p = backup.p
+    worker.start()
+
+    assert sorted(os.listdir(os.path.join(easyMod, 'sub'))) == ['0.txt', '1.txt']
+
+    with open(os.path.join(easyMod, 'sub', '0.txt'), 'rb') as f:
+        assert f.read() != b'changed'
+
+    assert os.listdir(os.path.join(dispath, 'best mod ever')) == ['0.txt']
+    assert not os.path.exists(os.path.join(create_mod_dirs, 'assets', 'mod_overrides', 'best mod ever'))
+
+    # Only the selected mods are restored
+    assert not os.path.exists(os.path.join(create_mod_dirs, 'Maps', 'super fun mod'))
+
+    assert worker.restored['best mod ever'][ModKeys.enabled.value] == False
+    assert worker.restored['best mod ever'][ModKeys.tags.value] == ['favorite']
+    assert set(worker.restored) == {'make game easy mod', 'best mod ever'}
+
+    # The version that was replaced can be restored from the trash
+    entries = Trash(create_mod_dirs, dispath).entries()
+
+    assert [x['mod'] for x in entries] == ['make game easy mod']
+
+def test_restore_symlink(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, backup_worker) -> None:
+    dispath = os.path.join(create_mod_dirs, 'disabledMods')
+    easyMod = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+
+    backup = backup_worker
+    backup.start()
+
+    chain = BackupChain(backup.backupPath)
+    name = chain.latest()['name']
+
+    # Enabled with the symlink mode since the backup
+    shutil.move(easyMod, dispath)
+    os.symlink(os.path.join(dispath, 'make game easy mod'), easyMod, target_is_directory=True)
+
+    backup.optionsManager.setSymlinkMods(True)
+    backup.optionsManager.writeData()
+
+    worker = RestoreMods(chain, name, ['mods/make game easy mod'], optionsPath=createTemp_Config_ini, savePath=createTemp_Mod_ini)
+    worker.optionsManager = backup.optionsManager
+    worker.p = backup.p
+    worker.start()
+
+    backup.optionsManager.setSymlinkMods(False)
+    backup.optionsManager.writeData()
+
+    # Kept in the disabled directory and linked, so it can be disabled again
+    assert os.path.islink(easyMod)
+    assert os.path.samefile(easyMod, os.path.join(dispath, 'make game easy mod'))
+    assert worker.failed == {}
+
+    assert worker.disableMod('make game easy mod')
+    assert not os.path.exists(easyMod)
+
+def test_restore_noTrash(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, monkeypatch, backup_worker, write_files) -> None:
+    easyMod = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+    write_files(easyMod, 1)
+
+    backup = backup_worker
+    backup.start()
+
+    chain = BackupChain(backup.backupPath)
+    name = chain.latest()['name']
+
+    with open(os.path.join(easyMod, '0.txt'), 'wb') as f:
+        f.write(b'changed')
+
+    # No trash on the same drive as the mod
+    monkeypatch.setattr(Trash, 'put', lambda *args: False)
+
+    worker = RestoreMods(chain, name, ['mods/make game easy mod'], optionsPath=createTemp_Config_ini, savePath=createTemp_Mod_ini)
+    worker.optionsManager = backup.optionsManager
+    worker.p = backup.p
+    worker.start()
+
+    # The installed version isn't overwritten
+    assert list(worker.failed) == ['make game easy mod']
+    assert worker.restored == {}
+
+    with open(os.path.join(easyMod, '0.txt'), 'rb') as f:
+        assert f.read() == b'changed'
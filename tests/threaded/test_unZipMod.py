@@ -1,12 +1,17 @@
 import os
 import shutil
 
+import zipfile
+
 import pytest
+from pytest import MonkeyPatch
 
 from src.threaded.unZipMod import UnZipMod
 from src.constant_vars import ModType
 from src.getPath import Pathing
 from src.save import OptionsManager, Save
+from src.archiveCache import ArchiveCache
+from src.contentStore import hashFile
 
 #TODO: Everything seems to work but the assert statement
 @pytest.mark.skip
@@ -30,3 +35,166 @@ def test_thread(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod
     worker.start()
 
     assert os.path.isdir(os.path.join(create_mod_dirs, 'mods', 'zip'))
+
+def test_cancel(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, write_files, countdown_token) -> None:
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.writeData()
+
+    write_files(os.path.join(create_mod_dirs, 'zip', 'zip'), 5)
+    url = shutil.make_archive(os.path.join(create_mod_dirs, 'zip'), 'zip', os.path.join(create_mod_dirs, 'zip'))
+
+    worker = UnZipMod((url, ModType.mods))
+    worker.optionsManager = parser
+    worker.saveManager = Save(createTemp_Mod_ini)
+    worker.p = Pathing(createTemp_Config_ini)
+
+    # Canceled in the middle of the archive
+    worker.cancelToken = countdown_token(4)
+
+    canceled = []
+    worker.doneCanceling.connect(lambda: canceled.append(True))
+
+    worker.start()
+
+    assert canceled
+    assert not os.path.exists(os.path.join(create_mod_dirs, 'mods', 'zip'))
+
+@pytest.mark.parametrize('poolSize', (1, 2))
+def test_report(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, monkeypatch: MonkeyPatch, poolSize: int, write_files) -> None:
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.writeData()
+
+    monkeypatch.setattr('src.threaded.unZipMod.poolSize', lambda x, y: poolSize)
+
+    archives = []
+
+    for name in ('first', 'second'):
+        write_files(os.path.join(create_mod_dirs, name, name), 3)
+        archives.append(shutil.make_archive(os.path.join(create_mod_dirs, name), 'gztar', os.path.join(create_mod_dirs, name)))
+
+    # A broken archive doesn't stop the others
+    broken = os.path.join(create_mod_dirs, 'broken.zip')
+
+    with open(broken, 'wb') as f:
+        f.write(b'PK\x03\x04 not a zip')
+
+    worker = UnZipMod(*[(x, ModType.mods) for x in (archives[0], broken, archives[1])])
+    worker.optionsManager = parser
+    worker.saveManager = Save(createTemp_Mod_ini)
+    worker.p = Pathing(createTemp_Config_ini)
+
+    errors = []
+    worker.error.connect(lambda x: errors.append(x))
+
+    worker.start()
+
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'mods', 'first'))
+    assert os.path.isdir(os.path.join(create_mod_dirs, 'mods', 'second'))
+
+    assert list(worker.failed) == ['broken.zip']
+    assert len(errors) == 1
+
+def test_plan(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> None:
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.writeData()
+
+    archive = os.path.join(create_mod_dirs, 'pack.zip')
+
+    # A wrapper folder with a BLT mod and a map inside
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr('pack v1/readme.txt', 'read me')
+        zf.writestr('pack v1/blt mod/mod.txt', '{}')
+        zf.writestr('pack v1/heist/main.xml', '<table/>')
+        zf.writestr('pack v1/heist/levels/heist/world.xml', '<table/>')
+
+    worker = UnZipMod((archive, ModType.mods))
+    worker.optionsManager = parser
+    worker.saveManager = Save(createTemp_Mod_ini)
+    worker.p = Pathing(createTemp_Config_ini)
+
+    worker.start()
+
+    assert os.path.isfile(os.path.join(create_mod_dirs, 'mods', 'blt mod', 'mod.txt'))
+    assert os.path.isfile(os.path.join(worker.p.maps(), 'heist', 'levels', 'heist', 'world.xml'))
+    assert not os.path.exists(os.path.join(create_mod_dirs, 'mods', 'pack v1'))
+
+def test_plan_unmatched(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str) -> None:
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.writeData()
+
+    archive = os.path.join(create_mod_dirs, 'mixed.zip')
+
+    # Next to the BLT mod are folders nothing marks as a mod
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr('pack v1/blt mod/mod.txt', '{}')
+        zf.writestr('pack v1/optional/lua/extra.lua', 'extra')
+        zf.writestr('pack v1/readme.txt', 'readme')
+        zf.writestr('bonus/picture.png', 'picture')
+
+    worker = UnZipMod((archive, ModType.mods_override))
+    worker.optionsManager = parser
+    worker.saveManager = Save(createTemp_Mod_ini)
+    worker.p = Pathing(createTemp_Config_ini)
+
+    worker.start()
+
+    # Installed into the chosen directory instead of being left out
+    assert os.path.isfile(os.path.join(worker.p.mod_overrides(), 'blt mod', 'mod.txt'))
+    assert os.path.isfile(os.path.join(worker.p.mod_overrides(), 'optional', 'lua', 'extra.lua'))
+    assert os.path.isfile(os.path.join(worker.p.mod_overrides(), 'bonus', 'picture.png'))
+    assert {os.path.basename(x) for x in worker.installed} == {'blt mod', 'optional', 'bonus', 'mixed'}
+
+    # Loose files go into a folder named after the archive
+    with open(os.path.join(worker.p.mod_overrides(), 'mixed', 'readme.txt')) as f:
+        assert f.read() == 'readme'
+
+def test_archiveCache(create_mod_dirs: str, createTemp_Config_ini: str, createTemp_Mod_ini: str, monkeypatch: MonkeyPatch, write_files) -> None:
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.setContentStore(True)
+    parser.setArchiveCache(True)
+    parser.writeData()
+
+    cachePath = os.path.join(create_mod_dirs, 'cache')
+
+    write_files(os.path.join(create_mod_dirs, 'zip', 'cached mod'), 3)
+    url = shutil.make_archive(os.path.join(create_mod_dirs, 'cached'), 'zip', os.path.join(create_mod_dirs, 'zip'))
+
+    def install() -> UnZipMod:
+        worker = UnZipMod((url, ModType.mods), storePath=os.path.join(create_mod_dirs, 'store'), cachePath=cachePath)
+        worker.optionsManager = parser
+        worker.saveManager = Save(createTemp_Mod_ini)
+        worker.p = Pathing(createTemp_Config_ini)
+        worker.start()
+        return worker
+
+    modPath = os.path.join(create_mod_dirs, 'mods', 'cached mod')
+
+    # Nothing cached has the archive's size, so it's only hashed once it was installed
+    monkeypatch.setattr('src.archiveCache.hashFile', lambda *args: pytest.fail('The archive was hashed before extracting it'))
+
+    install()
+
+    cache = ArchiveCache(cachePath)
+    digest = hashFile(url)
+
+    assert os.path.isfile(cache.archivePath(digest))
+    assert set(cache.file[digest]['mods']['cached mod']) == {'0.txt', '1.txt', '2.txt'}
+
+    shutil.rmtree(modPath)
+
+    # Installed again from the content store without extracting the archive
+    monkeypatch.setattr('src.threaded.unZipMod.extractJob', lambda *args: pytest.fail('The archive was extracted'))
+
+    worker = install()
+
+    parser.setContentStore(False)
+    parser.setArchiveCache(False)
+    parser.writeData()
+
+    assert not worker.failed
+    assert sorted(os.listdir(modPath)) == ['0.txt', '1.txt', '2.txt']
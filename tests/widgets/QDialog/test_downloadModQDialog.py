@@ -0,0 +1,43 @@
+import os
+import random
+
+from pytestqt.qtbot import QtBot
+
+from src.widgets.QDialog.downloadModQDialog import DownloadModDialog
+from src.api.downloadMod import PAUSED
+from src.api.network import NetworkService
+
+def test_dialog(qtbot: QtBot, local_server, tmp_path, createTemp_Config_ini: str, serve_mod) -> None:
+    data = random.Random(1).randbytes(64 * 1024)
+
+    serve_mod(data)
+
+    widget = DownloadModDialog('1234', createTemp_Config_ini, str(tmp_path), local_server.url, NetworkService(os.path.join(tmp_path, 'cache')))
+    qtbot.addWidget(widget)
+
+    # Slow enough to be paused mid-way
+    widget.worker.bandwidth = 128 * 1024
+
+    with qtbot.waitSignal(widget.worker.downloading, timeout=10000):
+        widget.worker.start()
+
+        # Nothing is paused before the file is being downloaded
+        assert not widget.pauseButton.isEnabled()
+
+        widget.togglePause()
+
+        assert widget.pauseButton.text() == 'Pause'
+
+    assert widget.pauseButton.isEnabled()
+
+    widget.pauseButton.click()
+
+    assert widget.worker.state == PAUSED
+    assert widget.pauseButton.text() == 'Resume'
+
+    with qtbot.waitSignal(widget.worker.succeeded, timeout=10000):
+        widget.pauseButton.click()
+
+    assert widget.path == os.path.join(tmp_path, 'mod.zip')
+    assert widget.result() == 1
+    assert widget.progressBar.value() == len(data)
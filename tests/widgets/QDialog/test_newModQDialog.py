@@ -1,35 +1,41 @@
 import os
+import time
 
 from pytestqt.qtbot import QtBot
 
 import PySide6.QtWidgets as qtw
+from PySide6.QtCore import Qt as qt, QItemSelectionModel
 
-from src.widgets.QDialog.newModQDialog import newModLocation
+from src.widgets.QDialog.newModQDialog import newModLocation, TYPE_COLUMNS
 from src.constant_vars import ModType
 
+def check(widget: newModLocation, row: int, modType: ModType) -> None:
+    index = widget.model.index(row, TYPE_COLUMNS.index(modType) + 1)
+    widget.model.setData(index, qt.CheckState.Checked.value, qt.ItemDataRole.CheckStateRole)
+
 def test_dialog(qtbot: QtBot, create_mod_dirs: str) -> None:
     list_of_paths = [
         os.path.join(create_mod_dirs, 'mods', 'super fun mod'),
         os.path.join(create_mod_dirs, 'mod_overrides', 'best mod ever'),
         os.path.join(create_mod_dirs, 'maps', 'make game easy mod')
         ]
-    
+
     widget = newModLocation(*list_of_paths)
     qtbot.addWidget(widget)
 
-    assert len(widget.findChildren(qtw.QGroupBox)) == 3
+    assert widget.model.rowCount() == 3
 
-    radioButton0: qtw.QRadioButton = widget.findChild(qtw.QRadioButton, f'super fun mod {ModType.mods}')
-    radioButton0.click()
+    check(widget, 0, ModType.mods)
 
     assert widget.buttonBox.button(qtw.QDialogButtonBox.StandardButton.Ok).isEnabled() == False
 
-    radioButton1: qtw.QRadioButton = widget.findChild(qtw.QRadioButton, f'best mod ever {ModType.mods_override}')
-    radioButton1.click()
+    check(widget, 1, ModType.mods_override)
 
-    radioButton2: qtw.QRadioButton = widget.findChild(qtw.QRadioButton, f'make game easy mod {ModType.maps}')
-    radioButton2.click()
+    # Checking another type replaces the first one
+    check(widget, 2, ModType.mods)
+    check(widget, 2, ModType.maps)
 
+    assert widget.model.index(2, 1).data(qt.ItemDataRole.CheckStateRole) == qt.CheckState.Unchecked
     assert widget.buttonBox.button(qtw.QDialogButtonBox.StandardButton.Ok).isEnabled()
 
     widget.buttonBox.accepted.emit()
@@ -37,3 +43,70 @@ def test_dialog(qtbot: QtBot, create_mod_dirs: str) -> None:
     assert widget.typeDict == {'super fun mod' : ModType.mods,
                                'best mod ever' : ModType.mods_override,
                                'make game easy mod': ModType.maps}
+
+def test_detected(qtbot: QtBot, create_mod_dirs: str) -> None:
+    list_of_paths = [
+        os.path.join(create_mod_dirs, 'mods', 'super fun mod'),
+        os.path.join(create_mod_dirs, 'mod_overrides', 'best mod ever')
+        ]
+
+    widget = newModLocation(*list_of_paths, detected={'super fun mod' : ModType.maps})
+    qtbot.addWidget(widget)
+
+    assert widget.model.index(0, 3).data(qt.ItemDataRole.CheckStateRole) == qt.CheckState.Checked
+    assert widget.buttonBox.button(qtw.QDialogButtonBox.StandardButton.Ok).isEnabled() == False
+
+    check(widget, 1, ModType.mods_override)
+
+    assert widget.buttonBox.button(qtw.QDialogButtonBox.StandardButton.Ok).isEnabled()
+
+def test_applyToSelection(qtbot: QtBot) -> None:
+    paths = [f'mod {i}.zip' for i in range(1000)]
+
+    start = time.perf_counter()
+
+    widget = newModLocation(*paths)
+    qtbot.addWidget(widget)
+    widget.show()
+
+    assert time.perf_counter() - start < 1
+
+    widget.modView.selectAll()
+
+    widget.typeBox.setCurrentIndex(TYPE_COLUMNS.index(ModType.mods_override))
+    widget.applyButton.click()
+
+    assert widget.buttonBox.button(qtw.QDialogButtonBox.StandardButton.Ok).isEnabled()
+
+    # Changing only some of them
+    widget.modView.selectionModel().select(
+        widget.model.index(0, 0),
+        QItemSelectionModel.SelectionFlag.ClearAndSelect | QItemSelectionModel.SelectionFlag.Rows
+    )
+
+    widget.typeBox.setCurrentIndex(TYPE_COLUMNS.index(ModType.maps))
+    widget.applyButton.click()
+
+    widget.buttonBox.accepted.emit()
+
+    assert widget.typeDict['mod 0.zip'] == ModType.maps
+    assert widget.typeDict['mod 999.zip'] == ModType.mods_override
+    assert len(widget.typeDict) == 1000
+
+def test_inspect(qtbot: QtBot, create_mod_dirs: str) -> None:
+    mapMod = os.path.join(create_mod_dirs, 'maps', 'make game easy mod')
+    os.makedirs(os.path.join(mapMod, 'levels'))
+
+    picked = os.path.join(create_mod_dirs, 'mods', 'super fun mod')
+    os.makedirs(os.path.join(picked, 'levels'))
+
+    widget = newModLocation(mapMod, picked, os.path.join(create_mod_dirs, 'unknown mod'), inspect=True)
+    qtbot.addWidget(widget)
+
+    # Picked by the user before it was inspected
+    check(widget, 1, ModType.mods)
+
+    # The types are checked once they're found
+    qtbot.waitUntil(lambda: widget.model.types[0] == ModType.maps)
+
+    assert widget.model.types[1:] == [ModType.mods, None]
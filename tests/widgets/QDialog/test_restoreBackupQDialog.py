@@ -0,0 +1,46 @@
+import os
+
+from pytestqt.qtbot import QtBot
+
+from src.widgets.QDialog.restoreBackupQDialog import RestoreBackup
+from src.backupChain import BackupChain
+from src.backupRepository import BackupRepository
+from src.constant_vars import BACKUP_FULL, BACKUP_REPOSITORY
+
+def test_dialog(qtbot: QtBot, create_mod_dirs: str, createTemp_Config_ini: str, write_backup) -> None:
+    backupPath = os.path.join(create_mod_dirs, 'backups')
+
+    sources = [
+        (os.path.join(create_mod_dirs, 'mods', 'make game easy mod'), 'mods/make game easy mod'),
+        (os.path.join(create_mod_dirs, 'maps', 'super fun mod'), 'Maps/super fun mod')
+    ]
+
+    write_backup(BackupChain(backupPath), BACKUP_FULL, None, sources)
+
+    widget = RestoreBackup(backupPath, createTemp_Config_ini)
+    qtbot.addWidget(widget)
+
+    assert widget.backupBox.count() == 1
+    assert widget.modList.count() == 2
+
+    assert [widget.modList.item(x).text() for x in range(2)] == ['super fun mod (maps)', 'make game easy mod (mods)']
+
+    # Nothing selected, nothing to restore
+    widget.restoreButton.click()
+
+def test_snapshots(qtbot: QtBot, create_mod_dirs: str, createTemp_Config_ini: str, write_backup) -> None:
+    backupPath = os.path.join(create_mod_dirs, 'backups')
+
+    sources = [(os.path.join(create_mod_dirs, 'mods', 'make game easy mod'), 'mods/make game easy mod')]
+
+    write_backup(BackupChain(backupPath), BACKUP_FULL, None, sources)
+
+    repository = BackupRepository(os.path.join(backupPath, BACKUP_REPOSITORY))
+    repository.saveSnapshot(repository.newName(), repository.addSources(sources), {})
+
+    widget = RestoreBackup(backupPath, createTemp_Config_ini)
+    qtbot.addWidget(widget)
+
+    # Zip backups and snapshots are listed together
+    assert widget.backupBox.count() == 2
+    assert widget.modList.count() == 1
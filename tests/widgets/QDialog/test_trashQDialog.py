@@ -0,0 +1,31 @@
+import os
+
+from pytestqt.qtbot import QtBot
+
+from src.widgets.QDialog.trashQDialog import TrashBin
+from src.save import OptionsManager
+from src.trash import Trash
+
+def test_restore(qtbot: QtBot, create_mod_dirs: str, createTemp_Config_ini: str) -> None:
+    parser = OptionsManager(createTemp_Config_ini)
+    parser.setGamepath(create_mod_dirs)
+    parser.setDispath(os.path.join(create_mod_dirs, 'disabledMods'))
+    parser.writeData()
+
+    modPath = os.path.join(create_mod_dirs, 'mods', 'make game easy mod')
+
+    Trash(create_mod_dirs, parser.getDispath()).put(modPath, 'make game easy mod', {'type' : 'mods'})
+
+    widget = TrashBin(createTemp_Config_ini)
+    qtbot.addWidget(widget)
+
+    assert widget.trashList.count() == 1
+
+    widget.trashList.item(0).setSelected(True)
+
+    with qtbot.waitSignal(widget.modsRestored) as blocker:
+        widget.restoreButton.click()
+
+    assert blocker.args == [{'make game easy mod' : {'type' : 'mods'}}]
+    assert widget.trashList.count() == 0
+    assert os.path.isdir(modPath)
@@ -6,6 +6,7 @@ from pytestqt.qtbot import QtBot
 
 from PySide6.QtCore import Qt as qt
 
+from src.api.network import NetworkService
 from src.widgets.managerQTableWidget import ModListWidget
 from src.constant_vars import ModType, ModRole
 
@@ -61,6 +62,15 @@ def test_getSelectedNameItems(create_QTable: ModListWidget) -> None:
 def test_getModTypeCount(create_QTable: ModListWidget) -> None:
     assert create_QTable.getModTypeCount(ModType.mods) == 1
 
+def test_setModsEnabled(create_QTable: ModListWidget) -> None:
+
+    create_QTable.setModsEnabled({'mod1' : False, 'mod3' : True, 'hidden mod' : True})
+
+    names = [create_QTable.getNameItem(x).text() for x in range(create_QTable.rowCount())]
+
+    assert create_QTable.getEnabledItem(names.index('mod1')).text() == 'Disabled'
+    assert create_QTable.getEnabledItem(names.index('mod3')).text() == 'Enabled'
+
 def test_Icon(create_QTable: ModListWidget, getDir: str) -> None:
 
     with tempfile.TemporaryDirectory(dir=os.path.join(getDir, 'game_path', 'mods')) as tmp_mod:
@@ -75,6 +85,44 @@ def test_Icon(create_QTable: ModListWidget, getDir: str) -> None:
 
         assert tmp_mod_item.icon().isNull() == False
 
+def test_addInstalledMods(create_QTable: ModListWidget) -> None:
+
+    rows = create_QTable.rowCount()
+
+    # mod1 was installed again as a map
+    create_QTable.addInstalledMods({os.path.join(create_QTable.p.maps(), 'mod1') : ModType.maps, os.path.join(create_QTable.p.mods(), 'new mod') : ModType.mods})
+
+    names = [create_QTable.getNameItem(x).text() for x in range(create_QTable.rowCount())]
+
+    assert create_QTable.rowCount() == rows + 1
+    assert sorted(names) == sorted(['mod2', 'mod3', 'mod1', 'new mod'])
+    assert create_QTable.getTypeItem(names.index('mod1')).text() == 'maps'
+    assert create_QTable.saveManager.getType('new mod') == ModType.mods
+
+def test_checkModUpdates(qtbot: QtBot, create_QTable: ModListWidget, local_server, tmp_path) -> None:
+
+    local_server.routes['/mods/1234/version'] = (200, {}, b'3.0.0')
+
+    create_QTable.saveManager.setModWorkshopAssetID('mod1', '1234')
+
+    checker = create_QTable.checkModUpdates(['mod1', 'mod2'], apiUrl=local_server.url, network=NetworkService(str(tmp_path)))
+
+    names = [create_QTable.getNameItem(x).text() for x in range(create_QTable.rowCount())]
+
+    assert create_QTable.getUpdateItem(names.index('mod1')).text() == 'Checking...'
+
+    with qtbot.waitSignal(checker.finished, timeout=5000):
+        pass
+
+    # mod2 doesn't have an asset id
+    assert local_server.requests == ['/mods/1234/version']
+
+    assert create_QTable.getUpdateItem(names.index('mod1')).text() == 'Update available: 3.0.0'
+    assert create_QTable.getUpdateItem(names.index('mod2')).text() == ''
+
+    # None of the mods can be checked
+    assert create_QTable.checkModUpdates(['mod3']) is None
+
 #TODO: Test installMods()
 @pytest.mark.skip
 def test_installMods():
@@ -84,6 +132,6 @@ def test_widget(qtbot: QtBot, create_QTable: ModListWidget) -> None:
 
     qtbot.addWidget(create_QTable)
 
-    assert create_QTable.columnCount() == 4
+    assert create_QTable.columnCount() == 5
     assert create_QTable.verticalHeader().isHidden() == True
     
@@ -52,4 +52,14 @@ def test_updateProgressBar(create_progressWidget: tuple[Worker, ProgressWidget,
 
     create_progressWidget[0].setCurrentProgress.emit(51, 'testing ^_^')
     assert create_progressWidget[1].progressBar.value() == 50
-    assert create_progressWidget[1].infoLabel.text() == 'testing ^_^'
\ No newline at end of file
+    assert create_progressWidget[1].infoLabel.text() == 'testing ^_^'
+
+def test_updateSubProgressBar(create_progressWidget: tuple[Worker, ProgressWidget, QtBot]) -> None:
+
+    assert create_progressWidget[1].subProgressBar.isHidden()
+
+    create_progressWidget[0].setSubProgress.emit(25, 100)
+
+    assert not create_progressWidget[1].subProgressBar.isHidden()
+    assert create_progressWidget[1].subProgressBar.maximum() == 100
+    assert create_progressWidget[1].subProgressBar.value() == 25
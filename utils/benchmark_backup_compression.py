@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+import random
+import zipfile
+import tempfile
+
+# Run from the repository's root: python utils/benchmark_backup_compression.py [size in MiB] [threads]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.parallelZip import writeMembers
+from src.constant_vars import COMPRESSION_LEVELS, COMPRESSION_BALANCED, STORED_EXTENSIONS_DEFAULT
+
+# Compares compressing a backup with a single thread against several threads,
+# and deflating every file against storing the extensions BackupMods stores by default
+
+def create_mods(path: str, size: int) -> list[tuple[str, str]]:
+    '''
+    Writes files that add up to about `size` bytes, like a few mod_overrides packs.
+
+    Textures are already compressed in real mods, so they're random data, the scripts and xml compress
+    '''
+
+    words = [os.urandom(8).hex().encode() for _ in range(2000)]
+
+    members: list[tuple[str, str]] = []
+
+    written = 0
+    index = 0
+
+    while written < size:
+        mod = f'mod {index % 8}'
+        os.makedirs(os.path.join(path, mod), exist_ok=True)
+
+        fileSize = random.randint(256 * 1024, 8 * 1024 * 1024)
+
+        if index % 2:
+            extension = '.texture'
+            data = os.urandom(fileSize)
+        else:
+            extension = random.choice(('.xml', '.lua'))
+            data = b' '.join(random.choices(words, k=fileSize // 17))
+
+        filePath = os.path.join(path, mod, f'{index}{extension}')
+
+        with open(filePath, 'wb') as f:
+            f.write(data)
+
+        members.append((f'assets/mod_overrides/{mod}/{index}{extension}', filePath))
+
+        written += len(data)
+        index += 1
+
+    return sorted(members)
+
+def time_compression(zipPath: str, members: list[tuple[str, str]], threads: int, stored: tuple[str, ...] = STORED_EXTENSIONS_DEFAULT) -> tuple[float, int]:
+    '''Returns the seconds it took to write the backup and its size, with the level `BackupMods.compression()` uses by default'''
+
+    start = time.perf_counter()
+
+    with zipfile.ZipFile(zipPath, 'w', zipfile.ZIP_DEFLATED) as zf:
+        writeMembers(zf, members, threads, level=COMPRESSION_LEVELS[COMPRESSION_BALANCED], stored=stored)
+
+    elapsed = time.perf_counter() - start
+    size = os.path.getsize(zipPath)
+
+    os.remove(zipPath)
+
+    return elapsed, size
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else min(os.cpu_count() or 1, 8)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        zipPath = os.path.join(tmp_dir, 'backup.zip')
+
+        print(f'Creating {size} MiB of mods...')
+        members = create_mods(os.path.join(tmp_dir, 'mods'), size * 1024 * 1024)
+        print(f'{len(members)} files, {os.cpu_count()} cores')
+
+        deflated, deflatedSize = time_compression(zipPath, members, threads, stored=())
+        print(f'{threads} threads, deflating every file: {deflated:.2f}s, {deflatedSize / 1024 / 1024:.1f} MiB')
+
+        sequential, _ = time_compression(zipPath, members, 1)
+        print(f'1 thread: {sequential:.2f}s')
+
+        parallel, size = time_compression(zipPath, members, threads)
+        print(f'{threads} threads: {parallel:.2f}s ({sequential / parallel:.2f}x), {size / 1024 / 1024:.1f} MiB ({deflated / parallel:.2f}x faster than deflating every file)')
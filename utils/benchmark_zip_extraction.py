@@ -0,0 +1,65 @@
+import os
+import sys
+import time
+import random
+import shutil
+import zipfile
+import tempfile
+
+# Run from the repository's root: python utils/benchmark_zip_extraction.py [size in MiB] [threads]
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import extract
+
+# Compares extracting one big zip with a single thread against several threads
+
+def create_zip(path: str, size: int) -> None:
+    '''Writes a zip of compressible files that add up to about `size` bytes, like a mod_overrides pack'''
+
+    words = [os.urandom(8).hex().encode() for _ in range(2000)]
+
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+
+        written = 0
+        index = 0
+
+        while written < size:
+            fileSize = random.randint(256 * 1024, 8 * 1024 * 1024)
+            data = b' '.join(random.choices(words, k=fileSize // 17))
+
+            zf.writestr(f'pack/textures/{index}.texture', data)
+
+            written += len(data)
+            index += 1
+
+def time_extraction(archive: str, dest: str, threads: int) -> float:
+    shutil.rmtree(dest, ignore_errors=True)
+
+    start = time.perf_counter()
+    extract.extractArchive(archive, dest, threads=threads)
+    elapsed = time.perf_counter() - start
+
+    shutil.rmtree(dest, ignore_errors=True)
+
+    return elapsed
+
+if __name__ == '__main__':
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 512
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else min(os.cpu_count() or 1, 8)
+
+    # Every size is extracted in parallel when asked to
+    extract.PARALLEL_ZIP_SIZE = 0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive = os.path.join(tmp_dir, 'pack.zip')
+        dest = os.path.join(tmp_dir, 'dest')
+
+        print(f'Creating a {size} MiB zip...')
+        create_zip(archive, size * 1024 * 1024)
+        print(f'Archive size: {os.path.getsize(archive) / 1024 / 1024:.1f} MiB, {os.cpu_count()} cores')
+
+        sequential = time_extraction(archive, dest, 1)
+        print(f'1 thread: {sequential:.2f}s')
+
+        parallel = time_extraction(archive, dest, threads)
+        print(f'{threads} threads: {parallel:.2f}s ({sequential / parallel:.2f}x)')